@@ -50,10 +50,8 @@ class DiagnosisService:
             total_capacity += (p.workdays_per_week * schedule_weeks - edo_count)
             
             # Worked: count actual shifts
-            total_worked += schedule.count_shifts(p.name, 'D') + \
-                            schedule.count_shifts(p.name, 'S') + \
-                            schedule.count_shifts(p.name, 'N') + \
-                            schedule.count_shifts(p.name, 'A')
+            counts = schedule.get_shift_counts(p.name)
+            total_worked += sum(counts.get(code, 0) for code in ('D', 'S', 'N', 'A'))
                             
         surplus = total_capacity - total_worked
         
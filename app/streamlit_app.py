@@ -3,8 +3,12 @@ Rota Optimizer — Streamlit Web UI
 =================================
 Pair-based scheduling with OR-Tools CP-SAT solver.
 """
+import dataclasses
 import sys
 import os
+import threading
+import time
+import pandas as pd
 import streamlit as st
 
 # Add src and project root to python path for imports
@@ -21,9 +25,10 @@ from app.views.export import render_downloads
 from app.components.utils import get_solver_config, get_weekend_config
 from rota.solver.optimizer import optimize_with_cache
 from rota.solver.edo import build_edo_plan
-from rota.solver.staffing import derive_staffing
+from rota.solver.staffing import JOURS, derive_staffing
 from rota.solver.validation import validate_schedule, calculate_fairness
-from rota.solver.weekend import WeekendSolver, WeekendConfig
+from rota.solver.weekend import WeekendConfig
+from rota.solver.weekend_pipeline import repair_weekends, split_workers, start_weekend_solve
 
 def main():
     # 1. Init
@@ -38,7 +43,6 @@ def main():
     
     # 3. Optimization Logic (Triggered from Sidebar)
     _handle_optimization(state)
-    _handle_weekend_optimization(state)
     
     # 4. Main Tabs - Architecture depends on merge_calendars mode
     has_week_result = state.schedule and state.schedule.status in ["optimal", "feasible"]
@@ -97,93 +101,156 @@ def _handle_optimization(state: SessionStateManager):
         weekend_config = None # Placeholder for now
 
         if state.trigger_optimize:
-            with st.spinner("🚀 Optimisation en cours..."):
-                # Get fairness mode from config
-                fm = solver_cfg.fairness_mode
-                fm_str = fm.value if hasattr(fm, 'value') else str(fm)
+            # The weekend does not depend on the weekday result: solve it
+            # concurrently and repair the Friday/Monday boundary afterwards
+            we_config = _weekend_config(state)
+            weekend_future = start_weekend_solve(state.people or [], we_config)
+            # The weekday solve gets the remaining cores
+            solver_cfg = dataclasses.replace(
+                solver_cfg, parallel_portfolio=True, workers_per_solve=split_workers()[0]
+            )
+            schedule = None
+
+            try:
+                with st.spinner("🚀 Optimisation en cours..."):
+                    # Get fairness mode from config
+                    fm = solver_cfg.fairness_mode
+                    fm_str = fm.value if hasattr(fm, 'value') else str(fm)
+                
+                    # Run/Resume optimization in a worker thread; solver callbacks
+                    # publish snapshots that this script thread renders as they improve
+                    live = {"best": None, "result": None, "error": None}
+                    lock = threading.Lock()
+                
+                    def on_solution(snapshot):
+                        with lock:
+                            best = live["best"]
+                            if best is None or snapshot.score < best.score:
+                                live["best"] = snapshot
+                
+                    def run():
+                        try:
+                            live["result"] = optimize_with_cache(
+                                people=state.people,
+                                config=solver_cfg,
+                                tries=state.config_tries,
+                                seed=None if state.config_seed == 0 else state.config_seed,
+                                cohort_mode=fm_str,
+                                custom_staffing=custom_staffing,
+                                weekend_config=weekend_config,
+                                on_solution=on_solution,
+                            )
+                        except Exception as e:
+                            live["error"] = e
+                
+                    worker = threading.Thread(target=run, daemon=True)
+                    worker.start()
+                    placeholder = st.empty()
+                    shown = None
+                    while worker.is_alive():
+                        with lock:
+                            best = live["best"]
+                        if best is not None and best is not shown:
+                            with placeholder.container():
+                                _render_best_so_far(best, state.people)
+                            shown = best
+                        time.sleep(0.5)
+                    worker.join()
+                    placeholder.empty()
                 
-                # Run/Resume optimization
-                schedule, seed, score, study_hash = optimize_with_cache(
-                    people=state.people,
-                    config=solver_cfg,
-                    tries=state.config_tries,
-                    seed=None if state.config_seed == 0 else state.config_seed,
-                    cohort_mode=fm_str,
-                    custom_staffing=custom_staffing,
-                    weekend_config=weekend_config,
-                )
+                    if live["error"] is not None:
+                        raise live["error"]
+                    schedule, seed, score, study_hash = live["result"]
                 
-                # Update state with result
-                state.schedule = schedule
-                state.best_seed = seed
-                state.best_score = score
-                state.study_hash = study_hash
-                state.trigger_optimize = False  # Reset trigger
+                    # Update state with result
+                    state.schedule = schedule
+                    state.best_seed = seed
+                    state.best_score = score
+                    state.study_hash = study_hash
+                    state.trigger_optimize = False  # Reset trigger
 
-                # Result processing
-                if schedule and schedule.status in ["optimal", "feasible"]:
-                    # Post-process artifacts
-                    edo_plan = build_edo_plan(state.people, state.config_weeks)
-                    state.edo_plan = edo_plan
+                    # Result processing
+                    if schedule and schedule.status in ["optimal", "feasible"]:
+                        # Post-process artifacts
+                        edo_plan = build_edo_plan(state.people, state.config_weeks)
+                        state.edo_plan = edo_plan
                     
-                    # Staffing verification
-                    if not state.people:
-                        st.error("❌ Erreur interne: Liste du personnel vide ou non initialisée.")
-                        return
+                        # Staffing verification
+                        if not state.people:
+                            st.error("❌ Erreur interne: Liste du personnel vide ou non initialisée.")
+                            return
 
-                    staffing = derive_staffing(state.people, state.config_weeks, edo_plan.plan, custom_staffing=custom_staffing)
-                    state.staffing = staffing
+                        staffing = derive_staffing(state.people, state.config_weeks, edo_plan.plan, custom_staffing=custom_staffing)
+                        state.staffing = staffing
                     
-                    # Validation & Fairness
-                    validation = validate_schedule(schedule, state.people, edo_plan, staffing)
-                    state.validation = validation
+                        # Validation & Fairness
+                        validation = validate_schedule(schedule, state.people, edo_plan, staffing)
+                        state.validation = validation
                     
-                    fairness_mode = solver_cfg.fairness_mode.value if hasattr(solver_cfg.fairness_mode, 'value') else "by-wd"
-                    fairness = calculate_fairness(schedule, state.people, fairness_mode)
-                    state.fairness = fairness
+                        fairness_mode = solver_cfg.fairness_mode.value if hasattr(solver_cfg.fairness_mode, 'value') else "by-wd"
+                        fairness = calculate_fairness(schedule, state.people, fairness_mode)
+                        state.fairness = fairness
                     
-                    st.success(f"✅ Solution trouvée! Score: {score:.1f}")
-                else:
-                    st.error("❌ Aucune solution réalisable trouvée.")
+                        st.success(f"✅ Solution trouvée! Score: {score:.1f}")
+                    else:
+                        st.error("❌ Aucune solution réalisable trouvée.")
+            finally:
+                # Join the weekend solve on every path so its errors are not lost
+                _collect_weekend(state, weekend_future, we_config, schedule)
 
-def _handle_weekend_optimization(state: SessionStateManager):
-    """Run weekend solver if a valid schedule exists (runs in both merged and separate modes)."""
-    # Only run if we have a valid weekday schedule
-    if not state.schedule or state.schedule.status not in ["optimal", "feasible"]:
-        return
+def _render_best_so_far(snapshot, people):
+    """Render an intermediate solver snapshot while the search continues."""
+    stats = snapshot.stats
+    objective, bound = stats["objective"], stats["bound"]
+    gap = abs(objective - bound) / max(abs(objective), 1.0)
     
-    # Only run if we don't already have a weekend result with assignments
-    # (Re-run if previous result had 0 assignments - likely cached from buggy solver)
-    if state.w_result and state.w_result.status in ["OPTIMAL", "FEASIBLE"]:
-        if hasattr(state.w_result, 'assignments') and len(state.w_result.assignments) > 0:
-            return  # Already have valid weekend result
+    st.caption("⏳ Meilleure solution provisoire — le solveur continue d'améliorer")
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Objectif", f"{objective:,.0f}")
+    c2.metric("Borne", f"{bound:,.0f}")
+    c3.metric("Écart", f"{gap:.1%}")
+    c4.metric("Temps", f"{snapshot.solve_time_seconds:.1f}s")
     
-    # Get weekend config
+    assign_map = snapshot.get_person_day_matrix(code_map={"D": "J", "S": "S", "N": "N"})
+    rows = []
+    for name in sorted(p.name for p in people):
+        row = {"Nom": name}
+        for w in range(1, snapshot.weeks + 1):
+            for d in JOURS:
+                row[f"S{w}_{d}"] = assign_map.get((name, w, d), "")
+        rows.append(row)
+    if rows:
+        st.dataframe(pd.DataFrame(rows).set_index("Nom"), width="stretch", height=300)
+
+
+def _weekend_config(state: SessionStateManager) -> WeekendConfig:
+    """WeekendConfig from the sidebar options."""
     we_config_dict = get_weekend_config()
-    
+    return WeekendConfig(
+        num_weeks=state.config_weeks,  # Required first argument
+        max_weekends_per_month=we_config_dict.get("max_weekends_month", 2),
+        forbid_consecutive_nights=we_config_dict.get("forbid_consecutive_nights", True),
+        num_workers=split_workers()[1],  # runs alongside the weekday solve
+        hint=state.w_result if state.w_result and state.w_result.assignments else None,
+    )
+
+
+def _collect_weekend(state: SessionStateManager, future, we_config: WeekendConfig, schedule):
+    """Wait for the concurrent weekend solve and repair it against a valid weekday schedule."""
     try:
-        we_config = WeekendConfig(
-            num_weeks=state.config_weeks,  # Required first argument
-            max_weekends_per_month=we_config_dict.get("max_weekends_month", 2),
-            forbid_consecutive_nights=we_config_dict.get("forbid_consecutive_nights", True),
-        )
+        w_result = future.result()
+        if not schedule or schedule.status not in ["optimal", "feasible"]:
+            return
         
-        people = state.people or []
+        with st.spinner("🗓️ Réparation de la jonction semaine/week-end..."):
+            w_result = repair_weekends(schedule, w_result, state.people, we_config)
+        state.w_result = w_result
         
-        with st.spinner("🗓️ Optimisation week-end en cours..."):
-            solver = WeekendSolver(
-                config=we_config,
-                people=people,
-            )
-            
-            w_result = solver.solve()
-            state.w_result = w_result
-            
-            if w_result.status in ["OPTIMAL", "FEASIBLE"]:
-                st.success(f"✅ Week-end optimisé! {len(w_result.assignments)} affectations")
-            else:
-                st.warning(f"⚠️ Week-end: {w_result.status}")
-                
+        if w_result.status in ["OPTIMAL", "FEASIBLE"]:
+            st.success(f"✅ Week-end optimisé! {len(w_result.assignments)} affectations")
+        else:
+            st.warning(f"⚠️ Week-end: {w_result.status}")
+    
     except Exception as e:
         import traceback
         st.error(f"❌ Erreur week-end: {e}")
@@ -289,8 +356,7 @@ def _render_weekend_only_dashboard(state: SessionStateManager):
         for w in range(1, weeks + 1):
             row = {"Semaine": f"S{w}"}
             for we_day in ["Sam", "Dim"]:
-                day_assignments = [a for a in w_result.assignments if a.week == w and a.day == we_day]
-                filled = len(day_assignments)
+                filled = w_result.get_slot_count(w, we_day)
                 required = 4  # 2 shifts × 2 staff per shift
                 
                 pct = (filled / required * 100) if required > 0 else 100
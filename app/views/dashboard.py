@@ -401,8 +401,7 @@ def _render_coverage(state, merged_mode: bool = False):
         if merged_mode and w_result and w_result.assignments:
             for we_day in ["Sam", "Dim"]:
                 # Count assignments for this day
-                day_assignments = [a for a in w_result.assignments if a.week == w and a.day == we_day]
-                filled = len(day_assignments)
+                filled = w_result.get_slot_count(w, we_day)
                 required = 4  # 2 shifts × 2 staff per shift
                 
                 pct = (filled / required * 100) if required > 0 else 100
@@ -552,7 +551,7 @@ def _render_analytics(state, merged_mode: bool = False):
         staffing = state.staffing
 
         for w in range(1, weeks + 1):
-            day_assignments = [a for a in schedule.assignments if a.week == w]
+            day_assignments = [a for d in JOURS for a in schedule.get_day_assignments(w, d)]
             filled = sum(
                 (1 if a.person_a else 0) + (1 if a.person_b else 0)
                 for a in day_assignments
@@ -796,8 +795,7 @@ def _render_by_shift(state, merged_mode: bool = False):
         for d in JOURS:
             row = {"Date": f"S{w}_{d}"}
             for shift_name, shift_code in [("Jour", "D"), ("Soir", "S"), ("Nuit", "N"), ("Admin", "A")]:
-                pairs = [a for a in schedule.assignments
-                         if a.week == w and a.day == d and a.shift == shift_code]
+                pairs = [a for a in schedule.get_day_assignments(w, d) if a.shift == shift_code]
 
                 if shift_code == "A":
                     row[shift_name] = ", ".join(a.person_a for a in pairs if a.person_a)
@@ -817,9 +815,7 @@ def _render_by_shift(state, merged_mode: bool = False):
             for we_day in ["Sam", "Dim"]:
                 row = {"Date": f"S{w}_{we_day}"}
                 for shift_name, shift_code in [("Jour", "D"), ("Nuit", "N")]:
-                    we_assignments = [a for a in w_result.assignments
-                                      if a.week == w and a.day == we_day and a.shift == shift_code]
-                    names = [a.person.name for a in we_assignments]
+                    names = w_result.get_slot_people(w, we_day, shift_code)
                     row[shift_name] = ", ".join(names) if names else "-"
                 row["Soir"] = "-"  # No evening shift on weekends
                 row["Admin"] = "-"  # No admin on weekends
@@ -6,7 +6,8 @@ Handles file downloads (Excel, PDF, CSV).
 import streamlit as st
 import io
 from app.state.session import SessionStateManager
-from rota.io.pair_export import export_pairs_to_csv, export_pairs_to_excel, export_merged_calendar, export_weekend_to_excel
+from rota.io.pair_export import export_pairs_to_csv, export_weekend_to_excel
+from rota.io.pair_export_stream import export_merged_calendar_streaming, export_pairs_to_excel_streaming
 from rota.io.pdf_export import export_schedule_to_pdf
 
 def render_downloads(state: SessionStateManager):
@@ -49,7 +50,7 @@ def render_downloads(state: SessionStateManager):
         }
         
         if should_merge:
-            export_merged_calendar(
+            export_merged_calendar_streaming(
                 state.schedule, state.w_result, state.people, state.edo_plan, xlsx_buffer,
                 validation=state.validation, fairness=state.fairness,
                 staffing=state.staffing,
@@ -57,7 +58,7 @@ def render_downloads(state: SessionStateManager):
             )
             filename = "planning_complet.xlsx"
         else:
-            export_pairs_to_excel(
+            export_pairs_to_excel_streaming(
                 state.schedule, state.people, state.edo_plan, xlsx_buffer,
                 validation=state.validation, fairness=state.fairness,
                 config=config_dict,
@@ -0,0 +1,107 @@
+"""
+Benchmark the Excel exports: in-memory vs streaming.
+
+Builds a synthetic weekday schedule and weekend result (no solve) for
+--people people over --weeks weeks, then runs the merged calendar
+(export_merged_calendar / export_merged_calendar_streaming) and the
+weekday workbook (export_pairs_to_excel / export_pairs_to_excel_streaming),
+each in a fresh process so peak RSS is not shared. Reports wall time, peak RSS of the export process (and its
+growth over the process after building the inputs) and file size.
+
+Usage:
+    python scripts/bench_export.py
+    python scripts/bench_export.py --people 60 --weeks 52 --repeat 3
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from rota.io.pair_export import export_merged_calendar, export_pairs_to_excel
+from rota.io.pair_export_stream import export_merged_calendar_streaming, export_pairs_to_excel_streaming
+from rota.models.person import Person
+from rota.solver.edo import build_edo_plan
+from rota.solver.pairs import PairAssignment, PairSchedule
+from rota.solver.staffing import JOURS
+from rota.solver.weekend import WEEKEND_DAYS, WEEKEND_SHIFTS, WeekendAssignment, WeekendResult
+
+EXPORTERS = {
+    "merged in-memory": export_merged_calendar,
+    "merged streaming": export_merged_calendar_streaming,
+    "pairs in-memory": export_pairs_to_excel,
+    "pairs streaming": export_pairs_to_excel_streaming,
+}
+
+
+def synthetic_inputs(n_people: int, weeks: int, seed: int = 0):
+    rng = random.Random(seed)
+    people = [Person(name=f"Agent {i:02d}", id=i, workdays_per_week=4) for i in range(n_people)]
+    names = [p.name for p in people]
+
+    assignments = []
+    for w in range(1, weeks + 1):
+        for d in JOURS:
+            working = rng.sample(names, min(len(names), 12))
+            for s_idx, shift in enumerate(("D", "S", "N")):
+                for slot in range(2):
+                    a, b = working[s_idx * 4 + slot * 2: s_idx * 4 + slot * 2 + 2]
+                    assignments.append(PairAssignment(w, d, shift, slot, a, b))
+    schedule = PairSchedule(
+        assignments=assignments, weeks=weeks, people_count=n_people,
+        status="feasible", score=0.0, solve_time_seconds=0.0,
+    )
+
+    weekend = []
+    for w in range(1, weeks + 1):
+        for d in WEEKEND_DAYS:
+            for shift in WEEKEND_SHIFTS:
+                weekend += [WeekendAssignment(people[i], w, d, shift) for i in rng.sample(range(n_people), 2)]
+    result = WeekendResult(weekend, "FEASIBLE", 0.0, num_weeks=weeks)
+    return schedule, result, people, build_edo_plan(people, weeks)
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def _run(label: str, n_people: int, weeks: int, queue) -> None:
+    schedule, result, people, edo_plan = synthetic_inputs(n_people, weeks)
+    before = _peak_rss_mb()
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    if label.startswith("merged"):
+        EXPORTERS[label](schedule, result, people, edo_plan, buffer, config={"seed": 0})
+    else:
+        EXPORTERS[label](schedule, people, edo_plan, buffer, config={"seed": 0})
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, _peak_rss_mb(), _peak_rss_mb() - before, len(buffer.getvalue())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel exports: in-memory vs streaming")
+    parser.add_argument("--people", type=int, default=60)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.people} people, {args.weeks} weeks")
+    print(f"  {'exporter':<17} {'time':>8} {'peak RSS':>10} {'growth':>9} {'size':>9}")
+    ctx = multiprocessing.get_context("spawn")
+    for _ in range(args.repeat):
+        for label in EXPORTERS:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run, args=(label, args.people, args.weeks, queue))
+            proc.start()
+            elapsed, peak, growth, size = queue.get()
+            proc.join()
+            print(f"  {label:<17} {elapsed:7.2f}s {peak:8.0f}MB {growth:7.0f}MB {size / 1e6:7.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark the integrated 7-day model against the two-pass weekend pipeline.
+
+Two-pass: solve_pairs on Mon-Fri, then WeekendSolver on Sat/Sun (as the
+app used to, without friday_night_workers). Parallel: both solves started
+together, then the conflicting weekends repaired (solve_week_and_weekend).
+Integrated: one solve_pairs call with WeekendMode.INTEGRATED.
+
+Both results are validated on the same 7-day staffing (validate_schedule)
+and on the calendar rules across the weekday/weekend boundary
+(calendar_violations). Times are wall-clock for the whole pipeline.
+
+Usage:
+    python scripts/bench_integrated_weekend.py --weeks 4 --time-limit 30
+    python scripts/bench_integrated_weekend.py --csv team_dummy.csv --weeks 8 --seeds 1 2
+"""
+import argparse
+import dataclasses
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from rota.io.csv_loader import load_team
+from rota.models.constraints import SolverConfig, WeekendMode
+from rota.solver.edo import build_edo_plan
+from rota.solver.pairs import solve_pairs
+from rota.solver.staffing import derive_staffing, model_days
+from rota.solver.validation import calendar_violations, validate_schedule
+from rota.solver.weekend import WeekendConfig, WeekendSolver, merge_weekend_result
+from rota.solver.weekend_pipeline import solve_week_and_weekend
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_CSVS = ["team_dummy.csv", "data/sample_people.csv"]
+
+
+def two_pass(people, config, edo_plan):
+    staffing = derive_staffing(people, config.weeks, edo_plan.plan)
+    schedule = solve_pairs(people, config, staffing, edo_plan)
+    weekend = WeekendSolver(
+        WeekendConfig(num_weeks=config.weeks, time_limit_seconds=config.time_limit_seconds),
+        people,
+    ).solve()
+    return merge_weekend_result(schedule, weekend), f"{schedule.status}/{weekend.status.lower()}"
+
+
+def parallel(people, config, edo_plan):
+    staffing = derive_staffing(people, config.weeks, edo_plan.plan)
+    schedule, weekend = solve_week_and_weekend(people, config, staffing, edo_plan)
+    return merge_weekend_result(schedule, weekend), f"{schedule.status}/{weekend.status.lower()}"
+
+
+def integrated(people, config, edo_plan):
+    staffing = derive_staffing(people, config.weeks, edo_plan.plan, days=model_days(config))
+    schedule = solve_pairs(people, config, staffing, edo_plan)
+    return schedule, schedule.status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Integrated 7-day model vs two-pass weekend pipeline")
+    parser.add_argument("--csv", nargs="*", default=DEFAULT_CSVS)
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--time-limit", type=int, default=30, help="Seconds per CP-SAT solve")
+    parser.add_argument("--seeds", type=int, nargs="*", default=[1])
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {args.weeks} weeks, {args.time_limit}s per solve")
+    for csv_path in args.csv:
+        path = csv_path if os.path.isabs(csv_path) else os.path.join(ROOT, csv_path)
+        people = load_team(path)
+        edo_plan = build_edo_plan(people, args.weeks)
+        base = SolverConfig(weeks=args.weeks, time_limit_seconds=args.time_limit)
+        full_config = dataclasses.replace(base, weekend_mode=WeekendMode.INTEGRATED)
+        full_staffing = derive_staffing(people, args.weeks, edo_plan.plan, days=model_days(full_config))
+
+        print(f"\n{csv_path} ({len(people)} people)")
+        print(
+            f"  {'pipeline':<11} {'seed':>4} {'time':>8} {'unfilled':>8} {'doubles':>7} "
+            f"{'night>work':>10} {'48h roll':>8} {'total':>6} status"
+        )
+        for seed in args.seeds:
+            for label, run, config in (
+                ("two-pass", two_pass, base),
+                ("parallel", parallel, base),
+                ("integrated", integrated, full_config),
+            ):
+                config = dataclasses.replace(config, random_seed=seed)
+                start = time.perf_counter()
+                schedule, status = run(people, config, edo_plan)
+                elapsed = time.perf_counter() - start
+
+                validation = validate_schedule(schedule, people, edo_plan, full_staffing)
+                calendar = calendar_violations(schedule)
+                total = validation.slots_vides + sum(calendar.values())
+                print(
+                    f"  {label:<11} {seed:>4} {elapsed:7.1f}s {validation.slots_vides:>8} "
+                    f"{calendar['double_shift']:>7} {calendar['night_to_work']:>10} "
+                    f"{calendar['rolling_48h']:>8} {total:>6} {status}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark the CP-SAT model build phase.
+
+Compares the dense VariableStore builder (build_pairs_model) against the
+previous nested-dict construction (assign[name][week][day][shift]) on a
+synthetic team. Only the build is timed; nothing is solved.
+
+Usage:
+    python scripts/bench_model_build.py --people 60 --weeks 52
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ortools.sat.python import cp_model
+
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.models.rules import SHIFTS
+from rota.solver.edo import build_edo_plan
+from rota.solver.pairs import build_pairs_model
+from rota.solver.staffing import JOURS, derive_staffing
+
+
+def build_nested_reference(people, config, staffing, edo_plan, days=JOURS):
+    """Previous nested-dict model construction (reference for timing only)."""
+    model = cp_model.CpModel()
+    weeks = config.weeks
+    names = [p.name for p in people]
+    name_to_person = {p.name: p for p in people}
+    shifts = ["D", "N", "S"]
+
+    assign = {}
+    for p in names:
+        assign[p] = {}
+        for w in range(1, weeks + 1):
+            assign[p][w] = {}
+            for d in days:
+                assign[p][w][d] = {s: model.NewBoolVar(f"assign_{p}_{w}_{d}_{s}") for s in shifts}
+    person_works = {
+        p: {w: {d: model.NewBoolVar(f"works_{p}_{w}_{d}") for d in days} for w in range(1, weeks + 1)}
+        for p in names
+    }
+
+    unfilled = []
+    for w in range(1, weeks + 1):
+        for d in days:
+            for s, mult in (("D", 2), ("N", 2), ("S", 1)):
+                needed = staffing[w].slots[d].get(s, 0) * mult
+                if needed == 0:
+                    continue
+                u = model.NewIntVar(0, needed, f"unfilled_{s}_{w}_{d}")
+                model.Add(sum(assign[p][w][d][s] for p in names) + u == needed)
+                unfilled.append(u)
+
+    for p in names:
+        for w in range(1, weeks + 1):
+            for d in days:
+                model.AddMaxEquality(person_works[p][w][d], [assign[p][w][d][s] for s in shifts])
+                model.Add(sum(assign[p][w][d][s] for s in shifts) <= 1)
+            for i, d in enumerate(days[:-1]):
+                model.Add(person_works[p][w][days[i + 1]] == 0).OnlyEnforceIf(assign[p][w][d]["N"])
+
+    night_counts = {}
+    ordered = [(w, d) for w in range(1, weeks + 1) for d in days]
+    for p in names:
+        night_counts[p] = model.NewIntVar(0, weeks * len(days), f"nights_{p}")
+        model.Add(night_counts[p] == sum(assign[p][w][d]["N"] for w, d in ordered))
+        window = config.max_nights_sequence + 1
+        for i in range(len(ordered) - window + 1):
+            model.Add(sum(assign[p][w][d]["N"] for w, d in ordered[i:i + window]) <= config.max_nights_sequence)
+        for w in range(1, weeks + 1):
+            if p in edo_plan.plan.get(w, set()):
+                model.Add(sum(person_works[p][w][d].Not() for d in days) >= 1)
+            model.Add(sum(assign[p][w][d][s] * SHIFTS[s].hours for d in days for s in shifts) <= 48)
+
+        timeline = []
+        for w in range(1, weeks + 1):
+            for d in days:
+                timeline.append(sum(assign[p][w][d][s] * SHIFTS[s].hours for s in shifts))
+            timeline.extend([0, 0])
+        for i in range(len(timeline) - 6):
+            model.Add(sum(timeline[i:i + 7]) <= 48)
+
+        working = []
+        for w in range(1, weeks + 1):
+            for d in days:
+                v = model.NewBoolVar(f"working_{p}_{w}_{d}")
+                model.Add(sum(assign[p][w][d][s] for s in shifts) == v)
+                working.append(v)
+            if w < weeks:
+                working.extend([0, 0])
+        window = config.max_consecutive_days + 1
+        for i in range(len(working) - window + 1):
+            model.Add(sum(working[i:i + window]) <= config.max_consecutive_days)
+
+        if name_to_person[p].no_evening:
+            for w, d in ordered:
+                model.Add(assign[p][w][d]["S"] == 0)
+
+    terms = [(u, 10000) for u in unfilled]
+    for p in names:
+        soirs = model.NewIntVar(0, weeks * len(days), f"soirs_{p}")
+        model.Add(soirs == sum(assign[p][w][d]["S"] for w, d in ordered))
+        total = model.NewIntVar(0, weeks * len(days), f"total_{p}")
+        model.Add(total == sum(assign[p][w][d][s] for w, d in ordered for s in shifts))
+        terms += [(night_counts[p], 100), (soirs, 50), (total, 5)]
+        for w in range(1, weeks + 1):
+            for i in range(len(days) - 1):
+                c = model.NewBoolVar(f"clop_{p}_{w}_{days[i]}")
+                a, b = assign[p][w][days[i]]["S"], assign[p][w][days[i + 1]]["D"]
+                model.AddBoolAnd([a, b]).OnlyEnforceIf(c)
+                model.AddBoolOr([a.Not(), b.Not()]).OnlyEnforceIf(c.Not())
+                terms.append((c, 1))
+    model.Minimize(sum(v * k for v, k in terms))
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark model build: dense store vs nested dicts")
+    parser.add_argument("--people", type=int, default=60)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    people = [
+        Person(name=f"P{i:02d}", workdays_per_week=4 if i % 3 else 3, edo_eligible=i % 2 == 0)
+        for i in range(args.people)
+    ]
+    config = SolverConfig(weeks=args.weeks)
+    edo_plan = build_edo_plan(people, config.weeks)
+    staffing = derive_staffing(people, config.weeks, edo_plan.plan)
+
+    def timed(fn):
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            model = fn()
+            best = min(best, time.perf_counter() - t0)
+        return best, model
+
+    t_store, built = timed(lambda: build_pairs_model(people, config, staffing, edo_plan))
+    t_nested, nested = timed(lambda: build_nested_reference(people, config, staffing, edo_plan))
+
+    store_proto = built.model.Proto()
+    nested_proto = nested.Proto()
+    print(f"{args.people} people x {args.weeks} weeks (best of {args.repeat})")
+    print(f"  nested dicts : {t_nested:7.2f}s  vars={len(nested_proto.variables):>8}  constraints={len(nested_proto.constraints):>8}")
+    print(f"  dense store  : {t_store:7.2f}s  vars={len(store_proto.variables):>8}  constraints={len(store_proto.constraints):>8}")
+    print(f"  speedup      : {t_nested / t_store:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark multi-try strategies: process pool vs CP-SAT internal portfolio.
+
+For each team CSV, runs optimize() once per strategy with the same time
+budget and reports the time at which the CP-SAT objective first reached the
+target (by default the worse of the two final objectives, i.e. a level both
+strategies attain). Times are measured from the start of optimize(), so they
+include model build, pickling and process start-up. For the process pool the
+trace is that of the try optimize() kept.
+
+Usage:
+    python scripts/bench_strategies.py --weeks 8 --tries 4 --time-limit 30
+    python scripts/bench_strategies.py --csv team_dummy.csv --target 12000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from rota.io.csv_loader import load_team
+from rota.models.constraints import SolverConfig
+from rota.solver.optimizer import optimize
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_CSVS = ["team_dummy.csv", "data/sample_people.csv"]
+
+
+def time_to_target(schedule, target):
+    """First elapsed time at which the objective trace reached target (None if never)."""
+    for elapsed, objective, _bound in schedule.stats.get("improvements", []):
+        if objective <= target:
+            return elapsed
+    return None
+
+
+def run(people, args, strategy):
+    config = SolverConfig(weeks=args.weeks, time_limit_seconds=args.time_limit)
+    t0 = time.perf_counter()
+    schedule, _, score = optimize(people, config, tries=args.tries, seed=args.seed, strategy=strategy)
+    wall = time.perf_counter() - t0
+    trace = schedule.stats.get("improvements", [])
+    objective = trace[-1][1] if trace else float("inf")
+    return schedule, objective, score, wall
+
+
+def fmt(value):
+    return f"{value:8.2f}s" if value is not None else "     n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare time-to-target for optimize() strategies")
+    parser.add_argument("--csv", nargs="*", default=DEFAULT_CSVS)
+    parser.add_argument("--weeks", type=int, default=8)
+    parser.add_argument("--tries", type=int, default=4)
+    parser.add_argument("--time-limit", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--target", type=float, default=None, help="CP-SAT objective target")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {args.weeks} weeks, {args.tries} tries, {args.time_limit}s limit")
+    for csv_path in args.csv:
+        path = csv_path if os.path.isabs(csv_path) else os.path.join(ROOT, csv_path)
+        people = load_team(path)
+
+        results = {s: run(people, args, s) for s in ("process_pool", "internal_portfolio")}
+        target = args.target
+        if target is None:
+            target = max(objective for _, objective, _, _ in results.values())
+
+        print(f"\n{csv_path} ({len(people)} people), target objective {target:.0f}")
+        print(f"  {'strategy':<20} {'to target':>9} {'wall':>9} {'objective':>10} {'score':>9}")
+        for strategy, (schedule, objective, score, wall) in results.items():
+            print(
+                f"  {strategy:<20} {fmt(time_to_target(schedule, target))} {fmt(wall)} "
+                f"{objective:10.0f} {score:9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
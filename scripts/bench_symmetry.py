@@ -0,0 +1,84 @@
+"""
+Benchmark symmetry breaking for interchangeable staff.
+
+For each team CSV, solves the same model with and without
+SolverConfig.break_symmetry and reports the number of interchangeable
+classes, the time to the first solution, the time at which the final
+objective was first reached, and the total solve time (time to optimal
+when the status is "optimal").
+
+Usage:
+    python scripts/bench_symmetry.py --weeks 8 --time-limit 120
+    python scripts/bench_symmetry.py --csv team_dummy.csv --seeds 1 2 3
+"""
+import argparse
+import dataclasses
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from rota.io.csv_loader import load_team
+from rota.models.constraints import SolverConfig
+from rota.solver.constraints import interchangeable_groups
+from rota.solver.edo import build_edo_plan
+from rota.solver.pairs import build_pairs_model, solve_model
+from rota.solver.staffing import derive_staffing
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_CSVS = ["team_dummy.csv", "data/sample_people.csv"]
+
+
+def run(people, config, staffing, edo_plan):
+    built = build_pairs_model(people, config, staffing, edo_plan)
+    schedule = solve_model(built, config)
+    trace = schedule.stats.get("improvements", [])
+    first = trace[0][0] if trace else None
+    final = next((t for t, objective, _ in trace if objective <= schedule.score), None)
+    return schedule, first, final, built
+
+
+def fmt(value):
+    return f"{value:8.2f}s" if value is not None else "     n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare solves with and without symmetry breaking")
+    parser.add_argument("--csv", nargs="*", default=DEFAULT_CSVS)
+    parser.add_argument("--weeks", type=int, default=8)
+    parser.add_argument("--time-limit", type=int, default=120)
+    parser.add_argument("--seeds", type=int, nargs="*", default=[1])
+    parser.add_argument("--workers", type=int, default=0, help="CP-SAT workers (0 = all cores)")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {args.weeks} weeks, {args.time_limit}s limit")
+    for csv_path in args.csv:
+        path = csv_path if os.path.isabs(csv_path) else os.path.join(ROOT, csv_path)
+        people = load_team(path)
+        edo_plan = build_edo_plan(people, args.weeks)
+        staffing = derive_staffing(people, args.weeks, edo_plan.plan)
+
+        print(f"\n{csv_path} ({len(people)} people)")
+        print(
+            f"  {'symmetry':<9} {'seed':>5} {'classes':>8} {'first':>9} {'to final':>9} "
+            f"{'solve':>9} {'objective':>10} status"
+        )
+        for seed in args.seeds:
+            for enabled in (False, True):
+                config = SolverConfig(
+                    weeks=args.weeks, time_limit_seconds=args.time_limit, random_seed=seed,
+                    break_symmetry=enabled,
+                )
+                if args.workers:
+                    config = dataclasses.replace(config, parallel_portfolio=True, workers_per_solve=args.workers)
+                schedule, first, final, built = run(people, config, staffing, edo_plan)
+                classes = interchangeable_groups(built.store, edo_plan)
+                sizes = "+".join(str(len(c)) for c in classes) or "-"
+                print(
+                    f"  {'on' if enabled else 'off':<9} {seed:>5} {sizes:>8} {fmt(first)} {fmt(final)} "
+                    f"{fmt(schedule.solve_time_seconds)} {schedule.score:10.0f} {schedule.status}"
+                )
+
+
+if __name__ == "__main__":
+    main()
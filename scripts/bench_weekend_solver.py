@@ -0,0 +1,82 @@
+"""
+Benchmark WeekendSolver latency knobs.
+
+For each team CSV, solves the weekend model once as a baseline, then with
+a relative-gap stop and warm-started from the baseline plan (the hint
+the app passes on re-optimization). Reports wall time, time to the first
+solution, objective, best bound and final gap.
+
+Usage:
+    python scripts/bench_weekend_solver.py --weeks 12 --time-limit 30
+    python scripts/bench_weekend_solver.py --csv team_dummy.csv --workers 1 4 --gap 0.05 --seeds 1 2
+"""
+import argparse
+import dataclasses
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from rota.io.csv_loader import load_team
+from rota.solver.weekend import WeekendConfig, WeekendSolver
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_CSVS = ["team_dummy.csv", "data/sample_people.csv"]
+
+
+def fmt(value, spec, width):
+    return f"{format(value, spec) if value is not None else 'n/a':>{width}}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WeekendSolver workers / gap / hint benchmark")
+    parser.add_argument("--csv", nargs="*", default=DEFAULT_CSVS)
+    parser.add_argument("--weeks", type=int, default=12)
+    parser.add_argument("--time-limit", type=int, default=30)
+    parser.add_argument("--workers", type=int, nargs="*", default=[0], help="CP-SAT workers (0 = all cores)")
+    parser.add_argument("--gap", type=float, default=0.05, help="relative_gap_limit of the gap row")
+    parser.add_argument("--seeds", type=int, nargs="*", default=[1])
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {args.weeks} weeks, {args.time_limit}s limit")
+    for csv_path in args.csv:
+        path = csv_path if os.path.isabs(csv_path) else os.path.join(ROOT, csv_path)
+        people = load_team(path)
+
+        print(f"\n{csv_path} ({len(people)} people)")
+        print(
+            f"  {'run':<9} {'workers':>7} {'seed':>5} {'time':>9} {'first':>9} "
+            f"{'objective':>10} {'bound':>10} {'gap':>7} status"
+        )
+        for workers in args.workers:
+            for seed in args.seeds:
+                base = WeekendConfig(
+                    num_weeks=args.weeks, time_limit_seconds=args.time_limit,
+                    num_workers=workers, random_seed=seed,
+                )
+                baseline = None
+                for label in ("baseline", "gap", "hinted"):
+                    config = base
+                    if label == "gap":
+                        config = dataclasses.replace(base, relative_gap_limit=args.gap)
+                    elif label == "hinted":
+                        config = dataclasses.replace(base, hint=baseline)
+                    start = time.perf_counter()
+                    result = WeekendSolver(config, people).solve()
+                    elapsed = time.perf_counter() - start
+                    if label == "baseline":
+                        baseline = result
+
+                    gap = None
+                    if result.objective is not None:
+                        gap = abs(result.objective - result.best_bound) / max(1.0, abs(result.objective))
+                    print(
+                        f"  {label:<9} {workers or 'all':>7} {seed:>5} {elapsed:8.2f}s "
+                        f"{fmt(result.first_solution_seconds, '.2f', 8)}s {fmt(result.objective, '.0f', 10)} "
+                        f"{fmt(result.best_bound, '.0f', 10)} {fmt(gap, '.1%', 7)} {result.status.lower()}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
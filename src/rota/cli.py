@@ -5,6 +5,7 @@ import json
 from typing import Any, Dict
 
 from rota.engine.solve import solve  # Uses targets_overlay wrapper
+from rota.solver.profiling import format_profile
 
 
 def _build_cfg(args: argparse.Namespace) -> Dict[str, Any]:
@@ -29,6 +30,20 @@ def _build_cfg(args: argparse.Namespace) -> Dict[str, Any]:
         cfg["verbose"] = int(args.verbose)
     return cfg
 
+def _print_profile(profile: Dict[str, Any]) -> None:
+    print("Profil du modèle:")
+    for line in format_profile(profile["build"]):
+        print(f"  {line}")
+    cpsat = profile["cpsat"]
+    if not cpsat:
+        return
+    print("CP-SAT:")
+    for key in ("presolve_seconds", "first_solution_seconds", "wall_time", "num_conflicts", "num_branches", "gap_integral"):
+        if cpsat.get(key) is not None:
+            print(f" - {key}: {cpsat[key]}")
+    for elapsed, gap in cpsat.get("gap_over_time", []):
+        print(f"   gap {gap:7.2%} à {elapsed:.2f}s")
+
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(description="Rota CLI (façade legacy)")
     p.add_argument("--csv", required=True, help="Chemin du CSV d'équipe (pattern)")
@@ -44,18 +59,24 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--post-rebalance-steps", type=int, default=0)
     p.add_argument("-v","--verbose", action="count", default=0)
     p.add_argument("--json", dest="json_out", action="store_true", help="Sortie JSON (summary)")
+    p.add_argument("--profile", action="store_true", help="Profil du modèle (contraintes, temps) et statistiques CP-SAT")
     args = p.parse_args(argv)
 
     cfg = _build_cfg(args)
-    res = solve(args.csv, cfg)
+    res = solve(args.csv, cfg, profile=args.profile)
 
     if args.json_out:
-        print(json.dumps({"summary": res.summary}, ensure_ascii=False, indent=2))
+        out: Dict[str, Any] = {"summary": res.summary}
+        if args.profile:
+            out["profile"] = res.metrics_json["profile"]
+        print(json.dumps(out, ensure_ascii=False, indent=2))
     else:
         print("Résumé:")
         for k,v in res.summary.items():
             print(f" - {k}: {v}")
         print(f"Affectations: {len(res.assignments)} lignes")
+        if args.profile:
+            _print_profile(res.metrics_json["profile"])
     return 0
 
 if __name__ == "__main__":
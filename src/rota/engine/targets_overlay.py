@@ -11,7 +11,7 @@ from rota.solver.edo import build_edo_plan
 
 # Use new solver components
 from rota.solver.optimizer import optimize
-from rota.solver.staffing import derive_staffing
+from rota.solver.staffing import derive_staffing, model_days
 from rota.solver.validation import calculate_fairness, validate_schedule
 
 
@@ -23,13 +23,15 @@ class SolveResult:
     metrics_json: Dict[str, Any]
 
 
-def solve(csv_path: str, cfg: Optional[Any] = None) -> SolveResult:
+def solve(csv_path: str, cfg: Optional[Any] = None, profile: bool = False) -> SolveResult:
     """
     Solve scheduling problem - compatible with legacy UI expectations.
     
     Args:
         csv_path: Path to team CSV, or can be a DataFrame
         cfg: Configuration object (legacy SolveConfig or new SolverConfig)
+        profile: Collect the model build profile and CP-SAT stats into
+            metrics_json["profile"] (see rota.solver.profiling)
         
     Returns:
         SolveResult with assignments DataFrame and metadata
@@ -41,7 +43,7 @@ def solve(csv_path: str, cfg: Optional[Any] = None) -> SolveResult:
         people = load_team(csv_path)
     
     # Build solver config from legacy config if provided
-    solver_cfg = SolverConfig()
+    solver_cfg = SolverConfig(profile=profile)
     tries = 1
     
     if cfg is not None:
@@ -94,7 +96,7 @@ def solve(csv_path: str, cfg: Optional[Any] = None) -> SolveResult:
     
     # Re-calculate validation metrics for result
     edo_plan = build_edo_plan(people, solver_cfg.weeks)
-    staffing = derive_staffing(people, solver_cfg.weeks, edo_plan.plan)
+    staffing = derive_staffing(people, solver_cfg.weeks, edo_plan.plan, days=model_days(solver_cfg))
     
     if schedule.status in ["optimal", "feasible"]:
         validation = validate_schedule(schedule, people, edo_plan, staffing)
@@ -170,6 +172,11 @@ def solve(csv_path: str, cfg: Optional[Any] = None) -> SolveResult:
         "fairness": fairness_dict,
         "config": solver_cfg.to_dict(),
     }
+    if profile:
+        metrics_json["profile"] = {
+            "build": schedule.stats.get("build_profile", []),
+            "cpsat": schedule.stats.get("cpsat", {}),
+        }
     
     return SolveResult(
         assignments=assignments_df,
@@ -5,7 +5,7 @@ Exports PairSchedule to Excel with all 6 legacy sheets and CSV with pair format.
 """
 import io
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from openpyxl import Workbook
@@ -18,7 +18,7 @@ from rota.solver.pairs import PairSchedule
 from rota.solver.staffing import JOURS
 from rota.solver.stats import calculate_person_stats
 from rota.solver.validation import FairnessMetrics, ValidationResult
-from rota.solver.weekend import WeekendResult
+from rota.solver.weekend import WEEKEND_DAYS, WEEKEND_SHIFTS, WeekendResult
 from rota.utils.logging_setup import get_logger
 
 # Import shared constants and utils
@@ -67,6 +67,96 @@ def export_pairs_to_csv(
     logger.info(f"Exported {len(rows)} assignments to CSV")
 
 
+# Row labels of the ParPoste_Statique sheet (no Admin)
+PAIR_SHIFT_ROWS = [("Jour", "D"), ("Soir", "S"), ("Nuit", "N")]
+
+GAP_HEADERS = ["Semaine", "Jour", "Quart", "Créneaux manquants", "Personnes à recruter"]
+
+
+def _pairs_person_day_map(
+    schedule: PairSchedule,
+    names: List[str],
+    edo_plan: EDOPlan,
+    days: List[str],
+) -> Dict[Tuple[str, int, str], str]:
+    """(person, week, day) -> matrix code (J/S/N), with days off marked OFF or EDO."""
+    works_on = schedule.get_person_day_matrix(code_map=CODE)
+    
+    for name in names:
+        for w in range(1, schedule.weeks + 1):
+            has_edo = name in edo_plan.plan.get(w, set())
+            edo_day = edo_plan.fixed.get(name, "")
+            edo_assigned = False
+            
+            for d in days:
+                key = (name, w, d)
+                if key not in works_on:
+                    # Not working - mark as OFF or EDO
+                    if has_edo and not edo_assigned:
+                        if (not edo_day) or (edo_day == d):
+                            works_on[key] = "EDO"
+                            edo_assigned = True
+                        else:
+                            works_on[key] = "OFF"
+                    else:
+                        works_on[key] = "OFF"
+    return works_on
+
+
+def _pairs_kpis(schedule: PairSchedule, validation: Optional[ValidationResult]) -> List[Tuple[str, Any]]:
+    """(label, value) rows of the 'Tableau de bord' sheet."""
+    kpis = [
+        ("Effectif", schedule.people_count),
+        ("Semaines", schedule.weeks),
+        ("Tous les postes pourvus", "Oui" if (validation is None or validation.slots_vides == 0) else "Non"),
+        ("Score", f"{schedule.score:.2f}" if schedule.score else "—"),
+    ]
+    if validation:
+        kpis.extend([
+            ("Violations Nuit→Travail", validation.nuit_suivie_travail),
+            ("Transitions Soir→Jour", validation.soir_vers_jour),
+            ("Écarts hebdo", validation.ecarts_hebdo_jours),
+            ("Écarts horizon", validation.ecarts_horizon_personnes),
+        ])
+    return kpis
+
+
+def _pairs_by_slot(schedule: PairSchedule) -> Dict[Tuple[int, str, str], str]:
+    """(week, day, shift) -> "A / B; C / D" (solo Soir shifts list one name)."""
+    pairs_by: Dict[Tuple[int, str, str], List[str]] = {}
+    for a in schedule.assignments:
+        if a.shift == "S":  # Solo shift (Soir)
+            label = a.person_a or ""
+        else:
+            label = f"{a.person_a} / {a.person_b}"
+        pairs_by.setdefault((a.week, a.day, a.shift), []).append(label)
+    return {key: "; ".join(p for p in labels if p.strip()) for key, labels in pairs_by.items()}
+
+
+def _pairs_gap_rows(schedule: PairSchedule, staffing: Dict, days: List[str]) -> List[Dict[str, Any]]:
+    """Unfilled slots per week/day/shift, keyed by GAP_HEADERS."""
+    gaps_data = []
+    for w in range(1, schedule.weeks + 1):
+        for d in days:
+            for s_code in ["D", "S", "N"]:
+                req_slots = staffing[w].slots[d].get(s_code, 0)
+                assigned = schedule.get_slot_count(w, d, s_code)
+                
+                if assigned < req_slots:
+                    missing_slots = req_slots - assigned
+                    people_needed = missing_slots * 2 if s_code in ["D", "N"] else missing_slots
+                    shift_name = {"D": "Jour", "S": "Soir", "N": "Nuit"}.get(s_code, s_code)
+                    
+                    gaps_data.append({
+                        "Semaine": w,
+                        "Jour": d,
+                        "Quart": shift_name,
+                        "Créneaux manquants": missing_slots,
+                        "Personnes à recruter": people_needed,
+                    })
+    return gaps_data
+
+
 def export_pairs_to_excel(
     schedule: PairSchedule,
     people: List[Person],
@@ -97,34 +187,8 @@ def export_pairs_to_excel(
     config = config or {}
     
     # Build matrix data
-    name_to_person = {p.name: p for p in people}
     names = sorted([p.name for p in people])
-    
-    # Build who works when using PairSchedule method
-    works_on = schedule.get_person_day_matrix(code_map=CODE)
-    
-    # Fill in OFF and EDO
-    for name in names:
-        for w in range(1, weeks + 1):
-            has_edo = name in edo_plan.plan.get(w, set())
-            edo_day = edo_plan.fixed.get(name, "")
-            edo_assigned = False
-            
-            for d in days:
-                key = (name, w, d)
-                if key not in works_on:
-                    # Not working - mark as OFF or EDO
-                    if has_edo and not edo_assigned:
-                        if (not edo_day) or (edo_day == d):
-                            works_on[key] = "EDO"
-                            edo_assigned = True
-                        else:
-                            works_on[key] = "OFF"
-                    else:
-                        works_on[key] = "OFF"
-                elif has_edo and not edo_assigned:
-                    # Working but still need to assign EDO
-                    pass  # Will get OFF or EDO* in remaining days
+    works_on = _pairs_person_day_map(schedule, names, edo_plan, days)
     
     # Create workbook
     wb = Workbook()
@@ -134,19 +198,7 @@ def export_pairs_to_excel(
     ws_db.title = "Tableau de bord"
     
     # KPIs
-    kpis = [
-        ("Effectif", schedule.people_count),
-        ("Semaines", weeks),
-        ("Tous les postes pourvus", "Oui" if (validation is None or validation.slots_vides == 0) else "Non"),
-        ("Score", f"{schedule.score:.2f}" if schedule.score else "—"),
-    ]
-    if validation:
-        kpis.extend([
-            ("Violations Nuit→Travail", validation.nuit_suivie_travail),
-            ("Transitions Soir→Jour", validation.soir_vers_jour),
-            ("Écarts hebdo", validation.ecarts_hebdo_jours),
-            ("Écarts horizon", validation.ecarts_horizon_personnes),
-        ])
+    kpis = _pairs_kpis(schedule, validation)
     
     ws_db.cell(row=1, column=1, value="Indicateur").font = Font(bold=True)
     ws_db.cell(row=1, column=2, value="Valeur").font = Font(bold=True)
@@ -197,24 +249,15 @@ def export_pairs_to_excel(
     _write_days_row(ws_pp, weeks, days)
     ws_pp.freeze_panes = "B3"
     
-    # Build pairs per shift per day
-    pairs_by = {}  # {(week, day, shift): ["A / B", "C / D"]}
-    for a in schedule.assignments:
-        key = (a.week, a.day, a.shift)
-        pairs_by.setdefault(key, [])
-        if a.shift == "S":  # Solo shift (Soir)
-            pairs_by[key].append(a.person_a or "")
-        else:
-            pairs_by[key].append(f"{a.person_a} / {a.person_b}")
+    # Pairs per shift per day
+    pairs_by = _pairs_by_slot(schedule)
     
-    shift_rows = [("Jour", "D"), ("Soir", "S"), ("Nuit", "N")]  # No Admin
-    for r_idx, (label, shift) in enumerate(shift_rows, start=3):
+    for r_idx, (label, shift) in enumerate(PAIR_SHIFT_ROWS, start=3):
         ws_pp.cell(row=r_idx, column=1, value=label).font = Font(bold=True)
         c = 2
         for w in range(1, weeks + 1):
             for d in days:
-                pairs_list = pairs_by.get((w, d, shift), [])
-                val = "; ".join(p for p in pairs_list if p.strip())
+                val = pairs_by.get((w, d, shift), "")
                 cell = ws_pp.cell(row=r_idx, column=c, value=val)
                 cell.alignment = Alignment(horizontal="left", vertical="center")
                 cell.border = BORDER_THIN
@@ -313,31 +356,11 @@ def export_pairs_to_excel(
     
     # ========== Sheet 7: Gaps (Unfilled Slots) ==========
     if staffing:
-        gaps_data = []
-        weeks = schedule.weeks
-        
-        for w in range(1, weeks + 1):
-            for d in days:
-                for s_code in ["D", "S", "N"]:
-                    req_slots = staffing[w].slots[d].get(s_code, 0)
-                    assigned = len([a for a in schedule.assignments if a.week == w and a.day == d and a.shift == s_code])
-                    
-                    if assigned < req_slots:
-                        missing_slots = req_slots - assigned
-                        people_needed = missing_slots * 2 if s_code in ["D", "N"] else missing_slots
-                        shift_name = {"D": "Jour", "S": "Soir", "N": "Nuit"}.get(s_code, s_code)
-                        
-                        gaps_data.append({
-                            "Semaine": w,
-                            "Jour": d,
-                            "Quart": shift_name,
-                            "Créneaux manquants": missing_slots,
-                            "Personnes à recruter": people_needed,
-                        })
+        gaps_data = _pairs_gap_rows(schedule, staffing, days)
         
         if gaps_data:
             ws_gaps = wb.create_sheet("Gaps")
-            headers = ["Semaine", "Jour", "Quart", "Créneaux manquants", "Personnes à recruter"]
+            headers = GAP_HEADERS
             
             # Write header
             for j, h in enumerate(headers, start=1):
@@ -469,7 +492,7 @@ def export_weekend_to_excel(
     
     # Header: Name, Total, 24h, S1_Sat, S1_Sun, S2_Sat, ...
     headers = ["Nom", "Total", "24h"]
-    days = ["Sam", "Dim"]
+    days = WEEKEND_DAYS
     
     # Build columns based on weeks
     for w in range(1, num_weeks + 1):
@@ -485,16 +508,6 @@ def export_weekend_to_excel(
         
     ws.freeze_panes = "B2"
     
-    # Process data
-    w_map = {}
-    for a in result.assignments:
-        # map "Sat"->"Sam", "Sun"->"Dim" for consistency if needed, but here we use English keys from solver
-        # Solver uses "Sat", "Sun"
-        key = (a.person.name, a.week, a.day) # day is Sat/Sun
-        if key not in w_map:
-            w_map[key] = []
-        w_map[key].append(a.shift)
-
     eligible_people = sorted([p for p in people if p.available_weekends], key=lambda p: p.name)
     
     for r, p in enumerate(eligible_people, start=2):
@@ -504,10 +517,12 @@ def export_weekend_to_excel(
         shifts_24h = 0
         
         col_idx = 4
+        p_idx = result.person_index.get(p.name)
         for w in range(1, num_weeks + 1):
-            for d_solver in ["Sat", "Sun"]:
-                shifts = w_map.get((p.name, w, d_solver), [])
-                shifts.sort()
+            for d_idx in range(len(days)):
+                shifts = []
+                if p_idx is not None and w <= result.num_weeks:
+                    shifts = [s for s_idx, s in enumerate(WEEKEND_SHIFTS) if result.grid[p_idx, w - 1, d_idx, s_idx]]
                 val = "+".join(shifts)
                 
                 cell = ws.cell(row=r, column=col_idx, value=val)
@@ -544,6 +559,104 @@ def export_weekend_to_excel(
     logger.info("Weekend export complete.")
 
 
+def _merged_person_day_map(
+    weekday_schedule: PairSchedule,
+    weekend_result: Optional[WeekendResult],
+) -> Dict[Tuple[str, int, str], str]:
+    """(person, week, day) -> shift code; weekend D and N on one day give "D+N"."""
+    full_map = weekday_schedule.get_person_day_matrix()
+    if weekend_result:
+        for a in weekend_result.assignments:
+            key = (a.person.name, a.week, a.day)
+            existing = full_map.get(key, "")
+            if existing:
+                full_map[key] = f"{existing}+{a.shift}"
+            else:
+                full_map[key] = a.shift
+    return full_map
+
+
+def _merged_dashboard_rows(
+    weekday_schedule: PairSchedule,
+    weekend_result: Optional[WeekendResult],
+    people: List[Person],
+    edo_plan: EDOPlan,
+    validation: Optional[ValidationResult],
+    staffing: Optional[Dict],
+    config: Dict[str, Any],
+) -> List[Tuple[list, bool]]:
+    """Rows of the merged 'Tableau de bord' sheet below its header: (values, is_section_title)."""
+    weeks = weekday_schedule.weeks
+    rows: List[Tuple[list, bool]] = []
+    
+    # General KPIs
+    rows.append((["Effectif", len(people)], False))
+    rows.append((["Semaines", weeks], False))
+    rows.append((["Score interne", f"{weekday_schedule.score:.2f}" if weekday_schedule.score else "N/A"], False))
+    rows.append((["Temps résolution", f"{weekday_schedule.solve_time_seconds:.1f}s" if weekday_schedule.solve_time_seconds else "N/A"], False))
+    
+    # Validation section
+    rows.append(([], False))  # Empty row
+    rows.append((["--- Validation ---", ""], True))
+    
+    if validation:
+        rows.append((["Slots vides", validation.slots_vides], False))
+        incomplete = sum(1 for v in validation.violations if v.type == "incomplete_pair")
+        rows.append((["Paires incomplètes", incomplete], False))
+        rows.append((["Violations Nuit→Travail", validation.nuit_suivie_travail], False))
+        rows.append((["Transitions Soir→Jour", validation.soir_vers_jour], False))
+        rows.append((["Violations 48h", validation.rolling_48h_violations], False))
+    else:
+        rows.append((["(Validation non disponible)", ""], False))
+    
+    # Capacity Analysis section
+    if staffing and edo_plan:
+        rows.append(([], False))
+        rows.append((["--- Analyse Capacité ---", ""], True))
+        
+        try:
+            from rota.solver.capacity import calculate_capacity
+            cap = calculate_capacity(weekday_schedule, people, staffing, edo_plan)
+            
+            rows.append((["Capacité équipe (jours)", cap.net_capacity], False))
+            rows.append((["Besoins totaux (shifts)", cap.total_required_person_shifts], False))
+            rows.append((["Affectés (shifts)", cap.total_assigned_person_shifts], False))
+            rows.append((["Balance", cap.capacity_balance], False))
+            rows.append((["Utilisation (%)", f"{cap.utilization_percent:.1f}%"], False))
+            
+            # Per-shift breakdown
+            for shift, data in cap.by_shift.items():
+                shift_name = {"D": "Jour", "S": "Soir", "N": "Nuit"}.get(shift, shift)
+                gap = data["gap"]
+                status = "OK" if gap <= 0 else f"Manque {gap}"
+                rows.append(([f"  {shift_name}: Requis/Affectés/Écart", f"{data['required']}/{data['assigned']}/{status}"], False))
+            
+            # Recommendation
+            if cap.agents_needed > 0.5:
+                rows.append((["⚠️ Agents supplémentaires requis", f"+{cap.agents_needed:.1f}"], False))
+            elif cap.excess_agent_days > 10:
+                rows.append((["✅ Marge disponible (jours-agent)", f"{cap.excess_agent_days:.0f}"], False))
+        except Exception as e:
+            rows.append((["(Erreur analyse capacité)", str(e)], False))
+    
+    # Weekend section (if enabled)
+    if weekend_result and weekend_result.assignments:
+        rows.append(([], False))
+        rows.append((["--- Week-end ---", ""], True))
+        rows.append((["Assignations WE", len(weekend_result.assignments)], False))
+        rows.append((["Statut WE", weekend_result.status], False))
+
+    
+    # Options section
+    rows.append(([], False))
+    rows.append((["--- Options ---", ""], True))
+    rows.append((["EDO activé", "Oui" if config.get("edo_enabled") else "Non"], False))
+    rows.append((["Nuits max séquence", config.get("max_nights_sequence", "N/A")], False))
+    rows.append((["Mode équité", config.get("fairness_mode", "N/A")], False))
+    rows.append((["Seed", config.get("seed", "N/A")], False))
+    return rows
+
+
 def export_merged_calendar(
     weekday_schedule: PairSchedule,
     weekend_result: WeekendResult,
@@ -605,75 +718,12 @@ def export_merged_calendar(
         cell.fill = fill_header
         cell.alignment = align_center
     
-    # General KPIs
-    ws_tdb.append(["Effectif", len(people)])
-    ws_tdb.append(["Semaines", weeks])
-    ws_tdb.append(["Score interne", f"{weekday_schedule.score:.2f}" if weekday_schedule.score else "N/A"])
-    ws_tdb.append(["Temps résolution", f"{weekday_schedule.solve_time_seconds:.1f}s" if weekday_schedule.solve_time_seconds else "N/A"])
-    
-    # Validation section
-    ws_tdb.append([])  # Empty row
-    ws_tdb.append(["--- Validation ---", ""])
-    ws_tdb[ws_tdb.max_row][0].font = font_bold
-    
-    if validation:
-        ws_tdb.append(["Slots vides", validation.slots_vides])
-        incomplete = sum(1 for v in validation.violations if v.type == "incomplete_pair")
-        ws_tdb.append(["Paires incomplètes", incomplete])
-        ws_tdb.append(["Violations Nuit→Travail", validation.nuit_suivie_travail])
-        ws_tdb.append(["Transitions Soir→Jour", validation.soir_vers_jour])
-        ws_tdb.append(["Violations 48h", validation.rolling_48h_violations])
-    else:
-        ws_tdb.append(["(Validation non disponible)", ""])
-    
-    # Capacity Analysis section
-    if staffing and edo_plan:
-        ws_tdb.append([])
-        ws_tdb.append(["--- Analyse Capacité ---", ""])
-        ws_tdb[ws_tdb.max_row][0].font = font_bold
-        
-        try:
-            from rota.solver.capacity import calculate_capacity
-            cap = calculate_capacity(weekday_schedule, people, staffing, edo_plan)
-            
-            ws_tdb.append(["Capacité équipe (jours)", cap.net_capacity])
-            ws_tdb.append(["Besoins totaux (shifts)", cap.total_required_person_shifts])
-            ws_tdb.append(["Affectés (shifts)", cap.total_assigned_person_shifts])
-            ws_tdb.append(["Balance", cap.capacity_balance])
-            ws_tdb.append(["Utilisation (%)", f"{cap.utilization_percent:.1f}%"])
-            
-            # Per-shift breakdown
-            for shift, data in cap.by_shift.items():
-                shift_name = {"D": "Jour", "S": "Soir", "N": "Nuit"}.get(shift, shift)
-                gap = data["gap"]
-                status = "OK" if gap <= 0 else f"Manque {gap}"
-                ws_tdb.append([f"  {shift_name}: Requis/Affectés/Écart", f"{data['required']}/{data['assigned']}/{status}"])
-            
-            # Recommendation
-            if cap.agents_needed > 0.5:
-                ws_tdb.append(["⚠️ Agents supplémentaires requis", f"+{cap.agents_needed:.1f}"])
-            elif cap.excess_agent_days > 10:
-                ws_tdb.append(["✅ Marge disponible (jours-agent)", f"{cap.excess_agent_days:.0f}"])
-        except Exception as e:
-            ws_tdb.append(["(Erreur analyse capacité)", str(e)])
-    
-    # Weekend section (if enabled)
-    if weekend_result and weekend_result.assignments:
-        ws_tdb.append([])
-        ws_tdb.append(["--- Week-end ---", ""])
-        ws_tdb[ws_tdb.max_row][0].font = font_bold
-        ws_tdb.append(["Assignations WE", len(weekend_result.assignments)])
-        ws_tdb.append(["Statut WE", weekend_result.status])
-
-    
-    # Options section
-    ws_tdb.append([])
-    ws_tdb.append(["--- Options ---", ""])
-    ws_tdb[ws_tdb.max_row][0].font = font_bold
-    ws_tdb.append(["EDO activé", "Oui" if config.get("edo_enabled") else "Non"])
-    ws_tdb.append(["Nuits max séquence", config.get("max_nights_sequence", "N/A")])
-    ws_tdb.append(["Mode équité", config.get("fairness_mode", "N/A")])
-    ws_tdb.append(["Seed", config.get("seed", "N/A")])
+    for row, is_title in _merged_dashboard_rows(
+        weekday_schedule, weekend_result, people, edo_plan, validation, staffing, config
+    ):
+        ws_tdb.append(row)
+        if is_title:
+            ws_tdb[ws_tdb.max_row][0].font = font_bold
     
     # Column widths
     ws_tdb.column_dimensions["A"].width = 25
@@ -684,26 +734,7 @@ def export_merged_calendar(
     # ============================================================
     ws_mgr = wb.create_sheet("Vue Manager")
     
-    # Build Map
-    full_map = {}  # (person, week, day) -> code
-    
-    # Weekday
-    for a in weekday_schedule.assignments:
-        code = a.shift  # "D", "N", "S"
-        if a.person_a:
-            full_map[(a.person_a, a.week, a.day)] = code
-        if a.person_b:
-            full_map[(a.person_b, a.week, a.day)] = code
-            
-    # Weekend
-    if weekend_result:
-        for a in weekend_result.assignments:
-            key = (a.person.name, a.week, a.day)
-            existing = full_map.get(key, "")
-            if existing:
-                full_map[key] = f"{existing}+{a.shift}"
-            else:
-                full_map[key] = a.shift
+    full_map = _merged_person_day_map(weekday_schedule, weekend_result)
 
     # Headers for Manager View
     ws_mgr.cell(row=1, column=1, value="Nom").font = font_bold
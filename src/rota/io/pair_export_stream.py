@@ -0,0 +1,522 @@
+"""
+Streaming Excel Export
+======================
+Write-only variants of pair_export.export_merged_calendar and
+pair_export.export_pairs_to_excel.
+
+The in-memory exporters keep every styled Cell of every sheet until save,
+which for 60 people x 52 weeks (plus one Perso_ sheet per person) costs
+tens of seconds and hundreds of MB. These exporters write the same sheets,
+values and formatting through openpyxl's write-only workbook:
+- rows are appended once, in final sheet order, and flushed to disk
+- cells are WriteOnlyCell objects carrying a named style; each style is
+  registered once per workbook on first use (StyleCache) instead of
+  building Font/PatternFill/Border objects per cell
+"""
+import io
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+from rota.io.pair_export import (
+    GAP_HEADERS,
+    PAIR_SHIFT_ROWS,
+    _merged_dashboard_rows,
+    _merged_person_day_map,
+    _pairs_by_slot,
+    _pairs_gap_rows,
+    _pairs_kpis,
+    _pairs_person_day_map,
+)
+from rota.io.pair_export_utils import COLORS
+from rota.models.person import Person
+from rota.solver.edo import EDOPlan
+from rota.solver.pairs import PairSchedule
+from rota.solver.staffing import JOURS
+from rota.solver.stats import calculate_person_stats
+from rota.solver.validation import FairnessMetrics, ValidationResult
+from rota.solver.weekend import WEEKEND_DAYS, WeekendResult
+from rota.utils.logging_setup import get_logger
+
+logger = get_logger("rota.io.pair_export_stream")
+
+
+def _fill(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+_GREY_THIN = Side(style="thin", color="CCCCCC")
+_BLACK_DOUBLE = Side(style="double", color="000000")
+_BORDER_GREY = Border(left=_GREY_THIN, right=_GREY_THIN, top=_GREY_THIN, bottom=_GREY_THIN)
+_BORDER_WEEK = Border(left=_BLACK_DOUBLE, right=_GREY_THIN, top=_GREY_THIN, bottom=_GREY_THIN)
+_BORDER_WEEK_END = Border(left=_GREY_THIN, right=_BLACK_DOUBLE, top=_GREY_THIN, bottom=_GREY_THIN)
+_CENTER = Alignment(horizontal="center", vertical="center")
+
+# Calendar cell fills (same colors as export_merged_calendar)
+_FILLS = {
+    "day": _fill("DDEEFF"),
+    "night": _fill("E6CCFF"),
+    "solo": _fill("FFDDAA"),
+    "24h": _fill("FFCCAA"),
+}
+
+# Matrice cell fills (pair_export_utils.COLORS), by style-name suffix
+_MATRIX_FILLS = {code.lower().replace("*", "_conflict"): _fill(color) for code, color in COLORS.items()}
+
+# Border of a Matrice / ParPoste_Statique cell by its place in the week
+_WEEK_POSITIONS = {"first": _BORDER_WEEK, "mid": _BORDER_GREY, "last": _BORDER_WEEK_END}
+
+
+def _styled(base: str, fill: Optional[str]) -> str:
+    return f"{base}_{fill}" if fill else base
+
+
+def _style_specs() -> Dict[str, Dict[str, Any]]:
+    """Named style name -> NamedStyle attributes."""
+    bold = Font(bold=True)
+    specs = {
+        "rota_bold": {"font": bold},
+        "rota_title": {"font": Font(size=14, bold=True)},
+        "rota_header": {"font": Font(bold=True, color="FFFFFF"), "fill": _fill("4472C4"), "alignment": _CENTER},
+        "rota_header_plain": {"font": Font(bold=True, color="FFFFFF"), "fill": _fill("4472C4")},
+        "rota_bold_center": {"font": bold, "alignment": _CENTER},
+        "rota_name": {"font": bold, "border": _BORDER_GREY},
+        "rota_day_label": {"alignment": _CENTER, "border": _BORDER_GREY},
+        "rota_weekend_label": {"font": Font(bold=True, color="FF0000"), "alignment": _CENTER, "border": _BORDER_GREY},
+        "rota_total": {"font": bold, "alignment": _CENTER, "border": _BORDER_GREY},
+        "rota_negative": {"font": Font(color="FF0000", bold=True)},
+        "rota_positive": {"font": Font(color="00AA00", bold=True)},
+        "rota_summary": {"font": bold, "fill": _fill("E0E0E0")},
+        "rota_summary_plain": {"fill": _fill("E0E0E0")},
+    }
+    left = Alignment(horizontal="left", vertical="center")
+    specs.update({
+        "rota_head_first": {"font": bold, "alignment": _CENTER, "border": Border(left=_BLACK_DOUBLE)},
+        "rota_head_last": {"font": bold, "alignment": _CENTER, "border": Border(right=_BLACK_DOUBLE)},
+        "rota_week_end": {"border": Border(right=_BLACK_DOUBLE)},
+        "rota_header_dark": {"font": Font(bold=True, color="FFFFFF"), "fill": _fill("333333")},
+        "rota_header_red": {"font": Font(bold=True, color="FFFFFF"), "fill": _fill("FF4444")},
+        "rota_critical": {"fill": _fill("FF4444")},
+        "rota_warning": {"fill": _fill("FFCC00")},
+    })
+    for pos, border in _WEEK_POSITIONS.items():
+        specs[f"rota_pp_{pos}"] = {"alignment": left, "border": border}
+        for fill in [None] + list(_MATRIX_FILLS):
+            extra = {"fill": _MATRIX_FILLS[fill]} if fill else {}
+            specs[_styled(f"rota_mx_{pos}", fill)] = {"alignment": _CENTER, "border": border, **extra}
+    for fill in [None] + list(_FILLS):
+        suffix = f"_{fill}" if fill else ""
+        extra = {"fill": _FILLS[fill]} if fill else {}
+        specs[f"rota_cal{suffix}"] = {"alignment": _CENTER, "border": _BORDER_GREY, **extra}
+        specs[f"rota_cal_week{suffix}"] = {"alignment": _CENTER, "border": _BORDER_WEEK, **extra}
+        specs[f"rota_perso{suffix}"] = {"alignment": _CENTER, **extra}
+    return specs
+
+
+class StyleCache:
+    """
+    Named styles of one workbook, registered on first use.
+
+    Cells only store the style name, so the workbook holds one style record
+    per name however many cells use it.
+    """
+
+    def __init__(self, wb: Workbook):
+        self.wb = wb
+        self._specs = _style_specs()
+        self._registered = set()
+
+    def __call__(self, name: str) -> str:
+        if name not in self._registered:
+            self.wb.add_named_style(NamedStyle(name=name, **self._specs[name]))
+            self._registered.add(name)
+        return name
+
+
+class _SheetWriter:
+    """Appends rows of (value, style name) to a write-only worksheet."""
+
+    def __init__(self, ws, styles: StyleCache):
+        self.ws = ws
+        self.styles = styles
+        self.rows = 0
+
+    def cell(self, value: Any, style: Optional[str] = None):
+        if style is None:
+            return value
+        c = WriteOnlyCell(self.ws, value=value)
+        c.style = self.styles(style)
+        return c
+
+    def append(self, values: List[Any], style: Optional[str] = None, first: Optional[str] = None) -> None:
+        """Append a row; style applies to every cell, first (if given) to the first cell."""
+        row = [self.cell(v, style) for v in values]
+        if first is not None and row:
+            row[0] = self.cell(values[0], first)
+        self.ws.append(row)
+        self.rows += 1
+
+
+def _manager_fill(val: str, weekend: bool) -> Optional[str]:
+    if val == "N":
+        return "night"
+    if val == "D":
+        return "solo" if weekend else "day"
+    if val == "S":
+        return "solo"
+    if "N" in val and "D" in val:
+        return "24h"
+    return None
+
+
+def _perso_fill(val: str) -> Optional[str]:
+    if val == "N":
+        return "night"
+    if val == "D":
+        return "day"
+    if val == "S":
+        return "solo"
+    if "N" in val:
+        return "24h"
+    return None
+
+
+def export_merged_calendar_streaming(
+    weekday_schedule: PairSchedule,
+    weekend_result: WeekendResult,
+    people: List[Person],
+    edo_plan: EDOPlan,
+    output: Union[str, Path, io.BytesIO],
+    validation: Optional[ValidationResult] = None,
+    fairness: Optional[FairnessMetrics] = None,
+    staffing: Optional[Dict] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Export the merged calendar with a write-only workbook.
+
+    Same arguments, sheets (in their final order) and cell values as
+    pair_export.export_merged_calendar.
+    """
+    logger.info("Exporting merged calendar (streaming)")
+
+    weeks = weekday_schedule.weeks
+    config = config or {}
+    days_all = JOURS + WEEKEND_DAYS
+    has_weekend = bool(weekend_result and weekend_result.assignments)
+
+    wb = Workbook(write_only=True)
+    styles = StyleCache(wb)
+    full_map = _merged_person_day_map(weekday_schedule, weekend_result)
+    active_people = sorted(p.name for p in people if p.workdays_per_week > 0)
+
+    def sheet(title: str, widths: Optional[Dict[str, float]] = None) -> _SheetWriter:
+        ws = wb.create_sheet(title)
+        for col, width in (widths or {}).items():
+            ws.column_dimensions[col].width = width
+        return _SheetWriter(ws, styles)
+
+    # --- 0. Tableau de bord ---
+    tdb = sheet("Tableau de bord", {"A": 25, "B": 20})
+    tdb.append(["Indicateur", "Valeur"], "rota_header")
+    for row, is_title in _merged_dashboard_rows(
+        weekday_schedule, weekend_result, people, edo_plan, validation, staffing, config
+    ):
+        tdb.append(row, first="rota_bold" if is_title else None)
+
+    # --- 1. Vue Manager ---
+    mgr = sheet("Vue Manager")
+    week_cols = len(days_all)
+    totals_col = 2 + weeks * week_cols
+    for w in range(weeks):
+        start = 2 + w * week_cols
+        mgr.ws.merged_cells.add(f"{get_column_letter(start)}1:{get_column_letter(start + week_cols - 1)}1")
+    mgr.ws.merged_cells.add(f"{get_column_letter(totals_col)}1:{get_column_letter(totals_col + 3)}1")
+    mgr.ws.freeze_panes = "B3"
+
+    top = [mgr.cell("Nom", "rota_bold")]
+    for w in range(1, weeks + 1):
+        top += [mgr.cell(f"Semaine {w}", "rota_bold_center")] + [None] * (week_cols - 1)
+    top.append(mgr.cell("Totaux Période", "rota_bold_center"))
+    mgr.ws.append(top)
+
+    labels = [mgr.cell("Nom", "rota_bold")]
+    for _ in range(weeks):
+        labels += [mgr.cell(d, "rota_weekend_label" if d in WEEKEND_DAYS else "rota_day_label") for d in days_all]
+    labels += [mgr.cell(h, "rota_total") for h in ["Total J", "Total N", "Total S", "Total WE"]]
+    mgr.ws.append(labels)
+
+    end_col_char = get_column_letter(totals_col - 1)
+    for r, name in enumerate(active_people, start=3):
+        row = [mgr.cell(name, "rota_name")]
+        for w in range(1, weeks + 1):
+            for d_idx, d in enumerate(days_all):
+                val = full_map.get((name, w, d), "")
+                base = "rota_cal_week" if d_idx == 0 else "rota_cal"
+                row.append(mgr.cell(val, _styled(base, _manager_fill(val, d in WEEKEND_DAYS))))
+        range_str = f"B{r}:{end_col_char}{r}"
+        we_formula = (
+            f'=SUMPRODUCT((MOD(COLUMN({range_str})-2,7)>=5)*'
+            f'(ISNUMBER(SEARCH("D",{range_str}))+ISNUMBER(SEARCH("N",{range_str}))+ISNUMBER(SEARCH("S",{range_str}))))'
+        )
+        row += [
+            mgr.cell(f'=COUNTIF({range_str}, "*D*")', "rota_total"),
+            mgr.cell(f'=COUNTIF({range_str}, "*N*")', "rota_total"),
+            mgr.cell(f'=COUNTIF({range_str}, "*S*")', "rota_total"),
+            mgr.cell(we_formula, "rota_total"),
+        ]
+        mgr.ws.append(row)
+
+    # --- 2. Synthèse (written before the Perso_ tabs to keep the sheet order) ---
+    syn = sheet("Synthèse", {"A": 20})
+    if has_weekend:
+        headers = ["Nom", "Jours", "Soirs", "Nuits", "Admin", "Total (Sem)", "Cible", "Écart", "Nb_EDO", "WE Shifts", "Total+WE"]
+    else:
+        headers = ["Nom", "Jours", "Soirs", "Nuits", "Admin", "Total", "Cible", "Écart", "Nb_EDO"]
+    syn.append(headers, "rota_header")
+
+    counts = {name: {"D": 0, "S": 0, "N": 0} for name in active_people}
+    for (name, _, day), val in full_map.items():
+        if name in counts and day not in WEEKEND_DAYS:
+            for code in counts[name]:
+                if code in val:
+                    counts[name][code] += 1
+    we_counts: Dict[str, int] = {}
+    if has_weekend:
+        for a in weekend_result.assignments:
+            we_counts[a.person.name] = we_counts.get(a.person.name, 0) + 1
+
+    for p in sorted(people, key=lambda x: x.name):
+        if p.workdays_per_week == 0:
+            continue
+        jours, soirs, nuits = counts[p.name]["D"], counts[p.name]["S"], counts[p.name]["N"]
+        admin = 0  # Not currently tracked
+        total_sem = jours + soirs + nuits + admin
+        edo_weeks = sum(1 for w in range(1, weeks + 1) if p.name in edo_plan.plan.get(w, set()))
+        cible = p.workdays_per_week * weeks - edo_weeks
+        ecart = total_sem - cible
+        row = [p.name, jours, soirs, nuits, admin, total_sem, cible, ecart, edo_weeks]
+        if has_weekend:
+            we_shifts = we_counts.get(p.name, 0)
+            row += [we_shifts, total_sem + we_shifts]
+        if ecart != 0:
+            row[7] = syn.cell(ecart, "rota_negative" if ecart < 0 else "rota_positive")  # Écart (column H)
+        syn.append(row)
+
+    last = syn.rows
+    summary = [syn.cell("TOTAL", "rota_summary")]
+    for col_idx in range(2, 12 if has_weekend else 10):
+        col_letter = get_column_letter(col_idx)
+        if has_weekend or col_idx <= 8:
+            summary.append(syn.cell(f"=SUM({col_letter}2:{col_letter}{last})", "rota_summary"))
+        else:
+            summary.append(syn.cell(None, "rota_summary"))
+    syn.ws.append(summary)
+
+    # --- 3. Perso_ tabs ---
+    for name in active_people:
+        safe_name = name.replace("/", "-").replace("\\", "-")[:20]
+        perso = sheet(f"Perso_{safe_name}", {get_column_letter(col): 12 for col in range(1, 9)})
+        perso.append([f"Planning: {name}"], first="rota_title")
+        perso.append([])
+        perso.append(["Semaine"] + days_all, "rota_bold")
+        for w in range(1, weeks + 1):
+            row = [perso.cell(f"S{w}", "rota_bold")]
+            for d in days_all:
+                val = full_map.get((name, w, d), "")
+                row.append(perso.cell(val, _styled("rota_perso", _perso_fill(val))))
+            perso.ws.append(row)
+
+    # --- 4. Technique ---
+    tech = sheet("Technique", {"A": 25, "B": 15, "C": 15})
+    tech.append(["Métrique", "Valeur"], "rota_header_plain")
+    if validation:
+        tech.append(["Slots_vides", validation.slots_vides])
+        tech.append(["doublons_jour", validation.doublons_jour])
+        tech.append(["Nuit_suivie_travail", validation.nuit_suivie_travail])
+        tech.append(["Soir_vers_Jour", validation.soir_vers_jour])
+        tech.append(["Ecarts_hebdo_jours", validation.ecarts_hebdo_jours])
+        tech.append(["Ecarts_horizon_personnes", validation.ecarts_horizon_personnes])
+        tech.append(["Violations_48h", validation.rolling_48h_violations])
+    tech.append([])
+    tech.append(["Équité par cohorte", ""], first="rota_bold")
+    tech.append(["Cohorte", "σ Nuits", "σ Soirs"], "rota_bold")
+    if fairness:
+        for cohort, night_std in fairness.night_std_by_cohort.items():
+            eve_std = fairness.eve_std_by_cohort.get(cohort, 0)
+            tech.append([cohort, f"{night_std:.2f}", f"{eve_std:.2f}"])
+
+    # --- 5. Week-end ---
+    if has_weekend:
+        we = sheet("Week-end", {col: 30 for col in ["B", "C", "D", "E"]})
+        we.append(["Semaine", "Sam J", "Sam N", "Dim J", "Dim N"], "rota_bold_center")
+        for w in range(1, weeks + 1):
+            we.append([f"S{w}"] + [
+                ", ".join(weekend_result.get_slot_people(w, d, s) or ["-"])
+                for d in WEEKEND_DAYS for s in ("D", "N")
+            ])
+
+    # --- 6. Manques (Gaps) ---
+    gap_types = {"unfilled_slot", "incomplete_pair"}
+    gaps = [v for v in (validation.violations if validation else []) if v.type in gap_types]
+    if gaps:
+        type_labels = {"unfilled_slot": "Slot vide", "incomplete_pair": "Paire incomplète"}
+        ws_gaps = sheet("Manques (Gaps)", {"E": 50})
+        ws_gaps.append(["Semaine", "Jour", "Poste", "Type", "Message"], "rota_bold")
+        for v in gaps:
+            ws_gaps.append([v.week, v.day, v.shift, type_labels.get(v.type, v.type), v.message])
+
+    # --- 7. Violations ---
+    if validation and validation.violations:
+        viol = sheet("Violations", {"G": 60})
+        viol.append(["Type", "Sévérité", "Semaine", "Jour", "Poste", "Personne", "Message"], "rota_bold")
+        for v in validation.violations:
+            viol.append([v.type, v.severity, v.week, v.day, v.shift, v.person, v.message])
+
+    wb.save(output)
+    logger.info(f"Streaming merged export complete: {len(active_people)} people, {weeks} weeks")
+
+
+def _week_position(d_idx: int, days: List[str]) -> str:
+    if d_idx == 0:
+        return "first"
+    return "last" if d_idx == len(days) - 1 else "mid"
+
+
+def _week_header_rows(writer: _SheetWriter, weeks: int, days: List[str]) -> None:
+    """SEMAINE n (merged) and day rows, with the double border around each week."""
+    top, labels = [None], [None]
+    for w in range(1, weeks + 1):
+        start = 2 + (w - 1) * len(days)
+        writer.ws.merged_cells.add(f"{get_column_letter(start)}1:{get_column_letter(start + len(days) - 1)}1")
+        top += [writer.cell(f"SEMAINE {w}", "rota_head_first")] + [None] * (len(days) - 2)
+        top.append(writer.cell(None, "rota_week_end"))
+        for d_idx, d in enumerate(days):
+            pos = _week_position(d_idx, days)
+            labels.append(writer.cell(d, {"first": "rota_head_first", "last": "rota_head_last"}.get(pos, "rota_bold_center")))
+    writer.ws.append(top)
+    writer.ws.append(labels)
+    writer.rows += 2
+
+
+def export_pairs_to_excel_streaming(
+    schedule: PairSchedule,
+    people: List[Person],
+    edo_plan: EDOPlan,
+    output: Union[str, Path, io.BytesIO],
+    validation: Optional[ValidationResult] = None,
+    fairness: Optional[FairnessMetrics] = None,
+    config: Optional[Dict[str, Any]] = None,
+    staffing: Optional[Dict] = None,
+    days: List[str] = JOURS,
+    team_borders: bool = False,
+) -> None:
+    """
+    Export the weekday schedule with a write-only workbook.
+
+    Same arguments, sheets (in their final order) and cell values as
+    pair_export.export_pairs_to_excel.
+    """
+    logger.info(f"Exporting {len(schedule.assignments)} assignments to Excel (streaming)")
+
+    weeks = schedule.weeks
+    config = config or {}
+    names = sorted(p.name for p in people)
+    works_on = _pairs_person_day_map(schedule, names, edo_plan, days)
+    grid_cols = 1 + weeks * len(days)
+
+    wb = Workbook(write_only=True)
+    styles = StyleCache(wb)
+
+    def sheet(title: str, widths: Dict[str, float], freeze: Optional[str] = None) -> _SheetWriter:
+        ws = wb.create_sheet(title)
+        for col, width in widths.items():
+            ws.column_dimensions[col].width = width
+        if freeze:
+            ws.freeze_panes = freeze
+        return _SheetWriter(ws, styles)
+
+    def columns(n: int, width: float) -> Dict[str, float]:
+        return {get_column_letter(i): width for i in range(1, n + 1)}
+
+    # --- Tableau de bord ---
+    kpis = _pairs_kpis(schedule, validation)
+    tdb = sheet("Tableau de bord", columns(4, 25))
+    tdb.append(["Indicateur", "Valeur"], "rota_bold")
+    for label, val in kpis:
+        tdb.append([label, val])
+    if config:
+        tdb.append([])
+        tdb.append(["Options"], first="rota_bold")
+        for k, v in config.items():
+            tdb.append([k, str(v)])
+
+    # --- Matrice ---
+    mx = sheet("Matrice", columns(grid_cols, 14), freeze="B3")
+    _week_header_rows(mx, weeks, days)
+    for name in names:
+        row = [name]
+        for w in range(1, weeks + 1):
+            for d_idx, d in enumerate(days):
+                val = works_on.get((name, w, d), "OFF")
+                fill = val.lower().replace("*", "_conflict") if val in COLORS else None
+                row.append(mx.cell(val, _styled(f"rota_mx_{_week_position(d_idx, days)}", fill)))
+        mx.ws.append(row)
+
+    # --- Synthèse ---
+    syn_headers = ["Nom", "Jours", "Soirs", "Nuits", "Admin", "Total_Jours", "Cible", "Écart", "Nb_EDO"]
+    syn = sheet("Synthèse", columns(len(syn_headers), 14), freeze="A2")
+    syn.append(syn_headers, "rota_bold")
+    for ps in sorted(calculate_person_stats(schedule, people, edo_plan), key=lambda x: x.name):
+        syn.append([ps.name, ps.jours, ps.soirs, ps.nuits, ps.admin, ps.total, ps.target, ps.delta, ps.edo_weeks])
+
+    # --- ParPoste_Statique ---
+    pp = sheet("ParPoste_Statique", columns(grid_cols, 20), freeze="B3")
+    _week_header_rows(pp, weeks, days)
+    pairs_by = _pairs_by_slot(schedule)
+    for label, shift in PAIR_SHIFT_ROWS:
+        row = [pp.cell(label, "rota_bold")]
+        for w in range(1, weeks + 1):
+            for d_idx, d in enumerate(days):
+                row.append(pp.cell(pairs_by.get((w, d, shift), ""), f"rota_pp_{_week_position(d_idx, days)}"))
+        pp.ws.append(row)
+
+    # --- Technique ---
+    tech = sheet("Technique", columns(5, 18))
+    if validation:
+        val_data = validation.as_dict()
+        tech.append(list(val_data), "rota_bold")
+        tech.append(list(val_data.values()))
+    if fairness:
+        while tech.rows < 3:
+            tech.append([])
+        tech.append(["Équité par cohorte"], first="rota_bold")
+        tech.append(["Cohorte", "σ Nuits", "σ Soirs"], "rota_bold")
+        for cid, std_n in fairness.night_std_by_cohort.items():
+            std_e = fairness.eve_std_by_cohort.get(cid, 0.0)
+            tech.append([cid, f"{std_n:.2f}", f"{std_e:.2f}"])
+
+    # --- Gaps ---
+    gaps_data = _pairs_gap_rows(schedule, staffing, days) if staffing else []
+    if gaps_data:
+        gaps = sheet("Gaps", columns(len(GAP_HEADERS), 20), freeze="A2")
+        gaps.append(GAP_HEADERS, "rota_header_red")
+        for row in gaps_data:
+            gaps.append([row[h] for h in GAP_HEADERS])
+        total = sum(g["Personnes à recruter"] for g in gaps_data)
+        gaps.ws.append([gaps.cell("TOTAL", "rota_bold"), None, None, None, gaps.cell(total, "rota_bold")])
+
+    # --- Violations ---
+    if validation and validation.violations:
+        viol = sheet("Violations", columns(6, 18), freeze="A2")
+        viol.append(["Sévérité", "Type", "Semaine", "Jour", "Personne", "Message"], "rota_header_dark")
+        for v in validation.violations:
+            severity = {"critical": "rota_critical", "warning": "rota_warning"}.get(v.severity)
+            viol.append([v.severity, v.type, v.week, v.day, v.person, v.message], severity)
+
+    wb.save(output)
+    logger.info(f"Streaming Excel export complete: {len(schedule.assignments)} assignments")
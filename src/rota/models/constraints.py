@@ -1,7 +1,7 @@
 """Solver configuration and constraint definitions."""
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .rules import RULES
 
@@ -42,6 +42,17 @@ class SolverConfig:
     num_workers: int = 4
     parallel_portfolio: bool = False  # If True, enables parallel seeds in optimizer
     workers_per_solve: int = 0 # If > 0, overrides internal CP-SAT worker count. 0 = Auto.
+    random_seed: Optional[int] = None  # CP-SAT random_seed for this solve (None = solver default)
+    search_profile: str = ""  # Named CP-SAT parameter profile (see solver.search_profiles)
+    portfolio_profiles: List[str] = field(default_factory=list)  # Profiles cycled across tries
+    target_score: Optional[float] = None  # Stop remaining tries once a score <= target is found
+    stop_on_optimal: bool = False  # Opt-in: stop remaining tries once a try proves optimality
+    rolling_block_weeks: int = 0  # If > 0 and < weeks, solve in rolling blocks of this many weeks
+    rolling_overlap_weeks: int = 1  # Weeks re-solved at the start of the next block
+    lns_time_seconds: float = 0.0  # If > 0, LNS improvement phase after the best try (see solver.lns)
+    lns_iteration_seconds: float = 2.0  # CP-SAT time limit of each LNS subproblem
+    break_symmetry: bool = False  # Order interchangeable people (see constraints.add_symmetry_breaking)
+    profile: bool = False  # Keep the CP-SAT search log for presolve timing (see solver.profiling)
     
     # Days to schedule
     include_weekends: bool = False
@@ -68,6 +79,8 @@ class SolverConfig:
     fairness_mode: FairnessMode = FairnessMode.BY_WORKDAYS
     night_fairness_weight: float = 10.0  # Weight for night distribution in objective
     evening_fairness_weight: float = 3.0  # Weight for evening distribution
+    # Per-term overrides of the CP-SAT objective weights (see solver.constraints.objectives.ObjectiveSpec)
+    objective_weights: Dict[str, int] = field(default_factory=dict)
     
     # Soft constraint weights
     preference_weight: float = 1.0  # Weight for honoring preferences
@@ -85,7 +98,7 @@ class SolverConfig:
 
     def to_dict(self) -> Dict:
         """Serialize to dictionary."""
-        return {
+        d = {
             "weeks": self.weeks,
             "time_limit_seconds": self.time_limit_seconds,
             "include_weekends": self.include_weekends,
@@ -101,6 +114,10 @@ class SolverConfig:
             "night_fairness_weight": self.night_fairness_weight,
             "evening_fairness_weight": self.evening_fairness_weight,
         }
+        # Only when set; unset terms use the ObjectiveSpec defaults
+        if self.objective_weights:
+            d["objective_weights"] = dict(self.objective_weights)
+        return d
 
 
     @classmethod
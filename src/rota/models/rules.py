@@ -39,6 +39,12 @@ class RulesConfig:
         "S": 1, 
         "N": 1,
     })
+    # Sat/Sun in the integrated 7-day model: one Jour pair, one Nuit pair
+    default_weekend_staffing: Dict[str, int] = field(default_factory=lambda: {
+        "D": 1,
+        "S": 0,
+        "N": 1,
+    })
     
     # Defaults
     default_weeks: int = 12
@@ -2,7 +2,7 @@
 from .edo import EDOPlan, build_edo_plan
 
 # Engine deleted
-from .pairs import PairAssignment, PairSchedule, solve_pairs
+from .pairs import PairAssignment, PairModel, PairSchedule, build_pairs_model, solve_pairs
 from .staffing import JOURS, WeekStaffing, derive_staffing
 from .stats import (
     PersonStats, 
@@ -19,6 +19,8 @@ from .validation import (
 
 __all__ = [
     "solve_pairs",
+    "build_pairs_model",
+    "PairModel",
     "PairSchedule", 
     "PairAssignment",
     "derive_staffing",
@@ -0,0 +1,191 @@
+"""
+Columnar Schedule Format
+========================
+Compact array representation of a PairSchedule and its binary encoding.
+
+A schedule is held as parallel NumPy columns, one row per assignment:
+- week (uint16)
+- day, shift (uint8 codes into the days / shifts tables)
+- slot (uint16)
+- person_a, person_b (int16 codes into the names table, -1 = empty)
+
+That is 10 bytes per assignment plus the name tables, against ~100 bytes of
+JSON per assignment. PairAssignment objects are only materialized when a
+schedule is decoded for use.
+
+Binary layout (little-endian):
+    MAGIC | header length (uint32) | header JSON | columns in COLUMN_DTYPES order
+
+The header keeps only the HEADER_STATS entries of schedule.stats; solver
+diagnostics (improvement traces, build profiles, LNS logs) are not stored.
+"""
+import json
+import struct
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from rota.solver.pairs import PairAssignment, PairSchedule
+
+MAGIC = b"RCS1"
+
+# Shift codes get stable low codes; unknown codes are appended per schedule
+DEFAULT_SHIFTS: List[str] = ["D", "N", "S", "A"]
+
+COLUMN_DTYPES: Dict[str, str] = {
+    "week": "<u2",
+    "day": "u1",
+    "shift": "u1",
+    "slot": "<u2",
+    "person_a": "<i2",
+    "person_b": "<i2",
+}
+
+# schedule.stats entries that round-trip through the header
+HEADER_STATS: Tuple[str, ...] = ("best_seed", "study_hash")
+
+
+@dataclass
+class ScheduleColumns:
+    """Assignments of a schedule as parallel arrays plus lookup tables."""
+    names: List[str]
+    days: List[str]
+    shifts: List[str]
+    week: np.ndarray
+    day: np.ndarray
+    shift: np.ndarray
+    slot: np.ndarray
+    person_a: np.ndarray
+    person_b: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.week)
+
+    @classmethod
+    def from_assignments(cls, assignments: Sequence[PairAssignment]) -> "ScheduleColumns":
+        """Encode a list of assignments (tables are built in first-seen order)."""
+        names: Dict[str, int] = {}
+        days: Dict[str, int] = {}
+        shifts: Dict[str, int] = {s: i for i, s in enumerate(DEFAULT_SHIFTS)}
+
+        def code(table: Dict[str, int], value: str) -> int:
+            if value not in table:
+                table[value] = len(table)
+            return table[value]
+
+        def person(name: str) -> int:
+            return code(names, name) if name else -1
+
+        n = len(assignments)
+        columns = {key: np.empty(n, dtype=dtype) for key, dtype in COLUMN_DTYPES.items()}
+        for i, a in enumerate(assignments):
+            columns["week"][i] = a.week
+            columns["day"][i] = code(days, a.day)
+            columns["shift"][i] = code(shifts, a.shift)
+            columns["slot"][i] = a.slot_idx
+            columns["person_a"][i] = person(a.person_a)
+            columns["person_b"][i] = person(a.person_b)
+
+        return cls(names=list(names), days=list(days), shifts=list(shifts), **columns)
+
+    def to_assignments(self) -> List[PairAssignment]:
+        """Materialize the PairAssignment view."""
+        names = self.names + [""]  # code -1 -> ""
+        days = self.days
+        shifts = self.shifts
+        return [
+            PairAssignment(week, days[d], shifts[s], slot, names[pa], names[pb])
+            for week, d, s, slot, pa, pb in zip(
+                self.week.tolist(), self.day.tolist(), self.shift.tolist(),
+                self.slot.tolist(), self.person_a.tolist(), self.person_b.tolist(),
+            )
+        ]
+
+    def shift_count_matrix(self) -> np.ndarray:
+        """
+        Shifts worked per person and shift code.
+
+        Returns:
+            int array of shape (len(names), len(shifts))
+        """
+        counts = np.zeros((len(self.names), len(self.shifts)), dtype=np.int32)
+        for people in (self.person_a, self.person_b):
+            mask = people >= 0
+            if people is self.person_b:
+                mask &= people != self.person_a
+            np.add.at(counts, (people[mask], self.shift[mask]), 1)
+        return counts
+
+
+def encode_schedule(schedule: PairSchedule) -> bytes:
+    """
+    Serialize a PairSchedule to the compact binary format.
+
+    Args:
+        schedule: Schedule to encode (HEADER_STATS values must be JSON-serializable)
+
+    Returns:
+        Encoded bytes
+    """
+    columns = ScheduleColumns.from_assignments(schedule.assignments)
+    header = json.dumps({
+        "weeks": schedule.weeks,
+        "people_count": schedule.people_count,
+        "status": schedule.status,
+        "score": schedule.score,
+        "solve_time_seconds": schedule.solve_time_seconds,
+        "stats": {key: schedule.stats[key] for key in HEADER_STATS if key in schedule.stats},
+        "names": columns.names,
+        "days": columns.days,
+        "shifts": columns.shifts,
+        "rows": len(columns),
+    }, ensure_ascii=False).encode("utf-8")
+
+    parts = [MAGIC, struct.pack("<I", len(header)), header]
+    parts.extend(getattr(columns, key).tobytes() for key in COLUMN_DTYPES)
+    return b"".join(parts)
+
+
+def decode_columns(data: bytes) -> Tuple[Dict, ScheduleColumns]:
+    """
+    Parse encoded bytes without materializing assignments.
+
+    Returns:
+        (header dict, ScheduleColumns)
+
+    Raises:
+        ValueError: If data is not in the columnar format
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a columnar schedule blob")
+    offset = len(MAGIC)
+    (header_len,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    header = json.loads(data[offset:offset + header_len].decode("utf-8"))
+    offset += header_len
+
+    rows = header["rows"]
+    arrays = {}
+    for key, dtype in COLUMN_DTYPES.items():
+        arrays[key] = np.frombuffer(data, dtype=dtype, count=rows, offset=offset)
+        offset += arrays[key].nbytes
+
+    columns = ScheduleColumns(
+        names=header["names"], days=header["days"], shifts=header["shifts"], **arrays
+    )
+    return header, columns
+
+
+def decode_schedule(data: bytes) -> PairSchedule:
+    """Rebuild a PairSchedule from encode_schedule() output."""
+    header, columns = decode_columns(data)
+    return PairSchedule(
+        assignments=columns.to_assignments(),
+        weeks=header["weeks"],
+        people_count=header["people_count"],
+        status=header["status"],
+        score=header["score"],
+        solve_time_seconds=header["solve_time_seconds"],
+        stats=header.get("stats", {}),
+    )
@@ -2,308 +2,415 @@
 Constraint Builders for CP-SAT Solver
 =====================================
 Extracted constraint logic from the monolithic solve_pairs() function.
-Each constraint builder takes the model, variables, and config, and adds constraints.
+Each constraint builder takes the model, the VariableStore, and config, and adds constraints.
+Variables are addressed by (person_idx, global_day_idx, shift_idx) through the store.
 """
-from typing import Dict, List, Tuple
+import dataclasses
+from typing import Dict, List, Optional, Tuple
 
 from ortools.sat.python import cp_model
 
-from rota.models.constraints import FairnessMode, SolverConfig
+from rota.models.constraints import SolverConfig
 from rota.models.person import Person
 from rota.models.rules import SHIFTS
 from rota.solver.edo import EDOPlan
-from rota.solver.staffing import WeekStaffing
+from rota.solver.profiling import profiled
+from rota.solver.staffing import WEEKEND_JOURS, WeekStaffing
+from rota.solver.variables import D_IDX, N_IDX, S_IDX, SHIFT_CODES, SHIFT_INDEX, VariableStore
 from rota.utils.logging_setup import SolverLogger
 
 slog = SolverLogger("rota.solver.constraints")
 
+LinearExpr = cp_model.LinearExpr
 
-# Type aliases for clarity
-AssignVars = Dict[str, Dict[int, Dict[str, Dict[str, cp_model.IntVar]]]]
-WorksVars = Dict[str, Dict[int, Dict[str, cp_model.IntVar]]]
+# Hours per shift, in SHIFT_CODES order
+SHIFT_HOURS = [SHIFTS[s].hours for s in SHIFT_CODES]
 
+# Person fields the weekday model never reads (besides the name)
+SYMMETRY_IGNORED_FIELDS = {"name", "available_weekends", "max_weekends_per_month"}
 
+
+def has_weekends(store: VariableStore) -> bool:
+    """True if the store models Sam/Dim (WeekendMode.INTEGRATED)."""
+    return any(d in store.day_pos for d in WEEKEND_JOURS)
+
+
+def slot_needs(day_slots: Dict[str, int]) -> Dict[str, int]:
+    """
+    People needed per shift on one day.
+
+    Day (D) and night (N) slots are pairs, soir (S) slots are solo; S is
+    omitted when the day has none.
+    """
+    needs = {"D": day_slots["D"] * 2, "N": day_slots["N"] * 2}
+    if day_slots.get("S", 0) > 0:
+        needs["S"] = day_slots["S"]
+    return needs
+
+
+@profiled
 def add_staffing_constraints(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     staffing: Dict[int, WeekStaffing],
 ) -> List[Tuple[cp_model.IntVar, str, int, str]]:
     """
     Add soft staffing constraints (allow unfilled slots).
-    
+
     Returns:
         List of (unfilled_var, shift, week, day) tuples for objective
     """
     slog.step("Constraint: Staffing requirements (Soft - allow gaps)")
     unfilled_vars = []
-    
-    for w in range(1, weeks + 1):
-        for d in days:
-            # Day shift (D): pairs need 2 people each
-            d_slots = staffing[w].slots[d]["D"]
-            d_people_needed = d_slots * 2
-            d_assigned = sum(assign[p][w][d]["D"] for p in names)
-            d_unfilled = model.NewIntVar(0, d_people_needed, f"unfilled_D_{w}_{d}")
-            model.Add(d_assigned + d_unfilled == d_people_needed)
-            unfilled_vars.append((d_unfilled, "D", w, d))
-            
-            # Night shift (N): pairs need 2 people each
-            n_slots = staffing[w].slots[d]["N"]
-            n_people_needed = n_slots * 2
-            n_assigned = sum(assign[p][w][d]["N"] for p in names)
-            n_unfilled = model.NewIntVar(0, n_people_needed, f"unfilled_N_{w}_{d}")
-            model.Add(n_assigned + n_unfilled == n_people_needed)
-            unfilled_vars.append((n_unfilled, "N", w, d))
-            
-            # Soir shift (S): solo
-            s_slots = staffing[w].slots[d].get("S", 0)
-            if s_slots > 0:
-                s_assigned = sum(assign[p][w][d]["S"] for p in names)
-                s_unfilled = model.NewIntVar(0, s_slots, f"unfilled_S_{w}_{d}")
-                model.Add(s_assigned + s_unfilled == s_slots)
-                unfilled_vars.append((s_unfilled, "S", w, d))
-    
+
+    for g in range(store.num_days):
+        w, d = store.day_label(g)
+        for shift, needed in slot_needs(staffing[w].slots[d]).items():
+            unfilled = model.NewIntVar(0, needed, f"unfilled_{shift}_{w}_{d}")
+            model.Add(LinearExpr.Sum(store.slot(g, SHIFT_INDEX[shift])) + unfilled == needed)
+            unfilled_vars.append((unfilled, shift, w, d))
+
     return unfilled_vars
 
 
-def add_one_shift_per_day(
+@profiled
+def add_person_works_link(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
 ) -> None:
-    """Add constraint: at most one shift per person per day."""
-    slog.step("Constraint: One shift per person per day")
-    for p in names:
-        for w in range(1, weeks + 1):
-            for d in days:
-                model.Add(sum(assign[p][w][d][s] for s in ["D", "N", "S"]) <= 1)
+    """
+    Link works[p, g] to the shift vars: sum of the day's shifts == works.
+
+    works is Boolean, so this also enforces at most one shift per day.
+    works[p, g] is the single work literal of a person-day: builders that
+    need "works that day" use it instead of summing or copying shift vars.
+    """
+    slog.step("Constraint: Link person_works helper (one shift per day)")
+    for p in range(store.num_people):
+        for g in range(store.num_days):
+            model.Add(LinearExpr.Sum(store.day_shifts(p, g)) == store.works_on(p, g))
 
 
+@profiled
 def add_night_rest_constraint(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    person_works: WorksVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     config: SolverConfig,
 ) -> None:
     """Add constraint: no work day after night shift."""
     if not config.forbid_night_to_day:
         return
-        
+
     slog.step("Constraint: No work after night")
-    for p in names:
-        for w in range(1, weeks + 1):
-            for i, d in enumerate(days[:-1]):
-                next_d = days[i + 1]
-                model.Add(person_works[p][w][next_d] == 0).OnlyEnforceIf(assign[p][w][d]["N"])
+    per_week = store.days_per_week
+    # Without modelled weekends, the weekend breaks the chain (Fri N -> Mon is fine)
+    full_week = has_weekends(store)
+    for p in range(store.num_people):
+        for g in range(store.num_days - 1):
+            if not full_week and g % per_week == per_week - 1:
+                continue
+            model.Add(store.works_on(p, g + 1) == 0).OnlyEnforceIf(store.x(p, g, N_IDX))
 
 
+@profiled
 def add_max_nights_constraint(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    name_to_person: Dict[str, Person],
-    weeks: int,
-    days: List[str],
-) -> Dict[str, cp_model.IntVar]:
+    store: VariableStore,
+    carried_nights: Optional[List[int]] = None,
+) -> List[cp_model.IntVar]:
     """
     Add constraint: max nights per person over horizon.
-    
+
+    Args:
+        carried_nights: Nights already worked before this model (rolling horizon),
+            indexed by person_idx; they count against max_nights
+
     Returns:
-        Dict mapping person name to their night count variable
+        List of night count variables, indexed by person_idx
     """
     slog.step("Constraint: Max nights per person")
-    night_counts = {}
-    
-    for p in names:
-        person = name_to_person[p]
-        night_assignments = [assign[p][w][d]["N"] for w in range(1, weeks + 1) for d in days]
-        night_counts[p] = model.NewIntVar(0, weeks * len(days), f"nights_{p}")
-        model.Add(night_counts[p] == sum(night_assignments))
-        
-        if person.max_nights < weeks * len(days):
-            model.Add(night_counts[p] <= person.max_nights)
-    
+    night_counts = []
+    horizon = store.num_days
+
+    for p, person in enumerate(store.people):
+        count = model.NewIntVar(0, horizon, f"nights_{person.name}")
+        model.Add(count == LinearExpr.Sum(store.person_shift(p, N_IDX)))
+        night_counts.append(count)
+
+        remaining = person.max_nights - (carried_nights[p] if carried_nights else 0)
+        if remaining < horizon:
+            model.Add(count <= max(0, remaining))
+
     return night_counts
 
 
+@profiled
 def add_consecutive_nights_constraint(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     config: SolverConfig,
 ) -> None:
     """Add constraint: max consecutive nights in a sequence."""
-    if config.max_nights_sequence >= len(days):
+    if config.max_nights_sequence >= store.days_per_week:
         return
-        
+
     slog.step(f"Constraint: Max {config.max_nights_sequence} consecutive nights")
-    
-    all_days_ordered = [(w, d) for w in range(1, weeks + 1) for d in days]
-    
-    for p in names:
-        window_size = config.max_nights_sequence + 1
-        for start_idx in range(len(all_days_ordered) - window_size + 1):
-            window_days = all_days_ordered[start_idx:start_idx + window_size]
-            window_nights = [assign[p][w][d]["N"] for (w, d) in window_days]
-            model.Add(sum(window_nights) <= config.max_nights_sequence)
+
+    window_size = config.max_nights_sequence + 1
+    for p in range(store.num_people):
+        nights = store.person_shift(p, N_IDX)
+        for start in range(len(nights) - window_size + 1):
+            model.Add(LinearExpr.Sum(nights[start:start + window_size]) <= config.max_nights_sequence)
 
 
+@profiled
 def add_edo_constraints(
     model: cp_model.CpModel,
-    person_works: WorksVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     edo_plan: EDOPlan,
 ) -> None:
     """
     Add EDO (Earned Day Off) constraints.
-    
+
     - Fixed EDO day: force that day off
-    - No fixed day: solver picks at least one day off
+    - No fixed day: solver picks at least one weekday off
     """
     slog.step("Constraint: EDO days")
-    for p in names:
-        for w in range(1, weeks + 1):
-            if p in edo_plan.plan.get(w, set()):
-                fixed = edo_plan.fixed.get(p, "")
-                if fixed and fixed in days:
-                    model.Add(person_works[p][w][fixed] == 0)
+    for p, name in enumerate(store.names):
+        for w in store.week_numbers:
+            if name in edo_plan.plan.get(w, set()):
+                fixed = edo_plan.fixed.get(name, "")
+                if fixed and fixed in store.day_pos:
+                    model.Add(store.works_on(p, store.day_index(w, fixed)) == 0)
                 else:
-                    off_days = [person_works[p][w][d].Not() for d in days]
-                    model.Add(sum(off_days) >= 1)
+                    off_days = [
+                        store.works_on(p, g).Not() for g in store.week_days(w)
+                        if store.day_label(g)[1] not in WEEKEND_JOURS
+                    ]
+                    model.Add(LinearExpr.Sum(off_days) >= 1)
 
 
+@profiled
 def add_weekly_hours_constraint(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
 ) -> None:
-    """Add constraint: max 48 hours per week (Mon-Fri)."""
+    """Add constraint: max 48 hours per week (over the modelled days)."""
     slog.step("Constraint: 48h per week")
-    for p in names:
-        for w in range(1, weeks + 1):
-            week_hours = []
-            for d in days:
-                for s in ["D", "N", "S"]:
-                    week_hours.append(assign[p][w][d][s] * SHIFTS[s].hours)
-            model.Add(sum(week_hours) <= 48)
+    for p in range(store.num_people):
+        for w in store.week_numbers:
+            week_vars = []
+            for g in store.week_days(w):
+                week_vars.extend(store.day_shifts(p, g))
+            coeffs = SHIFT_HOURS * store.days_per_week
+            model.Add(LinearExpr.WeightedSum(week_vars, coeffs) <= 48)
 
 
+@profiled
 def add_rolling_48h_constraint(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
 ) -> None:
     """
-    Add 48h rolling window constraint (across weeks, weekend = 0h).
-    
+    Add 48h rolling window constraint (across weeks; Sat/Sun count 0h
+    unless the model covers them).
+
     Uses flat timeline approach aligned with validation.py:check_rolling_48h().
     """
     slog.step("Constraint: 48h rolling window (Hard)")
-    
-    for p in names:
-        timeline_hours = []
-        
-        for w in range(1, weeks + 1):
-            for d in days:
-                hour_expr = sum(
-                    assign[p][w][d][s] * SHIFTS[s].hours
-                    for s in ["D", "N", "S"]
-                )
-                timeline_hours.append(hour_expr)
-            
-            timeline_hours.append(0)  # Saturday
-            timeline_hours.append(0)  # Sunday
-        
-        for i in range(len(timeline_hours) - 6):
-            window = timeline_hours[i : i + 7]
-            model.Add(sum(window) <= 48)
 
+    # Flat 7-day timeline: global day index per position, None for unmodelled Sat/Sun
+    timeline: List = []
+    for w in store.week_numbers:
+        timeline.extend(store.week_days(w))
+        timeline.extend([None] * (7 - store.days_per_week))
 
+    # Each window covers a contiguous run of global days: precompute (first, last) once
+    windows = []
+    for i in range(len(timeline) - 6):
+        worked = [g for g in timeline[i:i + 7] if g is not None]
+        windows.append((worked[0], worked[-1] + 1))
+
+    n_shifts = store.num_shifts
+    for p in range(store.num_people):
+        person_vars = store.person_all(p)
+        for lo, hi in windows:
+            model.Add(LinearExpr.WeightedSum(
+                person_vars[lo * n_shifts:hi * n_shifts], SHIFT_HOURS * (hi - lo)
+            ) <= 48)
+
+
+@profiled
 def add_consecutive_days_constraint(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     config: SolverConfig,
 ) -> None:
     """Add constraint: max consecutive work days."""
     max_days = getattr(config, "max_consecutive_days", 6)
     if not max_days or max_days >= 7 * 4:
         return
-        
-    slog.step(f"Hard: Max {max_days} consecutive workdays")
-    for p in names:
-        timeline_vars = []
-        for w in range(1, weeks + 1):
-            for d in days:
-                working = model.NewBoolVar(f"working_{p}_{w}_{d}")
-                model.Add(sum(assign[p][w][d][s] for s in ["D", "N", "S"]) == working)
-                timeline_vars.append(working)
-            
-            if w < weeks:
-                timeline_vars.append(0)  # Saturday
-                timeline_vars.append(0)  # Sunday
-        
-        window_size = max_days + 1
-        for i in range(len(timeline_vars) - window_size + 1):
-            window = timeline_vars[i : i + window_size]
-            model.Add(sum(window) <= max_days)
 
+    # Calendar timeline of global days, None for Sat/Sun (never worked)
+    pad = 7 - store.days_per_week
+    last_week = store.week_numbers[-1]
+    timeline: List = []
+    for w in store.week_numbers:
+        timeline.extend(store.week_days(w))
+        if w != last_week:
+            timeline.extend([None] * pad)
+
+    # Windows are contiguous runs of global days; drop those that cannot
+    # exceed the limit (weekend padding counts 0) and duplicates
+    window_size = max_days + 1
+    windows = set()
+    for i in range(len(timeline) - window_size + 1):
+        worked = [g for g in timeline[i:i + window_size] if g is not None]
+        if len(worked) > max_days:
+            windows.add((worked[0], worked[-1] + 1))
+    if not windows:
+        return
+
+    slog.step(f"Hard: Max {max_days} consecutive workdays ({len(windows)} windows)")
+    for p in range(store.num_people):
+        works = store.person_works(p)
+        for lo, hi in sorted(windows):
+            model.Add(LinearExpr.Sum(works[lo:hi]) <= max_days)
+
+
+@profiled
+def add_weekend_constraints(
+    model: cp_model.CpModel,
+    store: VariableStore,
+) -> None:
+    """
+    Weekend rules of the integrated 7-day model (no-op without Sam/Dim).
+
+    - available_weekends=False: no Sam/Dim shift
+    - at most max_weekends_per_month worked weekends per 4 weeks, over the
+      horizon (same budget as WeekendSolver)
+    """
+    if not has_weekends(store):
+        return
+
+    slog.step("Constraint: Weekend availability and weekends per month")
+    months = max(1.0, len(store.week_numbers) / 4.0)
+    for p, person in enumerate(store.people):
+        weekend = [
+            [store.works_on(p, store.day_index(w, d)) for d in WEEKEND_JOURS if d in store.day_pos]
+            for w in store.week_numbers
+        ]
+        if not person.available_weekends:
+            for days in weekend:
+                for works in days:
+                    model.Add(works == 0)
+            continue
+
+        max_weekends = int(person.max_weekends_per_month * months)
+        if max_weekends >= len(weekend):
+            continue
+        worked = []
+        for w, days in zip(store.week_numbers, weekend):
+            flag = model.NewBoolVar(f"weekend_{person.name}_{w}")
+            for works in days:
+                model.AddImplication(works, flag)
+            worked.append(flag)
+        model.Add(LinearExpr.Sum(worked) <= max_weekends)
 
+
+@profiled
 def add_no_evening_preference(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    name_to_person: Dict[str, Person],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
 ) -> None:
     """Add constraint: no Soir shifts for people with no_evening=True."""
     slog.step("Constraint: No Soir preferences")
-    for p in names:
-        person = name_to_person[p]
+    for p, person in enumerate(store.people):
         if person.no_evening:
-            for w in range(1, weeks + 1):
-                for d in days:
-                    model.Add(assign[p][w][d]["S"] == 0)
+            for var in store.person_shift(p, S_IDX):
+                model.Add(var == 0)
 
 
+@profiled
 def add_contractor_pair_constraint(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    people: List[Person],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     config: SolverConfig,
 ) -> None:
     """Add constraint: contractors must be paired with regular staff."""
     if not config.forbid_contractor_pairs:
         return
-        
-    contractors = [p.name for p in people if p.is_contractor]
+
+    contractors = [p for p, person in enumerate(store.people) if person.is_contractor]
     if len(contractors) < 2:
         return
-        
+
     slog.step(f"Constraint: No contractor pairs ({len(contractors)} contractors)")
-    for w in range(1, weeks + 1):
-        for d in days:
-            for s in ["D", "N"]:  # Only pair shifts
-                contractor_count = sum(assign[p][w][d][s] for p in contractors)
-                model.Add(contractor_count <= 1)
+    for g in range(store.num_days):
+        for s in (D_IDX, N_IDX):  # Only pair shifts
+            model.Add(LinearExpr.Sum([store.x(p, g, s) for p in contractors]) <= 1)
+
+
+def interchangeable_groups(store: VariableStore, edo_plan: EDOPlan) -> List[List[int]]:
+    """
+    Classes of people the model cannot tell apart.
+
+    Two people are interchangeable if every constraint-relevant Person field
+    matches and they take EDO in the same weeks; swapping their rows maps any
+    solution to one with the same objective.
+
+    Returns:
+        Groups of >= 2 person indices, each in store order
+    """
+    # Weekend fields matter once the model covers Sam/Dim
+    ignored = {"name"} if has_weekends(store) else SYMMETRY_IGNORED_FIELDS
+    groups: Dict[tuple, List[int]] = {}
+    for p, person in enumerate(store.people):
+        fields = tuple(
+            getattr(person, f.name) for f in dataclasses.fields(Person)
+            if f.compare and f.name not in ignored
+        )
+        edo_weeks = tuple(w for w in store.week_numbers if person.name in edo_plan.plan.get(w, set()))
+        groups.setdefault((fields, edo_weeks), []).append(p)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+@profiled
+def add_symmetry_breaking(
+    model: cp_model.CpModel,
+    store: VariableStore,
+    edo_plan: EDOPlan,
+    night_counts: List[cp_model.IntVar],
+) -> int:
+    """
+    Order interchangeable people lexicographically by (workdays, nights, soirs), descending.
+
+    Any solution can be permuted within a class to satisfy the ordering, so
+    no objective value is lost; CP-SAT just stops exploring the permutations.
+
+    Args:
+        night_counts: Night count variables from add_max_nights_constraint
+
+    Returns:
+        Number of ordering constraints added
+    """
+    groups = interchangeable_groups(store, edo_plan)
+    if not groups:
+        return 0
+
+    # (total, nights, soirs) packed into one integer, digits in base horizon + 1
+    base = store.num_days + 1
+
+    def key(p: int):
+        total = LinearExpr.Sum(store.person_all(p))
+        soirs = LinearExpr.Sum(store.person_shift(p, S_IDX))
+        return total * (base * base) + night_counts[p] * base + soirs
+
+    added = 0
+    for members in groups:
+        for a, b in zip(members, members[1:]):
+            model.Add(key(a) >= key(b))
+            added += 1
+
+    slog.step(f"Symmetry breaking: {len(groups)} classes, {added} orderings")
+    return added
@@ -2,25 +2,131 @@
 Objective Builders for CP-SAT Solver
 ====================================
 Extracted soft constraint / objective logic from solve_pairs().
+Variables are addressed through the VariableStore by person/day/shift index.
+
+ObjectiveSpec holds the weight of every term. Each term is defined once
+(fairness_terms, workday_terms, clopening_terms) against a small arithmetic
+interface: ModelTerms turns it into CP-SAT variables, ValueTerms evaluates it
+on a solved schedule (evaluate_objective), so tries are ranked on exactly
+what the solver minimized.
 """
-from typing import Dict, List, Tuple
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
 
 from ortools.sat.python import cp_model
 
 from rota.models.constraints import FairnessMode, SolverConfig
 from rota.models.person import Person
-from rota.models.rules import SHIFTS
+from rota.solver.constraints import slot_needs
 from rota.solver.edo import EDOPlan
-from rota.solver.staffing import WeekStaffing
+from rota.solver.profiling import profiled
+from rota.solver.staffing import WeekStaffing, staffing_days
+from rota.solver.variables import D_IDX, N_IDX, S_IDX, SHIFT_CODES, VariableStore
 from rota.utils.logging_setup import SolverLogger
 
 slog = SolverLogger("rota.solver.objectives")
 
+LinearExpr = cp_model.LinearExpr
 
 # Type aliases
-AssignVars = Dict[str, Dict[int, Dict[str, Dict[str, cp_model.IntVar]]]]
 ObjectiveTerms = List[Tuple[cp_model.IntVar, int]]
 
+# Defaults of SolverConfig.night_fairness_weight / evening_fairness_weight;
+# the fairness terms are scaled by the configured weight relative to these
+DEFAULT_NIGHT_FAIRNESS_WEIGHT = 10.0
+DEFAULT_EVENING_FAIRNESS_WEIGHT = 3.0
+
+# Scale of the stored trial scores; bump whenever the terms or weights change
+# so studies scored under the old objective are not ranked against new trials
+OBJECTIVE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class ObjectiveSpec:
+    """
+    Integer weight of each objective term (values are counts, lower is better).
+    
+    Terms:
+        unfilled: People missing from staffed slots
+        night_deviation: Sum over people of |nights - proportional target|
+        night_spread: Sum over cohorts of (max - min) nights
+        soir_deviation: Sum over people of |soirs - proportional target|
+        soir_spread: Sum over cohorts of (max - min) soirs
+        workday_deviation: Sum over people of workdays below target
+        clopening: Soir followed by Jour within a week
+    """
+    unfilled: int = 10000
+    night_deviation: int = 100
+    night_spread: int = 500
+    soir_deviation: int = 50
+    soir_spread: int = 300
+    workday_deviation: int = 5
+    clopening: int = 1
+    
+    @classmethod
+    def from_config(cls, config: SolverConfig) -> "ObjectiveSpec":
+        """
+        Weights for a solver configuration.
+        
+        Night terms scale with config.night_fairness_weight and soir terms with
+        config.evening_fairness_weight (the defaults give the base weights);
+        config.objective_weights then overrides terms by name.
+        """
+        base = cls()
+        night = config.night_fairness_weight / DEFAULT_NIGHT_FAIRNESS_WEIGHT
+        soir = config.evening_fairness_weight / DEFAULT_EVENING_FAIRNESS_WEIGHT
+        weights = asdict(base)
+        weights.update(
+            night_deviation=round(base.night_deviation * night),
+            night_spread=round(base.night_spread * night),
+            soir_deviation=round(base.soir_deviation * soir),
+            soir_spread=round(base.soir_spread * soir),
+        )
+        for term, weight in config.objective_weights.items():
+            if term not in weights:
+                raise ValueError(f"Unknown objective term '{term}', expected one of {sorted(weights)}")
+            weights[term] = int(weight)
+        return cls(**weights)
+    
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+    
+    def score(self, terms: Dict[str, int]) -> float:
+        """Weighted sum of term values from evaluate_objective()."""
+        weights = self.as_dict()
+        return float(sum(weights[term] * value for term, value in terms.items()))
+
+
+@dataclass
+class HorizonCarry:
+    """
+    Totals from weeks already solved before the model's first week.
+    
+    Used by the rolling-horizon solver so fairness targets are cumulative.
+    Lists are indexed by person_idx.
+    """
+    nights: List[int]
+    soirs: List[int]
+    days: int = 0        # Weekdays covered by the carried totals
+    soir_slots: int = 0  # Soir slots staffed over those days
+
+
+def _with_carry(
+    model: cp_model.CpModel,
+    counts: List[cp_model.IntVar],
+    carried: List[int],
+    bound: int,
+    label: str,
+    store: VariableStore,
+) -> List[cp_model.IntVar]:
+    """Cumulative count vars: count in this model + carried total."""
+    cumulative = []
+    for p, name in enumerate(store.names):
+        cum = model.NewIntVar(0, bound, f"cum_{label}s_{name}")
+        model.Add(cum == counts[p] + carried[p])
+        cumulative.append(cum)
+    return cumulative
+
 
 def build_cohorts(
     names: List[str],
@@ -28,8 +134,19 @@ def build_cohorts(
     config: SolverConfig,
 ) -> Dict[str, List[str]]:
     """Build cohort groupings based on fairness mode."""
+    cohorts = group_cohorts(names, name_to_person, config)
+    slog.step(f"Cohorts ({config.fairness_mode.value}): {[(k, len(v)) for k, v in cohorts.items()]}")
+    return cohorts
+
+
+def group_cohorts(
+    names: List[str],
+    name_to_person: Dict[str, Person],
+    config: SolverConfig,
+) -> Dict[str, List[str]]:
+    """build_cohorts() without the log line."""
     cohorts = {}
-    
+
     if config.fairness_mode == FairnessMode.BY_TEAM:
         for p in names:
             team = name_to_person[p].team or "no_team"
@@ -41,175 +158,386 @@ def build_cohorts(
             wd = name_to_person[p].workdays_per_week
             key = f"{wd}j"
             cohorts.setdefault(key, []).append(p)
-    
-    slog.step(f"Cohorts ({config.fairness_mode.value}): {[(k, len(v)) for k, v in cohorts.items()]}")
     return cohorts
 
 
+class ModelTerms:
+    """
+    Term arithmetic as CP-SAT variables and constraints.
+    
+    Every objective term is written once, against this interface; ValueTerms
+    runs the same definition on the integer counts of a solved schedule.
+    """
+    
+    def __init__(self, model: cp_model.CpModel):
+        self.model = model
+    
+    def deviation(self, value, target: int, bound: int, name: str) -> cp_model.IntVar:
+        """|value - target|"""
+        dev = self.model.NewIntVar(0, bound, name)
+        self.model.Add(dev >= value - target)
+        self.model.Add(dev >= target - value)
+        return dev
+    
+    def shortfall(self, value, target: int, bound: int, name: str) -> cp_model.IntVar:
+        """max(0, target - value)"""
+        short = self.model.NewIntVar(0, bound, name)
+        self.model.Add(short >= target - value)
+        return short
+    
+    def spread(self, values: list, bound: int, name: str) -> cp_model.IntVar:
+        """max(values) - min(values)"""
+        max_v = self.model.NewIntVar(0, bound, f"max_{name}")
+        min_v = self.model.NewIntVar(0, bound, f"min_{name}")
+        self.model.AddMaxEquality(max_v, values)
+        self.model.AddMinEquality(min_v, values)
+        spread = self.model.NewIntVar(0, bound, name)
+        self.model.Add(spread == max_v - min_v)
+        return spread
+    
+    def both(self, a, b, name: str) -> cp_model.IntVar:
+        """a and b, as a literal the objective pushes down (a ∧ b → lit only)."""
+        lit = self.model.NewBoolVar(name)
+        self.model.AddBoolOr([a.Not(), b.Not(), lit])
+        return lit
+    
+    def total(self, values: list, bound: int, name: str) -> cp_model.IntVar:
+        """sum(values)"""
+        total = self.model.NewIntVar(0, bound, name)
+        self.model.Add(total == LinearExpr.Sum(values))
+        return total
+
+
+class ValueTerms:
+    """ModelTerms arithmetic on plain integers (deviation variables are tight)."""
+    
+    def deviation(self, value: int, target: int, bound: int, name: str) -> int:
+        return abs(value - target)
+    
+    def shortfall(self, value: int, target: int, bound: int, name: str) -> int:
+        return max(0, target - value)
+    
+    def spread(self, values: List[int], bound: int, name: str) -> int:
+        return max(values) - min(values)
+    
+    def both(self, a: int, b: int, name: str) -> int:
+        return int(bool(a) and bool(b))
+    
+    def total(self, values: List[int], bound: int, name: str) -> int:
+        return sum(values)
+
+
+def proportional_target(person: Person, capacity: int, total: int) -> int:
+    """Share of total proportional to the person's workdays per week."""
+    return int(round((person.workdays_per_week / capacity) * total))
+
+
+def workday_target(person: Person, week_numbers: List[int], edo_plan: EDOPlan) -> int:
+    """Workdays owed over week_numbers, net of EDO weeks."""
+    edo_weeks = sum(1 for w in week_numbers if person.name in edo_plan.plan.get(w, set()))
+    return person.workdays_per_week * len(week_numbers) - edo_weeks
+
+
+def fairness_terms(
+    ops,
+    people: List[Person],
+    counts: list,
+    total: int,
+    horizon: int,
+    cohorts: Dict[str, List[str]],
+    label: str,
+) -> Tuple[list, list]:
+    """
+    Deviation and cohort spread parts of one shift's fairness terms.
+    
+    Args:
+        ops: ModelTerms or ValueTerms
+        people: People, in the order of counts
+        counts: Per-person shift counts (variables or integers)
+        total: Person-shifts shared out proportionally to workdays
+        horizon: Upper bound of a count
+        cohorts: Cohort name -> member names
+        label: "night" or "soir"
+        
+    Returns:
+        (per-person deviations from the proportional target, per-cohort spreads)
+    """
+    capacity = sum(p.workdays_per_week for p in people)
+    index = {p.name: i for i, p in enumerate(people)}
+    deviations = [
+        ops.deviation(counts[p], proportional_target(person, capacity, total), horizon, f"{label}_dev_{person.name}")
+        for p, person in enumerate(people)
+    ]
+    spreads = [
+        ops.spread([counts[index[m]] for m in members], horizon, f"{label}_spread_{cid}")
+        for cid, members in cohorts.items()
+        if len(members) > 1
+    ]
+    return deviations, spreads
+
+
+def workday_terms(ops, people: List[Person], totals: list, targets: List[int], horizon: int):
+    """Total workday undershoot: sum over people of max(0, target - worked)."""
+    undershoots = [
+        ops.shortfall(totals[p], targets[p], horizon, f"undershoot_{person.name}")
+        for p, person in enumerate(people)
+    ]
+    return ops.total(undershoots, len(people) * horizon, "total_deviation")
+
+
+def clopening_terms(ops, names: List[str], num_days: int, day_label, shift_at) -> list:
+    """
+    Soir followed by Jour the next day, within a week.
+    
+    Args:
+        ops: ModelTerms or ValueTerms
+        names: People, indexed like shift_at's p
+        num_days: Days modelled (weeks x days per week)
+        day_label: g -> (week, day)
+        shift_at: (p, g, shift_idx) -> variable or 0/1
+    """
+    clopenings = []
+    for p, name in enumerate(names):
+        for g in range(num_days - 1):
+            w, d = day_label(g)
+            if day_label(g + 1)[0] != w:
+                continue
+            clopenings.append(ops.both(shift_at(p, g, S_IDX), shift_at(p, g + 1, D_IDX), f"clop_{name}_{w}_{d}"))
+    return clopenings
+
+
+@profiled
 def add_unfilled_penalty(
     model: cp_model.CpModel,
     unfilled_vars: List[Tuple[cp_model.IntVar, str, int, str]],
     objective_terms: ObjectiveTerms,
+    spec: ObjectiveSpec = ObjectiveSpec(),
 ) -> None:
-    """Add penalty for unfilled slots."""
+    """Add penalty for unfilled slots (slack of add_staffing_constraints)."""
     slog.step(f"Soft: Penalizing {len(unfilled_vars)} potential unfilled slots")
-    total_unfilled = model.NewIntVar(0, len(unfilled_vars) * 10, "total_unfilled")
-    model.Add(total_unfilled == sum(uv[0] for uv in unfilled_vars))
-    objective_terms.append((total_unfilled, 10000))
+    total_unfilled = ModelTerms(model).total([uv[0] for uv in unfilled_vars], len(unfilled_vars) * 10, "total_unfilled")
+    objective_terms.append((total_unfilled, spec.unfilled))
 
 
+@profiled
 def add_night_fairness_objective(
     model: cp_model.CpModel,
-    night_counts: Dict[str, cp_model.IntVar],
-    names: List[str],
-    name_to_person: Dict[str, Person],
-    people: List[Person],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
+    night_counts: List[cp_model.IntVar],
     cohorts: Dict[str, List[str]],
     objective_terms: ObjectiveTerms,
+    carry: Optional[HorizonCarry] = None,
+    spec: ObjectiveSpec = ObjectiveSpec(),
 ) -> None:
-    """Add night fairness objective (proportional distribution)."""
+    """Add night fairness objective (proportional distribution, cumulative with carry)."""
     slog.step("Soft: Night fairness (proportional)")
-    
-    total_workdays_capacity = sum(p.workdays_per_week for p in people)
-    total_night_person_shifts = weeks * len(days) * 2
-    
-    for p in names:
-        person = name_to_person[p]
-        night_target = int(round((person.workdays_per_week / total_workdays_capacity) * total_night_person_shifts))
-        
-        deviation = model.NewIntVar(0, weeks * len(days), f"night_dev_{p}")
-        model.Add(deviation >= night_counts[p] - night_target)
-        model.Add(deviation >= night_target - night_counts[p])
-        objective_terms.append((deviation, 100))
-    
-    # Minimize spread within cohorts
-    for cid, members in cohorts.items():
-        if len(members) > 1:
-            cohort_night_vars = [night_counts[m] for m in members]
-            max_n = model.NewIntVar(0, weeks * len(days), f"max_nights_{cid}")
-            min_n = model.NewIntVar(0, weeks * len(days), f"min_nights_{cid}")
-            model.AddMaxEquality(max_n, cohort_night_vars)
-            model.AddMinEquality(min_n, cohort_night_vars)
-            spread = model.NewIntVar(0, weeks * len(days), f"night_spread_{cid}")
-            model.Add(spread == max_n - min_n)
-            objective_terms.append((spread, 500))
 
+    horizon = store.num_days + (carry.days if carry else 0)
+    counts = night_counts
+    if carry:
+        counts = _with_carry(model, night_counts, carry.nights, horizon, "night", store)
 
+    deviations, spreads = fairness_terms(ModelTerms(model), store.people, counts, horizon * 2, horizon, cohorts, "night")
+    objective_terms.extend((dev, spec.night_deviation) for dev in deviations)
+    objective_terms.extend((spread, spec.night_spread) for spread in spreads)
+
+
+@profiled
 def add_soir_fairness_objective(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    name_to_person: Dict[str, Person],
-    people: List[Person],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     staffing: Dict[int, WeekStaffing],
     cohorts: Dict[str, List[str]],
     objective_terms: ObjectiveTerms,
-) -> Dict[str, cp_model.IntVar]:
+    carry: Optional[HorizonCarry] = None,
+    spec: ObjectiveSpec = ObjectiveSpec(),
+) -> List[cp_model.IntVar]:
     """
-    Add Soir fairness objective.
-    
+    Add Soir fairness objective (cumulative with carry).
+
     Returns:
-        Dict mapping person name to their soir count variable
+        List of soir count variables (this model only), indexed by person_idx
     """
     slog.step("Soft: Soir fairness (proportional)")
-    
-    total_workdays_capacity = sum(p.workdays_per_week for p in people)
-    total_soir_slots = sum(staffing[w].slots[d].get("S", 0) for w in range(1, weeks + 1) for d in days)
-    
-    soir_counts = {}
-    for p in names:
-        person = name_to_person[p]
-        soir_assignments = [assign[p][w][d]["S"] for w in range(1, weeks + 1) for d in days]
-        soir_counts[p] = model.NewIntVar(0, weeks * len(days), f"soirs_{p}")
-        model.Add(soir_counts[p] == sum(soir_assignments))
-        
-        soir_target = int(round((person.workdays_per_week / total_workdays_capacity) * total_soir_slots))
-        deviation = model.NewIntVar(0, weeks * len(days), f"soir_dev_{p}")
-        model.Add(deviation >= soir_counts[p] - soir_target)
-        model.Add(deviation >= soir_target - soir_counts[p])
-        objective_terms.append((deviation, 50))
-    
-    # Minimize spread within cohorts
-    for cid, members in cohorts.items():
-        if len(members) > 1:
-            cohort_soir_vars = [soir_counts[m] for m in members]
-            max_s = model.NewIntVar(0, weeks * len(days), f"max_soirs_{cid}")
-            min_s = model.NewIntVar(0, weeks * len(days), f"min_soirs_{cid}")
-            model.AddMaxEquality(max_s, cohort_soir_vars)
-            model.AddMinEquality(min_s, cohort_soir_vars)
-            spread = model.NewIntVar(0, weeks * len(days), f"soir_spread_{cid}")
-            model.Add(spread == max_s - min_s)
-            objective_terms.append((spread, 300))
-    
+
+    total_soir_slots = sum(
+        staffing[w].slots[d].get("S", 0) for w in store.week_numbers for d in store.days
+    )
+    horizon = store.num_days
+    if carry:
+        total_soir_slots += carry.soir_slots
+        horizon += carry.days
+
+    soir_counts = []
+    for p, person in enumerate(store.people):
+        count = model.NewIntVar(0, store.num_days, f"soirs_{person.name}")
+        model.Add(count == LinearExpr.Sum(store.person_shift(p, S_IDX)))
+        soir_counts.append(count)
+
+    counts = soir_counts
+    if carry:
+        counts = _with_carry(model, soir_counts, carry.soirs, horizon, "soir", store)
+
+    deviations, spreads = fairness_terms(ModelTerms(model), store.people, counts, total_soir_slots, horizon, cohorts, "soir")
+    objective_terms.extend((dev, spec.soir_deviation) for dev in deviations)
+    objective_terms.extend((spread, spec.soir_spread) for spread in spreads)
+
     return soir_counts
 
 
+@profiled
 def add_workday_target_objective(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    name_to_person: Dict[str, Person],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     edo_plan: EDOPlan,
     objective_terms: ObjectiveTerms,
-) -> None:
-    """Add workday target deviation objective with hard cap."""
+    spec: ObjectiveSpec = ObjectiveSpec(),
+) -> List[Tuple[cp_model.IntVar, int]]:
+    """
+    Add workday target deviation objective with hard cap.
+
+    Returns:
+        List of (total_var, target) tuples, indexed by person_idx
+    """
     slog.step("Soft: Workday target deviation")
-    
-    total_deviation = model.NewIntVar(0, len(names) * weeks * len(days), "total_deviation")
-    deviation_terms = []
-    
-    for p in names:
-        person = name_to_person[p]
-        edo_weeks = sum(1 for w in range(1, weeks + 1) if p in edo_plan.plan.get(w, set()))
-        target = person.workdays_per_week * weeks - edo_weeks
-        
-        person_total = model.NewIntVar(0, weeks * len(days), f"total_{p}")
-        all_shifts = [assign[p][w][d][s] for w in range(1, weeks + 1) for d in days for s in ["D", "N", "S"]]
-        model.Add(person_total == sum(all_shifts))
-        
+
+    horizon = store.num_days
+    person_totals = []
+
+    for p, person in enumerate(store.people):
+        target = workday_target(person, store.week_numbers, edo_plan)
+
+        person_total = model.NewIntVar(0, horizon, f"total_{person.name}")
+        # Summed over the shift vars on purpose: the same total over the works
+        # literals solved 2-4x slower to optimal on team_dummy.csv
+        model.Add(person_total == LinearExpr.Sum(store.person_all(p)))
+        person_totals.append((person_total, target))
+
         # HARD constraint: Never exceed target
         model.Add(person_total <= target)
-        
-        # Soft: minimize undershoot
-        undershoot = model.NewIntVar(0, weeks * len(days), f"undershoot_{p}")
-        model.Add(undershoot >= target - person_total)
-        deviation_terms.append(undershoot)
-    
-    model.Add(total_deviation == sum(deviation_terms))
-    objective_terms.append((total_deviation, 5))
 
+    total_deviation = workday_terms(
+        ModelTerms(model), store.people, [t for t, _ in person_totals], [t for _, t in person_totals], horizon
+    )
+    objective_terms.append((total_deviation, spec.workday_deviation))
+    return person_totals
 
+
+@profiled
 def add_clopening_penalty(
     model: cp_model.CpModel,
-    assign: AssignVars,
-    names: List[str],
-    weeks: int,
-    days: List[str],
+    store: VariableStore,
     objective_terms: ObjectiveTerms,
+    spec: ObjectiveSpec = ObjectiveSpec(),
 ) -> None:
-    """Add penalty for Soir→Jour (clopening) patterns."""
+    """
+    Add penalty for Soir→Jour (clopening) patterns.
+
+    The objective pushes each clopening literal down, so only the implication
+    soir ∧ jour_next → clopening is needed (one clause, no reification).
+    """
     slog.step("Soft: Soir→Jour penalty")
+
+    ops = ModelTerms(model)
+    clopenings = clopening_terms(ops, store.names, store.num_days, store.day_label, store.x)
+    if clopenings:
+        clopening_count = ops.total(clopenings, store.num_people * store.num_days, "clopenings")
+        objective_terms.append((clopening_count, spec.clopening))
+
+
+def evaluate_objective(
+    schedule,
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    days: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    Re-compute each objective term from a solved schedule.
     
-    clopening_count = model.NewIntVar(0, len(names) * weeks * len(days), "clopenings")
-    clopening_terms = []
-    
-    for p in names:
-        for w in range(1, weeks + 1):
-            for d_idx in range(len(days) - 1):
-                d = days[d_idx]
-                d_next = days[d_idx + 1]
-                
-                clopening = model.NewBoolVar(f"clop_{p}_{w}_{d}")
-                model.AddBoolAnd([assign[p][w][d]["S"], assign[p][w][d_next]["D"]]).OnlyEnforceIf(clopening)
-                model.AddBoolOr([assign[p][w][d]["S"].Not(), assign[p][w][d_next]["D"].Not()]).OnlyEnforceIf(clopening.Not())
-                clopening_terms.append(clopening)
-    
-    if clopening_terms:
-        model.Add(clopening_count == sum(clopening_terms))
-        objective_terms.append((clopening_count, 1))
+    Runs the term definitions the builders use (fairness_terms, workday_terms,
+    clopening_terms) on ValueTerms, for a model of weeks 1..schedule.weeks
+    without carry, so spec.score() of the result equals the CP-SAT objective
+    value of that solution (with tight deviation variables).
+    
+    Args:
+        schedule: PairSchedule (anything with weeks and get_person_day_matrix())
+        people: List of Person objects the schedule was solved for
+        config: Solver configuration (fairness mode)
+        staffing: Slot requirements per week/day/shift
+        edo_plan: EDO allocation plan
+        days: Days of the week (defaults to the days staffing covers)
+        
+    Returns:
+        Dict mapping each ObjectiveSpec term to its unweighted value
+    """
+    ops = ValueTerms()
+    days = days or staffing_days(staffing)
+    weeks = list(range(1, schedule.weeks + 1))
+    labels = [(w, d) for w in weeks for d in days]
+    horizon = len(labels)
+    names = [p.name for p in people]
+    matrix = schedule.get_person_day_matrix()
+    
+    def shift_at(p: int, g: int, s: int) -> int:
+        return int(matrix.get((names[p], *labels[g])) == SHIFT_CODES[s])
+    
+    def count(p: int, s: int) -> int:
+        return sum(shift_at(p, g, s) for g in range(horizon))
+    
+    staffed: Dict[tuple, int] = {}
+    for (_, w, d), shift in matrix.items():
+        staffed[(w, d, shift)] = staffed.get((w, d, shift), 0) + 1
+    shortfalls = [
+        ops.shortfall(staffed.get((w, d, shift), 0), needed, needed, f"unfilled_{shift}_{w}_{d}")
+        for w, d in labels
+        for shift, needed in slot_needs(staffing[w].slots[d]).items()
+    ]
+    
+    cohorts = group_cohorts(names, {p.name: p for p in people}, config)
+    nights = [count(p, N_IDX) for p in range(len(people))]
+    soirs = [count(p, S_IDX) for p in range(len(people))]
+    soir_slots = sum(staffing[w].slots[d].get("S", 0) for w, d in labels)
+    night_deviations, night_spreads = fairness_terms(ops, people, nights, horizon * 2, horizon, cohorts, "night")
+    soir_deviations, soir_spreads = fairness_terms(ops, people, soirs, soir_slots, horizon, cohorts, "soir")
+    
+    worked = [sum(count(p, s) for s in range(len(SHIFT_CODES))) for p in range(len(people))]
+    targets = [workday_target(person, weeks, edo_plan) for person in people]
+    
+    return {
+        "unfilled": ops.total(shortfalls, 0, "total_unfilled"),
+        "night_deviation": ops.total(night_deviations, 0, "night_deviation"),
+        "night_spread": ops.total(night_spreads, 0, "night_spread"),
+        "soir_deviation": ops.total(soir_deviations, 0, "soir_deviation"),
+        "soir_spread": ops.total(soir_spreads, 0, "soir_spread"),
+        "workday_deviation": workday_terms(ops, people, worked, targets, horizon),
+        "clopening": ops.total(
+            clopening_terms(ops, names, horizon, labels.__getitem__, shift_at), 0, "clopenings"
+        ),
+    }
+
+
+def schedule_objective(
+    schedule,
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    days: Optional[List[str]] = None,
+) -> float:
+    """
+    Objective value of a solved schedule under config's ObjectiveSpec (inf if unsolved).
+    
+    A proven-optimal solve reports it directly. Otherwise it is re-computed
+    from the assignments: CP-SAT's value for a merely feasible solution can
+    include slack in the deviation variables, and rolling-horizon schedules
+    report per-block sums.
+    """
+    if schedule.status not in ["optimal", "feasible"]:
+        return float("inf")
+    if schedule.status == "optimal":
+        return schedule.score
+    terms = evaluate_objective(schedule, people, config, staffing, edo_plan, days)
+    schedule.stats["objective_terms"] = terms
+    return ObjectiveSpec.from_config(config).score(terms)
@@ -0,0 +1,252 @@
+"""
+Delta Solve
+===========
+Incremental re-solve after a small team edit.
+
+Instead of solving the whole horizon again, the previous schedule is kept
+wherever the edit cannot matter:
+- edited people (changed Person fields, new members, changed EDO weeks)
+  are free over the whole horizon
+- on the days an edit affects, widened by +/- neighbourhood_days, everyone is free
+- every other person-day is fixed to its previous shift
+
+All variables are hinted with the previous schedule, so the new plan stays
+close to the old one. If the restricted model has no solution (e.g. staffing
+was lowered under fixed assignments), the full model is solved from the hint.
+"""
+import dataclasses
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver.edo import EDOPlan, build_edo_plan
+from rota.solver.pairs import (
+    PairModel,
+    PairSchedule,
+    apply_solution_hint,
+    build_pairs_model,
+    solve_model,
+)
+from rota.solver.staffing import JOURS, WEEKEND_JOURS, derive_staffing, model_days
+from rota.solver.variables import SHIFT_CODES
+from rota.utils.logging_setup import SolverLogger, get_logger
+
+logger = get_logger("rota.solver.delta")
+slog = SolverLogger("rota.solver.delta")
+
+# Upper bound on the restricted solve, whatever config.time_limit_seconds says
+DELTA_TIME_LIMIT = 10
+
+# Person fields whose effect is limited to one shift type
+SHIFT_FIELDS: Dict[str, str] = {
+    "no_evening": "S",
+    "max_nights": "N",
+    "prefers_night": "N",
+}
+
+# Person fields that cannot change the weekday schedule (they only reach
+# the model when it covers weekends, see staffing.model_days)
+IGNORED_FIELDS = {"available_weekends", "max_weekends_per_month"}
+
+WorkedDays = Dict[Tuple[int, str], str]  # (week, day) -> shift of one person
+
+
+def _person_fields(old: Person, new: Person, ignored: Set[str] = IGNORED_FIELDS) -> List[str]:
+    """Compared Person fields that differ between two versions of a person."""
+    return [
+        f.name for f in dataclasses.fields(Person)
+        if f.compare and f.name not in ignored
+        and getattr(old, f.name) != getattr(new, f.name)
+    ]
+
+
+def find_edited_people(
+    previous_people: List[Person],
+    people: List[Person],
+    weeks: int,
+    ignored: Set[str] = IGNORED_FIELDS,
+) -> Set[str]:
+    """
+    Names of people whose own scheduling inputs changed.
+
+    Covers changed Person fields (except ignored ones), new members and
+    people whose EDO weeks moved (toggling edo_eligible on one person
+    reshuffles the EDO halves).
+    """
+    old = {p.name: p for p in previous_people}
+    edited = {
+        p.name for p in people
+        if p.name not in old or _person_fields(old[p.name], p, ignored)
+    }
+
+    old_plan = build_edo_plan(previous_people, weeks).plan
+    new_plan = build_edo_plan(people, weeks).plan
+    for w, names in new_plan.items():
+        edited |= names ^ old_plan.get(w, set())
+
+    return edited & {p.name for p in people}
+
+
+def _affected_days(
+    old: Optional[Person],
+    new: Optional[Person],
+    worked: WorkedDays,
+    weeks: int,
+    days: List[str],
+    ignored: Set[str] = IGNORED_FIELDS,
+) -> Set[Tuple[int, str]]:
+    """
+    (week, day) slots whose staffing an edit of one person can change.
+
+    Args:
+        old, new: The person before/after the edit (None if added/removed)
+        worked: The person's shifts in the previous schedule
+        weeks: Horizon length
+        days: Days of the week
+        ignored: Person fields the model does not read
+    """
+    all_days = {(w, d) for w in range(1, weeks + 1) for d in days}
+    if old is None:
+        return all_days  # a newcomer can take any slot
+    if new is None:
+        return set(worked)  # a leaver's slots must be refilled
+
+    changed = _person_fields(old, new, ignored)
+    if not changed:
+        # Only the EDO weeks moved: every week they worked can change
+        return set(worked)
+
+    affected: Set[Tuple[int, str]] = set()
+    for name in changed:
+        if name in SHIFT_FIELDS:
+            affected |= {slot for slot, shift in worked.items() if shift == SHIFT_FIELDS[name]}
+        elif name == "edo_fixed_day":
+            edo_days = {old.edo_fixed_day, new.edo_fixed_day}
+            affected |= {(w, d) for w, d in all_days if d in edo_days}
+        elif name in IGNORED_FIELDS:
+            affected |= {(w, d) for w, d in all_days if d in WEEKEND_JOURS}
+        else:
+            affected |= set(worked)
+    return affected
+
+
+def _fix_person_days(
+    built: PairModel,
+    matrix: Dict[tuple, str],
+    free_people: Set[str],
+    free_days: Set[int],
+) -> int:
+    """Pin every person-day outside the free region to its previous shift."""
+    store = built.store
+    fixed = 0
+    for p, name in enumerate(store.names):
+        if name in free_people:
+            continue
+        for g in range(store.num_days):
+            if g in free_days:
+                continue
+            w, d = store.day_label(g)
+            shift = matrix.get((name, w, d))
+            for s, var in enumerate(store.day_shifts(p, g)):
+                built.model.Add(var == (1 if shift == SHIFT_CODES[s] else 0))
+            fixed += 1
+    return fixed
+
+
+def delta_solve(
+    previous: PairSchedule,
+    previous_people: List[Person],
+    people: List[Person],
+    config: SolverConfig,
+    custom_staffing: Optional[Dict[str, int]] = None,
+    edo_plan: Optional[EDOPlan] = None,
+    neighbourhood_days: int = 1,
+) -> PairSchedule:
+    """
+    Re-solve only what a team edit frees up, starting from the previous schedule.
+
+    Args:
+        previous: Schedule solved for previous_people
+        previous_people: Team before the edit
+        people: Team after the edit
+        config: Solver configuration (time limit capped at DELTA_TIME_LIMIT
+            unless the edit frees every day)
+        custom_staffing: Staffing override, as passed to derive_staffing
+        edo_plan: EDO plan of the new team (built if omitted)
+        neighbourhood_days: Days freed on each side of an affected day
+
+    Returns:
+        New PairSchedule; stats hold delta_edited, delta_free_days,
+        delta_fixed_person_days, delta_fallback and delta_changes
+    """
+    start_time = time.time()
+    weeks = config.weeks
+    edo_plan = edo_plan or build_edo_plan(people, weeks)
+    days = model_days(config)
+    ignored = IGNORED_FIELDS if days == JOURS else set()
+    staffing = derive_staffing(people, weeks, edo_plan.plan, days=days, custom_staffing=custom_staffing)
+
+    edited = find_edited_people(previous_people, people, weeks, ignored)
+    slog.phase(f"Delta Solve ({len(edited)} edited: {', '.join(sorted(edited)) or 'none'})")
+
+    # The previous schedule need not respect a symmetry ordering of the new team
+    built = build_pairs_model(people, dataclasses.replace(config, break_symmetry=False), staffing, edo_plan)
+    store = built.store
+    previous_names = [p.name for p in previous_people]
+    apply_solution_hint(built, previous, previous_names)
+
+    # Free region: edited people everywhere, everyone around affected days
+    old = {p.name: p for p in previous_people}
+    new = {p.name: p for p in people}
+    worked: Dict[str, WorkedDays] = {}
+    matrix = previous.get_person_day_matrix()
+    for (name, w, d), shift in matrix.items():
+        worked.setdefault(name, {})[(w, d)] = shift
+
+    affected: Set[Tuple[int, str]] = set()
+    for name in edited | (set(old) - set(new)):
+        affected |= _affected_days(old.get(name), new.get(name), worked.get(name, {}), weeks, store.days, ignored)
+
+    free_days: Set[int] = set()
+    for w, d in affected:
+        if w in store.week_pos and d in store.day_pos:
+            g = store.day_index(w, d)
+            free_days.update(range(max(0, g - neighbourhood_days), min(store.num_days, g + neighbourhood_days + 1)))
+
+    restricted = built.clone()
+    fixed = _fix_person_days(restricted, matrix, edited, free_days)
+    slog.step(f"Free: {len(edited)} people, {len(free_days)}/{store.num_days} days; fixed {fixed} person-days")
+
+    # An edit touching every day frees the whole model: keep the full budget
+    time_limit = config.time_limit_seconds
+    if len(free_days) < store.num_days:
+        time_limit = min(time_limit, DELTA_TIME_LIMIT)
+    delta_config = dataclasses.replace(config, time_limit_seconds=time_limit)
+    schedule = solve_model(restricted, delta_config, start_time=start_time)
+    fallback = schedule.status not in ["optimal", "feasible"]
+    if fallback:
+        logger.warning(f"Restricted delta model {schedule.status}, solving the full model from the hint")
+        schedule = solve_model(built, config, start_time=start_time)
+    elif schedule.status == "optimal":
+        # Optimal for the restricted model only
+        schedule.status = "feasible"
+
+    new_matrix = schedule.get_person_day_matrix()
+    changes = sum(
+        1 for key in set(matrix) | set(new_matrix)
+        if key[0] in new and matrix.get(key) != new_matrix.get(key)
+    )
+    schedule.solve_time_seconds = time.time() - start_time
+    schedule.stats.update({
+        "delta_edited": sorted(edited),
+        "delta_free_days": len(free_days),
+        "delta_fixed_person_days": fixed,
+        "delta_fallback": fallback,
+        "delta_changes": changes,
+    })
+    logger.info(
+        f"Delta solve: status={schedule.status}, {changes} person-day changes, "
+        f"time={schedule.solve_time_seconds:.2f}s"
+    )
+    return schedule
@@ -0,0 +1,176 @@
+"""
+Large Neighbourhood Search
+==========================
+Improvement phase run after the CP-SAT solve.
+
+Each iteration picks a neighbourhood of the current best schedule, fixes
+every other shift variable and re-solves the small subproblem with a short
+time limit:
+- week: every person-day of one week is free
+- cohort: every day of one fairness cohort is free
+- nights: all night-shift variables are free, day and evening shifts stay fixed
+
+A candidate is accepted if it lowers the score of the whole schedule
+(by default the model objective, as used to rank tries).
+"""
+import dataclasses
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver.constraints.objectives import build_cohorts, schedule_objective
+from rota.solver.edo import EDOPlan
+from rota.solver.pairs import PairModel, PairSchedule, apply_solution_hint, build_pairs_model, solve_model
+from rota.solver.staffing import WeekStaffing
+from rota.solver.variables import N_IDX, SHIFT_CODES
+from rota.utils.logging_setup import SolverLogger, get_logger
+
+logger = get_logger("rota.solver.lns")
+slog = SolverLogger("rota.solver.lns")
+
+NEIGHBOURHOODS = ("week", "cohort", "nights")
+
+# Solved schedule -> score, lower is better
+ScoreFn = Callable[[PairSchedule], float]
+
+# (person_idx, global_day_idx, shift_idx) -> True if the variable is free
+FreeFn = Callable[[int, int, int], bool]
+
+
+def _pick_neighbourhood(
+    kind: str,
+    store,
+    cohorts: Dict[str, List[str]],
+    rng: random.Random,
+) -> Tuple[str, FreeFn]:
+    """Choose one neighbourhood of the given kind: (label, free-variable test)."""
+    if kind == "week":
+        week = rng.choice(store.week_numbers)
+        days = set(store.week_days(week))
+        return f"week {week}", lambda p, g, s: g in days
+    if kind == "cohort":
+        name = rng.choice(sorted(cohorts))
+        members = {store.person_index[n] for n in cohorts[name]}
+        return f"cohort {name}", lambda p, g, s: p in members
+    return "nights", lambda p, g, s: s == N_IDX
+
+
+def _fix_outside(built: PairModel, matrix: Dict[tuple, str], is_free: FreeFn) -> int:
+    """Pin every shift variable the neighbourhood does not free to its current value."""
+    store = built.store
+    fixed = 0
+    for p, name in enumerate(store.names):
+        for g in range(store.num_days):
+            w, d = store.day_label(g)
+            shift = matrix.get((name, w, d))
+            for s, var in enumerate(store.day_shifts(p, g)):
+                if not is_free(p, g, s):
+                    built.model.Add(var == (1 if shift == SHIFT_CODES[s] else 0))
+                    fixed += 1
+    return fixed
+
+
+def improve_with_lns(
+    schedule: PairSchedule,
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    time_budget: float,
+    iteration_seconds: float = 2.0,
+    score_fn: Optional[ScoreFn] = None,
+    seed: int = 0,
+) -> PairSchedule:
+    """
+    Improve a solved schedule by repeated neighbourhood re-solves.
+
+    Args:
+        schedule: Solved schedule to start from
+        people: List of Person objects
+        config: Solver configuration
+        staffing: Slot requirements per week/day/shift
+        edo_plan: EDO allocation plan
+        time_budget: Wall-clock seconds for the whole phase
+        iteration_seconds: CP-SAT time limit of each subproblem
+        score_fn: Score to minimize (defaults to schedule_objective)
+        seed: Seed for neighbourhood choice and CP-SAT
+
+    Returns:
+        Best schedule found (the input schedule if nothing improved).
+        stats["lns_log"] lists every iteration as
+        {iteration, neighbourhood, score, accepted, elapsed}.
+    """
+    if schedule.status not in ["optimal", "feasible"] or not people or time_budget <= 0:
+        return schedule
+
+    start_time = time.time()
+    if score_fn is None:
+        def score_fn(candidate: PairSchedule) -> float:
+            return schedule_objective(candidate, people, config, staffing, edo_plan)
+
+    slog.phase(f"LNS Improvement ({time_budget:.0f}s budget, {iteration_seconds:.1f}s per iteration)")
+    # Fixing a neighbourhood's complement can clash with a symmetry ordering
+    base = build_pairs_model(people, dataclasses.replace(config, break_symmetry=False), staffing, edo_plan)
+    cohorts = build_cohorts(base.store.names, {p.name: p for p in people}, config)
+    rng = random.Random(seed)
+
+    best = schedule
+    best_score = score_fn(schedule)
+    initial_score = best_score
+    log = []
+    iteration = 0
+
+    while True:
+        remaining = time_budget - (time.time() - start_time)
+        if remaining < 0.1:
+            break
+        iteration += 1
+        kind = NEIGHBOURHOODS[(iteration - 1) % len(NEIGHBOURHOODS)]
+
+        built = base.clone()
+        built.model.ClearHints()
+        apply_solution_hint(built, best)
+        label, is_free = _pick_neighbourhood(kind, built.store, cohorts, rng)
+        _fix_outside(built, best.get_person_day_matrix(), is_free)
+
+        sub_config = dataclasses.replace(
+            config,
+            time_limit_seconds=min(iteration_seconds, remaining),
+            random_seed=rng.randrange(1 << 30),
+        )
+        candidate = solve_model(built, sub_config)
+
+        accepted = False
+        score = float("inf")
+        if candidate.status in ["optimal", "feasible"]:
+            score = score_fn(candidate)
+            accepted = score < best_score - 1e-9
+        if accepted:
+            best, best_score = candidate, score
+
+        elapsed = time.time() - start_time
+        log.append({
+            "iteration": iteration,
+            "neighbourhood": label,
+            "score": score,
+            "accepted": accepted,
+            "elapsed": elapsed,
+        })
+        slog.step(
+            f"▸ LNS {iteration} ({label}): score={score:.2f}"
+            f"{' accepted' if accepted else ''}, best={best_score:.2f} at {elapsed:.1f}s"
+        )
+
+    if best is not schedule:
+        # Keep the original solve's metadata (seed, profile, objective trace)
+        best.stats = dict(schedule.stats)
+        best.solve_time_seconds = schedule.solve_time_seconds + (time.time() - start_time)
+    best.score = best_score
+    best.stats["lns_log"] = log
+    best.stats["lns_initial_score"] = initial_score
+    best.stats["lns_iterations"] = iteration
+    best.stats["lns_accepted"] = sum(1 for entry in log if entry["accepted"])
+    logger.info(f"LNS: {initial_score:.2f} -> {best_score:.2f} in {iteration} iterations")
+    return best
@@ -2,57 +2,366 @@
 Multi-Seed Optimizer
 ====================
 Runs multiple solver attempts with different seeds and keeps the best.
+
+Tries are ranked by the CP-SAT objective itself (schedule_objective), so the
+best seed is the best at what the solver minimized. Validation and fairness
+metrics are only computed where they are stored (optimize_with_cache).
 """
-import concurrent.futures
+import dataclasses
+import multiprocessing
 import os
-import random
+import queue
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from rota.models.constraints import SolverConfig
 from rota.models.person import Person
+from rota.solver.constraints.objectives import schedule_objective
 from rota.solver.edo import EDOPlan, build_edo_plan
-from rota.solver.pairs import PairSchedule, solve_pairs
-from rota.solver.staffing import WeekStaffing, derive_staffing
-from rota.solver.validation import calculate_fairness, score_solution, validate_schedule
+from rota.solver.lns import improve_with_lns
+from rota.solver.pairs import (
+    CompiledModel,
+    PairModel,
+    PairSchedule,
+    apply_solution_hint,
+    build_pairs_model,
+    solve_model,
+    solve_pairs,
+)
+from rota.solver.rolling import uses_rolling_horizon
+from rota.solver.search_profiles import profile_for_try
+from rota.solver.staffing import WeekStaffing, derive_staffing, model_days
+from rota.solver.validation import (
+    FairnessMetrics,
+    ValidationResult,
+    calculate_fairness,
+    score_solution,
+    validate_schedule,
+)
 from rota.utils.logging_setup import SolverLogger, get_logger
 
 logger = get_logger("rota.solver.optimizer")
 slog = SolverLogger("rota.solver.optimizer")
 
+# Multi-try strategies accepted by optimize()
+STRATEGIES = ("process_pool", "internal_portfolio")
 
-def _solve_single_try(
+# Minimum seconds between two snapshots relayed from a worker process
+SNAPSHOT_INTERVAL = 0.5
+
+# Scores a solved try, lower is better (inf if unsolved)
+ScoreFn = Callable[[PairSchedule], float]
+
+
+def _evaluate_schedule(
+    schedule: PairSchedule,
+    people: List[Person],
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    cohort_mode: str,
+) -> Tuple[Optional[ValidationResult], Optional[FairnessMetrics]]:
+    """Validation and fairness of a solved schedule ((None, None) if not solved)."""
+    if schedule.status not in ["optimal", "feasible"]:
+        return None, None
+    validation = validate_schedule(schedule, people, edo_plan, staffing)
+    fairness = calculate_fairness(schedule, people, cohort_mode)
+    return validation, fairness
+
+
+def _objective_score(
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+) -> ScoreFn:
+    """Scoring used to rank tries: the model's own objective."""
+    def score(schedule: PairSchedule) -> float:
+        return schedule_objective(schedule, people, config, staffing, edo_plan)
+    return score
+
+
+def _fairness_dict(fairness: Optional[FairnessMetrics]) -> Dict[str, Any]:
+    """Fairness metrics as stored with a trial."""
+    if fairness is None:
+        return {}
+    return {
+        "night_std": fairness.night_std,
+        "eve_std": fairness.eve_std,
+        "night_std_by_cohort": fairness.night_std_by_cohort,
+        "eve_std_by_cohort": fairness.eve_std_by_cohort,
+    }
+
+
+def _lns_phase(
+    schedule: Optional[PairSchedule],
+    score: float,
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    score_fn: ScoreFn,
     seed: int,
+) -> Tuple[Optional[PairSchedule], float]:
+    """Run the LNS improvement phase on the best try if config.lns_time_seconds asks for it."""
+    if (
+        schedule is None or score == float("inf") or config.lns_time_seconds <= 0
+        or uses_rolling_horizon(config)
+    ):
+        return schedule, score
+    improved = improve_with_lns(
+        schedule, people, config, staffing, edo_plan,
+        time_budget=config.lns_time_seconds,
+        iteration_seconds=config.lns_iteration_seconds,
+        score_fn=score_fn,
+        seed=seed,
+    )
+    return improved, improved.score
+
+
+def _try_config(config: SolverConfig, seed: int, try_index: Optional[int] = None) -> SolverConfig:
+    """
+    Per-try copy of the config carrying the CP-SAT seed and search profile.
+
+    Args:
+        config: Shared solver configuration
+        seed: CP-SAT random_seed for this try
+        try_index: Position in the portfolio; None keeps config.search_profile
+
+    Returns:
+        New SolverConfig (the shared one is left untouched)
+    """
+    profile = config.search_profile
+    if try_index is not None:
+        profile = profile_for_try(try_index, config.portfolio_profiles)
+    return dataclasses.replace(config, random_seed=seed, search_profile=profile)
+
+
+def _stop_reason(schedule: PairSchedule, score: float, config: SolverConfig) -> Optional[str]:
+    """Why the remaining tries can be skipped after this result (None = keep going)."""
+    if config.stop_on_optimal and schedule.status == "optimal":
+        return "optimal"
+    if config.target_score is not None and score <= config.target_score:
+        return "target_score"
+    return None
+
+
+def _solve_single_try(
     people: List[Person],
     config: SolverConfig,
     staffing: Dict[int, WeekStaffing],
     edo_plan: EDOPlan,
-    cohort_mode: str
-) -> Tuple[PairSchedule, float]:
-    """Helper for parallel execution."""
-    random.seed(seed)
+    cohort_mode: str,
+    snapshots=None,
+    details: bool = False,
+) -> Tuple[PairSchedule, Optional[ValidationResult], Optional[FairnessMetrics]]:
+    """
+    Helper for parallel execution (config already carries seed and profile).
     
-    # Run solver
-    schedule = solve_pairs(people, config, staffing, edo_plan)
+    Validation and fairness are only computed with details=True ((None, None) otherwise).
+    """
+    on_solution = snapshots.put if snapshots is not None else None
+    schedule = solve_pairs(people, config, staffing, edo_plan, on_solution=on_solution)
+    if not details:
+        return schedule, None, None
+    return (schedule, *_evaluate_schedule(schedule, people, staffing, edo_plan, cohort_mode))
+
+
+def _solve_compiled_try(
+    compiled: CompiledModel,
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    cohort_mode: str,
+    start_time: Optional[float] = None,
+    snapshots=None,
+    details: bool = False,
+) -> Tuple[PairSchedule, Optional[ValidationResult], Optional[FairnessMetrics]]:
+    """Worker for build-once mode: load the shared model and solve with this try's parameters."""
+    built = compiled.load()
+    on_solution = snapshots.put if snapshots is not None else None
+    schedule = solve_model(
+        built, config, start_time=start_time,
+        on_solution=on_solution, snapshot_interval=SNAPSHOT_INTERVAL,
+    )
+    if not details:
+        return schedule, None, None
+    return (schedule, *_evaluate_schedule(schedule, people, staffing, edo_plan, cohort_mode))
+
+
+class _SnapshotRelay:
+    """
+    Forward PairSchedule snapshots from worker processes to a callback.
     
-    # Score result
-    score = float("inf")
-    if schedule.status in ["optimal", "feasible"]:
-        # We need to validate to score
-        validation = validate_schedule(schedule, people, edo_plan, staffing)
-        fairness = calculate_fairness(schedule, people, cohort_mode)
-        
-        # Use standard weights (could be passed in config if needed, but defaults are fine for now)
-        score = score_solution(
-            validation, 
-            fairness,
-            w_night=config.night_fairness_weight, 
-            w_eve=config.evening_fairness_weight, 
-            w_dev=5.0, # default deviation weight
-            w_clopen=1.0 # default clopening weight
-        )
+    Workers put snapshots on a managed queue; a thread in this process
+    drains it and calls on_solution.
+    """
+    
+    def __init__(self, on_solution: Callable[[PairSchedule], None]):
+        self._manager = multiprocessing.Manager()
+        self.queue = self._manager.Queue()
+        self._thread = threading.Thread(target=self._run, args=(on_solution,), daemon=True)
+        self._thread.start()
+    
+    def _run(self, on_solution):
+        while True:
+            snapshot = self.queue.get()
+            if snapshot is None:
+                return
+            try:
+                on_solution(snapshot)
+            except Exception as e:
+                logger.warning(f"on_solution callback failed: {e}")
+    
+    def close(self):
+        self.queue.put(None)
+        self._thread.join()
+        self._manager.shutdown()
+
+
+def _parallel_config(config: SolverConfig, tries: int) -> Tuple[SolverConfig, int]:
+    """
+    Split the cores between concurrent tries.
+    
+    A config that already sets parallel_portfolio with workers_per_solve > 0
+    (e.g. the weekday share from weekend_pipeline.split_workers) caps the
+    cores split; otherwise every core is used.
+    
+    Returns:
+        (config for each try, number of concurrent solver processes)
+    """
+    # We use roughly 1 core per try, capped by available cores
+    if config.parallel_portfolio and config.workers_per_solve > 0:
+        total_cores = config.workers_per_solve
+    else:
+        total_cores = os.cpu_count() or 4
+    # Launch at most 'tries' parallel processes, but also limit by CPU count
+    num_concurrent_solvers = min(tries, total_cores)
+    
+    # Calculate how many internal threads each solver can use
+    # If we have 10 cores and 2 solvers, each gets 5 threads.
+    # If we have 10 cores and 10 solvers, each gets 1 thread.
+    workers_per_solve = max(1, total_cores // num_concurrent_solvers)
+    
+    slog.step(f"Parallel Execution: {num_concurrent_solvers} solvers x {workers_per_solve} threads (Total Cores: {total_cores})")
+    return (
+        dataclasses.replace(config, parallel_portfolio=True, workers_per_solve=workers_per_solve),
+        num_concurrent_solvers,
+    )
+
+
+def _run_parallel_tries(
+    seeds: List[int],
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    cohort_mode: str,
+    score_fn: ScoreFn,
+    compiled: Optional[CompiledModel] = None,
+    start_time: Optional[float] = None,
+    on_result: Optional[Callable[..., None]] = None,
+    on_solution: Optional[Callable[[PairSchedule], None]] = None,
+    details: bool = False,
+) -> Tuple[Optional[PairSchedule], Optional[int], float, int, Optional[str]]:
+    """
+    Process-pool engine shared by optimize() and optimize_with_cache().
+    
+    Runs one try per seed (profiles cycled by position), scores results as
+    they complete and cancels the rest once _stop_reason() fires.
+    
+    Args:
+        seeds: CP-SAT seed of each try
+        people, config, staffing, edo_plan, cohort_mode: The problem
+        score_fn: Turns a solved try into its score
+        compiled: Model built once in the parent (None builds per try)
+        start_time: Shared clock for objective traces
+        on_result: Called in this process as each try completes, with
+            (seed, try_config, schedule, score, validation, fairness)
+        on_solution: Receives intermediate snapshots from every worker
+        details: Compute validation and fairness in the workers (passed to
+            on_result; None otherwise)
         
-    return schedule, score
+    Returns:
+        (best_schedule, best_seed, best_score, completed_count, stop_reason);
+        best_schedule is None if every try failed
+    """
+    tries = len(seeds)
+    config, num_concurrent_solvers = _parallel_config(config, tries)
+    relay = _SnapshotRelay(on_solution) if on_solution is not None else None
+    snapshots = relay.queue if relay is not None else None
+    
+    best_schedule = None
+    best_score = float("inf")
+    best_seed = None
+    stop_reason = None
+    completed_count = 0
+    
+    # Results arrive from the pool's result-handler thread
+    results: "queue.Queue" = queue.Queue()
+    
+    try:
+        # The pool owns its worker processes: leaving the block terminates
+        # them, which is how tries still solving are cancelled on an early stop
+        with multiprocessing.Pool(processes=num_concurrent_solvers) as pool:
+            # Prepare tasks
+            for t, cur_seed in enumerate(seeds):
+                try_config = _try_config(config, cur_seed, t)
+                if compiled is not None:
+                    task, args = _solve_compiled_try, (
+                        compiled, people, try_config, staffing, edo_plan, cohort_mode,
+                        start_time, snapshots, details,
+                    )
+                else:
+                    task, args = _solve_single_try, (
+                        people, try_config, staffing, edo_plan, cohort_mode, snapshots, details,
+                    )
+                key = (cur_seed, try_config)
+                pool.apply_async(
+                    task, args,
+                    callback=lambda value, key=key: results.put((key, value, None)),
+                    error_callback=lambda error, key=key: results.put((key, None, error)),
+                )
+            
+            # Process results as they complete
+            # Timeout per result = 2x the solver time limit (or 120s minimum)
+            result_timeout = max(120, config.time_limit_seconds * 2)
+            while completed_count < tries:
+                try:
+                    (cur_seed, try_config), value, error = results.get(timeout=result_timeout)
+                except queue.Empty:
+                    logger.error(f"No try finished within {result_timeout}s, abandoning {tries - completed_count} tries")
+                    break
+                completed_count += 1
+                profile = try_config.search_profile
+                if error is not None:
+                    logger.error(f"Try failed for seed {cur_seed}: {error}")
+                    continue
+                
+                schedule, validation, fairness = value
+                score = score_fn(schedule)
+                slog.step(f"▸ Try {completed_count}/{tries} (seed={cur_seed}, profile={profile}) finished. Score: {score:.2f}")
+                if on_result is not None:
+                    on_result(cur_seed, try_config, schedule, score, validation, fairness)
+                
+                if score < best_score:
+                    slog.step(f"New best: seed={cur_seed}, profile={profile}, score={score:.2f}")
+                    best_score = score
+                    best_schedule = schedule
+                    best_seed = cur_seed
+                
+                stop_reason = _stop_reason(schedule, score, config)
+                if stop_reason is not None:
+                    if completed_count < tries:
+                        slog.step(f"Stopping early ({stop_reason}): cancelling {tries - completed_count} tries")
+                    break
+    finally:
+        if relay is not None:
+            relay.close()
+    
+    return best_schedule, best_seed, best_score, completed_count, stop_reason
+
 
 def optimize(
     people: List[Person],
@@ -61,6 +370,8 @@ def optimize(
     seed: Optional[int] = None,
     cohort_mode: str = "by-wd",
     custom_staffing: Optional[Dict[str, int]] = None,
+    reuse_model: bool = True,
+    strategy: str = "process_pool",
 ) -> Tuple[PairSchedule, int, float]:
     """
     Run multiple solver attempts and keep the best.
@@ -70,74 +381,59 @@ def optimize(
         config: Solver configuration
         tries: Number of attempts with sequential seeds
         seed: Base seed (defaults to current time)
-        cohort_mode: For fairness calculation
+        cohort_mode: Not used for ranking: tries are scored by the model
+            objective, whose cohorts follow config.fairness_mode
         custom_staffing: Optional override for staffing needs (e.g. for stress test)
+        reuse_model: Build the CP-SAT model once and ship the serialized proto
+            to every worker; tries then differ by CP-SAT random_seed and
+            search profile (cycled from config.portfolio_profiles)
+        strategy: "process_pool" runs one process per try; "internal_portfolio"
+            runs a single CP-SAT solve on all cores (tries is ignored) and lets
+            the solver's own workers share bounds and solutions
         
     Returns:
         (best_schedule, best_seed, best_score)
     """
-    slog.phase(f"Multi-Seed Optimization ({tries} tries)")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}', expected one of {STRATEGIES}")
     
+    start_time = time.time()
     base_seed = seed if seed is not None else int(time.time())
     
     # Pre-compute staffing and EDO (same for all tries)
     edo_plan = build_edo_plan(people, config.weeks)
-    staffing = derive_staffing(people, config.weeks, edo_plan.plan, custom_staffing=custom_staffing)
+    staffing = derive_staffing(
+        people, config.weeks, edo_plan.plan, days=model_days(config), custom_staffing=custom_staffing
+    )
+    
+    if strategy == "internal_portfolio":
+        return _optimize_internal_portfolio(
+            people, config, base_seed, staffing, edo_plan, start_time
+        )
+    
+    slog.phase(f"Multi-Seed Optimization ({tries} tries)")
     
     # Enable portfolio mode if >1 try
-    # We use roughly 1 core per try, capped by available cores
     if tries > 1:
-        config.parallel_portfolio = True
-        total_cores = os.cpu_count() or 4
-        # Launch at most 'tries' parallel processes, but also limit by CPU count
-        num_concurrent_solvers = min(tries, total_cores)
+        # Build once, solve many: compile the model in the parent, ship the proto
+        compiled = None
+        if reuse_model and people and not uses_rolling_horizon(config):
+            compiled = build_pairs_model(people, config, staffing, edo_plan).compile()
+            slog.step(f"Model compiled once ({compiled.build_time_seconds:.2f}s, {len(compiled.data) // 1024} KB)")
         
-        # Calculate how many internal threads each solver can use
-        # If we have 10 cores and 2 solvers, each gets 5 threads.
-        # If we have 10 cores and 10 solvers, each gets 1 thread.
-        workers_per_solve_calc = max(1, total_cores // num_concurrent_solvers)
-        config.workers_per_solve = workers_per_solve_calc
-        
-        slog.step(f"Parallel Execution: {num_concurrent_solvers} solvers x {workers_per_solve_calc} threads (Total Cores: {total_cores})")
-        
-        best_schedule = None
-        best_score = float("inf")
-        best_seed = base_seed
-        
-        with concurrent.futures.ProcessPoolExecutor(max_workers=num_concurrent_solvers) as executor:
-            # Prepare tasks
-            futures = {}
-            for t in range(tries):
-                cur_seed = base_seed + t
-                future = executor.submit(
-                    _solve_single_try, 
-                    cur_seed, people, config, staffing, edo_plan, cohort_mode
-                )
-                futures[future] = cur_seed
-                
-            # Process results as they complete
-            # Timeout per future = 2x the solver time limit (or 120s minimum)
-            future_timeout = max(120, config.time_limit_seconds * 2)
-            completed_count = 0
-            for future in concurrent.futures.as_completed(futures):
-                completed_count += 1
-                cur_seed = futures[future]
-                try:
-                    schedule, score = future.result(timeout=future_timeout)
-                    slog.step(f"▸ Try {completed_count}/{tries} (seed={cur_seed}) finished. Score: {score:.2f}")
-                    
-                    if score < best_score:
-                        slog.step(f"New best: seed={cur_seed}, score={score:.2f}")
-                        best_score = score
-                        best_schedule = schedule
-                        best_seed = cur_seed
-                        
-                except concurrent.futures.TimeoutError:
-                    logger.error(f"Try timed out for seed {cur_seed} (>{future_timeout}s)")
-                except Exception as e:
-                    logger.error(f"Try failed for seed {cur_seed}: {e}")
-                    
+        best_schedule, best_seed, best_score, completed_count, stop_reason = _run_parallel_tries(
+            [base_seed + t for t in range(tries)],
+            people, config, staffing, edo_plan, cohort_mode,
+            score_fn=_objective_score(people, config, staffing, edo_plan),
+            compiled=compiled,
+            start_time=start_time,
+        )
                     
+        best_schedule, best_score = _lns_phase(
+            best_schedule, best_score, people, config, staffing, edo_plan,
+            _objective_score(people, config, staffing, edo_plan), best_seed,
+        )
+        
         # Return best found
         if best_schedule:
              slog.phase(f"optimization complete. Best: {best_score:.2f}")
@@ -145,6 +441,10 @@ def optimize(
              best_schedule.score = best_score
              best_schedule.stats["best_seed"] = best_seed
              best_schedule.stats["tries"] = tries
+             best_schedule.stats["strategy"] = strategy
+             best_schedule.stats["model_builds"] = 1 if compiled is not None else tries
+             best_schedule.stats["tries_cancelled"] = tries - completed_count
+             best_schedule.stats["stop_reason"] = stop_reason
              return best_schedule, best_seed, best_score
         else:
              # Fallback if all failed (unlikely) or 0 tries
@@ -159,16 +459,69 @@ def optimize(
     else:
         # Sequential (Single Try)
         # config.parallel_portfolio is False by default
-        schedule, score = _solve_single_try(base_seed, people, config, staffing, edo_plan, cohort_mode)
+        try_config = _try_config(config, base_seed)
+        schedule, _, _ = _solve_single_try(people, try_config, staffing, edo_plan, cohort_mode)
+        score_fn = _objective_score(people, config, staffing, edo_plan)
+        schedule, score = _lns_phase(
+            schedule, score_fn(schedule), people, config, staffing, edo_plan, score_fn, base_seed,
+        )
         
         # Update schedule with stats
         schedule.score = score
         schedule.stats["best_seed"] = base_seed
         schedule.stats["tries"] = 1
+        schedule.stats["strategy"] = strategy
         
         return schedule, base_seed, score
 
 
+def _optimize_internal_portfolio(
+    people: List[Person],
+    config: SolverConfig,
+    seed: int,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    start_time: float,
+) -> Tuple[PairSchedule, int, float]:
+    """
+    Single CP-SAT solve using every core as internal portfolio workers.
+    
+    CP-SAT workers share bounds and solutions, so no process pool, pickling
+    or core splitting is needed. Objective improvements are logged as they arrive.
+    
+    Returns:
+        (schedule, seed, score)
+    """
+    num_workers = os.cpu_count() or 8
+    slog.phase(f"Internal Portfolio Optimization (1 solve x {num_workers} workers)")
+    
+    solve_config = dataclasses.replace(
+        config, parallel_portfolio=True, workers_per_solve=num_workers, random_seed=seed
+    )
+    
+    def on_improvement(elapsed: float, objective: float, bound: float):
+        slog.step(f"▸ {elapsed:.1f}s objective={objective:.0f} bound={bound:.0f}")
+    
+    if people and not uses_rolling_horizon(solve_config):
+        built = build_pairs_model(people, solve_config, staffing, edo_plan)
+        schedule = solve_model(built, solve_config, start_time=start_time, on_improvement=on_improvement)
+    else:
+        schedule = solve_pairs(people, solve_config, staffing, edo_plan)
+    
+    score_fn = _objective_score(people, config, staffing, edo_plan)
+    schedule, score = _lns_phase(
+        schedule, score_fn(schedule), people, solve_config, staffing, edo_plan, score_fn, seed,
+    )
+    slog.phase(f"optimization complete. Score: {score:.2f}")
+    
+    schedule.score = score
+    schedule.stats["best_seed"] = seed
+    schedule.stats["tries"] = 1
+    schedule.stats["strategy"] = "internal_portfolio"
+    schedule.stats["model_builds"] = 1
+    return schedule, seed, score
+
+
 def solve_with_validation(
     people: List[Person],
     config: SolverConfig,
@@ -186,7 +539,7 @@ def solve_with_validation(
         (schedule, score)
     """
     edo_plan = build_edo_plan(people, config.weeks)
-    staffing = derive_staffing(people, config.weeks, edo_plan.plan)
+    staffing = derive_staffing(people, config.weeks, edo_plan.plan, days=model_days(config))
     
     schedule = solve_pairs(people, config, staffing, edo_plan)
     
@@ -202,6 +555,42 @@ def solve_with_validation(
     return schedule, score
 
 
+def _apply_warm_start(
+    manager,
+    built: PairModel,
+    study_hash: str,
+    people: List[Person],
+    config: SolverConfig,
+) -> Optional[str]:
+    """
+    Hint the model with the best trial of this study, or of the nearest one.
+    
+    Returns:
+        Hash of the study used as hint source, or None if nothing usable
+    """
+    source = None
+    trial = manager.get_best_trial(study_hash)
+    if trial is not None and trial.score < float("inf"):
+        source = study_hash
+    else:
+        nearest = manager.find_nearest_study(people, config.weeks, exclude_hash=study_hash)
+        if nearest is None:
+            return None
+        source = nearest[0]
+        trial = manager.get_best_trial(source)
+        if trial is None or trial.score == float("inf"):
+            return None
+    
+    schedule = manager.load_schedule_from_trial(trial)
+    if schedule.status not in ["optimal", "feasible"]:
+        return None
+    
+    team = manager.get_study_team(source)
+    hints = apply_solution_hint(built, schedule, [p.name for p in team] if team else None)
+    slog.step(f"Warm start from study {source[:8]} (seed={trial.seed}, {hints} hints)")
+    return source
+
+
 def optimize_with_cache(
     people: List[Person],
     config: SolverConfig,
@@ -211,6 +600,8 @@ def optimize_with_cache(
     custom_staffing: Optional[Dict[str, int]] = None,
     weekend_config: Optional[Dict] = None,
     use_cache: bool = True,
+    on_solution: Optional[Callable[[PairSchedule], None]] = None,
+    warm_start: bool = True,
 ) -> Tuple[PairSchedule, int, float, str]:
     """
     Run optimization with study caching.
@@ -220,20 +611,27 @@ def optimize_with_cache(
         - Compares new results with cached best
         - Returns the overall best (cached or new)
     
+    Several new seeds run in parallel on the same process-pool engine as
+    optimize(); each trial is persisted as soon as it completes.
+    
     Args:
         people: List of Person objects
         config: Solver configuration
         tries: Number of attempts
         seed: Base seed
-        cohort_mode: For fairness calculation
+        cohort_mode: For the fairness metrics stored with each trial
         custom_staffing: Optional staffing override
         weekend_config: Optional weekend configuration
         use_cache: Whether to use study caching (default True)
+        on_solution: Called with intermediate PairSchedule snapshots as each
+            seed's solve improves (see solve_model)
+        warm_start: Hint the solver with the best cached trial of this study,
+            or of the nearest previous study (same weeks, overlapping team)
         
     Returns:
         (best_schedule, best_seed, best_score, study_hash)
     """
-    from rota.solver.study_manager import StudyManager, compute_study_hash
+    from rota.solver.study_manager import StudyManager, TrialRecord, TrialWriter, compute_study_hash
     
     manager = StudyManager()
     study_hash = compute_study_hash(config, people, custom_staffing, weekend_config)
@@ -271,53 +669,96 @@ def optimize_with_cache(
             return schedule, best_trial.seed, best_trial.score, study_hash
     
     # Run optimization with the new seeds
+    start_time = time.time()
     edo_plan = build_edo_plan(people, config.weeks)
-    staffing = derive_staffing(people, config.weeks, edo_plan.plan, custom_staffing=custom_staffing)
+    staffing = derive_staffing(
+        people, config.weeks, edo_plan.plan, days=model_days(config), custom_staffing=custom_staffing
+    )
     
     slog.phase(f"Cached Optimization ({len(seeds_to_try)} new tries, study={study_hash[:8]})")
     
-    best_schedule = None
-    best_score = float("inf")
-    best_seed = base_seed
+    # Build the model once; each seed only changes the CP-SAT parameters
+    # (rolling-horizon configs build one model per block inside solve_pairs)
+    built = None
+    if people and not uses_rolling_horizon(config):
+        built = build_pairs_model(people, config, staffing, edo_plan)
     
-    # Simple sequential for now (could parallelize)
-    for cur_seed in seeds_to_try:
-        random.seed(cur_seed)
-        schedule = solve_pairs(people, config, staffing, edo_plan)
-        
-        score = float("inf")
-        validation_dict = {}
-        fairness_dict = {}
-        
-        if schedule.status in ["optimal", "feasible"]:
-            validation = validate_schedule(schedule, people, edo_plan, staffing)
-            fairness = calculate_fairness(schedule, people, cohort_mode)
-            score = score_solution(
-                validation, fairness,
-                w_night=config.night_fairness_weight,
-                w_eve=config.evening_fairness_weight,
+    warm_start_study = None
+    if built is not None and use_cache and warm_start:
+        warm_start_study = _apply_warm_start(manager, built, study_hash, people, config)
+    
+    score_fn = _objective_score(people, config, staffing, edo_plan)
+    
+    # Trials are saved by the writer thread as they complete
+    writer = TrialWriter(manager, study_hash) if use_cache else None
+    
+    def on_result(cur_seed, try_config, schedule, score, validation, fairness):
+        schedule.stats["warm_start_study"] = warm_start_study
+        if writer is not None:
+            writer.submit(TrialRecord(
+                cur_seed, score, schedule,
+                validation.as_dict() if validation is not None else {},
+                _fairness_dict(fairness),
+                profile=try_config.search_profile or "default",
+            ))
+    
+    try:
+        if len(seeds_to_try) > 1:
+            # Same engine as optimize(): one process per try, sharing the compiled
+            # (and warm-start hinted) model
+            best_schedule, best_seed, best_score, completed_count, stop_reason = _run_parallel_tries(
+                seeds_to_try,
+                people, config, staffing, edo_plan, cohort_mode,
+                score_fn=score_fn,
+                compiled=built.compile() if built is not None else None,
+                start_time=start_time,
+                on_result=on_result,
+                on_solution=on_solution,
+                details=writer is not None,
             )
-            validation_dict = validation.as_dict()
-            fairness_dict = {
-                "night_std": fairness.night_std,
-                "eve_std": fairness.eve_std,
-                "night_std_by_cohort": fairness.night_std_by_cohort,
-                "eve_std_by_cohort": fairness.eve_std_by_cohort,
-            }
-        
-        # Save trial to cache
-        if use_cache:
-            manager.save_trial(study_hash, cur_seed, score, schedule, validation_dict, fairness_dict)
-        
-        slog.step(f"▸ Seed {cur_seed}: score={score:.2f}")
+            if best_seed is None:
+                best_seed = base_seed
+        else:
+            cur_seed = seeds_to_try[0]
+            try_config = _try_config(config, cur_seed)
+            if built is not None:
+                schedule = solve_model(built, try_config, start_time=start_time, on_solution=on_solution)
+            else:
+                schedule = solve_pairs(people, try_config, staffing, edo_plan, on_solution=on_solution)
+            validation, fairness = None, None
+            if writer is not None:
+                validation, fairness = _evaluate_schedule(schedule, people, staffing, edo_plan, cohort_mode)
+            best_score = score_fn(schedule)
+            on_result(cur_seed, try_config, schedule, best_score, validation, fairness)
+            slog.step(f"▸ Seed {cur_seed} ({try_config.search_profile or 'default'}): score={best_score:.2f}")
         
-        if score < best_score:
-            best_score = score
-            best_schedule = schedule
+            best_schedule = schedule if best_score < float("inf") else None
             best_seed = cur_seed
+            completed_count = 1
+            stop_reason = _stop_reason(schedule, best_score, config)
+    
+        # LNS result is saved as an extra trial of the same seed
+        if best_schedule is not None and config.lns_time_seconds > 0:
+            lns_start = best_score
+            best_schedule, best_score = _lns_phase(
+                best_schedule, best_score, people, config, staffing, edo_plan, score_fn, best_seed,
+            )
+            if writer is not None and best_score < lns_start:
+                validation, fairness = _evaluate_schedule(best_schedule, people, staffing, edo_plan, cohort_mode)
+                writer.submit(TrialRecord(
+                    best_seed, best_score, best_schedule,
+                    validation.as_dict() if validation is not None else {},
+                    _fairness_dict(fairness),
+                    profile="lns",
+                ))
+    finally:
+        # A failed save only loses the cache entry, never the solved schedule
+        save_error = writer.close() if writer is not None else None
     
     # Compare with cached best
-    cached_best = manager.get_best_trial(study_hash)
+    cached_best = None
+    if save_error is None:
+        cached_best = manager.get_best_trial(study_hash)
     if cached_best and cached_best.score < best_score:
         slog.step(f"Cached result better: {cached_best.score:.2f} vs {best_score:.2f}")
         best_schedule = manager.load_schedule_from_trial(cached_best)
@@ -328,5 +769,9 @@ def optimize_with_cache(
         best_schedule.score = best_score
         best_schedule.stats["best_seed"] = best_seed
         best_schedule.stats["study_hash"] = study_hash
+        best_schedule.stats["tries_cancelled"] = len(seeds_to_try) - completed_count
+        best_schedule.stats["stop_reason"] = stop_reason
+        if save_error is not None:
+            best_schedule.stats["trial_save_error"] = str(save_error)
     
     return best_schedule, best_seed, best_score, study_hash
@@ -9,28 +9,57 @@ Pairs are reconstructed in the output phase.
 Key model:
 - Jour (D) and Nuit (N): require 2 people per slot (pairs reconstructed post-solve)
 - Soir (S): solo shifts, 1 person per slot
-- Variables: assign[person][week][day][shift] = 1 if person works this shift
+- Variables: dense VariableStore, assign[person_idx, global_day_idx, shift_idx] = 1 if person works this shift
 """
+import os
 import time
+import zlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ortools.sat.python import cp_model
 
-from rota.models.constraints import FairnessMode, SolverConfig
+from rota.models.constraints import SolverConfig
 from rota.models.person import Person
-from rota.models.rules import SHIFTS
+from rota.solver.constraints import (
+    add_consecutive_days_constraint,
+    add_consecutive_nights_constraint,
+    add_contractor_pair_constraint,
+    add_edo_constraints,
+    add_max_nights_constraint,
+    add_night_rest_constraint,
+    add_no_evening_preference,
+    add_person_works_link,
+    add_rolling_48h_constraint,
+    add_staffing_constraints,
+    add_symmetry_breaking,
+    add_weekend_constraints,
+    add_weekly_hours_constraint,
+)
+from rota.solver.constraints.objectives import (
+    HorizonCarry,
+    ObjectiveSpec,
+    add_clopening_penalty,
+    add_night_fairness_objective,
+    add_soir_fairness_objective,
+    add_unfilled_penalty,
+    add_workday_target_objective,
+    build_cohorts,
+)
 from rota.solver.edo import EDOPlan
-from rota.solver.staffing import JOURS, WeekStaffing
+from rota.solver.profiling import BuildProfile, enable_search_log, response_stats
+from rota.solver.search_profiles import apply_search_profile
+from rota.solver.staffing import WeekStaffing, staffing_days
+from rota.solver.variables import SHIFT_CODES, SHIFT_INDEX, StoreLayout, VariableStore
 from rota.utils.logging_setup import SolverLogger, get_logger
 
 logger = get_logger("rota.solver.engine")
 slog = SolverLogger("rota.solver.engine")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PairAssignment:
-    """A single pair assignment."""
+    """A single pair assignment (immutable, so PairSchedule indexes stay valid)."""
     week: int
     day: str
     shift: str
@@ -46,29 +75,92 @@ class PairAssignment:
 
 @dataclass
 class PairSchedule:
-    """Complete schedule with pair assignments."""
-    assignments: List[PairAssignment]
+    """
+    Complete schedule with pair assignments.
+    
+    Lookups by person, by (week, day) and per-person shift counts are served
+    from indexes built lazily on first use. assignments is stored as a tuple
+    of frozen PairAssignment, so it can only change by assigning a new
+    sequence, which drops the indexes.
+    """
+    assignments: Tuple[PairAssignment, ...]
     weeks: int
     people_count: int
     status: str  # "optimal", "feasible", "infeasible"
     score: float = 0.0
     solve_time_seconds: float = 0.0
     stats: Dict = field(default_factory=dict)
+    _indexed: bool = field(default=False, init=False, repr=False, compare=False)
+    _by_person: Dict[str, List[PairAssignment]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_day: Dict[Tuple[int, str], List[PairAssignment]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _shift_counts: Dict[str, Dict[str, int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _slot_counts: Dict[tuple, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        if name == "assignments":
+            value = tuple(value)
+            super().__setattr__("_indexed", False)
+        super().__setattr__(name, value)
+    
+    def __getstate__(self):
+        # Indexes are rebuilt on demand; don't ship them across processes
+        state = self.__dict__.copy()
+        state["_indexed"] = False
+        for name in ("_by_person", "_by_day", "_shift_counts", "_slot_counts"):
+            state[name] = {}
+        return state
+    
+    def _ensure_indexes(self) -> None:
+        """Build the lookup indexes if missing."""
+        if self._indexed:
+            return
+        
+        by_person: Dict[str, List[PairAssignment]] = {}
+        by_day: Dict[Tuple[int, str], List[PairAssignment]] = {}
+        shift_counts: Dict[str, Dict[str, int]] = {}
+        slot_counts: Dict[tuple, int] = {}
+        for a in self.assignments:
+            by_day.setdefault((a.week, a.day), []).append(a)
+            slot = (a.week, a.day, a.shift)
+            slot_counts[slot] = slot_counts.get(slot, 0) + 1
+            names = (a.person_a,) if a.person_b == a.person_a else (a.person_a, a.person_b)
+            for name in names:
+                if not name:
+                    continue
+                by_person.setdefault(name, []).append(a)
+                counts = shift_counts.setdefault(name, {})
+                counts[a.shift] = counts.get(a.shift, 0) + 1
+        
+        self._by_person = by_person
+        self._by_day = by_day
+        self._shift_counts = shift_counts
+        self._slot_counts = slot_counts
+        self._indexed = True
     
     def get_person_shifts(self, name: str) -> List[PairAssignment]:
         """Get all shifts for a person."""
-        return [a for a in self.assignments 
-                if a.person_a == name or a.person_b == name]
+        self._ensure_indexes()
+        return list(self._by_person.get(name, ()))
     
     def get_day_assignments(self, week: int, day: str) -> List[PairAssignment]:
         """Get all assignments for a specific day."""
-        return [a for a in self.assignments 
-                if a.week == week and a.day == day]
+        self._ensure_indexes()
+        return list(self._by_day.get((week, day), ()))
     
     def count_shifts(self, name: str, shift: str) -> int:
         """Count shifts of a type for a person."""
-        return sum(1 for a in self.assignments 
-                   if (a.person_a == name or a.person_b == name) and a.shift == shift)
+        self._ensure_indexes()
+        return self._shift_counts.get(name, {}).get(shift, 0)
+    
+    def get_shift_counts(self, name: str) -> Dict[str, int]:
+        """Shift code -> number of shifts worked by a person."""
+        self._ensure_indexes()
+        return dict(self._shift_counts.get(name, {}))
+    
+    def get_slot_count(self, week: int, day: str, shift: str) -> int:
+        """Number of assignments filling one (week, day, shift) slot."""
+        self._ensure_indexes()
+        return self._slot_counts.get((week, day, shift), 0)
     
     def get_person_day_matrix(self, code_map: Optional[Dict[str, str]] = None) -> Dict[tuple, str]:
         """
@@ -96,11 +188,377 @@ class PairSchedule:
         Returns:
             Dict mapping (week, day, shift) to count of assigned slots
         """
-        from collections import defaultdict
-        counts = defaultdict(int)
-        for a in self.assignments:
-            counts[(a.week, a.day, a.shift)] += 1
-        return dict(counts)
+        self._ensure_indexes()
+        return dict(self._slot_counts)
+
+
+@dataclass
+class PairModel:
+    """A built (not yet solved) Person-Shift CP-SAT model."""
+    model: cp_model.CpModel
+    store: VariableStore
+    objective_terms: List[Tuple[cp_model.IntVar, int]]
+    unfilled_vars: List[Tuple[cp_model.IntVar, str, int, str]]
+    night_counts: List[cp_model.IntVar]
+    soir_counts: List[cp_model.IntVar]
+    build_time_seconds: float = 0.0
+    # Variables/constraints added per build phase (see _proto_size)
+    model_size: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # One entry per constraint/objective builder (see solver.profiling)
+    build_profile: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def clone(self) -> "PairModel":
+        """Independent copy of the model (hints included) that can take extra constraints."""
+        model = self.model.Clone()
+        return PairModel(
+            model=model,
+            store=VariableStore.from_layout(model, self.store.layout()),
+            objective_terms=[],
+            unfilled_vars=[],
+            night_counts=[],
+            soir_counts=[],
+            build_time_seconds=self.build_time_seconds,
+            model_size=self.model_size,
+            build_profile=self.build_profile,
+        )
+    
+    def compile(self) -> "CompiledModel":
+        """Serialize the model proto once so it can be shipped to worker processes."""
+        proto = self.model.Proto()
+        if hasattr(proto, "SerializeToString"):
+            data, encoding = proto.SerializeToString(), "binary"
+        else:
+            # ortools >= 9.13 exposes a pybind proto without binary serialization
+            data, encoding = str(proto).encode("utf-8"), "text"
+        return CompiledModel(
+            data=zlib.compress(data, 1),
+            encoding=encoding,
+            layout=self.store.layout(),
+            build_time_seconds=self.build_time_seconds,
+            model_size=self.model_size,
+            build_profile=self.build_profile,
+        )
+
+
+@dataclass
+class CompiledModel:
+    """Serialized PairModel: compressed proto plus the variable layout."""
+    data: bytes
+    encoding: str  # "binary" or "text"
+    layout: StoreLayout
+    build_time_seconds: float = 0.0
+    model_size: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    build_profile: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def load(self) -> PairModel:
+        """Rebuild a solvable PairModel (objective terms are kept inside the proto)."""
+        model = cp_model.CpModel()
+        proto = model.Proto()
+        raw = zlib.decompress(self.data)
+        if self.encoding == "binary":
+            proto.ParseFromString(raw)
+        else:
+            proto.parse_text_format(raw.decode("utf-8"))
+        return PairModel(
+            model=model,
+            store=VariableStore.from_layout(model, self.layout),
+            objective_terms=[],
+            unfilled_vars=[],
+            night_counts=[],
+            soir_counts=[],
+            build_time_seconds=self.build_time_seconds,
+            model_size=self.model_size,
+            build_profile=self.build_profile,
+        )
+
+
+class ObjectiveTracker(cp_model.CpSolverSolutionCallback):
+    """
+    Solution callback recording every objective improvement.
+    
+    Entries are (elapsed_seconds, objective, best_bound); elapsed is measured
+    from start_time so traces from different processes share one clock.
+    """
+    
+    def __init__(
+        self,
+        start_time: float,
+        on_improvement: Optional[Callable[[float, float, float], None]] = None,
+    ):
+        super().__init__()
+        self.start_time = start_time
+        self.improvements: List[Tuple[float, float, float]] = []
+        self._on_improvement = on_improvement
+    
+    def on_solution_callback(self):
+        entry = (time.time() - self.start_time, self.ObjectiveValue(), self.BestObjectiveBound())
+        self.improvements.append(entry)
+        if self._on_improvement is not None:
+            self._on_improvement(*entry)
+
+
+class SolutionStreamer(ObjectiveTracker):
+    """
+    ObjectiveTracker that also emits a PairSchedule snapshot per new solution.
+    
+    Snapshots carry status "feasible", score = CP-SAT objective and stats with
+    objective, bound, wall_time and solution_index. Callbacks run on a solver
+    thread; listeners should hand snapshots off rather than do heavy work.
+    """
+    
+    def __init__(
+        self,
+        start_time: float,
+        store: VariableStore,
+        on_solution: Callable[[PairSchedule], None],
+        on_improvement: Optional[Callable[[float, float, float], None]] = None,
+        min_interval: float = 0.0,
+    ):
+        super().__init__(start_time, on_improvement)
+        self.store = store
+        self._on_solution = on_solution
+        self._min_interval = min_interval
+        self._last_emit = float("-inf")
+    
+    def on_solution_callback(self):
+        super().on_solution_callback()
+        elapsed, objective, bound = self.improvements[-1]
+        if elapsed - self._last_emit < self._min_interval:
+            return
+        self._last_emit = elapsed
+        
+        self._on_solution(PairSchedule(
+            assignments=_extract_assignments(self.store, self.Value),
+            weeks=len(self.store.week_numbers),
+            people_count=self.store.num_people,
+            status="feasible",
+            score=objective,
+            solve_time_seconds=elapsed,
+            stats={
+                "objective": objective,
+                "bound": bound,
+                "wall_time": self.WallTime(),
+                "solution_index": len(self.improvements),
+            },
+        ))
+
+
+def _proto_size(model: cp_model.CpModel, *earlier: Dict[str, int]) -> Dict[str, int]:
+    """Variables and constraints in the model, minus those counted in earlier phases."""
+    proto = model.Proto()
+    return {
+        "variables": len(proto.variables) - sum(e["variables"] for e in earlier),
+        "constraints": len(proto.constraints) - sum(e["constraints"] for e in earlier),
+    }
+
+
+def build_pairs_model(
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    days: Optional[List[str]] = None,
+    weeks: Optional[List[int]] = None,
+    carry: Optional[HorizonCarry] = None,
+) -> PairModel:
+    """
+    Build the Person-Shift model without solving it.
+    
+    All constraint and objective builders address variables through a dense
+    VariableStore indexed by (person_idx, global_day_idx, shift_idx).
+    
+    Args:
+        people: List of Person objects (non-empty)
+        config: Solver configuration
+        staffing: Slot requirements per week/day/shift
+        edo_plan: EDO allocation plan
+        days: Days of the week (defaults to the days staffing covers)
+        weeks: Explicit week numbers to model (defaults to 1..config.weeks)
+        carry: Totals from earlier weeks (rolling horizon)
+        
+    Returns:
+        PairModel holding the model, variable store and objective terms
+    """
+    days = days or staffing_days(staffing)
+    start_time = time.time()
+    model = cp_model.CpModel()
+    
+    with BuildProfile() as profile:
+        # ========== Variables ==========
+        slog.step("Creating Person-Shift variables")
+        with profile.measure("VariableStore", model):
+            store = VariableStore(model, people, weeks or config.weeks, days)
+    
+        model_size = {"variables": _proto_size(model)}
+    
+        # ========== Hard Constraints ==========
+        slog.phase("Adding Hard Constraints")
+    
+        # Staffing is SOFT: unfilled slots are reported to manager for external contractors
+        unfilled_vars = add_staffing_constraints(model, store, staffing)
+        add_person_works_link(model, store)  # also one shift per day
+        add_night_rest_constraint(model, store, config)
+        night_counts = add_max_nights_constraint(model, store, carry.nights if carry else None)
+        add_consecutive_nights_constraint(model, store, config)
+        add_edo_constraints(model, store, edo_plan)
+        add_weekly_hours_constraint(model, store)
+        add_rolling_48h_constraint(model, store)
+        add_consecutive_days_constraint(model, store, config)
+        add_weekend_constraints(model, store)
+        add_no_evening_preference(model, store)
+        add_contractor_pair_constraint(model, store, config)
+        # Carried totals (and fixed context weeks) make block members distinguishable
+        if config.break_symmetry and carry is None:
+            add_symmetry_breaking(model, store, edo_plan, night_counts)
+    
+        model_size["hard"] = _proto_size(model, model_size["variables"])
+    
+        # ========== Soft Constraints (Objective) ==========
+        slog.phase("Adding Soft Constraints")
+        objective_terms = []
+        spec = ObjectiveSpec.from_config(config)
+    
+        add_unfilled_penalty(model, unfilled_vars, objective_terms, spec)
+        name_to_person = {p.name: p for p in people}
+        cohorts = build_cohorts(store.names, name_to_person, config)
+        add_night_fairness_objective(model, store, night_counts, cohorts, objective_terms, carry, spec)
+        soir_counts = add_soir_fairness_objective(model, store, staffing, cohorts, objective_terms, carry, spec)
+        add_workday_target_objective(model, store, edo_plan, objective_terms, spec)
+        add_clopening_penalty(model, store, objective_terms, spec)
+    
+        if objective_terms:
+            with profile.measure("Minimize", model):
+                model.Minimize(sum(var * weight for var, weight in objective_terms))
+        model_size["soft"] = _proto_size(model, model_size["variables"], model_size["hard"])
+        model_size["total"] = _proto_size(model)
+        for phase, size in model_size.items():
+            slog.step(f"Model size [{phase}]: {size['variables']} vars, {size['constraints']} constraints")
+    
+    return PairModel(
+        model=model,
+        store=store,
+        objective_terms=objective_terms,
+        unfilled_vars=unfilled_vars,
+        night_counts=night_counts,
+        soir_counts=soir_counts,
+        build_time_seconds=time.time() - start_time,
+        model_size=model_size,
+        build_profile=profile.entries,
+    )
+
+
+def apply_solution_hint(
+    built: PairModel,
+    schedule: PairSchedule,
+    hint_names: Optional[List[str]] = None,
+) -> int:
+    """
+    Warm-start a model with AddHint values taken from a previous schedule.
+    
+    Only people present in the hint schedule are hinted (all their shift
+    vars, 1 for the assigned shift and 0 otherwise); newcomers and weeks
+    outside the schedule are left free.
+    
+    Args:
+        built: Model from build_pairs_model()
+        schedule: Previous solution (e.g. a cached best trial)
+        hint_names: People the previous solution covered (defaults to
+            everyone assigned in it; pass the old team to also hint days off)
+        
+    Returns:
+        Number of hinted variables
+    """
+    store = built.store
+    model = built.model
+    matrix = schedule.get_person_day_matrix()
+    if hint_names is None:
+        hinted_people = {name for name, _, _ in matrix}
+    else:
+        hinted_people = set(hint_names)
+    
+    count = 0
+    for p, name in enumerate(store.names):
+        if name not in hinted_people:
+            continue
+        for g in range(store.num_days):
+            w, d = store.day_label(g)
+            if w > schedule.weeks:
+                continue
+            shift = matrix.get((name, w, d))
+            for s, var in enumerate(store.day_shifts(p, g)):
+                model.AddHint(var, 1 if shift == SHIFT_CODES[s] else 0)
+            model.AddHint(store.works_on(p, g), 1 if shift in SHIFT_INDEX else 0)
+            count += store.num_shifts + 1
+    return count
+
+
+def _extract_assignments(
+    store: VariableStore,
+    value: Callable[[cp_model.IntVar], int],
+) -> List[PairAssignment]:
+    """
+    Reconstruct pair assignments from solved variable values.
+    
+    Args:
+        store: Variable store of the solved model
+        value: Returns the solved value of a variable
+        
+    Returns:
+        Assignments sorted by (week, day, shift, slot)
+    """
+    assignments = []
+    names = store.names
+    
+    for g in range(store.num_days):
+        w, d = store.day_label(g)
+        
+        # Pair shifts: D and N
+        for s in ["D", "N"]:
+            slot_vars = store.slot(g, SHIFT_INDEX[s])
+            assigned_people = [names[p] for p, var in enumerate(slot_vars) if value(var) == 1]
+            
+            # Pair them up (arbitrary pairing)
+            slot_idx = 0
+            for i in range(0, len(assigned_people), 2):
+                if i + 1 < len(assigned_people):
+                    assignments.append(PairAssignment(
+                        week=w,
+                        day=d,
+                        shift=s,
+                        slot_idx=slot_idx,
+                        person_a=assigned_people[i],
+                        person_b=assigned_people[i + 1],
+                    ))
+                else:
+                    # Odd number (shouldn't happen), log as solo
+                    logger.warning(f"Odd number for pair shift {s} on W{w} {d}")
+                    assignments.append(PairAssignment(
+                        week=w,
+                        day=d,
+                        shift=s,
+                        slot_idx=slot_idx,
+                        person_a=assigned_people[i],
+                        person_b="",
+                    ))
+                slot_idx += 1
+        
+        # Solo shifts: S only (Admin removed)
+        slot_vars = store.slot(g, SHIFT_INDEX["S"])
+        assigned_people = [names[p] for p, var in enumerate(slot_vars) if value(var) == 1]
+        for slot_idx, person in enumerate(assigned_people):
+            assignments.append(PairAssignment(
+                week=w,
+                day=d,
+                shift="S",
+                slot_idx=slot_idx,
+                person_a=person,
+                person_b="",
+            ))
+    
+    # Sort assignments
+    day_order = {d: i for i, d in enumerate(store.days)}
+    assignments.sort(key=lambda a: (a.week, day_order[a.day], a.shift, a.slot_idx))
+    return assignments
 
 
 def solve_pairs(
@@ -108,23 +566,27 @@ def solve_pairs(
     config: SolverConfig,
     staffing: Dict[int, WeekStaffing],
     edo_plan: EDOPlan,
-    days: List[str] = JOURS,
+    days: Optional[List[str]] = None,
+    on_solution: Optional[Callable[[PairSchedule], None]] = None,
 ) -> PairSchedule:
     """
     Solve scheduling problem with pair assignments.
     
     Uses Person-Shift model for efficiency, reconstructs pairs in output.
+    Long horizons are solved block by block when config.rolling_block_weeks is set.
     
     Args:
         people: List of Person objects
         config: Solver configuration
         staffing: Slot requirements per week/day/shift
         edo_plan: EDO allocation plan
-        days: Days of the week
+        days: Days of the week (defaults to the days staffing covers)
+        on_solution: Called with a PairSchedule snapshot for each improving solution
         
     Returns:
         PairSchedule with assignments
     """
+    days = days or staffing_days(staffing)
     start_time = time.time()
     weeks = config.weeks
     
@@ -140,375 +602,46 @@ def solve_pairs(
             solve_time_seconds=time.time() - start_time,
         )
     
-    model = cp_model.CpModel()
-    names = [p.name for p in people]
-    name_to_person = {p.name: p for p in people}
-    
-    # ========== Variables ==========
-    slog.step("Creating Person-Shift variables")
-    
-    # assign[p][w][d][s] = 1 if person p works shift s on day d of week w
-    assign = {}
-    for p in names:
-        assign[p] = {}
-        for w in range(1, weeks + 1):
-            assign[p][w] = {}
-            for d in days:
-                assign[p][w][d] = {}
-                for s in ["D", "N", "S"]:
-                    var_name = f"assign_{p}_{w}_{d}_{s}"
-                    assign[p][w][d][s] = model.NewBoolVar(var_name)
-    
-    # Helper: person_works[p][w][d] = 1 if person works any shift on that day
-    person_works = {}
-    for p in names:
-        person_works[p] = {}
-        for w in range(1, weeks + 1):
-            person_works[p][w] = {}
-            for d in days:
-                var_name = f"works_{p}_{w}_{d}"
-                person_works[p][w][d] = model.NewBoolVar(var_name)
-    
-    num_vars = len(names) * weeks * len(days) * 4
-    logger.debug(f"Created {num_vars} assignment variables (Person-Shift model)")
-    
-    # ========== Hard Constraints ==========
-    slog.phase("Adding Hard Constraints")
-    
-    # 1. Staffing requirements: SOFT constraint (allow unfilled slots)
-    # Unfilled slots will be reported to manager for external contractors
-    # D: 4 pairs = 8 people, N: 1 pair = 2 people, S: 1 solo
-    slog.step("Constraint: Staffing requirements (Soft - allow gaps)")
-    unfilled_vars = []
-    
-    for w in range(1, weeks + 1):
-        for d in days:
-            # Day shift (D): 4 pairs = 8 people
-            d_slots = staffing[w].slots[d]["D"]
-            d_people_needed = d_slots * 2
-            d_assigned = sum(assign[p][w][d]["D"] for p in names)
-            d_unfilled = model.NewIntVar(0, d_people_needed, f"unfilled_D_{w}_{d}")
-            model.Add(d_assigned + d_unfilled == d_people_needed)
-            unfilled_vars.append((d_unfilled, "D", w, d))
-            
-            # Night shift (N): 1 pair = 2 people
-            n_slots = staffing[w].slots[d]["N"]
-            n_people_needed = n_slots * 2
-            n_assigned = sum(assign[p][w][d]["N"] for p in names)
-            n_unfilled = model.NewIntVar(0, n_people_needed, f"unfilled_N_{w}_{d}")
-            model.Add(n_assigned + n_unfilled == n_people_needed)
-            unfilled_vars.append((n_unfilled, "N", w, d))
-            
-            # Soir shift (S): solo
-            s_slots = staffing[w].slots[d].get("S", 0)
-            if s_slots > 0:
-                s_assigned = sum(assign[p][w][d]["S"] for p in names)
-                s_unfilled = model.NewIntVar(0, s_slots, f"unfilled_S_{w}_{d}")
-                model.Add(s_assigned + s_unfilled == s_slots)
-                unfilled_vars.append((s_unfilled, "S", w, d))
-    
-    # 2. Link person_works to shift assignments
-    slog.step("Constraint: Link person_works helper")
-    for p in names:
-        for w in range(1, weeks + 1):
-            for d in days:
-                # person_works = 1 if any shift is assigned
-                all_shifts = [assign[p][w][d][s] for s in ["D", "N", "S"]]
-                model.AddMaxEquality(person_works[p][w][d], all_shifts)
-    
-    # 3. At most one shift per person per day
-    slog.step("Constraint: One shift per person per day")
-    for p in names:
-        for w in range(1, weeks + 1):
-            for d in days:
-                model.Add(sum(assign[p][w][d][s] for s in ["D", "N", "S"]) <= 1)
-    
-    # 4. No work after night (rest day required)
-    if config.forbid_night_to_day:
-        slog.step("Constraint: No work after night")
-        for p in names:
-            for w in range(1, weeks + 1):
-                for i, d in enumerate(days[:-1]):
-                    next_d = days[i + 1]
-                    # If worked night today, don't work tomorrow
-                    model.Add(person_works[p][w][next_d] == 0).OnlyEnforceIf(assign[p][w][d]["N"])
-    
-    # 5. Max nights per person (over horizon)
-    slog.step("Constraint: Max nights per person")
-    night_counts = {}
-    for p in names:
-        person = name_to_person[p]
-        night_assignments = [assign[p][w][d]["N"] for w in range(1, weeks + 1) for d in days]
-        night_counts[p] = model.NewIntVar(0, weeks * len(days), f"nights_{p}")
-        model.Add(night_counts[p] == sum(night_assignments))
-        
-        if person.max_nights < weeks * len(days):
-            model.Add(night_counts[p] <= person.max_nights)
+    from rota.solver.rolling import solve_rolling, uses_rolling_horizon
+    if uses_rolling_horizon(config):
+        return solve_rolling(people, config, staffing, edo_plan, days, on_solution=on_solution)
     
-    # 5b. Max consecutive nights (sequence limit)
-    if config.max_nights_sequence < len(days):
-        slog.step(f"Constraint: Max {config.max_nights_sequence} consecutive nights")
-        
-        # Build ordered list of all days across weeks
-        all_days_ordered = [(w, d) for w in range(1, weeks + 1) for d in days]
-        
-        for p in names:
-            window_size = config.max_nights_sequence + 1
-            for start_idx in range(len(all_days_ordered) - window_size + 1):
-                window_days = all_days_ordered[start_idx:start_idx + window_size]
-                window_nights = [assign[p][w][d]["N"] for (w, d) in window_days]
-                model.Add(sum(window_nights) <= config.max_nights_sequence)
-    
-    # 6. EDO: Person doesn't work on EDO day
-    #    - If person has a fixed EDO day: force that day off
-    #    - If no fixed day: solver must pick exactly one day off (let it optimize)
-    slog.step("Constraint: EDO days")
-    for p in names:
-        for w in range(1, weeks + 1):
-            if p in edo_plan.plan.get(w, set()):
-                fixed = edo_plan.fixed.get(p, "")
-                if fixed and fixed in days:
-                    # Person has a fixed EDO day preference - enforce it
-                    model.Add(person_works[p][w][fixed] == 0)
-                else:
-                    # Person is EDO-eligible but no fixed day preference
-                    # Solver must pick at least one day off for this person this week
-                    # The workday count constraint already limits total days worked,
-                    # so we just need to ensure there's at least one OFF day
-                    # Sum of non-working days must be >= 1
-                    off_days = [person_works[p][w][d].Not() for d in days]
-                    model.Add(sum(off_days) >= 1)
-    
-    # 7. 48h/week constraint: max 48 hours per week (Mon-Fri)
-    slog.step("Constraint: 48h per week")
-    for p in names:
-        for w in range(1, weeks + 1):
-            week_hours = []
-            for d in days:
-                for s in ["D", "N", "S"]:
-                    week_hours.append(assign[p][w][d][s] * SHIFTS[s].hours)
-            model.Add(sum(week_hours) <= 48)
-    
-    # 7b. 48h rolling window constraint (across weeks, weekend = 0h)
-    # ALIGNED with validation.py:check_rolling_48h() - uses flat timeline approach
-    slog.step("Constraint: 48h rolling window (Hard)")
-    
-    # Build a flat timeline: 7 days per week (Mon-Fri work, Sat-Sun = 0)
-    # Timeline indices: week1=[0-6], week2=[7-13], etc.
-    # Days 0-4 = Mon-Fri (workdays), 5-6 = Sat-Sun (weekend, always 0)
-    
-    day_to_idx = {d: i for i, d in enumerate(days)}  # e.g., {"Lun": 0, "Mar": 1, ...}
-    
-    for p in names:
-        # Build timeline expressions for this person
-        # timeline_hours[i] = hours worked on day i of flat timeline
-        timeline_hours = []
-        
-        for w in range(1, weeks + 1):
-            # Mon-Fri (indices 0-4 within week)
-            for d in days:
-                hour_expr = sum(
-                    assign[p][w][d][s] * SHIFTS[s].hours
-                    for s in ["D", "N", "S"]
-                )
-                timeline_hours.append(hour_expr)
-            
-            # Sat-Sun (indices 5-6 within week) - 0 hours
-            timeline_hours.append(0)  # Saturday
-            timeline_hours.append(0)  # Sunday
-        
-        # Sliding window of 7 consecutive days
-        # Same logic as validation.py:483-486
-        for i in range(len(timeline_hours) - 6):
-            window = timeline_hours[i : i + 7]
-            model.Add(sum(window) <= 48)
-
+    built = build_pairs_model(people, config, staffing, edo_plan, days)
+    logger.debug(f"Model built in {built.build_time_seconds:.2f}s")
     
-    # 9. Max consecutive work days
-    max_days = getattr(config, "max_consecutive_days", 6)
-    if max_days and max_days < 7 * 4: # Sanity check
-        slog.step(f"Hard: Max {max_days} consecutive workdays (Mon-Fri)")
-        for p in names:
-             timeline_vars = []
-             for w in range(1, weeks + 1):
-                 # Mon-Fri
-                 for d in days:
-                     # Working if matches any shift (D, N, S)
-                     # Since strict constraint ensures max 1 shift/day, sum is 0 or 1
-                     working = model.NewBoolVar(f"working_{p}_{w}_{d}")
-                     model.Add(sum(assign[p][w][d][s] for s in ["D", "N", "S"]) == working)
-                     timeline_vars.append(working)
-                 
-                 # Weekend padding (Sat, Sun) - assumed 0 for week solver
-                 # This resets consecutive count unless max_days allows bridging (e.g. if we worked weekend)
-                 # But here we assume 0, so it effectively limits consecutive days within M-F blocks.
-                 if w < weeks: 
-                      timeline_vars.append(0) 
-                      timeline_vars.append(0) 
-            
-             # Sliding window constraint
-             window_size = max_days + 1
-             for i in range(len(timeline_vars) - window_size + 1):
-                  window = timeline_vars[i : i + window_size]
-                  # Sum of any (max+1) days must be <= max
-                  model.Add(sum(window) <= max_days)
+    return solve_model(built, config, start_time=start_time, on_solution=on_solution)
 
-    # 10. Individual preference: no_evening (no Soir shifts)
-    slog.step("Constraint: No Soir preferences")
-    for p in names:
-        person = name_to_person[p]
-        if person.no_evening:
-            for w in range(1, weeks + 1):
-                for d in days:
-                    model.Add(assign[p][w][d]["S"] == 0)
-    
-    # 11. Forbid contractor pairs (contractors must be paired with regular staff)
-    if config.forbid_contractor_pairs:
-        contractors = [p.name for p in people if p.is_contractor]
-        if len(contractors) >= 2:
-            slog.step(f"Constraint: No contractor pairs ({len(contractors)} contractors)")
-            # For pair shifts (D, N), if 2+ contractors work the same shift, that's a violation
-            for w in range(1, weeks + 1):
-                for d in days:
-                    for s in ["D", "N"]:  # Only pair shifts
-                        # Sum of contractors on this shift must be <= 1
-                        contractor_count = sum(assign[p][w][d][s] for p in contractors)
-                        model.Add(contractor_count <= 1)
-    
-    # ========== Soft Constraints (Objective) ==========
 
-    slog.phase("Adding Soft Constraints")
-    objective_terms = []
-    
-    # 0. Minimize unfilled slots (highest priority)
-    # These will be reported to manager for contractor coverage
-    slog.step(f"Soft: Penalizing {len(unfilled_vars)} potential unfilled slots")
-    total_unfilled = model.NewIntVar(0, len(unfilled_vars) * 10, "total_unfilled")
-    model.Add(total_unfilled == sum(uv[0] for uv in unfilled_vars))
-    objective_terms.append((total_unfilled, 10000))  # High penalty but below constraint violation
-    
-    # Build cohorts based on fairness mode
-    cohorts = {}
-    if config.fairness_mode == FairnessMode.BY_TEAM:
-        for p in names:
-            team = name_to_person[p].team or "no_team"
-            cohorts.setdefault(team, []).append(p)
-    elif config.fairness_mode == FairnessMode.GLOBAL:
-        cohorts["all"] = names.copy()
-    else:
-        # Default: BY_WORKDAYS
-        for p in names:
-            wd = name_to_person[p].workdays_per_week
-            key = f"{wd}j"
-            cohorts.setdefault(key, []).append(p)
-    
-    slog.step(f"Cohorts ({config.fairness_mode.value}): {[(k, len(v)) for k, v in cohorts.items()]}")
-    
-    # Calculate proportional targets
-    total_workdays_capacity = sum(p.workdays_per_week for p in people)
-    total_night_person_shifts = weeks * len(days) * 2  # 1 pair/day = 2 people
-    total_soir_slots = sum(staffing[w].slots[d].get("S", 0) for w in range(1, weeks + 1) for d in days)
-    
-    # Night fairness: proportional to workdays ratio
-    slog.step("Soft: Night fairness (proportional)")
-    night_targets = {}
-    for p in names:
-        person = name_to_person[p]
-        night_target = int(round((person.workdays_per_week / total_workdays_capacity) * total_night_person_shifts))
-        night_targets[p] = night_target
-        
-        # Add soft bounds: minimize deviation from target
-        deviation = model.NewIntVar(0, weeks * len(days), f"night_dev_{p}")
-        model.Add(deviation >= night_counts[p] - night_target)
-        model.Add(deviation >= night_target - night_counts[p])
-        objective_terms.append((deviation, 100))
-    
-    # Minimize spread within cohorts
-    for cid, members in cohorts.items():
-        if len(members) > 1:
-            cohort_night_vars = [night_counts[m] for m in members]
-            max_n = model.NewIntVar(0, weeks * len(days), f"max_nights_{cid}")
-            min_n = model.NewIntVar(0, weeks * len(days), f"min_nights_{cid}")
-            model.AddMaxEquality(max_n, cohort_night_vars)
-            model.AddMinEquality(min_n, cohort_night_vars)
-            spread = model.NewIntVar(0, weeks * len(days), f"night_spread_{cid}")
-            model.Add(spread == max_n - min_n)
-            objective_terms.append((spread, 500))
-    
-    # Soir fairness
-    slog.step("Soft: Soir fairness (proportional)")
-    soir_counts = {}
-    for p in names:
-        person = name_to_person[p]
-        soir_assignments = [assign[p][w][d]["S"] for w in range(1, weeks + 1) for d in days]
-        soir_counts[p] = model.NewIntVar(0, weeks * len(days), f"soirs_{p}")
-        model.Add(soir_counts[p] == sum(soir_assignments))
-        
-        soir_target = int(round((person.workdays_per_week / total_workdays_capacity) * total_soir_slots))
-        deviation = model.NewIntVar(0, weeks * len(days), f"soir_dev_{p}")
-        model.Add(deviation >= soir_counts[p] - soir_target)
-        model.Add(deviation >= soir_target - soir_counts[p])
-        objective_terms.append((deviation, 50))
-    
-    # Minimize spread within cohorts for Soir
-    for cid, members in cohorts.items():
-        if len(members) > 1:
-            cohort_soir_vars = [soir_counts[m] for m in members]
-            max_s = model.NewIntVar(0, weeks * len(days), f"max_soirs_{cid}")
-            min_s = model.NewIntVar(0, weeks * len(days), f"min_soirs_{cid}")
-            model.AddMaxEquality(max_s, cohort_soir_vars)
-            model.AddMinEquality(min_s, cohort_soir_vars)
-            spread = model.NewIntVar(0, weeks * len(days), f"soir_spread_{cid}")
-            model.Add(spread == max_s - min_s)
-            objective_terms.append((spread, 300))
-    
-    # Total workday deviation
-    slog.step("Soft: Workday target deviation")
-    total_deviation = model.NewIntVar(0, len(names) * weeks * len(days), "total_deviation")
-    deviation_terms = []
-    
-    person_totals = {}  # Store for stats
-    for p in names:
-        person = name_to_person[p]
-        edo_weeks = sum(1 for w in range(1, weeks + 1) if p in edo_plan.plan.get(w, set()))
-        target = person.workdays_per_week * weeks - edo_weeks
-        
-        person_total = model.NewIntVar(0, weeks * len(days), f"total_{p}")
-        all_shifts = [assign[p][w][d][s] for w in range(1, weeks + 1) for d in days for s in ["D", "N", "S"]]
-        model.Add(person_total == sum(all_shifts))
-        person_totals[p] = (person_total, target)
-        
-        # HARD constraint: Never exceed target (Respect targets > Fill slots)
-        model.Add(person_total <= target)
+def solve_model(
+    built: PairModel,
+    config: SolverConfig,
+    start_time: Optional[float] = None,
+    on_improvement: Optional[Callable[[float, float, float], None]] = None,
+    on_solution: Optional[Callable[[PairSchedule], None]] = None,
+    snapshot_interval: float = 0.0,
+) -> PairSchedule:
+    """
+    Solve an already-built model. The same PairModel can be solved many times.
+    
+    Args:
+        built: Model from build_pairs_model() or CompiledModel.load()
+        config: Solver configuration (time limit, workers, random_seed, search_profile;
+            profile keeps the CP-SAT search log for presolve timing)
+        start_time: Reference time for solve_time_seconds (defaults to now)
+        on_improvement: Called with (elapsed, objective, bound) on each new solution
+        on_solution: Called with a PairSchedule snapshot for each improving solution
+            (from a solver thread, while the search continues)
+        snapshot_interval: Minimum seconds between two snapshots
         
-        # Soft: minimize undershoot (prefer filling up to target)
-        undershoot = model.NewIntVar(0, weeks * len(days), f"undershoot_{p}")
-        model.Add(undershoot >= target - person_total)
-        deviation_terms.append(undershoot)
-    
-    model.Add(total_deviation == sum(deviation_terms))
-    objective_terms.append((total_deviation, 5))
-    
-    # Clopening penalty: Soir followed by Jour shift next day
-    slog.step("Soft: Soir→Jour penalty")
-    clopening_count = model.NewIntVar(0, len(names) * weeks * len(days), "clopenings")
-    clopening_terms = []
-    
-    for p in names:
-        for w in range(1, weeks + 1):
-            for d_idx in range(len(days) - 1):
-                d = days[d_idx]
-                d_next = days[d_idx + 1]
-                
-                # If Soir today and Jour tomorrow, penalize
-                clopening = model.NewBoolVar(f"clop_{p}_{w}_{d}")
-                model.AddBoolAnd([assign[p][w][d]["S"], assign[p][w][d_next]["D"]]).OnlyEnforceIf(clopening)
-                model.AddBoolOr([assign[p][w][d]["S"].Not(), assign[p][w][d_next]["D"].Not()]).OnlyEnforceIf(clopening.Not())
-                clopening_terms.append(clopening)
-    
-    if clopening_terms:
-        model.Add(clopening_count == sum(clopening_terms))
-        objective_terms.append((clopening_count, 1))
+    Returns:
+        PairSchedule with assignments; stats["build_profile"] lists the
+        builders (see solver.profiling) and stats["cpsat"] the solver response
+    """
+    if start_time is None:
+        start_time = time.time()
+    model = built.model
+    store = built.store
+    weeks = len(store.week_numbers)
     
     # ========== Solve ==========
     slog.phase("Solving")
@@ -517,7 +650,6 @@ def solve_pairs(
     solver.parameters.log_search_progress = False
     
     # Multi-threading logic
-    import os
     if hasattr(config, "parallel_portfolio") and config.parallel_portfolio:
         num_workers = config.workers_per_solve if config.workers_per_solve > 0 else 1
     else:
@@ -526,14 +658,20 @@ def solve_pairs(
     solver.parameters.num_search_workers = num_workers
     slog.step(f"Using {num_workers} parallel workers")
     
-    # Optimization hints
-    solver.parameters.linearization_level = 2
-    solver.parameters.cp_model_presolve = True
-    
-    if objective_terms:
-        model.Minimize(sum(var * weight for var, weight in objective_terms))
+    # Seed and search profile (optimization hints) vary per portfolio try
+    if config.random_seed is not None:
+        solver.parameters.random_seed = config.random_seed
+    profile = apply_search_profile(solver.parameters, config.search_profile)
+    slog.step(f"Search profile: {profile}, seed={config.random_seed}")
+    if config.profile:
+        enable_search_log(solver.parameters)
     
-    status = solver.Solve(model)
+    if on_solution is not None:
+        tracker = SolutionStreamer(start_time, store, on_solution, on_improvement, snapshot_interval)
+    else:
+        tracker = ObjectiveTracker(start_time, on_improvement)
+    solve_start = time.time()
+    status = solver.Solve(model, tracker)
     solve_time = time.time() - start_time
     
     status_name = {
@@ -545,80 +683,44 @@ def solve_pairs(
     }.get(status, "unknown")
     
     logger.info(f"Solve complete: status={status_name}, time={solve_time:.2f}s")
+    profile_stats = {
+        "build_profile": built.build_profile,
+        "cpsat": response_stats(solver, tracker.improvements, offset=solve_start - start_time),
+    }
     
     if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
         return PairSchedule(
             assignments=[],
             weeks=weeks,
-            people_count=len(people),
+            people_count=store.num_people,
             status=status_name,
             solve_time_seconds=solve_time,
+            stats=profile_stats,
         )
     
     # ========== Extract Solution & Reconstruct Pairs ==========
     slog.phase("Extracting Solution")
-    assignments = []
-    
-    for w in range(1, weeks + 1):
-        for d in days:
-            # Pair shifts: D and N
-            for s in ["D", "N"]:
-                assigned_people = [p for p in names if solver.Value(assign[p][w][d][s]) == 1]
-                
-                # Pair them up (arbitrary pairing)
-                slot_idx = 0
-                for i in range(0, len(assigned_people), 2):
-                    if i + 1 < len(assigned_people):
-                        assignments.append(PairAssignment(
-                            week=w,
-                            day=d,
-                            shift=s,
-                            slot_idx=slot_idx,
-                            person_a=assigned_people[i],
-                            person_b=assigned_people[i + 1],
-                        ))
-                    else:
-                        # Odd number (shouldn't happen), log as solo
-                        logger.warning(f"Odd number for pair shift {s} on W{w} {d}")
-                        assignments.append(PairAssignment(
-                            week=w,
-                            day=d,
-                            shift=s,
-                            slot_idx=slot_idx,
-                            person_a=assigned_people[i],
-                            person_b="",
-                        ))
-                    slot_idx += 1
-            
-            # Solo shifts: S only (Admin removed)
-            for s in ["S"]:
-                assigned_people = [p for p in names if solver.Value(assign[p][w][d][s]) == 1]
-                for slot_idx, person in enumerate(assigned_people):
-                    assignments.append(PairAssignment(
-                        week=w,
-                        day=d,
-                        shift=s,
-                        slot_idx=slot_idx,
-                        person_a=person,
-                        person_b="",
-                    ))
-    
-    # Sort assignments
-    assignments.sort(key=lambda a: (a.week, days.index(a.day), a.shift, a.slot_idx))
+    assignments = _extract_assignments(store, solver.Value)
     
-    score = solver.ObjectiveValue() if objective_terms else 0.0
+    score = solver.ObjectiveValue() if model.HasObjective() else 0.0
     
     logger.info(f"Extracted {len(assignments)} assignments, score={score}")
     
     # Stats
     stats = {
         "solve_time": solve_time,
+        "build_time": built.build_time_seconds,
+        "model_size": built.model_size,
+        "random_seed": config.random_seed,
+        "search_profile": profile,
+        "improvements": tracker.improvements,
+        **profile_stats,
     }
     
     return PairSchedule(
         assignments=assignments,
         weeks=weeks,
-        people_count=len(people),
+        people_count=store.num_people,
         status=status_name,
         score=score,
         solve_time_seconds=solve_time,
@@ -0,0 +1,163 @@
+"""
+Model Build Profiling
+=====================
+Per-builder size and timing of the CP-SAT model, plus solver response stats.
+
+Constraint and objective builders are decorated with @profiled. While a
+BuildProfile is active (build_pairs_model opens one per build), every call
+records the variables and constraints it added to the model proto and its
+wall time. Outside a BuildProfile the decorator only costs a context lookup.
+
+Entries are plain dicts so they can travel in PairSchedule.stats:
+    {"builder": name, "variables": n, "constraints": n, "seconds": t}
+"""
+import functools
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ortools.sat.python import cp_model
+
+_ACTIVE: ContextVar[Optional["BuildProfile"]] = ContextVar("rota_build_profile", default=None)
+
+# "Starting search at 0.05s with 1 workers." in the CP-SAT search log
+_SEARCH_START = re.compile(r"Starting search at ([0-9.]+)s")
+
+
+def _size(model: cp_model.CpModel) -> Tuple[int, int]:
+    proto = model.Proto()
+    return len(proto.variables), len(proto.constraints)
+
+
+class BuildProfile:
+    """
+    Collects one entry per profiled builder call.
+
+    Use as a context manager around a model build; nested builds (e.g. a
+    rolling-horizon block inside a profiled solve) get their own profile.
+    """
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self._token = None
+
+    def __enter__(self) -> "BuildProfile":
+        self._token = _ACTIVE.set(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _ACTIVE.reset(self._token)
+        self._token = None
+
+    @contextmanager
+    def measure(self, name: str, model: cp_model.CpModel) -> Iterator[None]:
+        """Record what the enclosed block adds to model under the given name."""
+        variables, constraints = _size(model)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            after_vars, after_constraints = _size(model)
+            self.entries.append({
+                "builder": name,
+                "variables": after_vars - variables,
+                "constraints": after_constraints - constraints,
+                "seconds": seconds,
+            })
+
+    def total_seconds(self) -> float:
+        return sum(entry["seconds"] for entry in self.entries)
+
+
+def profiled(builder: Callable) -> Callable:
+    """Decorator for builders taking the CpModel as first argument."""
+
+    @functools.wraps(builder)
+    def wrapper(model, *args, **kwargs):
+        profile = _ACTIVE.get()
+        if profile is None:
+            return builder(model, *args, **kwargs)
+        with profile.measure(builder.__name__, model):
+            return builder(model, *args, **kwargs)
+
+    return wrapper
+
+
+def enable_search_log(parameters) -> None:
+    """Keep the CP-SAT search log in the response (needed for presolve timing)."""
+    parameters.log_search_progress = True
+    parameters.log_to_stdout = False
+    parameters.log_to_response = True
+
+
+def presolve_seconds(solve_log: str) -> Optional[float]:
+    """Presolve duration parsed from a CP-SAT search log (None if absent)."""
+    match = _SEARCH_START.search(solve_log or "")
+    return float(match.group(1)) if match else None
+
+
+def _relative_gap(objective: float, bound: float) -> float:
+    return abs(objective - bound) / max(1.0, abs(objective))
+
+
+def response_stats(
+    solver: cp_model.CpSolver,
+    improvements: Sequence[Tuple[float, float, float]],
+    offset: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Summarize a finished CP-SAT solve.
+
+    Args:
+        solver: Solver after Solve()
+        improvements: ObjectiveTracker entries (elapsed, objective, bound)
+        offset: Seconds between the tracker's start_time and the Solve() call,
+            subtracted so times are relative to the solve itself
+
+    Returns:
+        Dict with CP-SAT counters, first_solution_seconds, presolve_seconds
+        (only when the search log was kept) and gap_over_time as
+        [seconds, relative gap] pairs, one per solution plus the final gap
+    """
+    response = solver.ResponseProto()
+    gap_over_time = [
+        [round(elapsed - offset, 4), _relative_gap(objective, bound)]
+        for elapsed, objective, bound in improvements
+    ]
+    if gap_over_time:
+        # The bound keeps moving after the last solution (e.g. proving optimality)
+        gap_over_time.append([
+            round(response.wall_time, 4),
+            _relative_gap(response.objective_value, response.best_objective_bound),
+        ])
+    stats = {
+        "wall_time": response.wall_time,
+        "user_time": response.user_time,
+        "deterministic_time": response.deterministic_time,
+        "num_conflicts": response.num_conflicts,
+        "num_branches": response.num_branches,
+        "num_booleans": response.num_booleans,
+        "num_integers": response.num_integers,
+        "num_lp_iterations": response.num_lp_iterations,
+        "gap_integral": response.gap_integral,
+        "first_solution_seconds": gap_over_time[0][0] if gap_over_time else None,
+        "gap_over_time": gap_over_time,
+    }
+    if response.solve_log:
+        stats["presolve_seconds"] = presolve_seconds(response.solve_log)
+        stats["response_stats"] = solver.ResponseStats()
+    return stats
+
+
+def format_profile(entries: Sequence[Dict[str, Any]]) -> List[str]:
+    """Text table of build profile entries, largest constraint count first."""
+    lines = [f"{'builder':<36} {'vars':>8} {'constraints':>12} {'time':>9}"]
+    for entry in sorted(entries, key=lambda e: -e["constraints"]):
+        lines.append(
+            f"{entry['builder']:<36} {entry['variables']:>8} {entry['constraints']:>12} "
+            f"{entry['seconds'] * 1000:>7.1f}ms"
+        )
+    return lines
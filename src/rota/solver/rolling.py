@@ -0,0 +1,189 @@
+"""
+Rolling-Horizon Solver
+======================
+Solves long horizons as a sequence of K-week blocks instead of one monolithic model.
+
+Each block model covers:
+- the last committed week, fixed to its solved values (context), so the
+  rolling 48h, night-sequence and consecutive-day windows see across the boundary
+- the next K free weeks; all but the last `overlap` weeks are committed,
+  the overlap weeks are re-solved at the start of the next block
+
+Cumulative night/soir totals of the committed weeks before the context week
+are carried into the fairness objectives and max_nights caps (HorizonCarry).
+Only one block model is alive at a time, so memory is bounded by K.
+"""
+import time
+from typing import Callable, Dict, List, Optional
+
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver.constraints.objectives import HorizonCarry
+from rota.solver.edo import EDOPlan
+from rota.solver.pairs import PairAssignment, PairModel, PairSchedule, build_pairs_model, solve_model
+from rota.solver.staffing import WeekStaffing, staffing_days
+from rota.solver.variables import SHIFT_CODES
+from rota.utils.logging_setup import SolverLogger, get_logger
+
+logger = get_logger("rota.solver.rolling")
+slog = SolverLogger("rota.solver.rolling")
+
+
+def uses_rolling_horizon(config: SolverConfig) -> bool:
+    """True if config asks for block solving and the horizon is longer than one block."""
+    return 0 < config.rolling_block_weeks < config.weeks
+
+
+def _carry_before(
+    assignments: List[PairAssignment],
+    people: List[Person],
+    staffing: Dict[int, WeekStaffing],
+    days: List[str],
+    first_week: int,
+) -> HorizonCarry:
+    """Night/soir totals of committed assignments before first_week."""
+    index = {p.name: i for i, p in enumerate(people)}
+    nights = [0] * len(people)
+    soirs = [0] * len(people)
+    for a in assignments:
+        if a.week >= first_week or a.shift not in ("N", "S"):
+            continue
+        counts = nights if a.shift == "N" else soirs
+        for name in (a.person_a, a.person_b):
+            if name in index:
+                counts[index[name]] += 1
+
+    weeks = range(1, first_week)
+    return HorizonCarry(
+        nights=nights,
+        soirs=soirs,
+        days=len(weeks) * len(days),
+        soir_slots=sum(staffing[w].slots[d].get("S", 0) for w in weeks for d in days),
+    )
+
+
+def _fix_week(built: PairModel, assignments: List[PairAssignment], week: int) -> None:
+    """Pin every shift var of one week to its committed value."""
+    store = built.store
+    worked = {}
+    for a in assignments:
+        if a.week == week:
+            for name in (a.person_a, a.person_b):
+                if name:
+                    worked[(name, a.day)] = a.shift
+
+    for p, name in enumerate(store.names):
+        for g in store.week_days(week):
+            shift = worked.get((name, store.day_label(g)[1]))
+            for s, var in enumerate(store.day_shifts(p, g)):
+                built.model.Add(var == (1 if shift == SHIFT_CODES[s] else 0))
+
+
+def solve_rolling(
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    days: Optional[List[str]] = None,
+    on_solution: Optional[Callable[[PairSchedule], None]] = None,
+) -> PairSchedule:
+    """
+    Solve the horizon block by block (config.rolling_block_weeks weeks each).
+
+    config.time_limit_seconds applies to each block.
+
+    Args:
+        people: List of Person objects
+        config: Solver configuration
+        staffing: Slot requirements per week/day/shift
+        edo_plan: EDO allocation plan
+        days: Days of the week (defaults to the days staffing covers)
+        on_solution: Called with the committed schedule so far after each block
+
+    Returns:
+        PairSchedule for the full horizon (partial, with the failing status,
+        if a block has no solution)
+    """
+    days = days or staffing_days(staffing)
+    start_time = time.time()
+    block = config.rolling_block_weeks
+    overlap = max(0, min(config.rolling_overlap_weeks, block - 1))
+    slog.phase(f"Rolling Horizon ({config.weeks} weeks, blocks of {block}, overlap {overlap})")
+
+    committed: List[PairAssignment] = []
+    block_stats = []
+    context_week = None
+    first_free = 1
+    # Block-wise optimality does not prove the whole horizon optimal
+    status = "feasible"
+    score = 0.0
+    bound = 0.0
+    build_time = 0.0
+
+    while first_free <= config.weeks:
+        free_weeks = list(range(first_free, min(first_free + block, config.weeks + 1)))
+        final = free_weeks[-1] == config.weeks
+        commit_weeks = free_weeks if final else free_weeks[:len(free_weeks) - overlap]
+        model_weeks = ([context_week] if context_week else []) + free_weeks
+
+        slog.step(f"Block weeks {free_weeks[0]}-{free_weeks[-1]} (commit {commit_weeks[0]}-{commit_weeks[-1]})")
+        carry = _carry_before(committed, people, staffing, days, model_weeks[0])
+        built = build_pairs_model(people, config, staffing, edo_plan, days, weeks=model_weeks, carry=carry)
+        if context_week:
+            _fix_week(built, committed, context_week)
+
+        result = solve_model(built, config)
+        build_time += built.build_time_seconds
+        block_stats.append({
+            "weeks": [free_weeks[0], free_weeks[-1]],
+            "status": result.status,
+            "objective": result.score,
+            "solve_time": result.solve_time_seconds,
+        })
+
+        if result.status not in ["optimal", "feasible"]:
+            logger.error(f"Rolling block starting week {free_weeks[0]} failed: {result.status}")
+            status = result.status
+            break
+        score += result.score
+        trace = result.stats.get("improvements")
+        bound += trace[-1][2] if trace else result.score
+
+        commit = set(commit_weeks)
+        committed.extend(a for a in result.assignments if a.week in commit)
+        context_week = commit_weeks[-1]
+        first_free = context_week + 1
+
+        if on_solution is not None:
+            on_solution(PairSchedule(
+                assignments=list(committed),
+                weeks=config.weeks,
+                people_count=len(people),
+                status="feasible",
+                score=score,
+                solve_time_seconds=time.time() - start_time,
+                stats={"objective": score, "bound": bound, "weeks_committed": context_week},
+            ))
+
+    solve_time = time.time() - start_time
+    logger.info(f"Rolling horizon complete: status={status}, blocks={len(block_stats)}, time={solve_time:.2f}s")
+
+    return PairSchedule(
+        assignments=committed,
+        weeks=config.weeks,
+        people_count=len(people),
+        status=status,
+        score=score,
+        solve_time_seconds=solve_time,
+        stats={
+            "solve_time": solve_time,
+            "build_time": build_time,
+            "random_seed": config.random_seed,
+            "search_profile": config.search_profile or "default",
+            "rolling_blocks": len(block_stats),
+            "rolling_block_weeks": block,
+            "rolling_overlap_weeks": overlap,
+            "blocks_optimal": sum(1 for b in block_stats if b["status"] == "optimal"),
+            "block_stats": block_stats,
+        },
+    )
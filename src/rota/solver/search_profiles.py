@@ -0,0 +1,64 @@
+"""
+CP-SAT Search Profiles
+======================
+Named CP-SAT parameter sets used to diversify multi-seed portfolios.
+
+Each try of a portfolio gets its own random_seed and one of these profiles,
+so tries explore genuinely different search spaces instead of repeating the
+same default search.
+"""
+from typing import Any, Dict, List
+
+from ortools.sat.python import cp_model
+
+from rota.utils.logging_setup import get_logger
+
+logger = get_logger("rota.solver.search_profiles")
+
+# Parameters applied to every solve before the profile overrides
+BASE_PARAMETERS: Dict[str, Any] = {
+    "linearization_level": 2,
+    "cp_model_presolve": True,
+}
+
+# Profile name -> SatParameters overrides (search_branching given by enum name)
+SEARCH_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "quick_restart": {"search_branching": "PORTFOLIO_WITH_QUICK_RESTART_SEARCH"},
+    "pseudo_cost": {"search_branching": "PSEUDO_COST_SEARCH"},
+    "lp_search": {"search_branching": "LP_SEARCH", "linearization_level": 2},
+    "no_lp": {"linearization_level": 0},
+    "no_presolve": {"cp_model_presolve": False},
+}
+
+# Profiles cycled across tries when SolverConfig.portfolio_profiles is empty
+DEFAULT_PORTFOLIO: List[str] = ["default", "quick_restart", "pseudo_cost", "no_lp", "lp_search"]
+
+
+def profile_for_try(try_index: int, profiles: List[str]) -> str:
+    """Profile used by the n-th try of a portfolio (cycles through the list)."""
+    portfolio = profiles or DEFAULT_PORTFOLIO
+    return portfolio[try_index % len(portfolio)]
+
+
+def apply_search_profile(parameters, profile: str) -> str:
+    """
+    Apply base parameters and a named profile to CP-SAT SatParameters.
+
+    Args:
+        parameters: solver.parameters of a CpSolver
+        profile: Profile name (empty or unknown names fall back to "default")
+
+    Returns:
+        Name of the profile actually applied
+    """
+    name = profile or "default"
+    if name not in SEARCH_PROFILES:
+        logger.warning(f"Unknown search profile '{name}', using default")
+        name = "default"
+
+    for key, value in {**BASE_PARAMETERS, **SEARCH_PROFILES[name]}.items():
+        if key == "search_branching":
+            value = getattr(cp_model, value)
+        setattr(parameters, key, value)
+    return name
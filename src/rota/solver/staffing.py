@@ -5,10 +5,14 @@ Fixed staffing based on specification:
 - Jour (D): 4 pairs = 8 people per day
 - Nuit (N): 1 pair = 2 people per day
 - Soir (S): 1 solo person per day
+
+With WeekendMode.INTEGRATED the model also covers Sam/Dim, staffed with
+WEEKEND_STAFFING (1 Jour pair, 1 Nuit pair, no Soir).
 """
 from dataclasses import dataclass
 from typing import Dict, List, Set
 
+from rota.models.constraints import SolverConfig, WeekendMode
 from rota.models.person import Person
 from rota.utils.logging_setup import get_logger, log_function_call
 
@@ -18,9 +22,11 @@ from rota.models.rules import RULES, SHIFTS
 
 # Days of the week (French abbrev) - Weekdays only
 JOURS = ["Lun", "Mar", "Mer", "Jeu", "Ven"]
+WEEKEND_JOURS = ["Sam", "Dim"]
 
 # Fixed staffing per day (from specification)
 FIXED_STAFFING = RULES.default_staffing
+WEEKEND_STAFFING = RULES.default_weekend_staffing
 
 # Shift types that use pairs vs solo
 # Derived from SHIFTS config
@@ -51,6 +57,20 @@ class WeekStaffing:
         return total
 
 
+def model_days(config: SolverConfig) -> List[str]:
+    """Days the Person-Shift model covers: Mon-Fri, or Mon-Sun in integrated weekend mode."""
+    if config.weekend_mode == WeekendMode.INTEGRATED:
+        return JOURS + WEEKEND_JOURS
+    return list(JOURS)
+
+
+def staffing_days(staffing: Dict[int, "WeekStaffing"]) -> List[str]:
+    """Days covered by a derive_staffing() result (JOURS if empty)."""
+    for week_staffing in staffing.values():
+        return list(week_staffing.slots)
+    return list(JOURS)
+
+
 @log_function_call
 def derive_staffing(
     people: List[Person],
@@ -62,7 +82,8 @@ def derive_staffing(
     """
     Generate fixed staffing for all weeks.
     
-    Uses FIXED_STAFFING unless custom_staffing is provided.
+    Uses FIXED_STAFFING unless custom_staffing is provided; weekend days
+    (see model_days) always use WEEKEND_STAFFING.
     
     Args:
         people: List of Person objects
@@ -92,7 +113,7 @@ def derive_staffing(
         person_days = total_wd - edo_count
         
         # Fixed slots per day
-        per_day = {d: dict(staffing) for d in days}
+        per_day = {d: dict(WEEKEND_STAFFING if d in WEEKEND_JOURS else staffing) for d in days}
         
         week_staffing = WeekStaffing(
             week=w,
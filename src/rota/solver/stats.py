@@ -43,7 +43,7 @@ def calculate_person_stats(
     
     Uses:
         - schedule.weeks for week count
-        - schedule.count_shifts() for shift counts
+        - schedule.get_shift_counts() for shift counts (indexed)
         - edo_plan.plan for EDO tracking
     
     Args:
@@ -60,11 +60,12 @@ def calculate_person_stats(
     for p in people:
         name = p.name
         
-        # Count shifts using schedule method (D, S, N, A codes)
-        j = schedule.count_shifts(name, 'D')
-        s = schedule.count_shifts(name, 'S')
-        n = schedule.count_shifts(name, 'N')
-        a = schedule.count_shifts(name, 'A')
+        # Count shifts using the schedule index (D, S, N, A codes)
+        counts = schedule.get_shift_counts(name)
+        j = counts.get('D', 0)
+        s = counts.get('S', 0)
+        n = counts.get('N', 0)
+        a = counts.get('A', 0)
         total = j + s + n + a
         
         # Count EDO weeks
@@ -3,18 +3,33 @@ Study Manager - Persistent Trial Storage
 =========================================
 Manages optimization study persistence using SQLite.
 Stores config hashes, trials, and best results for quick lookup.
+
+Trial payloads (schedule, validation, fairness) are zlib-compressed blobs
+loaded on demand; only the best keep_schedules trials of a study keep them,
+every trial keeps its seed and score.
+
+Each process keeps one long-lived WAL-mode connection per database file,
+shared by all its StudyManager instances. Trials produced concurrently should
+go through a TrialWriter, which batches them into single transactions from
+one writer thread.
 """
 import hashlib
 import json
 import os
+import queue
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from rota.models.constraints import SolverConfig
 from rota.models.person import Person
+from rota.solver.columnar import MAGIC, decode_schedule, encode_schedule
+from rota.solver.constraints.objectives import OBJECTIVE_VERSION
 from rota.solver.pairs import PairAssignment, PairSchedule
 from rota.utils.logging_setup import get_logger
 
@@ -23,6 +38,108 @@ logger = get_logger("rota.solver.study_manager")
 # Default database location
 DEFAULT_DB_PATH = Path("data/studies.db")
 
+# Columns added to the trials table after its first release: name -> DDL
+TRIAL_MIGRATIONS: Dict[str, str] = {
+    "profile": "TEXT DEFAULT ''",
+    "schedule_blob": "BLOB",
+    "validation_blob": "BLOB",
+    "fairness_blob": "BLOB",
+}
+
+# PRAGMA user_version once legacy JSON payloads have been compressed
+SCHEMA_VERSION = 2
+
+# Trials per study that keep their payloads (0 keeps all)
+DEFAULT_KEEP_SCHEDULES = 10
+
+COMPRESSION_LEVEL = 6
+
+# Seconds a connection waits on a locked database before raising
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+def _pack_json(data: Any) -> bytes:
+    """Compress a JSON-serializable payload."""
+    return zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def _unpack_json(blob: Optional[bytes]) -> Dict[str, Any]:
+    """Inverse of _pack_json (None -> {})."""
+    if blob is None:
+        return {}
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _pack_schedule(schedule: PairSchedule) -> bytes:
+    """Columnar encoding of a schedule, compressed."""
+    return zlib.compress(encode_schedule(schedule), COMPRESSION_LEVEL)
+
+
+def _unpack_schedule(blob: bytes) -> PairSchedule:
+    """Decode a stored schedule blob (raw columnar blobs predate compression)."""
+    if blob[:len(MAGIC)] != MAGIC:
+        blob = zlib.decompress(blob)
+    return decode_schedule(blob)
+
+
+def _legacy_schedule(schedule_json: str) -> PairSchedule:
+    """Rebuild a schedule stored as JSON before the columnar format."""
+    data = json.loads(schedule_json)
+    
+    assignments = [
+        PairAssignment(
+            week=a["week"],
+            day=a["day"],
+            shift=a["shift"],
+            slot_idx=a["slot_idx"],
+            person_a=a["person_a"],
+            person_b=a.get("person_b") or "",
+        )
+        for a in data["assignments"]
+    ]
+    
+    return PairSchedule(
+        assignments=assignments,
+        weeks=data["weeks"],
+        people_count=data["people_count"],
+        status=data["status"],
+        score=data["score"],
+        solve_time_seconds=data["solve_time_seconds"],
+        stats=data.get("stats", {}),
+    )
+
+
+# (resolved db path, pid) -> connection and the lock serializing its use
+_CONNECTIONS: Dict[Tuple[str, int], Tuple[sqlite3.Connection, threading.RLock]] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _pooled_connection(db_path: Path) -> Tuple[sqlite3.Connection, threading.RLock]:
+    """
+    Long-lived connection to db_path for the current process.
+    
+    Keyed by pid so a forked worker never reuses its parent's connection.
+    """
+    key = (str(Path(db_path).resolve()), os.getpid())
+    with _CONNECTIONS_LOCK:
+        if key not in _CONNECTIONS:
+            conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _CONNECTIONS[key] = (conn, threading.RLock())
+        return _CONNECTIONS[key]
+
+
+def _close_connection(db_path: Path):
+    """Close and forget the current process's connection to db_path."""
+    key = (str(Path(db_path).resolve()), os.getpid())
+    with _CONNECTIONS_LOCK:
+        entry = _CONNECTIONS.pop(key, None)
+    if entry is not None:
+        conn, lock = entry
+        with lock:
+            conn.close()
+
 
 def compute_study_hash(
     config: SolverConfig, 
@@ -34,7 +151,7 @@ def compute_study_hash(
     Generate unique hash for this optimization problem.
     
     Includes: team composition, constraints, weeks, fairness mode,
-              staffing requirements, weekend parameters
+              staffing requirements, weekend parameters, objective version
     Excludes: seed, time_limit, tries (vary between runs)
     
     Args:
@@ -52,6 +169,7 @@ def compute_study_hash(
     config_dict.pop("num_workers", None)
     config_dict.pop("workers_per_solve", None)
     config_dict.pop("parallel_portfolio", None)
+    config_dict["objective_version"] = OBJECTIVE_VERSION
     
     # Sort team by name for consistent hashing
     team_data = sorted([p.to_dict() for p in people], key=lambda x: x["name"])
@@ -90,16 +208,41 @@ class StudySummary:
 
 @dataclass
 class TrialResult:
-    """Result of a single optimization trial."""
+    """
+    Result of a single optimization trial (without its payloads).
+    
+    Use StudyManager.load_schedule_from_trial / load_trial_details to fetch
+    the schedule, validation and fairness data.
+    """
     trial_id: int
     study_hash: str
     seed: int
     score: float
-    schedule_json: str
-    validation_json: str
-    fairness_json: str
     solve_time_seconds: float
     created_at: datetime
+    profile: str = ""
+    has_schedule: bool = True  # False once pruned by the retention policy
+
+
+@dataclass
+class TrialRecord:
+    """A finished trial waiting to be saved (see StudyManager.save_trials_batch)."""
+    seed: int
+    score: float
+    schedule: PairSchedule
+    validation: Dict[str, Any]
+    fairness: Dict[str, Any]
+    profile: Optional[str] = None
+
+
+@dataclass
+class ProfileSummary:
+    """How one search profile performed across the trials of a study."""
+    profile: str
+    trials: int
+    wins: int
+    best_score: float
+    avg_score: float
 
 
 class StudyManager:
@@ -118,15 +261,39 @@ class StudyManager:
         manager.save_trial(study_hash, seed, score, schedule, validation, fairness)
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
-        """Initialize with database path."""
+    def __init__(self, db_path: Optional[Path] = None, keep_schedules: int = DEFAULT_KEEP_SCHEDULES):
+        """
+        Initialize with database path.
+        
+        Args:
+            db_path: SQLite file (default data/studies.db)
+            keep_schedules: Trials per study whose payloads are kept (0 keeps all)
+        """
         self.db_path = db_path or DEFAULT_DB_PATH
+        self.keep_schedules = keep_schedules
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
     
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run statements on the shared connection in one transaction.
+        
+        Statements are plain SQL constants, so sqlite3's per-connection
+        statement cache keeps them prepared across calls.
+        """
+        conn, lock = _pooled_connection(self.db_path)
+        with lock:
+            with conn:
+                yield conn
+    
+    def close(self):
+        """Close this process's connection to db_path (reopened on next use)."""
+        _close_connection(self.db_path)
+    
     def _init_db(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS studies (
                     study_hash TEXT PRIMARY KEY,
@@ -148,13 +315,22 @@ class StudyManager:
                     study_hash TEXT REFERENCES studies(study_hash),
                     seed INTEGER,
                     score REAL,
-                    schedule_json TEXT,
+                    schedule_json TEXT,  -- legacy, moved to blobs on migration
                     validation_json TEXT,
                     fairness_json TEXT,
                     solve_time_seconds REAL,
-                    created_at TIMESTAMP
+                    created_at TIMESTAMP,
+                    profile TEXT DEFAULT '',
+                    schedule_blob BLOB,
+                    validation_blob BLOB,
+                    fairness_blob BLOB
                 )
             """)
+            # Migrate databases created before these columns existed
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(trials)")}
+            for column, ddl in TRIAL_MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE trials ADD COLUMN {column} {ddl}")
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_trials_study 
                 ON trials(study_hash)
@@ -163,12 +339,49 @@ class StudyManager:
                 CREATE INDEX IF NOT EXISTS idx_trials_score 
                 ON trials(study_hash, score)
             """)
-            conn.commit()
+            migrated = 0
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                migrated = self._compress_payloads(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        
+        if migrated:
+            # Give the space of the old TEXT payloads back to the filesystem
+            conn, lock = _pooled_connection(self.db_path)
+            with lock:
+                conn.execute("VACUUM")
+            logger.info(f"Compressed payloads of {migrated} stored trials")
         logger.debug(f"Database initialized at {self.db_path}")
     
+    def _compress_payloads(self, conn: sqlite3.Connection) -> int:
+        """Move JSON TEXT payloads (and uncompressed schedule blobs) to compressed blobs."""
+        rows = conn.execute("""
+            SELECT id, schedule_json, validation_json, fairness_json, schedule_blob
+            FROM trials
+            WHERE schedule_json IS NOT NULL OR validation_json IS NOT NULL
+               OR fairness_json IS NOT NULL OR substr(schedule_blob, 1, ?) = ?
+        """, (len(MAGIC), MAGIC)).fetchall()
+        
+        for trial_id, schedule_json, validation_json, fairness_json, schedule_blob in rows:
+            if schedule_json:
+                schedule_blob = _pack_schedule(_legacy_schedule(schedule_json))
+            elif schedule_blob is not None and schedule_blob[:len(MAGIC)] == MAGIC:
+                schedule_blob = zlib.compress(schedule_blob, COMPRESSION_LEVEL)
+            conn.execute("""
+                UPDATE trials SET
+                    schedule_blob = ?, validation_blob = ?, fairness_blob = ?,
+                    schedule_json = NULL, validation_json = NULL, fairness_json = NULL
+                WHERE id = ?
+            """, (
+                schedule_blob,
+                _pack_json(json.loads(validation_json)) if validation_json else None,
+                _pack_json(json.loads(fairness_json)) if fairness_json else None,
+                trial_id,
+            ))
+        return len(rows)
+    
     def study_exists(self, study_hash: str) -> bool:
         """Check if a study exists."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             result = conn.execute(
                 "SELECT 1 FROM studies WHERE study_hash = ?", 
                 (study_hash,)
@@ -177,7 +390,7 @@ class StudyManager:
     
     def get_study_summary(self, study_hash: str) -> Optional[StudySummary]:
         """Get summary of a study."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             row = conn.execute("""
                 SELECT study_hash, study_name, weeks, team_size, 
                        best_score, best_seed, total_trials, 
@@ -202,7 +415,7 @@ class StudyManager:
     
     def get_study_config(self, study_hash: str) -> Optional[Dict]:
         """Get the config JSON stored with a study."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             row = conn.execute(
                 "SELECT config_json FROM studies WHERE study_hash = ?",
                 (study_hash,)
@@ -214,7 +427,7 @@ class StudyManager:
     
     def get_most_recent_config(self) -> Optional[Dict]:
         """Get config from the most recently updated study."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             row = conn.execute(
                 "SELECT config_json FROM studies ORDER BY updated_at DESC LIMIT 1"
             ).fetchone()
@@ -227,7 +440,7 @@ class StudyManager:
         """Get the team (people) stored with a study."""
         from rota.models.person import Person
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             row = conn.execute(
                 "SELECT team_json FROM studies WHERE study_hash = ?",
                 (study_hash,)
@@ -248,7 +461,7 @@ class StudyManager:
     
     def list_studies(self, limit: int = 20) -> List[StudySummary]:
         """List all studies, most recent first."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             rows = conn.execute("""
                 SELECT study_hash, study_name, weeks, team_size, 
                        best_score, best_seed, total_trials, 
@@ -287,6 +500,7 @@ class StudyManager:
         
         # Serialize full configuration context
         config_dict = config.to_dict()
+        config_dict["objective_version"] = OBJECTIVE_VERSION
         if custom_staffing:
             config_dict["custom_staffing"] = custom_staffing
         if weekend_config:
@@ -295,7 +509,7 @@ class StudyManager:
         config_json = json.dumps(config_dict, ensure_ascii=False)
         team_json = json.dumps([p.to_dict() for p in people], ensure_ascii=False)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO studies 
                 (study_hash, study_name, config_json, team_json, weeks, team_size,
@@ -314,7 +528,6 @@ class StudyManager:
                 now,
                 now,
             ))
-            conn.commit()
         logger.info(f"Created study {study_hash}")
     
     def save_trial(
@@ -325,68 +538,113 @@ class StudyManager:
         schedule: PairSchedule,
         validation_dict: Dict[str, Any],
         fairness_dict: Dict[str, Any],
+        profile: Optional[str] = None,
     ):
-        """Save a trial result."""
-        now = datetime.now().isoformat()
+        """
+        Save a trial result.
         
-        # Serialize schedule
-        schedule_data = {
-            "weeks": schedule.weeks,
-            "people_count": schedule.people_count,
-            "status": schedule.status,
-            "score": schedule.score,
-            "solve_time_seconds": schedule.solve_time_seconds,
-            "stats": schedule.stats,
-            "assignments": [
-                {
-                    "week": a.week,
-                    "day": a.day,
-                    "shift": a.shift,
-                    "slot_idx": a.slot_idx,
-                    "person_a": a.person_a,
-                    "person_b": a.person_b,
-                }
-                for a in schedule.assignments
-            ]
-        }
-        schedule_json = json.dumps(schedule_data, ensure_ascii=False)
-        validation_json = json.dumps(validation_dict, ensure_ascii=False)
-        fairness_json = json.dumps(fairness_dict, ensure_ascii=False)
+        Args:
+            profile: CP-SAT search profile that produced the trial
+                (defaults to schedule.stats["search_profile"])
+        """
+        self.save_trials_batch(
+            study_hash, [TrialRecord(seed, score, schedule, validation_dict, fairness_dict, profile)]
+        )
+    
+    def save_trials_batch(self, study_hash: str, trials: Sequence[TrialRecord]):
+        """
+        Save several trials of one study in a single transaction.
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Insert trial
-            conn.execute("""
-                INSERT INTO trials 
-                (study_hash, seed, score, schedule_json, validation_json, 
-                 fairness_json, solve_time_seconds, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                study_hash, seed, score, schedule_json, validation_json,
-                fairness_json, schedule.solve_time_seconds, now,
+        Payloads are encoded before the write lock is taken.
+        """
+        if not trials:
+            return
+        now = datetime.now().isoformat()
+        rows = []
+        for t in trials:
+            profile = t.profile
+            if profile is None:
+                profile = t.schedule.stats.get("search_profile", "")
+            rows.append((
+                study_hash, t.seed, t.score, _pack_schedule(t.schedule),
+                _pack_json(t.validation), _pack_json(t.fairness),
+                t.schedule.solve_time_seconds, now, profile,
             ))
+        best = min(trials, key=lambda t: t.score)
+        
+        with self._transaction() as conn:
+            conn.executemany("""
+                INSERT INTO trials 
+                (study_hash, seed, score, schedule_blob, validation_blob, 
+                 fairness_blob, solve_time_seconds, created_at, profile)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
             
             # Update study stats
             conn.execute("""
                 UPDATE studies SET
-                    total_trials = total_trials + 1,
+                    total_trials = total_trials + ?,
                     best_score = CASE WHEN ? < best_score THEN ? ELSE best_score END,
                     best_seed = CASE WHEN ? < best_score THEN ? ELSE best_seed END,
                     updated_at = ?
                 WHERE study_hash = ?
-            """, (score, score, score, seed, now, study_hash))
+            """, (len(rows), best.score, best.score, best.score, best.seed, now, study_hash))
             
-            conn.commit()
-        logger.debug(f"Saved trial: seed={seed}, score={score:.2f}")
+            if self.keep_schedules > 0:
+                self._prune_payloads(conn, study_hash, self.keep_schedules)
+        
+        for row in rows:
+            logger.debug(f"Saved trial: seed={row[1]}, profile={row[8]}, score={row[2]:.2f}")
+    
+    def _prune_payloads(self, conn: sqlite3.Connection, study_hash: str, keep: int) -> int:
+        """Drop payloads of all but the best `keep` trials of a study."""
+        cursor = conn.execute("""
+            UPDATE trials SET
+                schedule_blob = NULL, validation_blob = NULL, fairness_blob = NULL,
+                schedule_json = NULL, validation_json = NULL, fairness_json = NULL
+            WHERE study_hash = ?
+              AND (schedule_blob IS NOT NULL OR schedule_json IS NOT NULL)
+              AND id NOT IN (
+                  SELECT id FROM trials WHERE study_hash = ?
+                  ORDER BY score ASC, id ASC LIMIT ?
+              )
+        """, (study_hash, study_hash, keep))
+        return cursor.rowcount
+    
+    def prune_schedules(self, study_hash: Optional[str] = None, keep: Optional[int] = None) -> int:
+        """
+        Apply the retention policy: keep payloads of the best trials only.
+        
+        Scores, seeds and profiles of every trial are kept.
+        
+        Args:
+            study_hash: Study to prune (None prunes every study)
+            keep: Trials per study to keep (default self.keep_schedules)
+            
+        Returns:
+            Number of trials whose payloads were dropped
+        """
+        keep = self.keep_schedules if keep is None else keep
+        if keep <= 0:
+            return 0
+        with self._transaction() as conn:
+            if study_hash is None:
+                hashes = [row[0] for row in conn.execute("SELECT study_hash FROM studies")]
+            else:
+                hashes = [study_hash]
+            pruned = sum(self._prune_payloads(conn, h, keep) for h in hashes)
+        logger.info(f"Pruned payloads of {pruned} trials (keep={keep})")
+        return pruned
     
     def get_best_trial(self, study_hash: str) -> Optional[TrialResult]:
-        """Get the best trial for a study."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Get the best trial for a study (payloads are not read)."""
+        with self._transaction() as conn:
             row = conn.execute("""
-                SELECT id, study_hash, seed, score, schedule_json, 
-                       validation_json, fairness_json, solve_time_seconds, created_at
+                SELECT id, study_hash, seed, score, solve_time_seconds, created_at, profile,
+                       schedule_blob IS NOT NULL OR schedule_json IS NOT NULL
                 FROM trials 
                 WHERE study_hash = ?
-                ORDER BY score ASC
+                ORDER BY score ASC, id ASC
                 LIMIT 1
             """, (study_hash,)).fetchone()
             
@@ -398,52 +656,216 @@ class StudyManager:
                 study_hash=row[1],
                 seed=row[2],
                 score=row[3],
-                schedule_json=row[4],
-                validation_json=row[5],
-                fairness_json=row[6],
-                solve_time_seconds=row[7],
-                created_at=datetime.fromisoformat(row[8]) if row[8] else datetime.now(),
+                solve_time_seconds=row[4],
+                created_at=datetime.fromisoformat(row[5]) if row[5] else datetime.now(),
+                profile=row[6] or "",
+                has_schedule=bool(row[7]),
             )
     
+    def get_profile_summary(self, study_hash: str) -> List[ProfileSummary]:
+        """
+        Aggregate trial scores per search profile, best profile first.
+        
+        wins counts the profile's trials that match the study's best score.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute("""
+                SELECT COALESCE(NULLIF(profile, ''), 'unknown'),
+                       COUNT(*), MIN(score), AVG(score),
+                       SUM(CASE WHEN score = (
+                           SELECT MIN(score) FROM trials WHERE study_hash = ?
+                       ) THEN 1 ELSE 0 END)
+                FROM trials
+                WHERE study_hash = ?
+                GROUP BY 1
+                ORDER BY MIN(score) ASC, AVG(score) ASC
+            """, (study_hash, study_hash)).fetchall()
+            
+            return [
+                ProfileSummary(
+                    profile=row[0],
+                    trials=row[1],
+                    best_score=row[2],
+                    avg_score=row[3],
+                    wins=row[4],
+                )
+                for row in rows
+            ]
+    
+    def find_nearest_study(
+        self,
+        people: List[Person],
+        weeks: int,
+        exclude_hash: Optional[str] = None,
+        min_overlap: float = 0.5,
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Find the stored study closest to a new problem, for warm starts.
+        
+        Candidates must cover the same number of weeks, be scored under the
+        current OBJECTIVE_VERSION and have at least one trial; closeness is
+        the Jaccard overlap of team member names.
+        
+        Args:
+            people: Team of the new problem
+            weeks: Horizon of the new problem
+            exclude_hash: Study to skip (usually the new study itself)
+            min_overlap: Minimum team overlap to accept a candidate
+            
+        Returns:
+            (study_hash, overlap) of the best candidate, or None
+        """
+        names = {p.name for p in people}
+        if not names:
+            return None
+        
+        with self._transaction() as conn:
+            rows = conn.execute("""
+                SELECT study_hash, team_json, config_json FROM studies
+                WHERE weeks = ? AND total_trials > 0 AND study_hash != ?
+                ORDER BY updated_at DESC
+            """, (weeks, exclude_hash or "")).fetchall()
+        
+        best = None
+        for study_hash, team_json, config_json in rows:
+            config = json.loads(config_json or "{}")
+            if config.get("objective_version") != OBJECTIVE_VERSION:
+                continue
+            other = {p.get("name") for p in json.loads(team_json or "[]")}
+            overlap = len(names & other) / len(names | other)
+            if overlap >= min_overlap and (best is None or overlap > best[1]):
+                best = (study_hash, overlap)
+        return best
+    
     def load_schedule_from_trial(self, trial: TrialResult) -> PairSchedule:
-        """Reconstruct a PairSchedule from stored trial data."""
-        data = json.loads(trial.schedule_json)
+        """
+        Reconstruct a PairSchedule from stored trial data.
         
-        assignments = [
-            PairAssignment(
-                week=a["week"],
-                day=a["day"],
-                shift=a["shift"],
-                slot_idx=a["slot_idx"],
-                person_a=a["person_a"],
-                person_b=a.get("person_b"),
-            )
-            for a in data["assignments"]
-        ]
+        Raises:
+            LookupError: If the trial's schedule was pruned by the retention policy
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT schedule_blob, schedule_json FROM trials WHERE id = ?",
+                (trial.trial_id,)
+            ).fetchone()
         
-        return PairSchedule(
-            assignments=assignments,
-            weeks=data["weeks"],
-            people_count=data["people_count"],
-            status=data["status"],
-            score=data["score"],
-            solve_time_seconds=data["solve_time_seconds"],
-            stats=data.get("stats", {}),
-        )
+        if row and row[0] is not None:
+            return _unpack_schedule(row[0])
+        if row and row[1]:
+            return _legacy_schedule(row[1])
+        raise LookupError(f"Schedule of trial {trial.trial_id} is not stored")
+    
+    def load_trial_details(self, trial: TrialResult) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Load the validation and fairness dicts saved with a trial.
+        
+        Returns:
+            (validation, fairness); empty dicts if pruned
+        """
+        with self._transaction() as conn:
+            row = conn.execute("""
+                SELECT validation_blob, fairness_blob, validation_json, fairness_json
+                FROM trials WHERE id = ?
+            """, (trial.trial_id,)).fetchone()
+        
+        if not row:
+            return {}, {}
+        validation = _unpack_json(row[0]) if row[0] is not None else json.loads(row[2] or "{}")
+        fairness = _unpack_json(row[1]) if row[1] is not None else json.loads(row[3] or "{}")
+        return validation, fairness
     
     def delete_study(self, study_hash: str):
         """Delete a study and all its trials."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute("DELETE FROM trials WHERE study_hash = ?", (study_hash,))
             conn.execute("DELETE FROM studies WHERE study_hash = ?", (study_hash,))
-            conn.commit()
         logger.info(f"Deleted study {study_hash}")
     
     def get_tried_seeds(self, study_hash: str) -> List[int]:
         """Get list of seeds already tried for this study."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             rows = conn.execute(
                 "SELECT seed FROM trials WHERE study_hash = ?",
                 (study_hash,)
             ).fetchall()
             return [row[0] for row in rows]
+
+
+_STOP = object()
+
+
+class TrialWriter:
+    """
+    Single writer thread batching trials of one study into StudyManager.
+    
+    Any number of producers (result loops, future callbacks) call submit();
+    the writer drains whatever has queued up and saves it with one
+    save_trials_batch transaction, so trials finishing together never
+    contend for the SQLite write lock.
+    
+    Usage:
+        with TrialWriter(manager, study_hash) as writer:
+            writer.submit(TrialRecord(seed, score, schedule, validation, fairness))
+        # all trials are committed here (or writer.error says why not)
+    """
+    
+    def __init__(self, manager: StudyManager, study_hash: str, max_batch: int = 32):
+        self.manager = manager
+        self.study_hash = study_hash
+        self.max_batch = max_batch
+        self.saved = 0
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="trial-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, trial: TrialRecord):
+        """Queue a trial for saving (returns immediately)."""
+        self._queue.put(trial)
+    
+    def close(self) -> Optional[BaseException]:
+        """
+        Write every queued trial and stop the writer thread.
+        
+        A failed save is logged and kept in self.error rather than raised, so
+        a lost cache write never discards the schedule that was solved.
+        
+        Returns:
+            The first error raised while saving, or None
+        """
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        return self.error
+    
+    def __enter__(self) -> "TrialWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _run(self):
+        stop = False
+        while not stop:
+            batch = []
+            item = self._queue.get()
+            while True:
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch and self.error is None:
+                try:
+                    self.manager.save_trials_batch(self.study_hash, batch)
+                    self.saved += len(batch)
+                except Exception as e:
+                    logger.error(f"Failed to save {len(batch)} trials: {e}")
+                    self.error = e
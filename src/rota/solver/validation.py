@@ -2,17 +2,22 @@
 Validation and Scoring
 ======================
 Validate schedule quality and compute weighted score matching legacy formula.
+
+validate_schedule builds dense NumPy arrays from the assignments once and
+computes every metric as array operations.
 """
 from dataclasses import dataclass
 from statistics import pstdev
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from rota.models.person import Person
 from rota.models.rules import SHIFTS
 from rota.models.schedule import Schedule
 from rota.solver.edo import EDOPlan
 from rota.solver.pairs import PairSchedule
-from rota.solver.staffing import JOURS
+from rota.solver.staffing import staffing_days
 from rota.utils.logging_setup import get_logger
 
 logger = get_logger("rota.solver.validation")
@@ -95,217 +100,358 @@ class FairnessMetrics:
             self.eve_std_by_cohort = {}
 
 
+# Shift axis of the validation tensor (staffing checks use these four)
+VALIDATION_SHIFTS = ("D", "N", "S", "A")
+
+# Weekday position in the 7-day rolling-48h timeline (as in check_rolling_48h)
+_ROLLING_DAY_MAP = {
+    "Lun": 0, "Mar": 1, "Mer": 2, "Jeu": 3, "Ven": 4,
+    "Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4,
+}
+
+
+@dataclass
+class _ScheduleArrays:
+    """Dense views of a schedule's assignments, built in one pass."""
+    names: List[str]             # people first, then unknown names in order of appearance
+    codes: List[str]             # shift code per shift index
+    tensor: np.ndarray           # int8 [person, day, shift]: appearances
+    last: np.ndarray             # int8 [person, week, day]: shift index of last assignment, -1 = off
+    slot_rows: np.ndarray        # int16 [week, day, shift]: assignment rows per slot
+    incomplete: np.ndarray       # int16 [week, day, shift]: rows with person_a but no person_b
+    totals: np.ndarray           # int32 [person]: rows a person appears in (whole schedule)
+    rolling_hours: np.ndarray    # int32 [person, weeks * 7]: hours on the Mon-Sun timeline
+
+
+def _build_arrays(
+    schedule: PairSchedule,
+    people: List[Person],
+    days: List[str],
+) -> _ScheduleArrays:
+    """Index every assignment once and scatter it into the validation arrays."""
+    weeks = schedule.weeks
+    num_days = len(days)
+    day_pos = {d: i for i, d in enumerate(days)}
+    name_idx = {p.name: i for i, p in enumerate(people)}
+    names = [p.name for p in people]
+    codes = list(VALIDATION_SHIFTS)
+    code_idx = {c: i for i, c in enumerate(codes)}
+
+    def person(name) -> int:
+        if not name:
+            return -1
+        if name not in name_idx:
+            name_idx[name] = len(names)
+            names.append(name)
+        return name_idx[name]
+
+    def shift(code) -> int:
+        if code not in code_idx:
+            code_idx[code] = len(codes)
+            codes.append(code)
+        return code_idx[code]
+
+    n = len(schedule.assignments)
+    week = np.empty(n, dtype=np.int64)
+    day = np.empty(n, dtype=np.int64)
+    rday = np.empty(n, dtype=np.int64)
+    sh = np.empty(n, dtype=np.int64)
+    pa = np.empty(n, dtype=np.int64)
+    pb = np.empty(n, dtype=np.int64)
+    for i, a in enumerate(schedule.assignments):
+        week[i] = a.week
+        day[i] = day_pos.get(a.day, -1)
+        rday[i] = _ROLLING_DAY_MAP.get(a.day, -1)
+        sh[i] = shift(a.shift)
+        pa[i] = person(a.person_a)
+        pb[i] = person(a.person_b)
+
+    num_people = len(names)
+    hours_lut = np.array(
+        [SHIFTS[getattr(c, "value", c)].hours if getattr(c, "value", c) in SHIFTS else 0 for c in codes],
+        dtype=np.int32,
+    )
+
+    # Appearances: (row, person) for person_a then person_b, in write order
+    app_row = np.concatenate([np.arange(n), np.arange(n)])
+    app_order = np.concatenate([2 * np.arange(n), 2 * np.arange(n) + 1])
+    app_person = np.concatenate([pa, pb])
+    keep = app_person >= 0
+    app_row, app_order, app_person = app_row[keep], app_order[keep], app_person[keep]
+    app_week, app_day, app_shift = week[app_row], day[app_row], sh[app_row]
+
+    in_horizon = (app_week >= 1) & (app_week <= weeks) & (app_day >= 0)
+    p_in = app_person[in_horizon]
+    g_in = (app_week[in_horizon] - 1) * num_days + app_day[in_horizon]
+    s_in = app_shift[in_horizon]
+
+    tensor = np.zeros((num_people, weeks * num_days, len(codes)), dtype=np.int8)
+    np.add.at(tensor, (p_in, g_in, s_in), 1)
+
+    # Last write wins, as with a {(name, week, day): shift} dict
+    last_order = np.full((num_people, weeks * num_days), -1, dtype=np.int64)
+    np.maximum.at(last_order, (p_in, g_in), app_order[in_horizon])
+    shift_by_order = np.full(2 * n, -1, dtype=np.int64)
+    shift_by_order[app_order] = app_shift
+    last = np.where(last_order >= 0, shift_by_order[last_order], -1).astype(np.int8)
+    last = last.reshape(num_people, weeks, num_days)
+
+    row_ok = (week >= 1) & (week <= weeks) & (day >= 0)
+    slot_rows = np.zeros((weeks, num_days, len(codes)), dtype=np.int16)
+    np.add.at(slot_rows, (week[row_ok] - 1, day[row_ok], sh[row_ok]), 1)
+    incomplete = np.zeros_like(slot_rows)
+    half = row_ok & (pa >= 0) & (pb < 0)
+    np.add.at(incomplete, (week[half] - 1, day[half], sh[half]), 1)
+
+    # Rows per person over the whole schedule (a row naming someone twice counts once)
+    totals = np.zeros(num_people, dtype=np.int32)
+    np.add.at(totals, pa[pa >= 0], 1)
+    second = (pb >= 0) & (pb != pa)
+    np.add.at(totals, pb[second], 1)
+
+    # Rolling 48h timeline: Mon-Fri hours, Sat/Sun = 0, duplicates summed
+    r_ok = (app_week >= 1) & (app_week <= weeks) & (rday[app_row] >= 0)
+    rolling_hours = np.zeros((num_people, weeks * 7), dtype=np.int32)
+    np.add.at(
+        rolling_hours,
+        (app_person[r_ok], (app_week[r_ok] - 1) * 7 + rday[app_row][r_ok]),
+        hours_lut[app_shift[r_ok]],
+    )
+
+    return _ScheduleArrays(
+        names=names,
+        codes=codes,
+        tensor=tensor,
+        last=last,
+        slot_rows=slot_rows,
+        incomplete=incomplete,
+        totals=totals,
+        rolling_hours=rolling_hours,
+    )
+
+
+def _rolling_48h_errors(arrays: _ScheduleArrays) -> List[str]:
+    """Vectorized check_rolling_48h: 7-day window sums via cumulative sums."""
+    hours = arrays.rolling_hours
+    if hours.shape[1] < 7:
+        return []
+    csum = np.concatenate([np.zeros((hours.shape[0], 1), dtype=np.int64), np.cumsum(hours, axis=1)], axis=1)
+    windows = csum[:, 7:] - csum[:, :-7]
+
+    errors = []
+    for p, i in np.argwhere(windows > 48):
+        total = int(windows[p, i])
+        start_day, start_week = i % 7, (i // 7) + 1
+        end_day, end_week = (i + 6) % 7, ((i + 6) // 7) + 1
+        errors.append(
+            f"{arrays.names[p]}: {total}h sur 7j glissants "
+            f"(S{start_week}J{start_day+1} -> S{end_week}J{end_day+1})"
+        )
+    return errors
+
+
 def validate_schedule(
     schedule: PairSchedule,
     people: List[Person],
     edo_plan: EDOPlan,
     staffing: Dict,  # From derive_staffing
-    days: List[str] = JOURS,
+    days: Optional[List[str]] = None,
 ) -> ValidationResult:
     """
     Validate a schedule and count violations.
     
+    Metrics and violations are computed on a dense [person, day, shift]
+    tensor instead of repeated assignment scans.
+    
     Args:
         schedule: The schedule to validate
         people: List of Person objects
         edo_plan: EDO allocation plan
         staffing: Staffing requirements from derive_staffing
-        days: Days of the week
+        days: Days of the week (defaults to the days staffing covers)
         
     Returns:
         ValidationResult with all metrics
     """
+    days = days or staffing_days(staffing)
     weeks = schedule.weeks
-    name_to_person = {p.name: p for p in people}
-    names = [p.name for p in people]
-    
+    num_days = len(days)
+    num_people = len(people)
+    arrays = _build_arrays(schedule, people, days)
+    codes = arrays.codes
+    d_idx, n_idx, s_idx = codes.index("D"), codes.index("N"), codes.index("S")
     result = ValidationResult()
-    
-    # Build lookup for who works when
-    works_on = {}  # {(name, week, day): shift}
-    for a in schedule.assignments:
-        if a.person_a:
-            works_on[(a.person_a, a.week, a.day)] = a.shift
-        if a.person_b:
-            works_on[(a.person_b, a.week, a.day)] = a.shift
-    
-    # 1. Check for unfilled slots
+
+    # 1. Unfilled slots (rows per slot vs staffing) and incomplete pairs
+    n_checked = len(VALIDATION_SHIFTS)
+    expected = np.zeros((weeks, num_days, n_checked), dtype=np.int32)
+    staffed = np.zeros(weeks, dtype=bool)
     for w in range(1, weeks + 1):
         ws = staffing.get(w)
         if not ws:
             continue
-        for d in days:
-            # Check PAIR shifts (D, N) - each slot needs 2 people
-            for s in ["D", "N"]:
-                expected = ws.slots[d].get(s, 0)
-                actual = sum(1 for a in schedule.assignments 
-                            if a.week == w and a.day == d and a.shift == s)
-                if actual < expected:
-                    missing = expected - actual
-                    result.slots_vides += missing
-                    result.add_violation(Violation(
-                        type="unfilled_slot",
-                        severity="critical",
-                        week=w, day=d, shift=s,
-                        message=f"Semaine {w} {d}: {missing} créneaux {s} non remplis",
-                        count=missing
-                    ))
-                    
-                # Check pairs are complete (both slots filled)
-                for a in schedule.assignments:
-                    if a.week == w and a.day == d and a.shift == s:
-                        if a.person_a and not a.person_b:  # Has person_a but missing person_b
-                            result.slots_vides += 1
-                            result.add_violation(Violation(
-                                type="incomplete_pair",
-                                severity="critical",
-                                week=w, day=d, shift=s,
-                                message=f"Semaine {w} {d} {s}: paire incomplète"
-                            ))
-            
-            # Check SOLO shifts (S, A) - each slot needs 1 person
-            for s in ["S", "A"]:
-                expected = ws.slots[d].get(s, 0)
-                actual = sum(1 for a in schedule.assignments 
-                            if a.week == w and a.day == d and a.shift == s)
-                if actual < expected:
-                    missing = expected - actual
-                    result.slots_vides += missing
-                    result.add_violation(Violation(
-                        type="unfilled_slot",
-                        severity="critical",
-                        week=w, day=d, shift=s,
-                        message=f"Semaine {w} {d}: {missing} créneaux {s} non remplis",
-                        count=missing
-                    ))
-    
-    # 2. Check for duplicates (same person twice on same day)
-    for w in range(1, weeks + 1):
-        for d in days:
-            day_people = []
-            for a in schedule.get_day_assignments(w, d):
-                if a.person_a:
-                    day_people.append(a.person_a)
-                if a.person_b:
-                    day_people.append(a.person_b)
-            
-            # Count duplicates
-            seen = set()
-            for name in day_people:
-                if name in seen:
-                    result.doublons_jour += 1
-                    result.add_violation(Violation(
-                        type="duplicate",
-                        severity="critical",
-                        week=w, day=d, person=name,
-                        message=f"Semaine {w} {d}: {name} assigné 2 fois"
-                    ))
-                seen.add(name)
-    
+        staffed[w - 1] = True
+        for di, d in enumerate(days):
+            slots = ws.slots[d]
+            for si, s in enumerate(VALIDATION_SHIFTS):
+                expected[w - 1, di, si] = slots.get(s, 0)
+
+    missing = np.clip(expected - arrays.slot_rows[:, :, :n_checked], 0, None)
+    missing[~staffed] = 0
+    incomplete = np.zeros_like(missing)
+    incomplete[:, :, :2] = arrays.incomplete[:, :, :2]  # pairs only (D, N)
+    incomplete[~staffed] = 0
+    result.slots_vides += int(missing.sum() + incomplete.sum())
+
+    for wi, di, si in np.argwhere((missing > 0) | (incomplete > 0)):
+        w, d, s = int(wi) + 1, days[di], VALIDATION_SHIFTS[si]
+        miss = int(missing[wi, di, si])
+        if miss:
+            result.add_violation(Violation(
+                type="unfilled_slot",
+                severity="critical",
+                week=w, day=d, shift=s,
+                message=f"Semaine {w} {d}: {miss} créneaux {s} non remplis",
+                count=miss
+            ))
+        for _ in range(int(incomplete[wi, di, si])):
+            result.add_violation(Violation(
+                type="incomplete_pair",
+                severity="critical",
+                week=w, day=d, shift=s,
+                message=f"Semaine {w} {d} {s}: paire incomplète"
+            ))
+
+    # 2. Duplicates (same person more than once on a day)
+    extra = np.clip(arrays.tensor.sum(axis=2, dtype=np.int32) - 1, 0, None)
+    result.doublons_jour = int(extra.sum())
+    for g, p in np.argwhere(extra.T > 0):
+        w, d, name = int(g) // num_days + 1, days[g % num_days], arrays.names[p]
+        for _ in range(int(extra[p, g])):
+            result.add_violation(Violation(
+                type="duplicate",
+                severity="critical",
+                week=w, day=d, person=name,
+                message=f"Semaine {w} {d}: {name} assigné 2 fois"
+            ))
+
+    last = arrays.last[:num_people]
+    worked = last >= 0
+
     # 3. Night followed by work next day
-    for name in names:
-        for w in range(1, weeks + 1):
-            for i, d in enumerate(days[:-1]):
-                next_d = days[i + 1]
-                if works_on.get((name, w, d)) == "N" and (name, w, next_d) in works_on:
-                    result.nuit_suivie_travail += 1
-                    result.add_violation(Violation(
-                        type="night_followed_work",
-                        severity="warning",
-                        week=w, day=d, person=name,
-                        message=f"Semaine {w}: {name} travaille après nuit {d}"
-                    ))
-    
+    night_then_work = (last[:, :, :-1] == n_idx) & worked[:, :, 1:]
+    result.nuit_suivie_travail = int(night_then_work.sum())
+    for p, wi, i in np.argwhere(night_then_work):
+        w, name = int(wi) + 1, arrays.names[p]
+        result.add_violation(Violation(
+            type="night_followed_work",
+            severity="warning",
+            week=w, day=days[i], person=name,
+            message=f"Semaine {w}: {name} travaille après nuit {days[i]}"
+        ))
+
     # 4. Soir followed by Jour shift (clopening)
-    for name in names:
-        for w in range(1, weeks + 1):
-            for i, d in enumerate(days[:-1]):
-                next_d = days[i + 1]
-                if works_on.get((name, w, d)) == "S" and works_on.get((name, w, next_d)) == "D":
-                    result.soir_vers_jour += 1
-                    result.add_violation(Violation(
-                        type="clopening",
-                        severity="warning",
-                        week=w, day=d, person=name,
-                        message=f"Semaine {w}: {name} Soir→Jour {d}→{next_d}"
-                    ))
-    
-    # 5. 48h/week validation - check each person's weekly hours
-    # from rota.solver.staffing import SHIFT_HOURS
-    hours_exceeded = 0
-    for name in names:
-        for w in range(1, weeks + 1):
-            week_hours = 0
-            for d in days:
-                shift = works_on.get((name, w, d))
-                if shift and shift in SHIFTS:
-                    week_hours += SHIFTS[shift].hours
-            
-            if week_hours > 48:
-                hours_exceeded += 1
-                result.add_violation(Violation(
-                    type="48h_exceeded",
-                    severity="warning",
-                    week=w, day="", person=name,
-                    message=f"Semaine {w}: {name} travaille {week_hours}h (>48h)"
-                ))
+    clopening = (last[:, :, :-1] == s_idx) & (last[:, :, 1:] == d_idx)
+    result.soir_vers_jour = int(clopening.sum())
+    for p, wi, i in np.argwhere(clopening):
+        w, name = int(wi) + 1, arrays.names[p]
+        result.add_violation(Violation(
+            type="clopening",
+            severity="warning",
+            week=w, day=days[i], person=name,
+            message=f"Semaine {w}: {name} Soir→Jour {days[i]}→{days[i + 1]}"
+        ))
+
+    # 5. 48h/week on the (last) shift per day
+    hours_lut = np.array([SHIFTS[c].hours if c in SHIFTS else 0 for c in codes] + [0], dtype=np.int32)
+    week_hours = hours_lut[last].sum(axis=2)  # -1 (off) maps to the trailing 0
+    for p, wi in np.argwhere(week_hours > 48):
+        w, name = int(wi) + 1, arrays.names[p]
+        result.add_violation(Violation(
+            type="48h_exceeded",
+            severity="warning",
+            week=w, day="", person=name,
+            message=f"Semaine {w}: {name} travaille {int(week_hours[p, wi])}h (>48h)"
+        ))
 
     # 5b. Strict 48h rolling window
-    rolling_errors = check_rolling_48h(schedule)
-    for err in rolling_errors:
-        # Parse basic info from error string to create Violation
-        # "Name: Totalh ..."
+    for err in _rolling_48h_errors(arrays):
         parts = err.split(":")
         p_name = parts[0] if len(parts) > 0 else ""
         result.add_violation(Violation(
             type="48h_rolling",
-            severity="critical", # Strict violation
+            severity="critical",
             week=0, day="", person=p_name,
             message=err
         ))
         result.rolling_48h_violations += 1
 
-        # We assume this contributes to some metric, maybe ecarts?
-        # For now just adding violation is good for UI.
+    # 6. Weekly and horizon workday deviations
+    workdays = np.array([p.workdays_per_week for p in people], dtype=np.int32)
+    edo = np.array(
+        [[p.name in edo_plan.plan.get(w, set()) for w in range(1, weeks + 1)] for p in people],
+        dtype=np.int32,
+    ).reshape(num_people, weeks)
+    weekly_target = workdays[:, None] - edo
+    result.ecarts_hebdo_jours = int((worked.sum(axis=2) != weekly_target).sum())
+
+    horizon_target = weekly_target.sum(axis=1)
+    result.ecarts_horizon_personnes = int((arrays.totals[:num_people] != horizon_target).sum())
 
-    
-    # 6. Weekly workday deviations
-    for name in names:
-        person = name_to_person[name]
-        for w in range(1, weeks + 1):
-            # Target for this week
-            has_edo = name in edo_plan.plan.get(w, set())
-            target = person.workdays_per_week - (1 if has_edo else 0)
-            
-            # Actual
-            actual = sum(1 for d in days if (name, w, d) in works_on)
-            
-            if actual != target:
-                result.ecarts_hebdo_jours += 1
-    
-    # 6. Horizon total deviations
-    for name in names:
-        person = name_to_person[name]
-        
-        # Total target over horizon
-        total_target = sum(
-            person.workdays_per_week - (1 if name in edo_plan.plan.get(w, set()) else 0)
-            for w in range(1, weeks + 1)
-        )
-        
-        # Actual total
-        actual_total = sum(1 for a in schedule.assignments 
-                          if a.person_a == name or a.person_b == name)
-        
-        if actual_total != total_target:
-            result.ecarts_horizon_personnes += 1
-    
     logger.info(f"Validation: slots_vides={result.slots_vides}, doublons={result.doublons_jour}, "
                 f"nuit2work={result.nuit_suivie_travail}, soir2jour={result.soir_vers_jour}")
-    
+
     return result
 
 
+# Calendar position of every day, weekend included
+_CALENDAR_DAY_MAP = {**_ROLLING_DAY_MAP, "Sam": 5, "Dim": 6, "Sat": 5, "Sun": 6}
+
+
+def calendar_violations(schedule: PairSchedule) -> Dict[str, int]:
+    """
+    Rest and hours rules checked on the real Mon-Sun calendar.
+
+    validate_schedule follows the weekday specification (the weekend breaks
+    the night-rest chain and counts 0h). This check applies the rules across
+    the weekday/weekend boundary, e.g. to compare a weekday schedule merged
+    with a WeekendSolver result against an integrated 7-day schedule.
+
+    Returns:
+        Dict with night_to_work (night followed by any shift on the next
+        calendar day, Fri->Sat and Sun->Mon included), double_shift (two
+        shifts on one day) and rolling_48h (person-windows of 7 days over 48h)
+    """
+    names: Dict[str, int] = {}
+    horizon = schedule.weeks * 7
+    rows = []
+    for a in schedule.assignments:
+        pos = _CALENDAR_DAY_MAP.get(a.day)
+        if pos is None or not 1 <= a.week <= schedule.weeks:
+            continue
+        for name in {a.person_a, a.person_b} - {""}:
+            rows.append((names.setdefault(name, len(names)), (a.week - 1) * 7 + pos, a.shift))
+
+    hours = np.zeros((len(names), horizon), dtype=np.int32)
+    shifts = np.zeros((len(names), horizon), dtype=np.int32)
+    nights = np.zeros((len(names), horizon), dtype=bool)
+    for p, t, shift in rows:
+        hours[p, t] += SHIFTS[shift].hours if shift in SHIFTS else 0
+        shifts[p, t] += 1
+        nights[p, t] |= shift == "N"
+
+    rolling = 0
+    if horizon >= 7:
+        csum = np.concatenate([np.zeros((len(names), 1), dtype=np.int64), np.cumsum(hours, axis=1)], axis=1)
+        rolling = int((csum[:, 7:] - csum[:, :-7] > 48).sum())
+
+    return {
+        "night_to_work": int((nights[:, :-1] & (shifts[:, 1:] > 0)).sum()),
+        "double_shift": int((shifts > 1).sum()),
+        "rolling_48h": rolling,
+    }
+
+
 def calculate_fairness(
     schedule: PairSchedule,
     people: List[Person],
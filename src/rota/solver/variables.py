@@ -0,0 +1,167 @@
+"""
+Dense Variable Store
+====================
+Array-indexed storage for the Person-Shift decision variables of the CP-SAT model.
+
+Variables are addressed by integer indices instead of nested name-keyed dicts:
+- person_idx: position in the people list
+- global_day_idx: position in the flat (week, day) timeline of the horizon
+- shift_idx: position in SHIFT_CODES
+
+Handles live in flat lists laid out as ((p * num_days) + g) * num_shifts + s, so
+per-person and per-slot series are plain list slices.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple, Union
+
+from ortools.sat.python import cp_model
+
+from rota.models.person import Person
+
+# Shifts modelled by the weekday solver, in index order
+SHIFT_CODES: Tuple[str, ...] = ("D", "N", "S")
+SHIFT_INDEX: Dict[str, int] = {s: i for i, s in enumerate(SHIFT_CODES)}
+
+D_IDX = SHIFT_INDEX["D"]
+N_IDX = SHIFT_INDEX["N"]
+S_IDX = SHIFT_INDEX["S"]
+
+
+@dataclass
+class StoreLayout:
+    """Picklable description of a store: enough to re-attach it to a loaded model."""
+    people: List[Person]
+    week_numbers: List[int]
+    days: List[str]
+    assign_indices: List[int]
+    works_indices: List[int]
+
+
+class VariableStore:
+    """
+    Flat store of assign/works BoolVars for one model.
+
+    Usage:
+        store = VariableStore(model, people, weeks=4, days=JOURS)
+        x = store.x(p_idx, store.day_index(2, "Mar"), N_IDX)
+        nights = store.person_shift(p_idx, N_IDX)  # one var per day
+    """
+
+    def __init__(
+        self,
+        model: cp_model.CpModel,
+        people: List[Person],
+        weeks: Union[int, Sequence[int]],
+        days: Sequence[str],
+    ):
+        self._init_index(model, people, weeks, days)
+        self.assign: List[cp_model.IntVar] = []
+        self.works: List[cp_model.IntVar] = []
+        self._create_variables()
+
+    def _init_index(self, model, people, weeks, days):
+        """Set up name/week/day lookup tables."""
+        self.model = model
+        self.people = list(people)
+        self.names = [p.name for p in self.people]
+        self.person_index = {n: i for i, n in enumerate(self.names)}
+
+        # Weeks may be a count (1..weeks) or an explicit list of week numbers
+        if isinstance(weeks, int):
+            self.week_numbers = list(range(1, weeks + 1))
+        else:
+            self.week_numbers = list(weeks)
+        self.week_pos = {w: i for i, w in enumerate(self.week_numbers)}
+
+        self.days = list(days)
+        self.day_pos = {d: i for i, d in enumerate(self.days)}
+        self.days_per_week = len(self.days)
+
+        self.num_people = len(self.names)
+        self.num_days = len(self.week_numbers) * self.days_per_week
+        self.num_shifts = len(SHIFT_CODES)
+
+    def _create_variables(self):
+        """Create assign[p, g, s] and works[p, g] in flat index order."""
+        new_bool = self.model.NewBoolVar
+        assign = self.assign
+        works = self.works
+        labels = [(w, d) for w in self.week_numbers for d in self.days]
+
+        for p in self.names:
+            for w, d in labels:
+                for s in SHIFT_CODES:
+                    assign.append(new_bool(f"assign_{p}_{w}_{d}_{s}"))
+
+        for p in self.names:
+            for w, d in labels:
+                works.append(new_bool(f"works_{p}_{w}_{d}"))
+
+    @classmethod
+    def from_layout(cls, model: cp_model.CpModel, layout: StoreLayout) -> "VariableStore":
+        """Re-attach a store to a model rebuilt from a serialized proto."""
+        store = cls.__new__(cls)
+        store._init_index(model, layout.people, layout.week_numbers, layout.days)
+        store.assign = [model.GetBoolVarFromProtoIndex(i) for i in layout.assign_indices]
+        store.works = [model.GetBoolVarFromProtoIndex(i) for i in layout.works_indices]
+        return store
+
+    def layout(self) -> StoreLayout:
+        """Describe this store so it can be re-attached in another process."""
+        return StoreLayout(
+            people=self.people,
+            week_numbers=self.week_numbers,
+            days=self.days,
+            assign_indices=[v.Index() for v in self.assign],
+            works_indices=[v.Index() for v in self.works],
+        )
+
+    # ========== Index helpers ==========
+
+    def day_index(self, week: int, day: str) -> int:
+        """Global day index of (week, day) in the horizon."""
+        return self.week_pos[week] * self.days_per_week + self.day_pos[day]
+
+    def day_label(self, g: int) -> Tuple[int, str]:
+        """(week, day) label of a global day index."""
+        return self.week_numbers[g // self.days_per_week], self.days[g % self.days_per_week]
+
+    def week_days(self, week: int) -> range:
+        """Global day indices covering one week."""
+        start = self.week_pos[week] * self.days_per_week
+        return range(start, start + self.days_per_week)
+
+    # ========== Variable access ==========
+
+    def x(self, p: int, g: int, s: int) -> cp_model.IntVar:
+        """assign var: person p works shift s on global day g."""
+        return self.assign[(p * self.num_days + g) * self.num_shifts + s]
+
+    def works_on(self, p: int, g: int) -> cp_model.IntVar:
+        """works var: person p works any shift on global day g."""
+        return self.works[p * self.num_days + g]
+
+    def day_shifts(self, p: int, g: int) -> List[cp_model.IntVar]:
+        """All shift vars of person p on global day g."""
+        start = (p * self.num_days + g) * self.num_shifts
+        return self.assign[start:start + self.num_shifts]
+
+    def person_shift(self, p: int, s: int) -> List[cp_model.IntVar]:
+        """Shift s vars of person p, one per global day."""
+        start = p * self.num_days * self.num_shifts + s
+        stop = (p + 1) * self.num_days * self.num_shifts
+        return self.assign[start:stop:self.num_shifts]
+
+    def person_all(self, p: int) -> List[cp_model.IntVar]:
+        """Every assign var of person p over the horizon."""
+        span = self.num_days * self.num_shifts
+        return self.assign[p * span:(p + 1) * span]
+
+    def person_works(self, p: int) -> List[cp_model.IntVar]:
+        """works vars of person p, one per global day."""
+        return self.works[p * self.num_days:(p + 1) * self.num_days]
+
+    def slot(self, g: int, s: int) -> List[cp_model.IntVar]:
+        """Shift s vars of every person on global day g."""
+        step = self.num_days * self.num_shifts
+        return self.assign[g * self.num_shifts + s::step]
@@ -1,14 +1,21 @@
 """Weekend solver module using CP-SAT."""
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
 from ortools.sat.python import cp_model
 
 from rota.models.person import Person
+from rota.solver.pairs import ObjectiveTracker, PairAssignment, PairSchedule
 
 logger = logging.getLogger(__name__)
 
+WEEKEND_DAYS = ["Sam", "Dim"]  # French: Samedi, Dimanche
+WEEKEND_SHIFTS = ["D", "N"]
+WEEKEND_SHIFT_HOURS = 12
+
 
 @dataclass
 class WeekendConfig:
@@ -16,6 +23,10 @@ class WeekendConfig:
     num_weeks: int
     staff_per_shift: int = 2  # 2 for Day, 2 for Night
     time_limit_seconds: int = 30
+    num_workers: int = 0  # CP-SAT workers (0 = solver default, all cores)
+    random_seed: Optional[int] = None  # CP-SAT random_seed (None = solver default)
+    relative_gap_limit: float = 0.0  # Stop once (objective - bound) / objective <= limit (0 = prove optimality)
+    hint: Optional["WeekendResult"] = None  # Previous weekend plan used as a CP-SAT solution hint
     max_weekends_per_month: int = 2  # Default max weekends per month (UI option)
     
     # Weights
@@ -39,24 +50,107 @@ class WeekendAssignment:
     @property
     def hours(self) -> int:
         """Return shift hours (12h each)."""
-        return 12
+        return WEEKEND_SHIFT_HOURS
 
 
 @dataclass
 class WeekendResult:
-    """Result of weekend solver."""
+    """
+    Result of weekend solver.
+
+    Assignments are indexed once, at construction, into a dense boolean
+    grid[person, week - 1, day, shift] (axes ordered as names, WEEKEND_DAYS,
+    WEEKEND_SHIFTS) with per-person and per-week aggregates, so lookups do
+    not scan the assignment list. The index is derived from assignments:
+    build a new result rather than editing assignments in place.
+    """
     assignments: List[WeekendAssignment]
     status: str
     solve_time: float
     message: str = ""
-    
+    names: List[str] = field(default_factory=list)  # Person axis order (eligible people)
+    num_weeks: int = 0  # Week axis length (at least the last assigned week)
+    objective: Optional[float] = None  # CP-SAT objective of the returned plan
+    best_bound: Optional[float] = None  # CP-SAT best objective bound at the end of the search
+    first_solution_seconds: Optional[float] = None  # Time from Solve() to the first solution
+
+    grid: np.ndarray = field(init=False, repr=False, compare=False)
+    person_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+    hours: np.ndarray = field(init=False, repr=False, compare=False)  # [person, week]
+    person_shift_counts: np.ndarray = field(init=False, repr=False, compare=False)  # [person, shift]
+    week_slot_counts: np.ndarray = field(init=False, repr=False, compare=False)  # [week, day, shift]
+
+    def __post_init__(self):
+        self.names = list(self.names)
+        self.person_index = {name: i for i, name in enumerate(self.names)}
+        for a in self.assignments:
+            if a.person.name not in self.person_index:
+                self.person_index[a.person.name] = len(self.names)
+                self.names.append(a.person.name)
+        self.num_weeks = max([self.num_weeks] + [a.week for a in self.assignments])
+
+        self.grid = np.zeros((len(self.names), self.num_weeks, len(WEEKEND_DAYS), len(WEEKEND_SHIFTS)), dtype=bool)
+        if self.assignments:
+            rows = np.array([
+                (self.person_index[a.person.name], a.week - 1, WEEKEND_DAYS.index(a.day), WEEKEND_SHIFTS.index(a.shift))
+                for a in self.assignments
+            ])
+            self.grid[rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3]] = True
+
+        self.hours = self.grid.sum(axis=(2, 3)) * WEEKEND_SHIFT_HOURS
+        self.person_shift_counts = self.grid.sum(axis=(1, 2))
+        self.week_slot_counts = self.grid.sum(axis=0)
+
+    def _in_horizon(self, week: int) -> bool:
+        return 1 <= week <= self.num_weeks
+
+    def works(self, person_name: str, week: int, day: str, shift: str) -> bool:
+        """True if the person works the (week, day, shift) slot."""
+        p = self.person_index.get(person_name)
+        if p is None or not self._in_horizon(week):
+            return False
+        return bool(self.grid[p, week - 1, WEEKEND_DAYS.index(day), WEEKEND_SHIFTS.index(shift)])
+
     def get_person_hours(self, person_name: str, week: int) -> int:
         """Get total hours worked by a person in a specific weekend."""
-        return sum(
-            a.hours for a in self.assignments 
-            if a.person.name == person_name and a.week == week
-        )
-    
+        p = self.person_index.get(person_name)
+        if p is None or not self._in_horizon(week):
+            return 0
+        return int(self.hours[p, week - 1])
+
+    def get_person_total_hours(self, person_name: str) -> int:
+        """Total weekend hours of a person over the horizon."""
+        p = self.person_index.get(person_name)
+        return int(self.hours[p].sum()) if p is not None else 0
+
+    def get_person_shift_counts(self, person_name: str) -> Dict[str, int]:
+        """Shift code -> number of weekend shifts worked by a person."""
+        p = self.person_index.get(person_name)
+        if p is None:
+            return {s: 0 for s in WEEKEND_SHIFTS}
+        return {s: int(n) for s, n in zip(WEEKEND_SHIFTS, self.person_shift_counts[p])}
+
+    def get_weekends_worked(self, person_name: str) -> List[int]:
+        """Weeks in which a person works at least one weekend shift."""
+        p = self.person_index.get(person_name)
+        if p is None:
+            return []
+        return [int(w) + 1 for w in np.flatnonzero(self.hours[p])]
+
+    def get_slot_people(self, week: int, day: str, shift: str) -> List[str]:
+        """Names working one (week, day, shift) slot, in person-axis order."""
+        if not self._in_horizon(week):
+            return []
+        column = self.grid[:, week - 1, WEEKEND_DAYS.index(day), WEEKEND_SHIFTS.index(shift)]
+        return [self.names[p] for p in np.flatnonzero(column)]
+
+    def get_slot_count(self, week: int, day: str, shift: Optional[str] = None) -> int:
+        """Number of people on a (week, day) slot, one shift or both."""
+        if not self._in_horizon(week):
+            return 0
+        counts = self.week_slot_counts[week - 1, WEEKEND_DAYS.index(day)]
+        return int(counts.sum() if shift is None else counts[WEEKEND_SHIFTS.index(shift)])
+
     def get_person_shift_type(self, person_name: str, week: int) -> str:
         """Return shift type: '24h', '12h', or 'OFF'."""
         hours = self.get_person_hours(person_name, week)
@@ -68,17 +162,38 @@ class WeekendResult:
 
 
 class WeekendSolver:
-    """Solver for weekend schedules (Sat/Sun)."""
+    """
+    Solver for weekend schedules (Sat/Sun).
+
+    Boundary inputs from the weekday schedule (both keyed by weekend week):
+    - friday_night_workers: people on the Friday night, kept off Saturday
+    - monday_workers: people working the following Monday, kept off Sunday night
 
-    def __init__(self, config: WeekendConfig, people: List[Person], friday_night_workers: Dict[int, List[str]] = None):
+    With previous and free_weeks, only the weekends in free_weeks are
+    re-solved; every other weekend keeps previous's assignments.
+    """
+
+    def __init__(
+        self,
+        config: WeekendConfig,
+        people: List[Person],
+        friday_night_workers: Dict[int, List[str]] = None,
+        monday_workers: Optional[Dict[int, List[str]]] = None,
+        previous: Optional["WeekendResult"] = None,
+        free_weeks: Optional[Set[int]] = None,
+    ):
         self.config = config
         self.people = [p for p in people if p.available_weekends]
         self.all_people = people  # Keep reference to all
         self.friday_night_workers = friday_night_workers or {}
+        self.monday_workers = monday_workers or {}
+        self.previous = previous
+        self.free_weeks = free_weeks
+        self.person_index = {p.name: i for i, p in enumerate(self.people)}
         self.model = cp_model.CpModel()
         self.vars = {}  # (person_id, week, day, shift) -> BoolVar
-        self.days = ["Sam", "Dim"]  # French: Samedi, Dimanche
-        self.shifts = ["D", "N"]
+        self.days = WEEKEND_DAYS
+        self.shifts = WEEKEND_SHIFTS
         self.consecutive_penalties = [] # Store consecutive penalties to add to objective later
         self.total_deficits = [] # Store deficit variables
 
@@ -93,26 +208,47 @@ class WeekendSolver:
         self._add_coverage_constraints()
         self._add_workload_constraints()
         self._add_consistency_constraints()
+        self._fix_kept_weeks()
         self._add_fairness_objective()
+        self._add_hint()
 
         solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = self.config.time_limit_seconds
         solver.parameters.log_search_progress = False
+        if self.config.num_workers > 0:
+            solver.parameters.num_search_workers = self.config.num_workers
+        if self.config.random_seed is not None:
+            solver.parameters.random_seed = self.config.random_seed
+        if self.config.relative_gap_limit > 0:
+            solver.parameters.relative_gap_limit = self.config.relative_gap_limit
         
-        status_val = solver.Solve(self.model)
+        tracker = ObjectiveTracker(time.time())
+        status_val = solver.Solve(self.model, tracker)
         status_str = solver.StatusName(status_val)
         
         assignments = []
+        objective = best_bound = None
         if status_str in ("OPTIMAL", "FEASIBLE"):
             assignments = self._extract_solution(solver)
+            objective = solver.ObjectiveValue()
+            best_bound = solver.BestObjectiveBound()
+        first_solution = tracker.improvements[0][0] if tracker.improvements else None
             
-        logger.info(f"WeekendSolver: status={status_str}, assignments={len(assignments)}")
+        logger.info(
+            f"WeekendSolver: status={status_str}, assignments={len(assignments)}, "
+            f"objective={objective}, bound={best_bound}"
+        )
             
         return WeekendResult(
             assignments=assignments,
             status=status_str,
             solve_time=solver.WallTime(),
-            message=f"{len(assignments)} affectations pour {len(self.people)} personnes éligibles"
+            message=f"{len(assignments)} affectations pour {len(self.people)} personnes éligibles",
+            names=list(self.person_index),
+            num_weeks=self.config.num_weeks,
+            objective=objective,
+            best_bound=best_bound,
+            first_solution_seconds=first_solution,
         )
 
     def _create_variables(self):
@@ -269,15 +405,20 @@ class WeekendSolver:
 
     def _add_consistency_constraints(self):
         """Add constraints linking to week schedule and internal consistency."""
-        # 1. Fri Night -> Sat Day forbidden
+        # 1. Fri Night -> no work on Saturday (rest after night)
         for w, workers in self.friday_night_workers.items():
             if w > self.config.num_weeks: continue
             for name in workers:
-                p = next((p for p in self.people if p.name == name), None)
-                if p:
-                    # Forbid Sat Day
-                    if (p.name, w, "Sam", "D") in self.vars:
-                         self.model.Add(self.vars[(p.name, w, "Sam", "D")] == 0)
+                if name in self.person_index:
+                    for s in self.shifts:
+                        if (name, w, "Sam", s) in self.vars:
+                            self.model.Add(self.vars[(name, w, "Sam", s)] == 0)
+
+        # 1b. Sun Night -> Monday worked: forbid Sun Night
+        for w, workers in self.monday_workers.items():
+            for name in workers:
+                if (name, w, "Dim", "N") in self.vars:
+                    self.model.Add(self.vars[(name, w, "Dim", "N")] == 0)
         
         # 2. No consecutive nights (Sat N + Sun N)
         if self.config.forbid_consecutive_nights:
@@ -289,6 +430,50 @@ class WeekendSolver:
                         # Cannot work both nights
                         self.model.Add(sat_n + sun_n <= 1)
 
+    def _add_hint(self):
+        """Hint every variable with the previous plan (config.hint), 0 where it has no value."""
+        hint = self.config.hint
+        if hint is None:
+            return
+        for key, var in self.vars.items():
+            self.model.AddHint(var, 1 if hint.works(*key) else 0)
+
+    def _fix_kept_weeks(self):
+        """Pin the weekends outside free_weeks to previous's assignments."""
+        if self.previous is None or self.free_weeks is None:
+            return
+        for key, var in self.vars.items():
+            if key[1] not in self.free_weeks:
+                self.model.Add(var == (1 if self.previous.works(*key) else 0))
+
+
+def merge_weekend_result(schedule: PairSchedule, result: WeekendResult) -> PairSchedule:
+    """
+    Weekday schedule plus a WeekendSolver result as one 7-day PairSchedule.
+
+    Weekend workers of each (week, day, shift) are paired in solver order;
+    status, score and stats are those of the weekday schedule.
+    """
+    slots: Dict[Tuple[int, str, str], List[str]] = {}
+    for a in result.assignments:
+        slots.setdefault((a.week, a.day, a.shift), []).append(a.person.name)
+
+    weekend = []
+    for (week, day, shift), names in sorted(slots.items()):
+        for slot_idx, i in enumerate(range(0, len(names), 2)):
+            pair = names[i:i + 2] + [""]
+            weekend.append(PairAssignment(week, day, shift, slot_idx, pair[0], pair[1]))
+
+    return PairSchedule(
+        assignments=list(schedule.assignments) + weekend,
+        weeks=schedule.weeks,
+        people_count=schedule.people_count,
+        status=schedule.status,
+        score=schedule.score,
+        solve_time_seconds=schedule.solve_time_seconds + result.solve_time,
+        stats=dict(schedule.stats),
+    )
+
 
 @dataclass
 class WeekendValidation:
@@ -299,15 +484,12 @@ def validate_weekend_schedule(result: WeekendResult, people: List[Person], weeks
     if result.status not in ["OPTIMAL", "FEASIBLE"]:
         return WeekendValidation([], [])
         
-    shifts_per_person = {p.name: [] for p in people}
-    for a in result.assignments:
-        shifts_per_person[a.person.name].append(a.week)
+    weeks_per_person = {p.name: result.get_weekends_worked(p.name) for p in people}
         
-    unused = [name for name, shifts in shifts_per_person.items() if not shifts]
+    unused = [name for name, weeks_worked in weeks_per_person.items() if not weeks_worked]
     
     consecutive = []
-    for name, shifts in shifts_per_person.items():
-        weeks_worked = sorted(list(set(shifts)))
+    for name, weeks_worked in weeks_per_person.items():
         # Check for sequence of 3
         for i in range(len(weeks_worked) - 2):
             if weeks_worked[i+1] == weeks_worked[i] + 1 and weeks_worked[i+2] == weeks_worked[i] + 2:
@@ -0,0 +1,235 @@
+"""
+Weekend Pipeline
+================
+Concurrent weekday and weekend solves, reconciled by a boundary repair pass.
+
+The two-pass pipeline (solve_pairs on Mon-Fri, then WeekendSolver) runs the
+solves back to back. Neither depends on the other's result except at the
+weekday/weekend boundary, so the weekend solve can start as soon as the team
+is loaded, on its own share of the cores:
+
+    future = start_weekend_solve(people, weekend_config)
+    schedule = solve_pairs(people, config, staffing, edo_plan)
+    weekend = repair_weekends(schedule, future.result(), people, weekend_config)
+
+The boundary is then checked against the weekday schedule:
+- Friday night worker on the Saturday
+- Sunday night worker on the following Monday
+
+Only the weekends with a conflict are re-solved (WeekendSolver with
+free_weeks), every other weekend is kept as is. End-to-end latency is about
+max(weekday, weekend) plus a short repair.
+"""
+import dataclasses
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver.edo import EDOPlan
+from rota.solver.pairs import PairSchedule, solve_pairs
+from rota.solver.staffing import WeekStaffing
+from rota.solver.weekend import WeekendConfig, WeekendResult, WeekendSolver
+from rota.utils.logging_setup import SolverLogger, get_logger
+
+logger = get_logger("rota.solver.weekend_pipeline")
+slog = SolverLogger("rota.solver.weekend_pipeline")
+
+# Upper bound on the repair solve, whatever weekend_config.time_limit_seconds says
+REPAIR_TIME_LIMIT = 5
+
+# Share of the cores given to the weekend solve (the smaller model)
+WEEKEND_CORE_SHARE = 0.25
+
+
+def split_workers(total_cores: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Split the cores between the weekday and the weekend solve.
+
+    Returns:
+        (weekday_workers, weekend_workers), each at least 1
+    """
+    total = total_cores or os.cpu_count() or 1
+    weekend = max(1, int(total * WEEKEND_CORE_SHARE))
+    return max(1, total - weekend), weekend
+
+
+def start_weekend_solve(
+    people: List[Person],
+    weekend_config: WeekendConfig,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> Future:
+    """
+    Start WeekendSolver in a background thread.
+
+    CP-SAT releases the GIL while solving, so the weekday solve can run in
+    the calling thread at the same time.
+
+    Args:
+        people: List of Person objects
+        weekend_config: Weekend solver configuration (num_workers caps its cores)
+        executor: Executor to submit to (a one-shot thread if omitted)
+
+    Returns:
+        Future resolving to the WeekendResult
+    """
+    if executor is not None:
+        return executor.submit(WeekendSolver(weekend_config, people).solve)
+    own = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weekend-solve")
+    future = own.submit(WeekendSolver(weekend_config, people).solve)
+    own.shutdown(wait=False)
+    return future
+
+
+def boundary_workers(schedule: PairSchedule) -> Tuple[Dict[int, List[str]], Dict[int, List[str]]]:
+    """
+    Weekday workers next to each weekend.
+
+    Returns:
+        (friday_night_workers, monday_workers), both keyed by the weekend's
+        week: Friday night of week w, Monday of week w + 1
+    """
+    fridays: Dict[int, Set[str]] = {}
+    mondays: Dict[int, Set[str]] = {}
+    for a in schedule.assignments:
+        names = {a.person_a, a.person_b} - {""}
+        if a.day == "Ven" and a.shift == "N":
+            fridays.setdefault(a.week, set()).update(names)
+        elif a.day == "Lun" and a.week > 1:
+            mondays.setdefault(a.week - 1, set()).update(names)
+    return (
+        {w: sorted(names) for w, names in fridays.items()},
+        {w: sorted(names) for w, names in mondays.items()},
+    )
+
+
+def boundary_conflicts(schedule: PairSchedule, result: WeekendResult) -> Dict[int, Set[str]]:
+    """
+    People breaking the night rest across the weekday/weekend boundary.
+
+    Args:
+        schedule: Weekday schedule
+        result: Weekend schedule solved without the weekday boundary
+
+    Returns:
+        Weekend week -> names with a Fri N -> Saturday or Sun N -> Monday conflict
+    """
+    fridays, mondays = boundary_workers(schedule)
+    conflicts: Dict[int, Set[str]] = {}
+    for a in result.assignments:
+        name = a.person.name
+        if a.day == "Sam" and name in fridays.get(a.week, []):
+            conflicts.setdefault(a.week, set()).add(name)
+        elif a.day == "Dim" and a.shift == "N" and name in mondays.get(a.week, []):
+            conflicts.setdefault(a.week, set()).add(name)
+    return conflicts
+
+
+def repair_weekends(
+    schedule: PairSchedule,
+    result: WeekendResult,
+    people: List[Person],
+    weekend_config: WeekendConfig,
+) -> WeekendResult:
+    """
+    Re-solve the weekends that conflict with the weekday schedule.
+
+    The other weekends are fixed to result's assignments, so the repair model
+    only has the conflicting weeks free.
+
+    Args:
+        schedule: Weekday schedule
+        result: Weekend schedule to repair
+        people: List of Person objects
+        weekend_config: Weekend solver configuration (time limit capped at
+            REPAIR_TIME_LIMIT)
+
+    Returns:
+        Repaired WeekendResult (result itself if nothing conflicts or the
+        repair finds no solution); solve_time includes the repair
+    """
+    if result.status not in ("OPTIMAL", "FEASIBLE"):
+        return result
+    conflicts = boundary_conflicts(schedule, result)
+    if not conflicts:
+        return result
+
+    start_time = time.time()
+    slog.step(
+        f"Weekend repair: {sum(len(n) for n in conflicts.values())} boundary conflicts "
+        f"in weeks {', '.join(str(w) for w in sorted(conflicts))}"
+    )
+    fridays, mondays = boundary_workers(schedule)
+    repair_config = dataclasses.replace(
+        weekend_config,
+        time_limit_seconds=min(weekend_config.time_limit_seconds, REPAIR_TIME_LIMIT),
+        hint=result,
+    )
+    repaired = WeekendSolver(
+        repair_config,
+        people,
+        friday_night_workers=fridays,
+        monday_workers=mondays,
+        previous=result,
+        free_weeks=set(conflicts),
+    ).solve()
+
+    if repaired.status not in ("OPTIMAL", "FEASIBLE"):
+        logger.warning(f"Weekend repair {repaired.status}, keeping the unrepaired weekends")
+        return result
+    repaired.solve_time = result.solve_time + (time.time() - start_time)
+    repaired.message = f"{len(conflicts)} week-end(s) réparé(s) à la jonction semaine/week-end."
+    return repaired
+
+
+def solve_week_and_weekend(
+    people: List[Person],
+    config: SolverConfig,
+    staffing: Dict[int, WeekStaffing],
+    edo_plan: EDOPlan,
+    weekend_config: Optional[WeekendConfig] = None,
+) -> Tuple[PairSchedule, WeekendResult]:
+    """
+    Solve weekdays and weekends concurrently, then repair the boundary.
+
+    The cores are split with split_workers: weekend_config.num_workers <= 0
+    gets the weekend share, and config gets the weekday share unless it
+    already sets parallel_portfolio with workers_per_solve > 0.
+
+    Args:
+        people: List of Person objects
+        config: Weekday solver configuration
+        staffing: Weekday slot requirements
+        edo_plan: EDO allocation plan
+        weekend_config: Weekend solver configuration (derived from config if omitted)
+
+    Returns:
+        (weekday schedule, repaired weekend result)
+    """
+    weekend_config = weekend_config or WeekendConfig(
+        num_weeks=config.weeks, time_limit_seconds=config.time_limit_seconds
+    )
+    weekday_workers, weekend_workers = split_workers()
+    if weekend_config.num_workers <= 0:
+        weekend_config = dataclasses.replace(weekend_config, num_workers=weekend_workers)
+    if not (config.parallel_portfolio and config.workers_per_solve > 0):
+        config = dataclasses.replace(config, parallel_portfolio=True, workers_per_solve=weekday_workers)
+
+    slog.phase(
+        f"Weekday + Weekend Solve ({config.workers_per_solve} + {weekend_config.num_workers} workers)"
+    )
+    start_time = time.time()
+    future = start_weekend_solve(people, weekend_config)
+    schedule = solve_pairs(people, config, staffing, edo_plan)
+    weekend = future.result()
+    joined = time.time() - start_time
+
+    if schedule.status in ["optimal", "feasible"]:
+        weekend = repair_weekends(schedule, weekend, people, weekend_config)
+    logger.info(
+        f"Weekday + weekend: {schedule.status}/{weekend.status.lower()}, "
+        f"solves {joined:.2f}s, total {time.time() - start_time:.2f}s"
+    )
+    return schedule, weekend
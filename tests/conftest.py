@@ -29,6 +29,14 @@ def default_config():
     return SolverConfig(weeks=2, time_limit_seconds=30)
 
 
+@pytest.fixture
+def team():
+    """Mixed 18-person team: 14 four-day P people (even ones EDO-eligible), 4 three-day Q people."""
+    people = [Person(name=f"P{i}", workdays_per_week=4, edo_eligible=i % 2 == 0) for i in range(14)]
+    people += [Person(name=f"Q{i}", workdays_per_week=3) for i in range(4)]
+    return people
+
+
 @pytest.fixture
 def team_dummy_path():
     """Path to the test data file."""
@@ -0,0 +1,77 @@
+"""Tests for the columnar schedule format."""
+import json
+
+import pytest
+
+from rota.solver.columnar import ScheduleColumns, decode_columns, decode_schedule, encode_schedule
+from rota.solver.pairs import PairAssignment, PairSchedule
+
+
+def _schedule():
+    return PairSchedule(
+        assignments=[
+            PairAssignment(1, "Lun", "D", 0, "Alice", "Bob"),
+            PairAssignment(1, "Lun", "S", 0, "Charlie", ""),
+            PairAssignment(2, "Mar", "N", 1, "Bob", "Élodie"),
+            PairAssignment(2, "Sam", "X", 0, "Alice", "Alice"),
+        ],
+        weeks=2,
+        people_count=4,
+        status="optimal",
+        score=12.5,
+        solve_time_seconds=3.0,
+        stats={"best_seed": 7, "study_hash": "abc123", "improvements": [[0.1, 10.0, 5.0]]},
+    )
+
+
+class TestColumnarCodec:
+    """Round trips through the binary encoding."""
+    
+    def test_round_trip(self):
+        schedule = _schedule()
+        loaded = decode_schedule(encode_schedule(schedule))
+        
+        assert loaded.assignments == schedule.assignments
+        assert (loaded.weeks, loaded.people_count, loaded.status) == (2, 4, "optimal")
+        assert loaded.score == 12.5
+        assert loaded.stats == {"best_seed": 7, "study_hash": "abc123"}
+    
+    def test_empty_schedule(self):
+        schedule = PairSchedule(assignments=[], weeks=1, people_count=0, status="infeasible")
+        assert decode_schedule(encode_schedule(schedule)).assignments == ()
+    
+    def test_smaller_than_json(self):
+        assignments = [
+            PairAssignment(w, d, "D", 0, f"Person{w % 7}", f"Person{(w + 3) % 7}")
+            for w in range(1, 53) for d in ["Lun", "Mar", "Mer", "Jeu", "Ven"]
+        ]
+        schedule = PairSchedule(assignments=assignments, weeks=52, people_count=7, status="feasible")
+        as_json = json.dumps([
+            {"week": a.week, "day": a.day, "shift": a.shift, "slot_idx": a.slot_idx,
+             "person_a": a.person_a, "person_b": a.person_b}
+            for a in assignments
+        ])
+        assert len(encode_schedule(schedule)) * 5 < len(as_json)
+    
+    def test_rejects_foreign_data(self):
+        with pytest.raises(ValueError):
+            decode_schedule(b'{"assignments": []}')
+
+
+class TestScheduleColumns:
+    """Array view of the assignments."""
+    
+    def test_shift_count_matrix_matches_count_shifts(self):
+        schedule = _schedule()
+        _, columns = decode_columns(encode_schedule(schedule))
+        matrix = columns.shift_count_matrix()
+        
+        for p, name in enumerate(columns.names):
+            for s, shift in enumerate(columns.shifts):
+                assert matrix[p, s] == schedule.count_shifts(name, shift)
+    
+    def test_codes(self):
+        columns = ScheduleColumns.from_assignments(_schedule().assignments)
+        assert columns.names == ["Alice", "Bob", "Charlie", "Élodie"]
+        assert columns.shifts[:4] == ["D", "N", "S", "A"]
+        assert columns.person_b.tolist() == [1, -1, 3, 0]
@@ -0,0 +1,72 @@
+"""Tests for the incremental delta solve."""
+from dataclasses import replace
+
+import pytest
+
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver.delta import delta_solve, find_edited_people
+from rota.solver.edo import build_edo_plan
+from rota.solver.pairs import solve_pairs
+from rota.solver.staffing import derive_staffing
+
+
+@pytest.fixture
+def config():
+    return SolverConfig(weeks=2, time_limit_seconds=10)
+
+
+@pytest.fixture
+def previous(team, config):
+    edo_plan = build_edo_plan(team, config.weeks)
+    staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+    return solve_pairs(team, config, staffing, edo_plan)
+
+
+class TestEditedPeople:
+    """Which people a team edit frees."""
+
+    def test_changed_fields_and_newcomers(self, team):
+        edited = list(team)
+        edited[1] = replace(team[1], no_evening=True)
+        edited[2] = replace(team[2], available_weekends=False)  # weekend-only field
+        edited.append(Person(name="New", workdays_per_week=4))
+
+        assert find_edited_people(team, edited, weeks=2) == {"P1", "New"}
+
+    def test_edo_reshuffle_marks_moved_people(self, team):
+        edited = list(team)
+        edited[1] = replace(team[1], edo_eligible=True)
+
+        moved = find_edited_people(team, edited, weeks=2)
+        assert "P1" in moved
+        assert len(moved) > 1
+
+
+class TestDeltaSolve:
+    """Re-solving only the part of the plan an edit touches."""
+
+    def test_no_evening_edit(self, team, config, previous):
+        name = next(a.person_a for a in previous.assignments if a.shift == "S")
+        edited = [replace(p, no_evening=True) if p.name == name else p for p in team]
+
+        schedule = delta_solve(previous, team, edited, config)
+
+        assert schedule.status == "feasible"
+        assert schedule.stats["delta_edited"] == [name]
+        assert not schedule.stats["delta_fallback"]
+        assert schedule.count_shifts(name, "S") == 0
+        assert schedule.stats["delta_free_days"] < 2 * 5
+
+    def test_untouched_days_kept(self, team, config, previous):
+        name = next(a.person_a for a in previous.assignments if a.shift == "S")
+        edited = [replace(p, no_evening=True) if p.name == name else p for p in team]
+
+        schedule = delta_solve(previous, team, edited, config, neighbourhood_days=0)
+
+        before = previous.get_person_day_matrix()
+        after = schedule.get_person_day_matrix()
+        evenings = {(w, d) for (n, w, d), s in before.items() if n == name and s == "S"}
+        for (n, w, d), shift in before.items():
+            if n != name and (w, d) not in evenings:
+                assert after.get((n, w, d)) == shift
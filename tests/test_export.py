@@ -7,7 +7,14 @@ from rota.models.person import Person
 from rota.solver.pairs import PairAssignment, PairSchedule
 from rota.solver.edo import EDOPlan
 from rota.solver.validation import FairnessMetrics, ValidationResult
-from rota.io.pair_export import export_pairs_to_csv, export_pairs_to_excel
+from rota.io.pair_export import (
+    export_merged_calendar,
+    export_pairs_to_csv,
+    export_pairs_to_excel,
+    export_weekend_to_excel,
+)
+from rota.io.pair_export_stream import export_merged_calendar_streaming, export_pairs_to_excel_streaming
+from rota.solver.weekend import WeekendAssignment, WeekendResult
 
 
 @pytest.fixture
@@ -131,3 +138,135 @@ class TestExcelExport:
         )
         
         assert len(buffer.getvalue()) > 0
+
+
+class TestWeekendExcelExport:
+    """Test weekend Excel export."""
+
+    def test_weekend_cells(self, mock_people):
+        """Each S{w}_{day} cell lists the shifts of that weekend day."""
+        from openpyxl import load_workbook
+
+        for p in mock_people:
+            p.available_weekends = True
+        alice, bob = mock_people[0], mock_people[1]
+        result = WeekendResult(
+            assignments=[
+                WeekendAssignment(alice, 1, "Sam", "D"),
+                WeekendAssignment(alice, 1, "Sam", "N"),
+                WeekendAssignment(bob, 2, "Dim", "N"),
+            ],
+            status="OPTIMAL",
+            solve_time=0.1,
+        )
+
+        buffer = io.BytesIO()
+        export_weekend_to_excel(result, mock_people, buffer, num_weeks=2)
+        buffer.seek(0)
+        ws = load_workbook(buffer).active
+
+        headers = [c.value for c in ws[1]]
+        rows = {row[0]: dict(zip(headers, row)) for row in ws.iter_rows(min_row=2, values_only=True)}
+        assert rows["Alice"]["S1_Sam"] == "D+N"
+        assert rows["Alice"]["Total"] == 2
+        assert rows["Alice"]["24h"] == 1
+        assert rows["Bob"]["S2_Dim"] == "N"
+        assert rows["Eve"]["Total"] == 0
+
+
+class TestStreamingMergedExport:
+    """The write-only merged export matches the in-memory one."""
+
+    @pytest.fixture
+    def weekend_result(self, mock_people):
+        alice, bob, charlie = mock_people[:3]
+        return WeekendResult(
+            assignments=[
+                WeekendAssignment(alice, 1, "Sam", "D"),
+                WeekendAssignment(alice, 1, "Sam", "N"),
+                WeekendAssignment(bob, 1, "Dim", "N"),
+                WeekendAssignment(charlie, 1, "Dim", "N"),
+            ],
+            status="OPTIMAL",
+            solve_time=0.1,
+        )
+
+    def _export(self, exporter, mock_schedule, weekend_result, mock_people, mock_edo_plan):
+        from openpyxl import load_workbook
+
+        validation = ValidationResult()
+        fairness = FairnessMetrics(night_std=0.5, eve_std=0.3)
+        buffer = io.BytesIO()
+        exporter(
+            mock_schedule, weekend_result, mock_people, mock_edo_plan, buffer,
+            validation=validation, fairness=fairness, config={"seed": 7},
+        )
+        buffer.seek(0)
+        return load_workbook(buffer)
+
+    def test_same_sheets_and_values(self, mock_schedule, weekend_result, mock_people, mock_edo_plan):
+        expected = self._export(export_merged_calendar, mock_schedule, weekend_result, mock_people, mock_edo_plan)
+        streamed = self._export(export_merged_calendar_streaming, mock_schedule, weekend_result, mock_people, mock_edo_plan)
+
+        assert streamed.sheetnames == expected.sheetnames
+        for name in expected.sheetnames:
+            values = lambda ws: [[c.value for c in row] for row in ws.iter_rows()]
+            assert values(streamed[name]) == values(expected[name]), name
+            assert set(map(str, streamed[name].merged_cells.ranges)) == set(map(str, expected[name].merged_cells.ranges))
+
+    def test_calendar_cells_use_shared_named_styles(self, mock_schedule, weekend_result, mock_people, mock_edo_plan):
+        wb = self._export(export_merged_calendar_streaming, mock_schedule, weekend_result, mock_people, mock_edo_plan)
+        ws = wb["Vue Manager"]
+
+        # Alice: Lun D (weekday day), Sam D+N (24h); week start column has the double border
+        assert ws["B3"].value == "D" and ws["B3"].style == "rota_cal_week_day"
+        assert ws["G3"].value == "D+N" and ws["G3"].style == "rota_cal_24h"
+        assert ws["G3"].fill.fgColor.rgb.endswith("FFCCAA")
+        assert len(wb.named_styles) < 40
+
+
+class TestStreamingPairsExport:
+    """The write-only weekday export matches the in-memory one."""
+
+    def _export(self, exporter, mock_schedule, mock_people, mock_edo_plan):
+        from openpyxl import load_workbook
+        from rota.solver.staffing import derive_staffing
+        from rota.solver.validation import validate_schedule
+
+        staffing = derive_staffing(mock_people, mock_schedule.weeks, mock_edo_plan.plan)
+        validation = validate_schedule(mock_schedule, mock_people, mock_edo_plan, staffing)
+        fairness = FairnessMetrics(night_std=0.5, eve_std=0.3, night_std_by_cohort={"4j": 0.5})
+        buffer = io.BytesIO()
+        exporter(
+            mock_schedule, mock_people, mock_edo_plan, buffer,
+            validation=validation, fairness=fairness, config={"seed": 7}, staffing=staffing,
+        )
+        buffer.seek(0)
+        return load_workbook(buffer)
+
+    def test_same_sheets_values_and_formatting(self, mock_schedule, mock_people, mock_edo_plan):
+        expected = self._export(export_pairs_to_excel, mock_schedule, mock_people, mock_edo_plan)
+        streamed = self._export(export_pairs_to_excel_streaming, mock_schedule, mock_people, mock_edo_plan)
+
+        assert streamed.sheetnames == expected.sheetnames
+        assert "Gaps" in streamed.sheetnames and "Violations" in streamed.sheetnames
+        cell = lambda c: (
+            c.value, c.font.b, c.fill.fgColor.rgb if c.fill.fill_type else None,
+            c.border.left.style if c.border.left else None,
+            c.border.right.style if c.border.right else None,
+        )
+        for name in expected.sheetnames:
+            rows = lambda ws: [[cell(c) for c in row] for row in ws.iter_rows()]
+            assert rows(streamed[name]) == rows(expected[name]), name
+            assert streamed[name].freeze_panes == expected[name].freeze_panes
+            assert set(map(str, streamed[name].merged_cells.ranges)) == set(map(str, expected[name].merged_cells.ranges))
+
+    def test_matrix_cells_use_shared_named_styles(self, mock_schedule, mock_people, mock_edo_plan):
+        wb = self._export(export_pairs_to_excel_streaming, mock_schedule, mock_people, mock_edo_plan)
+        ws = wb["Matrice"]
+
+        # Alice works Lun D (first day of the week: double left border)
+        assert ws["A3"].value == "Alice"
+        assert ws["B3"].value == "J" and ws["B3"].style == "rota_mx_first_j"
+        assert ws["C3"].style == "rota_mx_mid_j"
+
@@ -0,0 +1,56 @@
+"""Tests for the LNS improvement phase."""
+import time
+
+import pytest
+
+from rota.models.constraints import SolverConfig
+from rota.solver.edo import build_edo_plan
+from rota.solver.lns import improve_with_lns
+from rota.solver.optimizer import optimize
+from rota.solver.pairs import solve_pairs
+from rota.solver.staffing import derive_staffing
+
+
+@pytest.fixture
+def problem(team):
+    config = SolverConfig(weeks=2, time_limit_seconds=1)
+    edo_plan = build_edo_plan(team, config.weeks)
+    staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+    return config, staffing, edo_plan
+
+
+class TestImproveWithLns:
+    """Neighbourhood re-solves starting from a solved schedule."""
+
+    def test_score_never_worsens(self, team, problem):
+        config, staffing, edo_plan = problem
+        schedule = solve_pairs(team, config, staffing, edo_plan)
+
+        start = time.time()
+        improved = improve_with_lns(
+            schedule, team, config, staffing, edo_plan,
+            time_budget=3, iteration_seconds=0.5,
+        )
+        elapsed = time.time() - start
+
+        assert improved.status in ["optimal", "feasible"]
+        assert improved.score <= improved.stats["lns_initial_score"]
+        assert improved.stats["lns_iterations"] == len(improved.stats["lns_log"]) >= 1
+        assert {e["neighbourhood"].split()[0] for e in improved.stats["lns_log"]} <= {"week", "cohort", "nights"}
+        # Budget covers the subproblem solves; model building adds a little on top
+        assert elapsed < 3 + 5
+
+    def test_unsolved_schedule_is_returned_unchanged(self, team, problem):
+        config, staffing, edo_plan = problem
+        schedule = solve_pairs([], config, staffing, edo_plan)
+
+        assert improve_with_lns(schedule, team, config, staffing, edo_plan, time_budget=1) is schedule
+
+
+def test_optimize_runs_lns_phase(team):
+    config = SolverConfig(weeks=2, time_limit_seconds=1, lns_time_seconds=2, lns_iteration_seconds=0.5)
+
+    schedule, _, score = optimize(team, config, tries=1, seed=3)
+
+    assert "lns_log" in schedule.stats
+    assert score == schedule.score <= schedule.stats["lns_initial_score"]
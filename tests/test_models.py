@@ -203,3 +203,11 @@ class TestSolverConfig:
         cfg2 = SolverConfig.from_dict(d)
         assert cfg2.weeks == 8
         assert cfg2.fairness_mode == FairnessMode.GLOBAL
+    
+    def test_objective_weights_serialized_only_when_set(self):
+        """Default configs keep the study hash they had before objective_weights."""
+        assert "objective_weights" not in SolverConfig().to_dict()
+        
+        d = SolverConfig(objective_weights={"clopening": 7}).to_dict()
+        assert d["objective_weights"] == {"clopening": 7}
+        assert SolverConfig.from_dict(d).objective_weights == {"clopening": 7}
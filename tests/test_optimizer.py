@@ -3,7 +3,8 @@ import pytest
 
 from rota.models.constraints import SolverConfig
 from rota.models.person import Person
-from rota.solver.optimizer import optimize, solve_with_validation
+from rota.solver.optimizer import _parallel_config, _stop_reason, _try_config, optimize, solve_with_validation
+from rota.solver.pairs import PairSchedule
 
 
 class TestOptimize:
@@ -40,6 +41,20 @@ class TestOptimize:
         assert best_seed >= 100
         assert best_score < float("inf")
     
+    def test_tries_ranked_by_model_objective(self, team):
+        """The best score is the objective CP-SAT minimized, not a re-weighted score."""
+        from rota.solver.constraints.objectives import schedule_objective
+        from rota.solver.edo import build_edo_plan
+        from rota.solver.staffing import derive_staffing
+        
+        config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=30)
+        schedule, _, best_score = optimize(team, config, tries=2, seed=5)
+        
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        schedule.status = "feasible"  # force re-computation from the assignments
+        assert schedule_objective(schedule, team, config, staffing, edo_plan) == best_score
+    
     def test_stats_recorded(self, team):
         """Test optimization stats are recorded."""
         config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=30)
@@ -49,6 +64,103 @@ class TestOptimize:
         assert "best_seed" in schedule.stats
         assert "tries" in schedule.stats
         assert schedule.stats["tries"] == 2
+    
+    def test_model_built_once(self, team):
+        """Multi-try portfolio builds the model once and varies only solver parameters."""
+        config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=30)
+        
+        schedule, _, best_score = optimize(team, config, tries=2, seed=1)
+        
+        assert schedule.stats["model_builds"] == 1
+        assert best_score < float("inf")
+    
+    def test_rebuild_per_try(self, team):
+        """reuse_model=False keeps the per-seed rebuild path."""
+        config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=30)
+        
+        schedule, _, _ = optimize(team, config, tries=2, seed=1, reuse_model=False)
+        
+        assert schedule.stats["model_builds"] == 2
+    
+    def test_seed_and_profile_reach_solver(self, team):
+        """Each try carries its own CP-SAT seed and search profile."""
+        config = SolverConfig(
+            weeks=1, forbid_night_to_day=False, time_limit_seconds=30,
+            portfolio_profiles=["no_lp", "pseudo_cost"],
+        )
+        
+        schedule, best_seed, _ = optimize(team, config, tries=2, seed=5)
+        
+        assert schedule.stats["random_seed"] == best_seed
+        expected = "no_lp" if best_seed == 5 else "pseudo_cost"
+        assert schedule.stats["search_profile"] == expected
+
+    
+    def test_target_score_cancels_remaining_tries(self, team):
+        """Reaching target_score cancels the outstanding tries."""
+        config = SolverConfig(
+            weeks=1, forbid_night_to_day=False, time_limit_seconds=30, target_score=1e9,
+        )
+        
+        schedule, _, best_score = optimize(team, config, tries=3, seed=1)
+        
+        assert best_score < float("inf")
+        assert schedule.stats["stop_reason"] == "target_score"
+        assert schedule.stats["tries_cancelled"] == 2
+    
+    def test_all_tries_run_without_stop_condition(self, team):
+        """Without a target and with stop_on_optimal off (the default), every try runs."""
+        config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=30)
+        
+        schedule, _, _ = optimize(team, config, tries=2, seed=1)
+        
+        assert schedule.stats["tries_cancelled"] == 0
+        assert schedule.stats["stop_reason"] is None
+    
+    def test_internal_portfolio(self, team):
+        """internal_portfolio runs one multi-worker solve and records improvements."""
+        config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=30)
+        
+        schedule, best_seed, best_score = optimize(team, config, tries=3, seed=9, strategy="internal_portfolio")
+        
+        assert schedule.status in ["optimal", "feasible"]
+        assert best_seed == 9
+        assert best_score < float("inf")
+        assert schedule.stats["strategy"] == "internal_portfolio"
+        assert schedule.stats["tries"] == 1
+        assert schedule.stats["improvements"]
+    
+    def test_unknown_strategy(self, team):
+        with pytest.raises(ValueError):
+            optimize(team, SolverConfig(weeks=1), strategy="threads")
+
+
+class TestTryConfig:
+    """Per-try seed/profile assignment."""
+    
+    def test_profiles_cycle(self):
+        config = SolverConfig(portfolio_profiles=["default", "no_lp"])
+        profiles = [_try_config(config, 10 + t, t).search_profile for t in range(3)]
+        assert profiles == ["default", "no_lp", "default"]
+        assert config.random_seed is None
+    
+    def test_single_try_keeps_profile(self):
+        config = SolverConfig(search_profile="quick_restart")
+        try_config = _try_config(config, 42)
+        assert try_config.random_seed == 42
+        assert try_config.search_profile == "quick_restart"
+    
+    def test_stop_on_optimal_is_opt_in(self):
+        schedule = PairSchedule(assignments=[], weeks=1, people_count=0, status="optimal")
+        assert _stop_reason(schedule, 10.0, SolverConfig()) is None
+        assert _stop_reason(schedule, 10.0, SolverConfig(stop_on_optimal=True)) == "optimal"
+        assert _stop_reason(schedule, 10.0, SolverConfig(target_score=10.0)) == "target_score"
+    
+    def test_parallel_config_respects_core_budget(self):
+        config = SolverConfig(parallel_portfolio=True, workers_per_solve=6)
+        try_config, concurrent = _parallel_config(config, tries=3)
+        assert concurrent == 3
+        assert try_config.workers_per_solve == 2
 
 
 class TestSolveWithValidation:
@@ -80,3 +192,72 @@ class TestSolveWithValidation:
         # May be infeasible or feasible depending on staffing
         if schedule.status == "infeasible":
             assert score == float("inf")
+
+
+class TestWarmStart:
+    """optimize_with_cache hints new studies from the nearest cached one."""
+    
+    def test_nearest_study_used_as_hint(self, tmp_path, monkeypatch):
+        from rota.solver import study_manager
+        from rota.solver.optimizer import optimize_with_cache
+        
+        monkeypatch.setattr(study_manager, "DEFAULT_DB_PATH", tmp_path / "studies.db")
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=10)
+        
+        first, _, _, first_hash = optimize_with_cache(team, config, seed=1)
+        assert first.stats["warm_start_study"] is None
+        
+        team[0] = Person(name="P0", workdays_per_week=4, max_nights=1)
+        second, _, _, second_hash = optimize_with_cache(team, config, seed=1)
+        assert second_hash != first_hash
+        assert second.stats["warm_start_study"] == first_hash
+
+
+class TestParallelCachedOptimize:
+    """optimize_with_cache runs several seeds on the process-pool engine."""
+    
+    def test_parallel_tries_persisted_and_cached(self, tmp_path, monkeypatch):
+        from rota.solver import study_manager
+        from rota.solver.optimizer import optimize_with_cache
+        
+        monkeypatch.setattr(study_manager, "DEFAULT_DB_PATH", tmp_path / "studies.db")
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(
+            weeks=1, forbid_night_to_day=False, time_limit_seconds=10, stop_on_optimal=False
+        )
+        snapshots = []
+        
+        schedule, best_seed, best_score, study_hash = optimize_with_cache(
+            team, config, tries=3, seed=7, on_solution=snapshots.append
+        )
+        assert schedule.status in ["optimal", "feasible"]
+        assert best_seed in (7, 8, 9)
+        assert snapshots
+        
+        manager = study_manager.StudyManager()
+        assert sorted(manager.get_tried_seeds(study_hash)) == [7, 8, 9]
+        assert manager.get_best_trial(study_hash).score == best_score
+        
+        # Resuming the study tries new seeds and never returns worse than the cache
+        _, _, resumed_score, _ = optimize_with_cache(team, config, tries=2, seed=7)
+        assert resumed_score <= best_score
+        assert sorted(manager.get_tried_seeds(study_hash)) == [7, 8, 9, 10, 11]
+    
+    def test_failed_trial_save_keeps_schedule(self, tmp_path, monkeypatch):
+        import sqlite3
+        from rota.solver import study_manager
+        from rota.solver.optimizer import optimize_with_cache
+        
+        def locked(self, study_hash, trials):
+            raise sqlite3.OperationalError("database is locked")
+        
+        monkeypatch.setattr(study_manager, "DEFAULT_DB_PATH", tmp_path / "studies.db")
+        monkeypatch.setattr(study_manager.StudyManager, "save_trials_batch", locked)
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=1, forbid_night_to_day=False, time_limit_seconds=10)
+        
+        schedule, _, score, _ = optimize_with_cache(team, config, seed=3)
+        assert schedule.status in ["optimal", "feasible"]
+        assert score < float("inf")
+        assert "database is locked" in schedule.stats["trial_save_error"]
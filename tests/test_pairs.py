@@ -1,4 +1,6 @@
 """Tests for pair-based solver."""
+from dataclasses import replace
+
 import pytest
 
 from rota.models.constraints import SolverConfig
@@ -205,6 +207,51 @@ class TestPairScheduleHelpers:
         assert schedule.count_shifts("Alice", "D") == 1
         assert schedule.count_shifts("Bob", "N") == 1
 
+    def test_indexes_match_linear_scan(self):
+        """Indexed lookups return what a scan of assignments would."""
+        assignments = [
+            PairAssignment(1, "Lun", "N", 0, "Alice", "Bob"),
+            PairAssignment(1, "Lun", "S", 0, "Charlie", ""),
+            PairAssignment(2, "Mar", "D", 0, "Alice", "Charlie"),
+            PairAssignment(2, "Mar", "D", 1, "Bob", "Dave"),
+        ]
+        schedule = PairSchedule(assignments=assignments, weeks=2, people_count=4, status="optimal")
+        
+        assert schedule.get_day_assignments(2, "Mar") == assignments[2:]
+        assert schedule.get_day_assignments(1, "Mar") == []
+        assert schedule.get_person_shifts("Charlie") == [assignments[1], assignments[2]]
+        assert schedule.get_shift_counts("Alice") == {"N": 1, "D": 1}
+        assert schedule.get_slot_count(2, "Mar", "D") == 2
+        assert schedule.get_slot_counts() == {(1, "Lun", "N"): 1, (1, "Lun", "S"): 1, (2, "Mar", "D"): 2}
+    
+    def test_indexes_invalidated_on_mutation(self):
+        """Assignments can only change by replacement, which refreshes the indexes."""
+        import dataclasses
+        
+        schedule = PairSchedule(
+            assignments=[PairAssignment(1, "Lun", "N", 0, "Alice", "Bob")],
+            weeks=1, people_count=3, status="optimal"
+        )
+        assert schedule.count_shifts("Alice", "N") == 1
+        
+        # Stored as a tuple of frozen assignments: no in-place edits
+        with pytest.raises(AttributeError):
+            schedule.assignments.append(PairAssignment(1, "Mar", "N", 0, "Alice", "Charlie"))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            schedule.assignments[0].person_a = "Charlie"
+        
+        schedule.assignments = schedule.assignments + (PairAssignment(1, "Mar", "N", 0, "Alice", "Charlie"),)
+        assert schedule.count_shifts("Alice", "N") == 2
+        
+        schedule.assignments = [PairAssignment(1, "Lun", "D", 0, "Bob", "Charlie")]
+        assert schedule.count_shifts("Alice", "N") == 0
+        assert len(schedule.get_day_assignments(1, "Lun")) == 1
+        
+        # Same length, different content
+        schedule.assignments = [dataclasses.replace(schedule.assignments[0], person_a="Alice")]
+        assert schedule.count_shifts("Alice", "D") == 1
+        assert schedule.count_shifts("Bob", "D") == 0
+
 
 class TestEDOConstraint:
     """Tests for EDO constraint."""
@@ -232,3 +279,221 @@ class TestEDOConstraint:
                 edo_mer_shifts = schedule.get_person_shifts("EDO_Mer")
                 wed_shifts = [s for s in edo_mer_shifts if s.day == "Mer"]
                 assert len(wed_shifts) == 0, "EDO_Mer should not work on Wednesday"
+
+
+class TestCompiledModel:
+    """Tests for build-once / solve-many support."""
+    
+    def test_compiled_roundtrip_solves(self):
+        """A model compiled to bytes and loaded back solves to a valid schedule."""
+        from rota.solver.pairs import build_pairs_model, solve_model
+        
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=1, time_limit_seconds=10, forbid_night_to_day=False)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        built = build_pairs_model(team, config, staffing, edo_plan)
+        compiled = built.compile()
+        assert isinstance(compiled.data, bytes)
+        
+        loaded = compiled.load()
+        assert loaded.store.num_people == 16
+        assert loaded.model.HasObjective()
+        
+        config.random_seed = 7
+        schedule = solve_model(loaded, config)
+        assert schedule.status in ["optimal", "feasible"]
+        assert schedule.people_count == 16
+        assert schedule.count_shifts("P0", "N") >= 0
+        assert sum(1 for a in schedule.assignments if a.shift == "N") == 5
+    
+    def test_same_model_solved_twice(self):
+        """The same built model can be re-solved with a different seed."""
+        from rota.solver.pairs import build_pairs_model, solve_model
+        
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=1, time_limit_seconds=10, forbid_night_to_day=False)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        built = build_pairs_model(team, config, staffing, edo_plan)
+        first = solve_model(built, replace(config, random_seed=1))
+        second = solve_model(built, replace(config, random_seed=2, search_profile="pseudo_cost"))
+        
+        assert first.status in ["optimal", "feasible"]
+        assert second.status in ["optimal", "feasible"]
+        assert first.stats["random_seed"] == 1
+        assert second.stats["search_profile"] == "pseudo_cost"
+
+
+class TestModelSize:
+    """Per-phase variable/constraint counts."""
+    
+    def test_phases_add_up_and_reach_stats(self):
+        from rota.solver.pairs import build_pairs_model, solve_model
+        
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=2, time_limit_seconds=10)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        built = build_pairs_model(team, config, staffing, edo_plan)
+        size = built.model_size
+        proto = built.model.Proto()
+        assert size["total"] == {"variables": len(proto.variables), "constraints": len(proto.constraints)}
+        for key in ("variables", "constraints"):
+            assert sum(size[phase][key] for phase in ("variables", "hard", "soft")) == size["total"][key]
+        
+        schedule = solve_model(built.compile().load(), config)
+        assert schedule.stats["model_size"] == size
+    
+    def test_consecutive_days_windows_enforced(self):
+        """Windows that can exceed the limit are kept (weekend padding only prunes the trivial ones)."""
+        team = [Person(name=f"P{i}", workdays_per_week=5) for i in range(14)]
+        config = SolverConfig(weeks=2, time_limit_seconds=10, max_consecutive_days=3)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        schedule = solve_pairs(team, config, staffing, edo_plan)
+        assert schedule.status in ["optimal", "feasible"]
+        
+        matrix = schedule.get_person_day_matrix()
+        for person in team:
+            for w in (1, 2):
+                run = 0
+                for d in JOURS:
+                    run = run + 1 if (person.name, w, d) in matrix else 0
+                    assert run <= 3
+
+
+class TestBuildProfile:
+    """Per-builder profile and CP-SAT response stats."""
+    
+    def test_builders_account_for_model_and_reach_stats(self):
+        from rota.solver.pairs import build_pairs_model, solve_model
+        
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=2, time_limit_seconds=10, profile=True)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        built = build_pairs_model(team, config, staffing, edo_plan)
+        entries = {e["builder"]: e for e in built.build_profile}
+        assert {"VariableStore", "add_staffing_constraints", "add_clopening_penalty"} <= set(entries)
+        for key in ("variables", "constraints"):
+            assert sum(e[key] for e in built.build_profile) == built.model_size["total"][key]
+        
+        schedule = solve_model(built.compile().load(), config)
+        assert schedule.stats["build_profile"] == built.build_profile
+        cpsat = schedule.stats["cpsat"]
+        assert cpsat["presolve_seconds"] is not None
+        assert 0 <= cpsat["first_solution_seconds"] <= cpsat["wall_time"] + 1
+        assert len(cpsat["gap_over_time"]) == len(schedule.stats["improvements"]) + 1
+        if schedule.status == "optimal":
+            assert cpsat["gap_over_time"][-1][1] == 0
+    
+    def test_search_log_only_kept_when_profiling(self):
+        from rota.solver.profiling import BuildProfile, profiled
+        
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=1, time_limit_seconds=10)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        schedule = solve_pairs(team, config, staffing, edo_plan)
+        assert "presolve_seconds" not in schedule.stats["cpsat"]
+        assert schedule.stats["build_profile"]
+        
+        # Outside a BuildProfile the decorator is a plain call
+        calls = []
+        wrapped = profiled(lambda model: calls.append(model))
+        wrapped("model")
+        assert calls == ["model"]
+        with BuildProfile() as profile:
+            pass
+        assert profile.entries == []
+
+
+class TestIntegratedWeekend:
+    """WeekendMode.INTEGRATED: one Person-Shift model over Mon-Sun."""
+    
+    @pytest.fixture
+    def problem(self):
+        from rota.models.constraints import WeekendMode
+        from rota.solver.staffing import model_days
+        
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(18)]
+        team += [Person(name=f"X{i}", workdays_per_week=4, available_weekends=False) for i in range(2)]
+        config = SolverConfig(weeks=2, time_limit_seconds=20, weekend_mode=WeekendMode.INTEGRATED)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan, days=model_days(config))
+        return team, config, staffing, edo_plan
+    
+    def test_weekends_follow_weekday_rules(self, problem):
+        from rota.solver.validation import calendar_violations
+        
+        team, config, staffing, edo_plan = problem
+        schedule = solve_pairs(team, config, staffing, edo_plan)
+        assert schedule.status in ["optimal", "feasible"]
+        
+        weekend = [a for a in schedule.assignments if a.day in ("Sam", "Dim")]
+        assert {a.shift for a in weekend} == {"D", "N"}
+        assert not any(a.person_a.startswith("X") or a.person_b.startswith("X") for a in weekend)
+        # Fri N -> Sat, Sun N -> Mon and 48h windows over the weekend all hold
+        assert calendar_violations(schedule) == {"night_to_work": 0, "double_shift": 0, "rolling_48h": 0}
+    
+    def test_weekday_mode_unchanged(self, problem):
+        team, config, _, edo_plan = problem
+        weekday_config = replace(config, weekend_mode=SolverConfig().weekend_mode)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        schedule = solve_pairs(team, weekday_config, staffing, edo_plan)
+        assert {a.day for a in schedule.assignments} <= set(JOURS)
+
+
+class TestSolutionStreaming:
+    """Intermediate PairSchedule snapshots from the solution callback."""
+    
+    def test_snapshots_emitted(self):
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=2, time_limit_seconds=10, forbid_night_to_day=False)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        
+        snapshots = []
+        schedule = solve_pairs(team, config, staffing, edo_plan, on_solution=snapshots.append)
+        
+        assert schedule.status in ["optimal", "feasible"]
+        assert snapshots
+        assert len(snapshots) == len(schedule.stats["improvements"])
+        last = snapshots[-1]
+        assert last.weeks == 2
+        assert last.assignments
+        assert last.stats["objective"] == schedule.score
+        assert last.stats["bound"] <= last.stats["objective"]
+        objectives = [s.score for s in snapshots]
+        assert objectives == sorted(objectives, reverse=True)
+
+
+class TestSolutionHint:
+    """Warm start from a previous schedule."""
+    
+    def test_hint_from_previous_schedule(self):
+        from rota.solver.pairs import apply_solution_hint, build_pairs_model, solve_model
+        
+        team = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=1, time_limit_seconds=10, forbid_night_to_day=False)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        previous = solve_pairs(team, config, staffing, edo_plan)
+        
+        # One newcomer: everyone else is hinted, the newcomer is left free
+        new_team = team[:-1] + [Person(name="New", workdays_per_week=4)]
+        built = build_pairs_model(new_team, config, staffing, edo_plan)
+        hints = apply_solution_hint(built, previous, [p.name for p in team])
+        
+        assert hints == 15 * 5 * 4
+        assert len(built.model.Proto().solution_hint.vars) == hints
+        schedule = solve_model(built, config)
+        assert schedule.status in ["optimal", "feasible"]
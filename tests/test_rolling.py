@@ -0,0 +1,67 @@
+"""Tests for the rolling-horizon solver."""
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver.edo import build_edo_plan
+from rota.solver.pairs import solve_pairs
+from rota.solver.rolling import uses_rolling_horizon
+from rota.solver.staffing import JOURS, derive_staffing
+from rota.solver.validation import validate_schedule
+
+
+def _solve(team, weeks=5, block=2, **kwargs):
+    config = SolverConfig(weeks=weeks, time_limit_seconds=10, rolling_block_weeks=block, **kwargs)
+    edo_plan = build_edo_plan(team, config.weeks)
+    staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+    return solve_pairs(team, config, staffing, edo_plan), edo_plan, staffing
+
+
+class TestRollingHorizon:
+    """Block-by-block solving with frozen context week."""
+
+    def test_enabled_only_for_long_horizons(self):
+        assert uses_rolling_horizon(SolverConfig(weeks=8, rolling_block_weeks=4))
+        assert not uses_rolling_horizon(SolverConfig(weeks=4, rolling_block_weeks=4))
+        assert not uses_rolling_horizon(SolverConfig(weeks=8))
+
+    def test_covers_full_horizon(self, team):
+        schedule, _, _ = _solve(team, weeks=5, block=2)
+
+        assert schedule.status == "feasible"
+        assert schedule.weeks == 5
+        # Overlap 1 with blocks of 2: commit one week per block, last block commits two
+        assert schedule.stats["rolling_blocks"] == 4
+        assert {a.week for a in schedule.assignments} == set(range(1, 6))
+
+    def test_cross_block_constraints_hold(self, team):
+        schedule, edo_plan, staffing = _solve(team, weeks=5, block=2, max_nights_sequence=2)
+
+        validation = validate_schedule(schedule, team, edo_plan, staffing)
+        assert validation.rolling_48h_violations == 0
+        assert validation.doublons_jour == 0
+
+        # Night sequences never exceed the limit, including across block boundaries
+        nights = {(name, a.week, a.day) for a in schedule.assignments if a.shift == "N"
+                  for name in (a.person_a, a.person_b)}
+        timeline = [(w, d) for w in range(1, 6) for d in JOURS]
+        for p in team:
+            run = 0
+            for w, d in timeline:
+                run = run + 1 if (p.name, w, d) in nights else 0
+                assert run <= 2
+
+    def test_max_nights_over_whole_horizon(self, team):
+        team[0] = Person(name="P0", workdays_per_week=4, max_nights=2)
+        schedule, _, _ = _solve(team, weeks=5, block=2)
+
+        assert schedule.count_shifts("P0", "N") <= 2
+
+    def test_block_snapshots(self, team):
+        config = SolverConfig(weeks=4, time_limit_seconds=10, rolling_block_weeks=2)
+        edo_plan = build_edo_plan(team, config.weeks)
+        staffing = derive_staffing(team, config.weeks, edo_plan.plan)
+        snapshots = []
+
+        schedule = solve_pairs(team, config, staffing, edo_plan, on_solution=snapshots.append)
+
+        assert len(snapshots) == schedule.stats["rolling_blocks"]
+        assert [s.stats["weeks_committed"] for s in snapshots] == [1, 2, 4]
@@ -1,14 +1,18 @@
 """Tests for staffing derivation."""
 import pytest
 
+from rota.models.constraints import SolverConfig, WeekendMode
 from rota.models.person import Person
 from rota.solver.staffing import (
     JOURS,
+    WEEKEND_JOURS,
     WeekStaffing,
     calculate_people_needed,
     derive_staffing,
     get_total_slots,
     get_week_slot_count,
+    model_days,
+    staffing_days,
 )
 
 
@@ -131,6 +135,18 @@ class TestStaffingHelpers:
         # Night: 10 slots × 2 people = 20
         assert people_needed["N"] == 20
 
+    
+    def test_integrated_weekend_staffing(self):
+        """Integrated mode adds Sam/Dim with one Jour and one Nuit pair."""
+        config = SolverConfig(weekend_mode=WeekendMode.INTEGRATED)
+        people = [Person(name=f"P{i}", workdays_per_week=4) for i in range(8)]
+        staffing = derive_staffing(people, weeks=1, edo_plan={}, days=model_days(config))
+        
+        assert staffing_days(staffing) == JOURS + WEEKEND_JOURS
+        assert staffing[1].slots["Sam"] == {"D": 1, "S": 0, "N": 1}
+        assert staffing[1].slots["Lun"]["D"] == 4
+        assert model_days(SolverConfig()) == JOURS
+
 
 class TestEdgeCases:
     """Tests for edge cases."""
@@ -0,0 +1,277 @@
+"""Tests for study persistence."""
+import json
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver import study_manager
+from rota.solver.pairs import PairAssignment, PairSchedule
+from rota.solver.study_manager import StudyManager, TrialRecord, TrialWriter, compute_study_hash
+
+
+def _schedule(profile=""):
+    return PairSchedule(
+        assignments=[PairAssignment(week=1, day="Lun", shift="D", slot_idx=0, person_a="A", person_b="B")],
+        weeks=1,
+        people_count=2,
+        status="feasible",
+        stats={"search_profile": profile} if profile else {},
+    )
+
+
+class TestTrialProfiles:
+    """Search profile recorded with each trial."""
+    
+    def test_profile_saved_and_summarized(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        config = SolverConfig(weeks=1)
+        people = [Person(name="A"), Person(name="B")]
+        study_hash = compute_study_hash(config, people)
+        manager.create_study(study_hash, config, people)
+        
+        manager.save_trial(study_hash, 1, 30.0, _schedule("default"), {}, {})
+        manager.save_trial(study_hash, 2, 10.0, _schedule(), {}, {}, profile="no_lp")
+        manager.save_trial(study_hash, 3, 20.0, _schedule("default"), {}, {})
+        
+        best = manager.get_best_trial(study_hash)
+        assert best.seed == 2
+        assert best.profile == "no_lp"
+        
+        summary = manager.get_profile_summary(study_hash)
+        assert [s.profile for s in summary] == ["no_lp", "default"]
+        assert summary[0].wins == 1
+        assert summary[1].trials == 2
+        assert summary[1].avg_score == 25.0
+    
+    def test_migrates_old_trials_table(self, tmp_path):
+        db_path = tmp_path / "old.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE trials (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    study_hash TEXT, seed INTEGER, score REAL,
+                    schedule_json TEXT, validation_json TEXT, fairness_json TEXT,
+                    solve_time_seconds REAL, created_at TIMESTAMP
+                )
+            """)
+        
+        StudyManager(db_path)
+        
+        with sqlite3.connect(db_path) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(trials)")}
+        assert "profile" in columns
+        assert "schedule_blob" in columns
+
+
+def _study(manager, weeks=1):
+    config = SolverConfig(weeks=weeks)
+    people = [Person(name="A"), Person(name="B")]
+    study_hash = compute_study_hash(config, people)
+    manager.create_study(study_hash, config, people)
+    return study_hash
+
+
+class TestTrialStorage:
+    """Compressed payloads, lazy loading and retention."""
+    
+    def test_payloads_round_trip(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        study_hash = _study(manager)
+        manager.save_trial(study_hash, 1, 5.0, _schedule("default"), {"score": 5.0}, {"nights": [1, 2]})
+        
+        best = manager.get_best_trial(study_hash)
+        assert best.has_schedule
+        assert manager.load_schedule_from_trial(best).assignments == _schedule().assignments
+        assert manager.load_trial_details(best) == ({"score": 5.0}, {"nights": [1, 2]})
+    
+    def test_migrates_json_payloads(self, tmp_path):
+        db_path = tmp_path / "old.db"
+        legacy = json.dumps({
+            "weeks": 1, "people_count": 2, "status": "feasible", "score": 5.0,
+            "solve_time_seconds": 1.0, "stats": {},
+            "assignments": [{"week": 1, "day": "Lun", "shift": "D", "slot_idx": 0,
+                             "person_a": "A", "person_b": "B"}],
+        })
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE trials (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    study_hash TEXT, seed INTEGER, score REAL,
+                    schedule_json TEXT, validation_json TEXT, fairness_json TEXT,
+                    solve_time_seconds REAL, created_at TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "INSERT INTO trials (study_hash, seed, score, schedule_json, validation_json) "
+                "VALUES ('h', 1, 5.0, ?, '{\"ok\": true}')",
+                (legacy,),
+            )
+        
+        manager = StudyManager(db_path)
+        
+        with sqlite3.connect(db_path) as conn:
+            row = conn.execute("SELECT schedule_json, schedule_blob FROM trials").fetchone()
+        assert row[0] is None and row[1] is not None
+        best = manager.get_best_trial("h")
+        assert manager.load_schedule_from_trial(best).assignments == _schedule().assignments
+        assert manager.load_trial_details(best) == ({"ok": True}, {})
+    
+    def test_keeps_payloads_of_best_trials_only(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db", keep_schedules=2)
+        study_hash = _study(manager)
+        for seed, score in enumerate([30.0, 10.0, 40.0, 20.0], start=1):
+            manager.save_trial(study_hash, seed, score, _schedule(), {}, {})
+        
+        with sqlite3.connect(manager.db_path) as conn:
+            kept = conn.execute(
+                "SELECT seed FROM trials WHERE schedule_blob IS NOT NULL ORDER BY seed"
+            ).fetchall()
+        assert [row[0] for row in kept] == [2, 4]
+        assert sorted(manager.get_tried_seeds(study_hash)) == [1, 2, 3, 4]
+        assert manager.get_best_trial(study_hash).seed == 2
+        
+        assert manager.prune_schedules(study_hash, keep=1) == 1
+        best = manager.get_best_trial(study_hash)
+        assert manager.load_schedule_from_trial(best).assignments == _schedule().assignments
+    
+    def test_pruned_schedule_raises(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db", keep_schedules=1)
+        study_hash = _study(manager)
+        manager.save_trial(study_hash, 1, 10.0, _schedule(), {}, {})
+        trial = manager.get_best_trial(study_hash)
+        manager.save_trial(study_hash, 2, 5.0, _schedule(), {}, {})
+        
+        with pytest.raises(LookupError):
+            manager.load_schedule_from_trial(trial)
+
+
+def _save_in_worker(manager, study_hash, seed):
+    manager.save_trial(study_hash, seed, float(seed), _schedule(), {}, {})
+    return seed
+
+
+class TestConnections:
+    """Pooled WAL connection, batched inserts and the writer thread."""
+    
+    def test_wal_mode(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        _study(manager)
+        with sqlite3.connect(manager.db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    
+    def test_save_trials_batch(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        study_hash = _study(manager)
+        manager.save_trial(study_hash, 1, 15.0, _schedule(), {}, {})
+        manager.save_trials_batch(study_hash, [
+            TrialRecord(seed, score, _schedule(), {}, {}, profile="no_lp")
+            for seed, score in [(2, 20.0), (3, 5.0), (4, 12.0)]
+        ])
+        
+        summary = manager.get_study_summary(study_hash)
+        assert summary.total_trials == 4
+        assert (summary.best_seed, summary.best_score) == (3, 5.0)
+        assert manager.get_best_trial(study_hash).profile == "no_lp"
+    
+    def test_writer_from_many_threads(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        study_hash = _study(manager)
+        
+        with TrialWriter(manager, study_hash, max_batch=4) as writer:
+            def produce(base):
+                for i in range(5):
+                    writer.submit(TrialRecord(base + i, float(base + i), _schedule(), {}, {}))
+            threads = [threading.Thread(target=produce, args=(10 * k,)) for k in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        
+        assert writer.saved == 20
+        assert manager.get_study_summary(study_hash).total_trials == 20
+        assert manager.get_best_trial(study_hash).seed == 0
+    
+    def test_writer_error_returned_not_raised(self, tmp_path, monkeypatch):
+        manager = StudyManager(tmp_path / "studies.db")
+        study_hash = _study(manager)
+        
+        def locked(study_hash, trials):
+            raise sqlite3.OperationalError("database is locked")
+        monkeypatch.setattr(manager, "save_trials_batch", locked)
+        
+        writer = TrialWriter(manager, study_hash)
+        writer.submit(TrialRecord(1, 1.0, _schedule(), {}, {}))
+        error = writer.close()
+        
+        assert isinstance(error, sqlite3.OperationalError)
+        assert writer.error is error
+        assert writer.saved == 0
+    
+    def test_manager_used_from_worker_processes(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        study_hash = _study(manager)
+        manager.save_trial(study_hash, 100, 100.0, _schedule(), {}, {})
+        
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            seeds = list(pool.map(_save_in_worker, [manager] * 4, [study_hash] * 4, range(1, 5)))
+        
+        assert seeds == [1, 2, 3, 4]
+        assert sorted(manager.get_tried_seeds(study_hash)) == [1, 2, 3, 4, 100]
+
+
+class TestNearestStudy:
+    """Nearest-study lookup used for warm starts."""
+    
+    def test_picks_highest_team_overlap(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        config = SolverConfig(weeks=2)
+        team_a = [Person(name=n) for n in "ABCD"]
+        team_b = [Person(name=n) for n in "ABXY"]
+        for team in (team_a, team_b):
+            study_hash = compute_study_hash(config, team)
+            manager.create_study(study_hash, config, team)
+            manager.save_trial(study_hash, 1, 10.0, _schedule(), {}, {})
+        
+        new_team = [Person(name=n) for n in "ABCE"]
+        study_hash, overlap = manager.find_nearest_study(new_team, weeks=2)
+        assert study_hash == compute_study_hash(config, team_a)
+        assert overlap == 3 / 5
+    
+    def test_requires_same_weeks(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        config = SolverConfig(weeks=4)
+        team = [Person(name=n) for n in "ABCD"]
+        study_hash = compute_study_hash(config, team)
+        manager.create_study(study_hash, config, team)
+        manager.save_trial(study_hash, 1, 10.0, _schedule(), {}, {})
+        
+        assert manager.find_nearest_study(team, weeks=2) is None
+        assert manager.find_nearest_study(team, weeks=4, exclude_hash=study_hash) is None
+    
+    def test_skips_studies_scored_under_an_older_objective(self, tmp_path):
+        manager = StudyManager(tmp_path / "studies.db")
+        config = SolverConfig(weeks=2)
+        team = [Person(name=n) for n in "ABCD"]
+        study_hash = compute_study_hash(config, team)
+        manager.create_study(study_hash, config, team)
+        manager.save_trial(study_hash, 1, 10.0, _schedule(), {}, {})
+        
+        legacy = config.to_dict()
+        with sqlite3.connect(manager.db_path) as conn:
+            conn.execute(
+                "UPDATE studies SET config_json = ? WHERE study_hash = ?",
+                (json.dumps(legacy), study_hash),
+            )
+        
+        assert manager.find_nearest_study(team, weeks=2) is None
+    
+    def test_objective_version_is_part_of_the_hash(self, monkeypatch):
+        config = SolverConfig(weeks=2)
+        team = [Person(name=n) for n in "ABCD"]
+        current = compute_study_hash(config, team)
+        monkeypatch.setattr(study_manager, "OBJECTIVE_VERSION", 1)
+        assert compute_study_hash(config, team) != current
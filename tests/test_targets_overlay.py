@@ -80,3 +80,16 @@ def test_solve_handles_csv_path(tmp_path, simple_team_df):
         
     result = solve(str(csv_path), cfg=LegacyConfig())
     assert not result.assignments.empty
+
+
+def test_solve_profile(simple_team_df):
+    """profile=True adds the build profile and CP-SAT stats to metrics_json."""
+    class LegacyConfig:
+        weeks = 1
+        time_limit_seconds = 5
+    
+    result = solve(simple_team_df, cfg=LegacyConfig(), profile=True)
+    profile = result.metrics_json["profile"]
+    assert profile["build"]
+    assert "presolve_seconds" in profile["cpsat"]
+    assert "profile" not in solve(simple_team_df, cfg=LegacyConfig()).metrics_json
@@ -1,15 +1,20 @@
 """Tests for validation and scoring."""
+from typing import Dict, List, Optional
+
 import pytest
 
 from rota.models.constraints import SolverConfig
 from rota.models.person import Person
-from rota.solver.edo import build_edo_plan
+from rota.models.rules import SHIFTS
+from rota.solver.edo import EDOPlan, build_edo_plan
 from rota.solver.pairs import PairAssignment, PairSchedule, solve_pairs
-from rota.solver.staffing import derive_staffing
+from rota.solver.staffing import derive_staffing, staffing_days
 from rota.solver.validation import (
     FairnessMetrics,
     ValidationResult,
+    Violation,
     calculate_fairness,
+    check_rolling_48h,
     score_solution,
     validate_schedule,
 )
@@ -156,3 +161,263 @@ class TestValidationResult:
         result = ValidationResult(doublons_jour=1)
         
         assert result.has_critical_issues
+
+
+def validate_by_scanning(
+    schedule: PairSchedule,
+    people: List[Person],
+    edo_plan: EDOPlan,
+    staffing: Dict,  # From derive_staffing
+    days: Optional[List[str]] = None,
+) -> ValidationResult:
+    """
+    Scan-based oracle for validate_schedule: one pass over the assignments
+    per check, as the original implementation did.
+    """
+    days = days or staffing_days(staffing)
+    weeks = schedule.weeks
+    name_to_person = {p.name: p for p in people}
+    names = [p.name for p in people]
+    
+    result = ValidationResult()
+    
+    # Build lookup for who works when
+    works_on = {}  # {(name, week, day): shift}
+    for a in schedule.assignments:
+        if a.person_a:
+            works_on[(a.person_a, a.week, a.day)] = a.shift
+        if a.person_b:
+            works_on[(a.person_b, a.week, a.day)] = a.shift
+    
+    # 1. Check for unfilled slots
+    for w in range(1, weeks + 1):
+        ws = staffing.get(w)
+        if not ws:
+            continue
+        for d in days:
+            # Check PAIR shifts (D, N) - each slot needs 2 people
+            for s in ["D", "N"]:
+                expected = ws.slots[d].get(s, 0)
+                actual = sum(1 for a in schedule.assignments 
+                            if a.week == w and a.day == d and a.shift == s)
+                if actual < expected:
+                    missing = expected - actual
+                    result.slots_vides += missing
+                    result.add_violation(Violation(
+                        type="unfilled_slot",
+                        severity="critical",
+                        week=w, day=d, shift=s,
+                        message=f"Semaine {w} {d}: {missing} créneaux {s} non remplis",
+                        count=missing
+                    ))
+                    
+                # Check pairs are complete (both slots filled)
+                for a in schedule.assignments:
+                    if a.week == w and a.day == d and a.shift == s:
+                        if a.person_a and not a.person_b:  # Has person_a but missing person_b
+                            result.slots_vides += 1
+                            result.add_violation(Violation(
+                                type="incomplete_pair",
+                                severity="critical",
+                                week=w, day=d, shift=s,
+                                message=f"Semaine {w} {d} {s}: paire incomplète"
+                            ))
+            
+            # Check SOLO shifts (S, A) - each slot needs 1 person
+            for s in ["S", "A"]:
+                expected = ws.slots[d].get(s, 0)
+                actual = sum(1 for a in schedule.assignments 
+                            if a.week == w and a.day == d and a.shift == s)
+                if actual < expected:
+                    missing = expected - actual
+                    result.slots_vides += missing
+                    result.add_violation(Violation(
+                        type="unfilled_slot",
+                        severity="critical",
+                        week=w, day=d, shift=s,
+                        message=f"Semaine {w} {d}: {missing} créneaux {s} non remplis",
+                        count=missing
+                    ))
+    
+    # 2. Check for duplicates (same person twice on same day)
+    for w in range(1, weeks + 1):
+        for d in days:
+            day_people = []
+            for a in schedule.get_day_assignments(w, d):
+                if a.person_a:
+                    day_people.append(a.person_a)
+                if a.person_b:
+                    day_people.append(a.person_b)
+            
+            # Count duplicates
+            seen = set()
+            for name in day_people:
+                if name in seen:
+                    result.doublons_jour += 1
+                    result.add_violation(Violation(
+                        type="duplicate",
+                        severity="critical",
+                        week=w, day=d, person=name,
+                        message=f"Semaine {w} {d}: {name} assigné 2 fois"
+                    ))
+                seen.add(name)
+    
+    # 3. Night followed by work next day
+    for name in names:
+        for w in range(1, weeks + 1):
+            for i, d in enumerate(days[:-1]):
+                next_d = days[i + 1]
+                if works_on.get((name, w, d)) == "N" and (name, w, next_d) in works_on:
+                    result.nuit_suivie_travail += 1
+                    result.add_violation(Violation(
+                        type="night_followed_work",
+                        severity="warning",
+                        week=w, day=d, person=name,
+                        message=f"Semaine {w}: {name} travaille après nuit {d}"
+                    ))
+    
+    # 4. Soir followed by Jour shift (clopening)
+    for name in names:
+        for w in range(1, weeks + 1):
+            for i, d in enumerate(days[:-1]):
+                next_d = days[i + 1]
+                if works_on.get((name, w, d)) == "S" and works_on.get((name, w, next_d)) == "D":
+                    result.soir_vers_jour += 1
+                    result.add_violation(Violation(
+                        type="clopening",
+                        severity="warning",
+                        week=w, day=d, person=name,
+                        message=f"Semaine {w}: {name} Soir→Jour {d}→{next_d}"
+                    ))
+    
+    # 5. 48h/week validation - check each person's weekly hours
+    # from rota.solver.staffing import SHIFT_HOURS
+    hours_exceeded = 0
+    for name in names:
+        for w in range(1, weeks + 1):
+            week_hours = 0
+            for d in days:
+                shift = works_on.get((name, w, d))
+                if shift and shift in SHIFTS:
+                    week_hours += SHIFTS[shift].hours
+            
+            if week_hours > 48:
+                hours_exceeded += 1
+                result.add_violation(Violation(
+                    type="48h_exceeded",
+                    severity="warning",
+                    week=w, day="", person=name,
+                    message=f"Semaine {w}: {name} travaille {week_hours}h (>48h)"
+                ))
+
+    # 5b. Strict 48h rolling window
+    rolling_errors = check_rolling_48h(schedule)
+    for err in rolling_errors:
+        # Parse basic info from error string to create Violation
+        # "Name: Totalh ..."
+        parts = err.split(":")
+        p_name = parts[0] if len(parts) > 0 else ""
+        result.add_violation(Violation(
+            type="48h_rolling",
+            severity="critical", # Strict violation
+            week=0, day="", person=p_name,
+            message=err
+        ))
+        result.rolling_48h_violations += 1
+
+        # We assume this contributes to some metric, maybe ecarts?
+        # For now just adding violation is good for UI.
+
+    
+    # 6. Weekly workday deviations
+    for name in names:
+        person = name_to_person[name]
+        for w in range(1, weeks + 1):
+            # Target for this week
+            has_edo = name in edo_plan.plan.get(w, set())
+            target = person.workdays_per_week - (1 if has_edo else 0)
+            
+            # Actual
+            actual = sum(1 for d in days if (name, w, d) in works_on)
+            
+            if actual != target:
+                result.ecarts_hebdo_jours += 1
+    
+    # 6. Horizon total deviations
+    for name in names:
+        person = name_to_person[name]
+        
+        # Total target over horizon
+        total_target = sum(
+            person.workdays_per_week - (1 if name in edo_plan.plan.get(w, set()) else 0)
+            for w in range(1, weeks + 1)
+        )
+        
+        # Actual total
+        actual_total = sum(1 for a in schedule.assignments 
+                          if a.person_a == name or a.person_b == name)
+        
+        if actual_total != total_target:
+            result.ecarts_horizon_personnes += 1
+    
+    return result
+
+
+class TestVectorizedParity:
+    """validate_schedule (NumPy) matches the scan-based oracle exactly."""
+    
+    @staticmethod
+    def _random_schedule(people, weeks, seed):
+        import random
+        
+        from rota.solver.staffing import JOURS
+        
+        rng = random.Random(seed)
+        names = [p.name for p in people] + ["Ghost"]
+        assignments = []
+        for w in range(1, weeks + 1):
+            for d in JOURS:
+                for shift, slots in (("D", 2), ("N", 1), ("S", 1), ("A", 1)):
+                    for slot in range(rng.randint(0, slots + 1)):
+                        person_a = rng.choice(names)
+                        person_b = rng.choice(names + [None]) if shift in ("D", "N") else None
+                        assignments.append(PairAssignment(w, d, shift, slot, person_a, person_b))
+        # Rows on days outside the grid are ignored by per-day checks but count in totals
+        assignments.append(PairAssignment(1, "Sam", "D", 0, names[0], names[1]))
+        return PairSchedule(assignments=assignments, weeks=weeks, people_count=len(people), status="feasible")
+    
+    @staticmethod
+    def _assert_same(fast, ref):
+        from dataclasses import asdict
+        
+        for field in ("slots_vides", "doublons_jour", "nuit_suivie_travail", "soir_vers_jour",
+                      "ecarts_hebdo_jours", "ecarts_horizon_personnes", "rolling_48h_violations"):
+            assert getattr(fast, field) == getattr(ref, field), field
+        key = lambda v: tuple(sorted(asdict(v).items()))
+        assert sorted(map(key, fast.violations)) == sorted(map(key, ref.violations))
+    
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_schedules(self, seed):
+        people = [Person(name=f"P{i}", workdays_per_week=4 if i % 3 else 3, edo_eligible=i % 2 == 0)
+                  for i in range(10)]
+        weeks = 3
+        edo_plan = build_edo_plan(people, weeks)
+        staffing = derive_staffing(people, weeks, edo_plan.plan)
+        schedule = self._random_schedule(people, weeks, seed)
+        
+        self._assert_same(
+            validate_schedule(schedule, people, edo_plan, staffing),
+            validate_by_scanning(schedule, people, edo_plan, staffing),
+        )
+    
+    def test_solved_schedule(self):
+        people = [Person(name=f"P{i}", workdays_per_week=4) for i in range(16)]
+        config = SolverConfig(weeks=2, time_limit_seconds=10)
+        edo_plan = build_edo_plan(people, config.weeks)
+        staffing = derive_staffing(people, config.weeks, edo_plan.plan)
+        schedule = solve_pairs(people, config, staffing, edo_plan)
+        
+        self._assert_same(
+            validate_schedule(schedule, people, edo_plan, staffing),
+            validate_by_scanning(schedule, people, edo_plan, staffing),
+        )
@@ -0,0 +1,47 @@
+"""Tests for the dense variable store."""
+from ortools.sat.python import cp_model
+
+from rota.models.person import Person
+from rota.solver.staffing import JOURS
+from rota.solver.variables import D_IDX, N_IDX, S_IDX, VariableStore
+
+
+def _store(weeks=2):
+    people = [Person(name=f"P{i}") for i in range(3)]
+    return VariableStore(cp_model.CpModel(), people, weeks, JOURS)
+
+
+class TestVariableStore:
+    """Index arithmetic of VariableStore."""
+
+    def test_dimensions(self):
+        store = _store(weeks=2)
+        assert store.num_people == 3
+        assert store.num_days == 10
+        assert len(store.assign) == 3 * 10 * 3
+        assert len(store.works) == 3 * 10
+
+    def test_day_index_roundtrip(self):
+        store = _store(weeks=2)
+        g = store.day_index(2, "Mer")
+        assert g == 7
+        assert store.day_label(g) == (2, "Mer")
+        assert list(store.week_days(2)) == list(range(5, 10))
+
+    def test_explicit_week_numbers(self):
+        people = [Person(name="A")]
+        store = VariableStore(cp_model.CpModel(), people, [5, 6], JOURS)
+        assert store.day_index(5, "Lun") == 0
+        assert store.day_label(9) == (6, "Ven")
+
+    def test_slices_match_x(self):
+        store = _store(weeks=2)
+        p, g = 1, 6
+        assert store.day_shifts(p, g) == [store.x(p, g, s) for s in (D_IDX, N_IDX, S_IDX)]
+        assert store.person_shift(p, N_IDX) == [store.x(p, d, N_IDX) for d in range(store.num_days)]
+        assert store.slot(g, S_IDX) == [store.x(q, g, S_IDX) for q in range(store.num_people)]
+        assert store.person_works(p)[g] is store.works_on(p, g)
+
+    def test_variable_names(self):
+        store = _store(weeks=1)
+        assert store.x(2, store.day_index(1, "Jeu"), N_IDX).Name() == "assign_P2_1_Jeu_N"
@@ -1,5 +1,13 @@
 from rota.models.person import Person
-from rota.solver.weekend import WeekendConfig, WeekendSolver
+from rota.solver.pairs import PairAssignment, PairSchedule
+from rota.solver.validation import calendar_violations
+from rota.solver.weekend import (
+    WeekendAssignment,
+    WeekendConfig,
+    WeekendResult,
+    WeekendSolver,
+    merge_weekend_result,
+)
 
 
 def test_weekend_solver_basics():
@@ -76,3 +84,113 @@ def test_12h_24h_tracking():
     for p in people:
         shift_type = result.get_person_shift_type(p.name, 1)
         assert shift_type == "24h"
+
+
+def test_merge_weekend_result_exposes_boundary_conflicts():
+    """A weekday Friday night followed by a Saturday shift is caught on the merged calendar."""
+    people = [Person(name=f"P{i}", id=i) for i in range(3)]
+    weekend = WeekendResult(
+        assignments=[
+            WeekendAssignment(people[0], 1, "Sam", "D"),
+            WeekendAssignment(people[2], 1, "Sam", "D"),
+            WeekendAssignment(people[2], 1, "Sam", "N"),
+        ],
+        status="OPTIMAL",
+        solve_time=0.5,
+    )
+    weekdays = PairSchedule(
+        assignments=[PairAssignment(1, "Ven", "N", 0, "P0", "P1")],
+        weeks=1,
+        people_count=3,
+        status="optimal",
+        solve_time_seconds=1.0,
+    )
+
+    merged = merge_weekend_result(weekdays, weekend)
+
+    assert [(a.day, a.shift, a.person_a, a.person_b) for a in merged.assignments] == [
+        ("Ven", "N", "P0", "P1"),
+        ("Sam", "D", "P0", "P2"),
+        ("Sam", "N", "P2", ""),
+    ]
+    assert merged.solve_time_seconds == 1.5
+    assert calendar_violations(merged) == {"night_to_work": 1, "double_shift": 1, "rolling_48h": 0}
+
+
+def test_weekend_result_index():
+    people = [Person(name=f"P{i}", id=i) for i in range(3)]
+    result = WeekendResult(
+        assignments=[
+            WeekendAssignment(people[1], 1, "Sam", "D"),
+            WeekendAssignment(people[1], 1, "Sam", "N"),
+            WeekendAssignment(people[0], 2, "Dim", "N"),
+        ],
+        status="OPTIMAL",
+        solve_time=0.1,
+        names=["P0", "P1", "P2"],
+        num_weeks=3,
+    )
+
+    assert result.grid.shape == (3, 3, 2, 2)
+    assert result.get_person_hours("P1", 1) == 24
+    assert result.get_person_shift_type("P1", 1) == "24h"
+    assert result.get_person_shift_type("P0", 2) == "12h"
+    assert result.get_person_shift_type("P2", 1) == "OFF"
+    assert result.get_person_hours("Unknown", 1) == 0
+    assert result.get_person_hours("P0", 9) == 0
+    assert result.get_person_total_hours("P1") == 24
+    assert result.get_person_shift_counts("P1") == {"D": 1, "N": 1}
+    assert result.get_weekends_worked("P0") == [2]
+    assert result.get_slot_people(1, "Sam", "N") == ["P1"]
+    assert result.get_slot_count(1, "Sam") == 2
+    assert result.get_slot_count(2, "Dim", "D") == 0
+    assert result.works("P1", 1, "Sam", "N")
+    assert not result.works("P1", 2, "Sam", "N")
+    assert not result.works("Unknown", 1, "Sam", "N")
+
+
+def test_weekend_result_index_without_names():
+    """Hand-built results index people in assignment order."""
+    result = WeekendResult(
+        assignments=[WeekendAssignment(Person(name="X", id=1), 2, "Dim", "D")],
+        status="FEASIBLE",
+        solve_time=0.0,
+    )
+
+    assert result.names == ["X"]
+    assert result.num_weeks == 2
+    assert result.get_person_hours("X", 2) == 12
+
+
+def test_solver_result_is_indexed_by_eligible_people():
+    people = [Person(name=f"P{i}", id=i, available_weekends=i != 2) for i in range(6)]
+    result = WeekendSolver(WeekendConfig(num_weeks=2), people).solve()
+
+    assert result.names == ["P0", "P1", "P3", "P4", "P5"]
+    assert result.grid.shape == (5, 2, 2, 2)
+    assert int(result.grid.sum()) == len(result.assignments)
+    for a in result.assignments:
+        assert a.person.name in result.get_slot_people(a.week, a.day, a.shift)
+
+
+def test_solver_reports_objective_bound_and_first_solution():
+    people = [Person(name=f"P{i}", id=i, available_weekends=True) for i in range(8)]
+    config = WeekendConfig(num_weeks=2, num_workers=1, random_seed=3, relative_gap_limit=0.5)
+    result = WeekendSolver(config, people).solve()
+
+    assert result.status in ["OPTIMAL", "FEASIBLE"]
+    assert result.objective is not None and result.best_bound is not None
+    assert result.best_bound <= result.objective + 1e-6
+    assert 0 <= result.first_solution_seconds <= result.solve_time + 1.0
+
+
+def test_hint_from_previous_plan():
+    """A hinted re-solve of an unchanged team finds a plan at least as good."""
+    people = [Person(name=f"P{i}", id=i, available_weekends=True) for i in range(8)]
+    config = WeekendConfig(num_weeks=2, num_workers=1, random_seed=1)
+    previous = WeekendSolver(config, people).solve()
+
+    hinted = WeekendSolver(WeekendConfig(num_weeks=2, num_workers=1, random_seed=2, hint=previous), people).solve()
+
+    assert hinted.status in ["OPTIMAL", "FEASIBLE"]
+    assert hinted.objective <= previous.objective + 1e-6
@@ -0,0 +1,93 @@
+from rota.models.constraints import SolverConfig
+from rota.models.person import Person
+from rota.solver.edo import build_edo_plan
+from rota.solver.pairs import PairAssignment, PairSchedule
+from rota.solver.staffing import derive_staffing
+from rota.solver.weekend import WeekendConfig, WeekendSolver
+from rota.solver.weekend_pipeline import (
+    boundary_conflicts,
+    boundary_workers,
+    repair_weekends,
+    solve_week_and_weekend,
+    split_workers,
+    start_weekend_solve,
+)
+
+
+def _weekdays(assignments, weeks=2):
+    return PairSchedule(
+        assignments=assignments,
+        weeks=weeks,
+        people_count=8,
+        status="feasible",
+        solve_time_seconds=1.0,
+    )
+
+
+def _team(n=8):
+    return [Person(name=f"P{i}", id=i, available_weekends=True, max_weekends_per_month=4) for i in range(n)]
+
+
+def test_split_workers():
+    assert split_workers(1) == (1, 1)
+    assert split_workers(8) == (6, 2)
+    assert split_workers(16) == (12, 4)
+
+
+def test_boundary_workers():
+    schedule = _weekdays([
+        PairAssignment(1, "Ven", "N", 0, "P0", "P1"),
+        PairAssignment(1, "Ven", "D", 0, "P2", "P3"),
+        PairAssignment(1, "Lun", "D", 0, "P4", ""),
+        PairAssignment(2, "Lun", "S", 0, "P5", "P6"),
+    ])
+
+    fridays, mondays = boundary_workers(schedule)
+
+    assert fridays == {1: ["P0", "P1"]}
+    # Monday of week 2 follows the weekend of week 1
+    assert mondays == {1: ["P5", "P6"]}
+
+
+def test_repair_removes_boundary_conflicts_and_keeps_other_weekends():
+    people = _team()
+    config = WeekendConfig(num_weeks=2, staff_per_shift=2, time_limit_seconds=10)
+    result = WeekendSolver(config, people).solve()
+    assert result.status in ["OPTIMAL", "FEASIBLE"]
+
+    # Put everyone on Saturday 1 on the Friday night before it
+    saturday = sorted({a.person.name for a in result.assignments if a.week == 1 and a.day == "Sam"})
+    schedule = _weekdays([
+        PairAssignment(1, "Ven", "N", i // 2, *(saturday[i:i + 2] + [""])[:2])
+        for i in range(0, len(saturday), 2)
+    ])
+    assert set(boundary_conflicts(schedule, result)) == {1}
+
+    repaired = repair_weekends(schedule, result, people, config)
+
+    assert repaired.status in ["OPTIMAL", "FEASIBLE"]
+    assert boundary_conflicts(schedule, repaired) == {}
+    week2 = lambda r: sorted((a.person.name, a.day, a.shift) for a in r.assignments if a.week == 2)
+    assert week2(repaired) == week2(result)
+    assert repaired.solve_time >= result.solve_time
+
+
+def test_repair_without_conflicts_returns_result():
+    people = _team()
+    config = WeekendConfig(num_weeks=1, staff_per_shift=2, time_limit_seconds=10)
+    result = start_weekend_solve(people, config).result()
+
+    assert repair_weekends(_weekdays([], weeks=1), result, people, config) is result
+
+
+def test_solve_week_and_weekend():
+    people = [Person(name=f"P{i}", id=i, available_weekends=True) for i in range(12)]
+    config = SolverConfig(weeks=2, time_limit_seconds=10)
+    edo_plan = build_edo_plan(people, 2)
+    staffing = derive_staffing(people, 2, edo_plan.plan)
+
+    schedule, weekend = solve_week_and_weekend(people, config, staffing, edo_plan)
+
+    assert schedule.status in ["optimal", "feasible"]
+    assert weekend.status in ["OPTIMAL", "FEASIBLE"]
+    assert boundary_conflicts(schedule, weekend) == {}